@@ -0,0 +1,221 @@
+"""Cycle-time, iteration and throughput analytics for the dashboard.
+
+Computed in one pass over a ``QuestTable``'s columns:
+- Lead time: quest start (the ``_YYYY-MM-DD__HHMM`` suffix every quest id
+  carries) to the journal's completion date, as percentiles in days
+- Plan and fix iteration histograms (last bin is open-ended)
+- Finished quests per week over the recent weeks, zero weeks included
+
+For large tables NumPy is used when it is installed (``pip install
+quest-dashboard[analytics]``); it reads the table's ``array`` columns without
+copying. The pure-Python path gives identical results, so NumPy is an
+accelerator, not a dependency, and small repos never pay for importing it.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from array import array
+from datetime import date
+
+from .columnar import KIND_FINISHED, QuestTable
+from .models import QuestAnalytics
+
+PERCENTILES = (50, 75, 90, 95)
+
+# Iteration counts at or above this share the last histogram bin ("6+")
+ITERATION_BINS = 6
+_BIN_LABELS = tuple(str(i) for i in range(ITERATION_BINS)) + (f"{ITERATION_BINS}+",)
+
+# Weeks of throughput shown, ending with the current week
+THROUGHPUT_WEEKS = 26
+
+# Quest ids end in "_YYYY-MM-DD__HHMM" (e.g. "ci-quest-validation_2026-02-04__1532")
+_START_SUFFIX_LEN = 17
+_START_SUFFIX_RE = re.compile(r"_(\d{4}-\d{2}-\d{2})__\d{4}")
+
+# Marks rows whose quest id carries no parsable start date
+_NO_START = -1
+
+# Below this many rows, importing NumPy costs more than it saves
+_MIN_NUMPY_ROWS = 20_000
+
+
+def quest_start_day(quest_id: str) -> date | None:
+    """Return the start date embedded in a quest id, or None."""
+    match = _START_SUFFIX_RE.fullmatch(quest_id, max(len(quest_id) - _START_SUFFIX_LEN, 0))
+    if match is None:
+        return None
+    try:
+        return date.fromisoformat(match[1])
+    except ValueError:
+        return None
+
+
+def compute_analytics(
+    table: QuestTable, today: date, use_numpy: bool | None = None
+) -> QuestAnalytics:
+    """Aggregate lead times, iteration histograms and weekly throughput.
+
+    Args:
+        table: Columnar quest data (see ``QuestTable.from_dashboard_data``)
+        today: Last day of the throughput window
+        use_numpy: Force (True) or disable (False) NumPy; None = only for
+            large tables. Falls back to pure Python if NumPy is missing.
+
+    Returns:
+        QuestAnalytics for the dashboard panels
+    """
+    if use_numpy is None:
+        use_numpy = len(table) >= _MIN_NUMPY_ROWS
+    np = _load_numpy() if use_numpy else None
+    starts = _start_days(table)
+    this_week = _week(today.toordinal())
+    first_week = this_week - THROUGHPUT_WEEKS + 1
+
+    if np is not None:
+        lead, plan, fix, weekly = _aggregate_numpy(np, table, starts, first_week)
+    else:
+        lead, plan, fix, weekly = _aggregate_python(table, starts, first_week)
+
+    return QuestAnalytics(
+        lead_time_days={f"p{p}": v for p, v in zip(PERCENTILES, lead[1])},
+        lead_time_samples=lead[0],
+        plan_iterations=dict(zip(_BIN_LABELS, plan)),
+        fix_iterations=dict(zip(_BIN_LABELS, fix)),
+        weekly_throughput=[
+            (date.fromordinal((first_week + i) * 7 + 1).isoformat(), count)
+            for i, count in enumerate(weekly)
+        ],
+    )
+
+
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _week(ordinal: int) -> int:
+    """Monday-based week number (date.fromordinal(1) is a Monday)."""
+    return (ordinal - 1) // 7
+
+
+def _start_days(table: QuestTable) -> array:
+    """Start-day ordinal per row, found by scanning the quest_id buffer once.
+
+    One ``finditer`` over the concatenated ids replaces a regex call per row;
+    a match counts only if it ends exactly where a row ends. Rows it misses
+    (e.g. a stray date-like run overlapping the real suffix) get a direct
+    per-row check, so the result equals matching each id on its own.
+    """
+    starts = array("l", [_NO_START]) * len(table)
+    column = table.text.get("quest_id")
+    if column is None or not len(column):
+        return starts
+    buffer, offsets = column.buffer, column.offsets
+    # Reversed so the first row wins when empty ids share an end offset
+    row_by_end = dict(zip(reversed(offsets), range(len(offsets) - 1, -1, -1)))
+    ordinals: dict[str, int] = {}  # "YYYY-MM-DD" -> ordinal; many quests share a day
+
+    def ordinal_for(day: str) -> int:
+        ordinal = ordinals.get(day)
+        if ordinal is None:
+            try:
+                ordinal = date.fromisoformat(day).toordinal()
+            except ValueError:
+                ordinal = _NO_START
+            ordinals[day] = ordinal
+        return ordinal
+
+    found = 0
+    for match in _START_SUFFIX_RE.finditer(buffer):
+        index = row_by_end.get(match.end())
+        if index is not None and match.start() >= (offsets[index - 1] if index else 0):
+            starts[index] = ordinal_for(match[1])
+            found += 1
+
+    if found < len(starts):
+        fullmatch = _START_SUFFIX_RE.fullmatch
+        for index, end in enumerate(offsets):
+            if starts[index] != _NO_START:
+                continue
+            begin = offsets[index - 1] if index else 0
+            match = fullmatch(buffer, max(end - _START_SUFFIX_LEN, begin), end)
+            if match is not None:
+                starts[index] = ordinal_for(match[1])
+    return starts
+
+
+def _aggregate_numpy(np, table: QuestTable, starts: array, first_week: int):
+    def view(column: array):
+        # Zero-copy view of an array("l") column
+        return np.frombuffer(column, dtype=f"i{column.itemsize}")
+
+    kind = np.frombuffer(table.kind, dtype=np.uint8)
+    day = view(table.day)
+    start = view(starts)
+    finished = kind == KIND_FINISHED
+
+    lead = day - start
+    lead = lead[finished & (start != _NO_START) & (lead >= 0)]
+    if lead.size:
+        percentiles = [round(float(v), 1) for v in np.percentile(lead, PERCENTILES)]
+    else:
+        percentiles = []
+
+    def histogram(column: array) -> list[int]:
+        values = view(column)
+        values = np.minimum(values[values >= 0], ITERATION_BINS)
+        return np.bincount(values, minlength=ITERATION_BINS + 1).tolist()
+
+    weeks = (day[finished] - 1) // 7 - first_week
+    weeks = weeks[(weeks >= 0) & (weeks < THROUGHPUT_WEEKS)]
+    weekly = np.bincount(weeks, minlength=THROUGHPUT_WEEKS).tolist()
+    return (
+        (int(lead.size), percentiles),
+        histogram(table.plan_iterations),
+        histogram(table.fix_iterations),
+        weekly,
+    )
+
+
+def _aggregate_python(table: QuestTable, starts: array, first_week: int):
+    leads: list[int] = []
+    weekly = [0] * THROUGHPUT_WEEKS
+    for kind, day, start in zip(table.kind, table.day, starts):
+        if kind != KIND_FINISHED:
+            continue
+        if start != _NO_START and day >= start:
+            leads.append(day - start)
+        week = _week(day) - first_week
+        if 0 <= week < THROUGHPUT_WEEKS:
+            weekly[week] += 1
+
+    leads.sort()
+    percentiles = [round(percentile(leads, p), 1) for p in PERCENTILES] if leads else []
+
+    def histogram(column: array) -> list[int]:
+        bins = [0] * (ITERATION_BINS + 1)
+        for value in column:
+            if value >= 0:
+                bins[min(value, ITERATION_BINS)] += 1
+        return bins
+
+    return (
+        (len(leads), percentiles),
+        histogram(table.plan_iterations),
+        histogram(table.fix_iterations),
+        weekly,
+    )
+
+
+def percentile(ordered: list[int], p: float) -> float:
+    """Linear-interpolation percentile of sorted data (NumPy's default method)."""
+    rank = (len(ordered) - 1) * p / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
@@ -0,0 +1,242 @@
+"""Per-quest artifact size and context-budget accounting.
+
+Every file in a quest's ``phase_0*/`` directories (plans, reviews, handoffs,
+feedback) is measured in bytes and approximate tokens, the same offline
+estimate the context digest uses. Agents read these artifacts back into
+their prompts, so a quest whose artifacts keep growing is a quest whose
+next plan or fix iteration starts with less room.
+
+Scanning is incremental, with results cached next to the output
+(``.artifact-sizes-cache.json``):
+
+- A file whose size and mtime match the cache reuses its recorded token
+  count without being read
+- Artifacts are overwritten on each plan and fix iteration, so the cache
+  also keeps the largest phase total seen per iteration. That history is
+  what shows growth across iterations.
+
+Quests whose artifacts exceed the token budget are flagged on the
+dashboard's Artifact Sizes panel and in the build warnings.
+
+Usage:
+    PYTHONPATH=scripts python3 -m quest_dashboard.artifacts [--repo-root PATH] [--budget TOKENS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from .audit import find_quest_dirs
+from .fsutil import write_atomic
+from .models import QuestArtifactSize
+from .tokens import estimate_tokens
+
+CACHE_NAME = ".artifact-sizes-cache.json"
+CACHE_VERSION = 1
+
+# Tokens of phase artifacts one quest may accumulate before it is flagged
+DEFAULT_BUDGET = 40000
+
+# Phase directory prefix -> state.json counter for its iterations
+ITERATION_PHASES = {"phase_01": "plan_iteration", "phase_03": "fix_iteration"}
+
+
+@dataclass(frozen=True, slots=True)
+class ArtifactScan:
+    """Per-quest sizes plus what the scan had to read."""
+
+    quests: list[QuestArtifactSize]  # Largest token total first
+    measured: int  # Files read (cache misses)
+    cached: int  # Files answered from the cache
+
+    @property
+    def over_budget(self) -> list[QuestArtifactSize]:
+        return [q for q in self.quests if q.over_budget]
+
+
+def scan_artifacts(
+    quest_root: Path, cache_path: Path | None = None, budget: int = DEFAULT_BUDGET
+) -> ArtifactScan:
+    """Measure every phase artifact, reusing cached token counts where possible.
+
+    Args:
+        quest_root: The ``.quest`` directory
+        cache_path: JSON cache (read and rewritten); None disables caching
+        budget: Token total above which a quest is flagged
+
+    Returns:
+        ArtifactScan with one entry per quest that has phase artifacts
+    """
+    cache = _load_cache(cache_path)
+    old_files: dict[str, list] = cache["files"]
+    old_history: dict[str, dict] = cache["history"]
+    new_files: dict[str, list] = {}
+    new_history: dict[str, dict] = {}
+
+    quests: list[QuestArtifactSize] = []
+    measured = 0
+    for quest_dir in find_quest_dirs(quest_root):
+        quest_id = quest_dir.relative_to(quest_root).as_posix()
+        sizes: dict[str, tuple[int, int]] = {}  # Path within the quest -> (bytes, tokens)
+        for path in sorted(quest_dir.glob("phase_0*/*")):
+            rel = path.relative_to(quest_root).as_posix()
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if not path.is_file():
+                continue
+
+            # Stat match -> reuse the recorded token count without reading the file
+            entry = old_files.get(rel)
+            if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                tokens = entry[2]
+            else:
+                try:
+                    content = path.read_bytes()
+                except OSError:
+                    continue
+                tokens = estimate_tokens(content.decode("utf-8", errors="replace"))
+                measured += 1
+            new_files[rel] = [st.st_size, st.st_mtime_ns, tokens]
+            sizes[path.relative_to(quest_dir).as_posix()] = (st.st_size, tokens)
+
+        if not sizes:
+            continue
+        history = _record_iterations(
+            old_history.get(quest_id, {}), _read_iterations(quest_dir), sizes
+        )
+        new_history[quest_id] = history
+        quests.append(_summarize(quest_id, sizes, history, budget))
+
+    if cache_path is not None:
+        new_cache = {"version": CACHE_VERSION, "files": new_files, "history": new_history}
+        if new_cache != cache:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(cache_path, json.dumps(new_cache, sort_keys=True) + "\n")
+
+    quests.sort(key=lambda q: (-q.tokens, q.quest_id))
+    return ArtifactScan(quests=quests, measured=measured, cached=len(new_files) - measured)
+
+
+def _read_iterations(quest_dir: Path) -> dict[str, int]:
+    """Current plan/fix iteration counters from state.json (missing -> 0)."""
+    try:
+        state = json.loads((quest_dir / "state.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = {}
+    if not isinstance(state, dict):
+        state = {}
+    iterations = {}
+    for key in ITERATION_PHASES.values():
+        value = state.get(key)
+        iterations[key] = value if isinstance(value, int) and value >= 0 else 0
+    return iterations
+
+
+def _record_iterations(
+    history: dict, iterations: dict[str, int], sizes: dict[str, tuple[int, int]]
+) -> dict[str, dict[str, int]]:
+    """Fold the current phase totals into the per-iteration history.
+
+    Each iterated phase keeps the largest token total seen for each of its
+    iterations; earlier iterations keep whatever was recorded for them.
+    """
+    updated = {}
+    for prefix, key in ITERATION_PHASES.items():
+        recorded = history.get(key)
+        totals = dict(recorded) if isinstance(recorded, dict) else {}
+        current = sum(tokens for rel, (_, tokens) in sizes.items() if rel.startswith(prefix))
+        if current:
+            iteration = str(iterations[key])
+            totals[iteration] = max(totals.get(iteration, 0), current)
+        updated[key] = totals
+    return updated
+
+
+def _summarize(
+    quest_id: str,
+    sizes: dict[str, tuple[int, int]],
+    history: dict[str, dict[str, int]],
+    budget: int,
+) -> QuestArtifactSize:
+    largest = max(sizes, key=lambda rel: (sizes[rel][1], rel))
+    tokens = sum(t for _, t in sizes.values())
+
+    def growth(key: str) -> tuple[int, ...]:
+        return tuple(history[key][i] for i in sorted(history[key], key=int))
+
+    return QuestArtifactSize(
+        quest_id=quest_id,
+        files=len(sizes),
+        bytes=sum(b for b, _ in sizes.values()),
+        tokens=tokens,
+        largest=largest,
+        largest_tokens=sizes[largest][1],
+        plan_tokens=growth("plan_iteration"),
+        fix_tokens=growth("fix_iteration"),
+        over_budget=tokens > budget,
+    )
+
+
+def _load_cache(cache_path: Path | None) -> dict:
+    empty = {"version": CACHE_VERSION, "files": {}, "history": {}}
+    if cache_path is None:
+        return empty
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty
+    if (
+        not isinstance(cache, dict)
+        or cache.get("version") != CACHE_VERSION
+        or not isinstance(cache.get("files"), dict)
+        or not isinstance(cache.get("history"), dict)
+    ):
+        return empty
+    return cache
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Exit code 1 if any quest is over budget."""
+    parser = argparse.ArgumentParser(description="Measure quest phase artifacts")
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=DEFAULT_BUDGET,
+        help=f"Token budget per quest. Default: {DEFAULT_BUDGET}.",
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help=f"Sizes cache path. Default: docs/dashboard/{CACHE_NAME} "
+        "(shared with the dashboard build).",
+    )
+    args = parser.parse_args(argv)
+
+    repo_root = Path(args.repo_root).resolve()
+    cache_path = (
+        Path(args.cache) if args.cache else repo_root / "docs" / "dashboard" / CACHE_NAME
+    )
+    scan = scan_artifacts(repo_root / ".quest", cache_path, args.budget)
+
+    for quest in scan.quests:
+        flag = "[OVER] " if quest.over_budget else ""
+        print(
+            f"{flag}{quest.quest_id}: {quest.tokens} tokens in {quest.files} files"
+            f" (largest {quest.largest}, {quest.largest_tokens})"
+        )
+    print(
+        f"{len(scan.over_budget)} of {len(scan.quests)} quests over {args.budget} tokens"
+        f" ({scan.measured} files measured, {scan.cached} cached)"
+    )
+    return 1 if scan.over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
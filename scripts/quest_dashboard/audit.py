@@ -0,0 +1,464 @@
+"""Batch auditor for quest state and handoff files.
+
+Python port of ``scripts/validate-quest-state.sh`` that audits every quest
+under ``.quest`` in one process. It uses the same transition table, artifact
+checks, handoff semantic checks and allowlist iteration bounds
+(``gates.max_plan_iterations`` / ``gates.max_fix_iterations``, warn-only).
+Each JSON file is parsed at most once, and large quest sets are audited in
+a process pool.
+
+Without ``--target``, each quest is checked against the transition that
+brought it into its current phase: at least one allowed predecessor
+transition must have its artifacts and handoff verdicts in place. With
+``--target PHASE``, every quest is checked exactly as
+``validate-quest-state.sh <quest-dir> PHASE`` would check it.
+
+Usage:
+    python3 -m quest_dashboard.audit
+    python3 -m quest_dashboard.audit --target reviewing --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import Diagnostic
+
+PHASES = (
+    "plan",
+    "plan_reviewed",
+    "presenting",
+    "presentation_complete",
+    "building",
+    "reviewing",
+    "fixing",
+    "complete",
+)
+
+# Allowed (current, target) transitions and the artifacts each requires.
+# ("file", path) must be a file; ("dir", path) must contain at least one file.
+TRANSITIONS: dict[tuple[str, str], tuple[tuple[str, str], ...]] = {
+    ("plan", "plan_reviewed"): (
+        ("file", "phase_01_plan/plan.md"),
+        ("file", "phase_01_plan/review_claude.md"),
+        ("file", "phase_01_plan/review_codex.md"),
+        ("file", "phase_01_plan/arbiter_verdict.md"),
+    ),
+    ("plan", "plan"): (("file", "phase_01_plan/arbiter_verdict.md"),),
+    ("plan_reviewed", "presenting"): (("file", "phase_01_plan/plan.md"),),
+    ("presenting", "presentation_complete"): (("file", "phase_01_plan/plan.md"),),
+    ("presentation_complete", "building"): (("file", "phase_01_plan/plan.md"),),
+    ("plan_reviewed", "building"): (("file", "phase_01_plan/plan.md"),),
+    ("building", "reviewing"): (("dir", "phase_02_implementation"),),
+    ("reviewing", "fixing"): (
+        ("file", "phase_03_review/review_claude.md"),
+        ("file", "phase_03_review/review_codex.md"),
+    ),
+    ("reviewing", "complete"): (
+        ("file", "phase_03_review/review_claude.md"),
+        ("file", "phase_03_review/review_codex.md"),
+    ),
+    ("fixing", "reviewing"): (
+        ("file", "phase_03_review/review_fix_feedback_discussion.md"),
+    ),
+}
+
+DEFAULT_MAX_PLAN_ITERATIONS = 4
+DEFAULT_MAX_FIX_ITERATIONS = 3
+
+# Below this many quests, auditing serially beats process pool startup
+_MIN_PARALLEL_QUESTS = 64
+
+_ARBITER_HANDOFF = "phase_01_plan/handoff_arbiter.json"
+_REVIEW_HANDOFFS = (
+    "phase_03_review/handoff_claude.json",
+    "phase_03_review/handoff_codex.json",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class IterationLimits:
+    """Iteration bounds from ``.ai/allowlist.json`` gates."""
+
+    max_plan: int = DEFAULT_MAX_PLAN_ITERATIONS
+    max_fix: int = DEFAULT_MAX_FIX_ITERATIONS
+
+
+@dataclass(frozen=True, slots=True)
+class AuditFinding:
+    """One failed check ("fail") or exceeded iteration bound ("warn")."""
+
+    level: str
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class QuestAudit:
+    """Audit outcome for one quest directory."""
+
+    quest: str  # Directory name under .quest
+    phase: str | None
+    transition: str | None  # "current->target" that was checked
+    findings: tuple[AuditFinding, ...] = field(default_factory=tuple)
+
+    @property
+    def failed(self) -> bool:
+        return any(f.level == "fail" for f in self.findings)
+
+
+def load_limits(repo_root: Path) -> tuple[IterationLimits, list[str]]:
+    """Read iteration bounds from the allowlist, falling back to defaults.
+
+    Args:
+        repo_root: Repository root containing ``.ai/allowlist.json``
+
+    Returns:
+        Tuple of (limits, warnings for non-integer values)
+    """
+    warnings: list[str] = []
+    try:
+        gates = json.loads(
+            (repo_root / ".ai" / "allowlist.json").read_text(encoding="utf-8")
+        ).get("gates", {})
+    except (OSError, ValueError, AttributeError):
+        return IterationLimits(), warnings
+
+    values = {}
+    for key, default in (
+        ("max_plan_iterations", DEFAULT_MAX_PLAN_ITERATIONS),
+        ("max_fix_iterations", DEFAULT_MAX_FIX_ITERATIONS),
+    ):
+        raw = gates.get(key) if isinstance(gates, dict) else None
+        if raw is None:
+            values[key] = default
+        elif isinstance(raw, int) and not isinstance(raw, bool) and raw >= 0:
+            values[key] = raw
+        elif isinstance(raw, str) and raw.isdigit():
+            values[key] = int(raw)  # jq -r prints "4" and 4 alike
+        else:
+            warnings.append(
+                f"allowlist {key} is not a valid integer: '{raw}' (using default {default})"
+            )
+            values[key] = default
+    return (
+        IterationLimits(
+            max_plan=values["max_plan_iterations"], max_fix=values["max_fix_iterations"]
+        ),
+        warnings,
+    )
+
+
+def find_quest_dirs(quest_root: Path) -> list[Path]:
+    """Return quest directories (those holding state.json), skipping archives."""
+    if not quest_root.is_dir():
+        return []
+    found = []
+    for root, dirs, files in os.walk(quest_root):
+        dirs[:] = [d for d in dirs if d != "archive"]  # Never walk archive trees
+        if "state.json" in files:
+            found.append(Path(root))
+    return sorted(found)
+
+
+def audit_quests(
+    quest_root: Path,
+    limits: IterationLimits = IterationLimits(),
+    target: str | None = None,
+    workers: int | None = None,
+) -> list[QuestAudit]:
+    """Audit every quest under quest_root.
+
+    Args:
+        quest_root: The ``.quest`` directory
+        limits: Iteration bounds (see load_limits)
+        target: Check this transition target for every quest (None = check
+            how each quest entered its current phase)
+        workers: Worker process count (None = os.cpu_count(), 1 = serial)
+
+    Returns:
+        One QuestAudit per quest, sorted by directory name
+    """
+    quest_dirs = find_quest_dirs(quest_root)
+    audit_one = partial(audit_quest, limits=limits, target=target)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(quest_dirs) >= _MIN_PARALLEL_QUESTS:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(audit_one, quest_dirs, chunksize=16))
+    return [audit_one(quest_dir) for quest_dir in quest_dirs]
+
+
+def audit_quest(
+    quest_dir: Path,
+    limits: IterationLimits = IterationLimits(),
+    target: str | None = None,
+) -> QuestAudit:
+    """Audit one quest directory (see module docstring for the two modes)."""
+    files = _JsonFiles(quest_dir)
+    state, error = files.load("state.json")
+    if error:
+        return QuestAudit(quest_dir.name, None, None, (AuditFinding("fail", error),))
+
+    findings: list[AuditFinding] = []
+    phase = state.get("phase") if isinstance(state, dict) else None
+    if not phase:
+        findings.append(AuditFinding("fail", "state.json missing 'phase' field"))
+        return QuestAudit(quest_dir.name, None, None, tuple(findings))
+
+    plan_iteration = _iteration(state, "plan_iteration", findings)
+    fix_iteration = _iteration(state, "fix_iteration", findings)
+
+    if target is not None:
+        transition = (phase, target)
+        if transition not in TRANSITIONS:
+            findings.append(
+                AuditFinding(
+                    "fail",
+                    f"Invalid transition: {phase} -> {target} "
+                    "(not in allowed transition table)",
+                )
+            )
+        else:
+            findings.extend(_transition_findings(files, transition))
+    else:
+        if phase not in PHASES:
+            findings.append(AuditFinding("fail", f"Unknown phase: {phase}"))
+            return QuestAudit(quest_dir.name, phase, None, tuple(findings))
+        transition = _best_entry_transition(files, phase)
+        if transition is not None:
+            findings.extend(_transition_findings(files, transition))
+
+    source, checked_target = transition if transition else (phase, phase)
+    findings.extend(
+        _iteration_findings(source, checked_target, plan_iteration, fix_iteration, limits)
+    )
+    return QuestAudit(
+        quest_dir.name,
+        phase,
+        f"{transition[0]}->{transition[1]}" if transition else None,
+        tuple(findings),
+    )
+
+
+def audit_warnings(audits: list[QuestAudit]) -> list[Diagnostic]:
+    """Flatten audit findings into dashboard diagnostics (code ``audit-<level>``)."""
+    # Deferred: the dashboard package is only needed when called from the build,
+    # so this module still runs directly as a standalone script
+    from .models import Diagnostic
+
+    return [
+        Diagnostic(
+            f"audit-{finding.level}",
+            f"Audit {finding.level}: {audit.quest}: {finding.message}",
+            audit.quest,
+        )
+        for audit in audits
+        for finding in audit.findings
+    ]
+
+
+def format_report(audits: list[QuestAudit]) -> str:
+    """Render a plain-text report in the style of validate-quest-state.sh."""
+    failed = sum(1 for a in audits if a.failed)
+    warned = sum(1 for a in audits if any(f.level == "warn" for f in a.findings))
+    lines = [f"=== Quest Audit: {len(audits)} quests, {failed} failed, {warned} warned ==="]
+    for audit in audits:
+        label = f"{audit.quest} ({audit.transition or audit.phase or 'unknown'})"
+        if not audit.findings:
+            lines.append(f"[PASS] {label}")
+        for finding in audit.findings:
+            lines.append(f"[{finding.level.upper()}] {label}: {finding.message}")
+    return "\n".join(lines) + "\n"
+
+
+class _JsonFiles:
+    """Per-quest JSON loader that parses each file at most once."""
+
+    def __init__(self, quest_dir: Path):
+        self.quest_dir = quest_dir
+        self._cache: dict[str, tuple[object, str | None]] = {}
+
+    def load(self, rel_path: str) -> tuple[object, str | None]:
+        """Return (parsed JSON, None) or (None, error message)."""
+        if rel_path not in self._cache:
+            path = self.quest_dir / rel_path
+            try:
+                self._cache[rel_path] = (json.loads(path.read_text(encoding="utf-8")), None)
+            except FileNotFoundError:
+                self._cache[rel_path] = (None, f"{rel_path} not found")
+            except (OSError, UnicodeDecodeError, ValueError):
+                self._cache[rel_path] = (None, f"{rel_path} is not valid JSON")
+        return self._cache[rel_path]
+
+    def next_role(self, rel_path: str) -> tuple[bool, object]:
+        """Return (exists, value of .next) for a handoff file, like ``jq -r .next``."""
+        value, error = self.load(rel_path)
+        if error and error.endswith("not found"):
+            return False, None
+        if isinstance(value, dict):
+            return True, value.get("next")
+        return True, ""  # Invalid JSON or not an object: matches no expected value
+
+
+def _iteration(state: dict, key: str, findings: list[AuditFinding]) -> int:
+    """Read an iteration counter; like ``jq -r '.key // 0'`` plus a digits check."""
+    value = state.get(key)
+    if value is None or value is False:
+        return 0
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    findings.append(AuditFinding("fail", f"{key} is not a valid integer: '{value}'"))
+    return 0
+
+
+def _best_entry_transition(files: _JsonFiles, phase: str) -> tuple[str, str] | None:
+    """Pick the predecessor transition into phase with the fewest failures.
+
+    The initial ``plan`` phase has no entry requirements.
+    """
+    candidates = [t for t in TRANSITIONS if t[1] == phase and t[0] != phase]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda t: len(_transition_findings(files, t)))
+
+
+def _transition_findings(
+    files: _JsonFiles, transition: tuple[str, str]
+) -> list[AuditFinding]:
+    findings = []
+    for kind, rel_path in TRANSITIONS[transition]:
+        path = files.quest_dir / rel_path
+        if kind == "file" and not path.is_file():
+            findings.append(AuditFinding("fail", f"Missing artifact: {rel_path}"))
+        elif kind == "dir" and not _has_file(path):
+            findings.append(AuditFinding("fail", f"Directory is empty or missing: {rel_path}"))
+    message = _semantic_failure(files, transition)
+    if message:
+        findings.append(AuditFinding("fail", f"Semantic check: {message}"))
+    return findings
+
+
+def _semantic_failure(files: _JsonFiles, transition: tuple[str, str]) -> str | None:
+    """Handoff verdict checks; returns a failure message or None."""
+    if transition == ("plan_reviewed", "building"):
+        exists, next_role = files.next_role(_ARBITER_HANDOFF)
+        if not exists:
+            return f"handoff_arbiter.json not found at {_ARBITER_HANDOFF}"
+        if next_role != "builder":
+            return (
+                "arbiter did not approve for building "
+                f"(next={_jq_text(next_role)}, expected builder)"
+            )
+    elif transition == ("reviewing", "fixing"):
+        if not any(files.next_role(path) == (True, "fixer") for path in _REVIEW_HANDOFFS):
+            return "no reviewer indicates issues requiring fixing"
+    elif transition == ("reviewing", "complete"):
+        if not all(files.next_role(path) == (True, None) for path in _REVIEW_HANDOFFS):
+            return "reviews are not both clean (both handoff files must have next=null)"
+    return None
+
+
+def _iteration_findings(
+    source: str, target: str, plan_iteration: int, fix_iteration: int, limits: IterationLimits
+) -> list[AuditFinding]:
+    """Warn-only iteration bounds, keyed on the target phase like the shell script."""
+    if target == "plan" and plan_iteration >= limits.max_plan:
+        return [
+            AuditFinding(
+                "warn",
+                f"Plan iteration {plan_iteration} >= max {limits.max_plan} "
+                "(iteration bounds exceeded)",
+            )
+        ]
+    if (target == "fixing" or (target == "reviewing" and source == "fixing")) and (
+        fix_iteration >= limits.max_fix
+    ):
+        return [
+            AuditFinding(
+                "warn",
+                f"Fix iteration {fix_iteration} >= max {limits.max_fix} "
+                "(iteration bounds exceeded)",
+            )
+        ]
+    return []
+
+
+def _has_file(directory: Path) -> bool:
+    if not directory.is_dir():
+        return False
+    for _root, _dirs, filenames in os.walk(directory):
+        if filenames:
+            return True
+    return False
+
+
+def _jq_text(value: object) -> str:
+    """Format a JSON value the way ``jq -r`` prints it."""
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Exit code 1 if any quest fails."""
+    parser = argparse.ArgumentParser(
+        description="Audit state and handoff files for every quest under .quest"
+    )
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--target",
+        choices=PHASES,
+        default=None,
+        help="Check this transition for every quest (like validate-quest-state.sh).",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit a JSON report.")
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Worker processes. Default: CPU count."
+    )
+    args = parser.parse_args(argv)
+
+    repo_root = Path(args.repo_root).resolve()
+    limits, limit_warnings = load_limits(repo_root)
+    for warning in limit_warnings:
+        print(f"[WARN] {warning}", file=sys.stderr)
+
+    audits = audit_quests(repo_root / ".quest", limits, args.target, args.jobs)
+
+    if args.json:
+        report = {
+            "quests": len(audits),
+            "failed": sum(1 for a in audits if a.failed),
+            "limits": {"max_plan_iterations": limits.max_plan, "max_fix_iterations": limits.max_fix},
+            "results": [
+                {
+                    "quest": a.quest,
+                    "phase": a.phase,
+                    "transition": a.transition,
+                    "findings": [{"level": f.level, "message": f.message} for f in a.findings],
+                }
+                for a in audits
+            ],
+        }
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(audits), end="")
+
+    return 1 if any(a.failed for a in audits) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
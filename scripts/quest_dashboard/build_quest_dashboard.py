@@ -5,20 +5,35 @@ Usage:
     python3 scripts/quest_dashboard/build_quest_dashboard.py
     python3 scripts/quest_dashboard/build_quest_dashboard.py --output custom/path.html
     python3 scripts/quest_dashboard/build_quest_dashboard.py --github-url https://github.com/owner/repo
+    python3 scripts/quest_dashboard/build_quest_dashboard.py --detail-pages
+    python3 scripts/quest_dashboard/build_quest_dashboard.py --shard-portfolio year
+    python3 scripts/quest_dashboard/build_quest_dashboard.py --if-changed
+    python3 scripts/quest_dashboard/build_quest_dashboard.py --history
+    python3 scripts/quest_dashboard/build_quest_dashboard.py --ref v1.2.0
 """
 
 import argparse
+import json
 import sys
 from pathlib import Path
 
-# Prefer installed package; fall back to sys.path for direct script execution
+# Prefer installed package; fall back to sys.path for direct script execution.
+# Only the lock and stamp modules are imported up front so --if-changed can
+# exit before the loaders, renderer and subprocess are imported (see _build()).
 try:
-    from quest_dashboard.loaders import load_dashboard_data
-    from quest_dashboard.render import render_dashboard
+    from quest_dashboard.buildlock import run_coalesced
+    from quest_dashboard.stamp import compute_fingerprint, is_up_to_date, write_stamp
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-    from quest_dashboard.loaders import load_dashboard_data
-    from quest_dashboard.render import render_dashboard
+    from quest_dashboard.buildlock import run_coalesced
+    from quest_dashboard.stamp import compute_fingerprint, is_up_to_date, write_stamp
+
+# Mirrors shards.SHARD_CHOICES without importing the renderer
+SHARD_CHOICES = ("year", "quarter")
+
+# Stats history store for --history, relative to the repo root (gitignored).
+# Fixed rather than next to the output, so CI output directories never publish it.
+DEFAULT_HISTORY_FILE = "docs/dashboard/stats-history.ndjson"
 
 
 def parse_args(argv=None):
@@ -31,6 +46,11 @@ Examples:
   python3 scripts/quest_dashboard/build_quest_dashboard.py
   python3 scripts/quest_dashboard/build_quest_dashboard.py --output docs/custom.html
   python3 scripts/quest_dashboard/build_quest_dashboard.py --github-url https://github.com/owner/repo
+  python3 scripts/quest_dashboard/build_quest_dashboard.py --detail-pages --jobs 8
+  python3 scripts/quest_dashboard/build_quest_dashboard.py --shard-portfolio quarter
+  python3 scripts/quest_dashboard/build_quest_dashboard.py --if-changed   # git hooks
+  python3 scripts/quest_dashboard/build_quest_dashboard.py --ref release/1.2 \
+      --output docs/dashboard/release-1.2.html
         """,
     )
     parser.add_argument(
@@ -48,7 +68,145 @@ Examples:
         default=None,
         help="GitHub repo URL. Auto-detected from git remote if omitted.",
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--ref",
+        default=None,
+        help="Read quest data from this git branch, tag or commit instead of the "
+        "working tree (no checkout needed). Stamp, report and cache files are "
+        "named after the output.",
+    )
+    parser.add_argument(
+        "--event-log",
+        action="store_true",
+        help="Update active quests from .quest/events.ndjson (written by quest-state): "
+        "only quests named since the last build are re-read.",
+    )
+    parser.add_argument(
+        "--detail-pages",
+        action="store_true",
+        help="Also write one detail page per quest to a quests/ directory next to the output.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for detail pages. Default: CPU count.",
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help=f"Record this build in the stats history and chart it (default store: "
+        f"{DEFAULT_HISTORY_FILE}).",
+    )
+    parser.add_argument(
+        "--history-file",
+        default=None,
+        help="Stats history NDJSON path (relative to repo root or absolute); implies "
+        f"--history. Default: {DEFAULT_HISTORY_FILE}.",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help=argparse.SUPPRESS,  # History is off by default; accepted for old hooks
+    )
+    parser.add_argument(
+        "--no-analytics",
+        action="store_true",
+        help="Skip the lead-time, iteration and throughput panels.",
+    )
+    parser.add_argument(
+        "--phase-history",
+        action="store_true",
+        help="Mine state.json git history for time-in-phase (incremental, cached "
+        "in .phase-history-cache.json next to the output).",
+    )
+    parser.add_argument(
+        "--shard-portfolio",
+        choices=SHARD_CHOICES,
+        default=None,
+        help="Inline only the current year/quarter of quests; lazy-load older "
+        "periods from portfolio/ fragments next to the output.",
+    )
+    parser.add_argument(
+        "--if-changed",
+        action="store_true",
+        help="Skip the build when inputs and output match the stamp file.",
+    )
+    parser.add_argument(
+        "--stamp-file",
+        default=None,
+        help="Stamp path for --if-changed. Default: .build-stamp.json next to the output.",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Write Prometheus textfile metrics (.prom) to this path "
+        "(relative to repo root or absolute).",
+    )
+    parser.add_argument(
+        "--diagnostics-file",
+        default=None,
+        help="Full JSON report of build warnings (relative to repo root or absolute). "
+        "Default: diagnostics.json next to the output.",
+    )
+    parser.add_argument(
+        "--audit",
+        action="store_true",
+        help="Audit every quest's state and handoff files and show findings as warnings.",
+    )
+    parser.add_argument(
+        "--validate-handoffs",
+        action="store_true",
+        help="Validate every handoff*.json against .ai/schemas/handoff.schema.json "
+        "and show per-role violation rates.",
+    )
+    parser.add_argument(
+        "--artifact-sizes",
+        action="store_true",
+        help="Measure every quest's phase artifacts in bytes and tokens and show "
+        "growth across plan and fix iterations (cached in .artifact-sizes-cache.json).",
+    )
+    parser.add_argument(
+        "--artifact-budget",
+        type=int,
+        default=None,
+        metavar="TOKENS",
+        help="Flag quests whose artifacts exceed this many tokens (with --artifact-sizes). "
+        "Default: 40000.",
+    )
+    parser.add_argument(
+        "--quest-index",
+        action="store_true",
+        help="Also update the generated table in .quest/README.md (only rows of "
+        "changed quests are rewritten; text outside the markers is kept).",
+    )
+    parser.add_argument(
+        "--no-lock",
+        action="store_true",
+        help="Build without the output-directory lock (no request coalescing).",
+    )
+    args = parser.parse_args(argv)
+    if args.artifact_budget is not None and not args.artifact_sizes:
+        parser.error("--artifact-budget requires --artifact-sizes")
+    if args.ref:
+        working_tree_only = [
+            flag
+            for flag, enabled in (
+                ("--event-log", args.event_log),
+                ("--detail-pages", args.detail_pages),
+                ("--audit", args.audit),
+                ("--validate-handoffs", args.validate_handoffs),
+                ("--artifact-sizes", args.artifact_sizes),
+                ("--quest-index", args.quest_index),
+            )
+            if enabled
+        ]
+        if working_tree_only:
+            parser.error(f"--ref cannot be combined with {', '.join(working_tree_only)}")
+        if args.history and not args.history_file:
+            # The default store charts working-tree builds; a ref gets its own trend
+            parser.error("--ref --history needs an explicit --history-file")
+    return args
 
 
 def main(argv=None):
@@ -68,26 +226,309 @@ def main(argv=None):
     else:
         output_path = (repo_root / args.output).resolve()
 
+    if args.no_lock:
+        return _build_if_needed(args, repo_root, output_path)
+
+    # Coalesce concurrent requests: one build at a time, plus one follow-up
+    # per distinct request that arrived while it ran. A queued request may be
+    # built by another process, so its paths are made absolute first.
+    request = {**vars(args), "repo_root": str(repo_root), "output": str(output_path)}
+    if args.stamp_file:
+        request["stamp_file"] = str(Path(args.stamp_file).resolve())
+    result, _ = run_coalesced(
+        output_path.parent,
+        json.dumps(request, sort_keys=True),
+        lambda queued: _build_queued(json.loads(queued)),
+    )
+    if result is None:
+        print(f"Dashboard build already running; request queued: {output_path}")
+        return 0
+    return result
+
+
+def _build_queued(request: dict) -> int:
+    """Build one request read back from the pending marker."""
+    args = argparse.Namespace(**request)
+    return _build_if_needed(args, Path(args.repo_root), Path(args.output))
+
+
+def _build_if_needed(args, repo_root: Path, output_path: Path) -> int:
+    """Build unless --if-changed finds the stamp current."""
+    # No-op fast path: compare stat-only fingerprints before heavy imports
+    fingerprint = None
+    if args.if_changed:
+        stamp_path = (
+            Path(args.stamp_file).resolve()
+            if args.stamp_file
+            else _build_state_path(output_path, ".build-stamp.json", args.ref)
+        )
+        ignored = ("if_changed", "stamp_file", "jobs", "no_lock", "repo_root", "output")
+        options = {
+            key: value for key, value in vars(args).items() if key not in ignored
+        }
+        options["output"] = str(output_path)
+        fingerprint = compute_fingerprint(repo_root, options)
+        if is_up_to_date(stamp_path, fingerprint, output_path):
+            print(f"Dashboard up to date: {output_path}")
+            return 0
+
+    result = _build(args, repo_root, output_path)
+
+    if fingerprint is not None:
+        write_stamp(stamp_path, fingerprint, output_path)
+    return result
+
+
+def _build_state_path(output_path: Path, name: str, ref: str | None) -> Path:
+    """Report or cache file next to the output, named per output for --ref builds.
+
+    A ref build usually writes next to the working-tree dashboard (e.g.
+    docs/dashboard/release-1.2.html); prefixing the output's stem keeps it
+    from overwriting that build's diagnostics.json or thrashing its caches.
+    """
+    if not ref:
+        return output_path.parent / name
+    dot = "." if name.startswith(".") else ""
+    return output_path.parent / f"{dot}{output_path.stem}.{name.lstrip('.')}"
+
+
+def _build(args, repo_root: Path, output_path: Path) -> int:
+    """Load quest data, render the dashboard and write all outputs."""
+    from quest_dashboard.metrics import BuildMetrics, format_metrics, write_metrics
+
+    metrics = BuildMetrics()
+    with metrics.stage("import"):
+        from quest_dashboard import artifacts, gitmeta, phase_history
+        from quest_dashboard.analytics import compute_analytics
+        from quest_dashboard.audit import audit_quests, audit_warnings, load_limits
+        from quest_dashboard.columnar import QuestTable
+        from quest_dashboard.diagnostics import (
+            REPORT_NAME,
+            group_diagnostics,
+            summary_lines,
+            write_report,
+        )
+        from quest_dashboard.fsutil import write_atomic
+        from quest_dashboard.handoff import CACHE_NAME, SCHEMA_PATH, role_stats, scan_handoffs
+        from quest_dashboard.history import append_snapshot, take_snapshot
+        from quest_dashboard.loaders import ACTIVE_CACHE_NAME, load_dashboard_data
+        from quest_dashboard.models import Diagnostic
+        from quest_dashboard.pages import write_detail_pages
+        from quest_dashboard.quest_index import INDEX_PATH, update_quest_index
+        from quest_dashboard.render import render_dashboard
+        from quest_dashboard.shards import write_portfolio_shards
+    git_processes_before = gitmeta.git_process_count()
+
     # Load dashboard data (github_url wired per Arbiter Note 4)
-    data = load_dashboard_data(repo_root, github_url=args.github_url)
+    with metrics.stage("load"):
+        try:
+            data = load_dashboard_data(
+                repo_root,
+                github_url=args.github_url,
+                ref=args.ref,
+                active_cache=output_path.parent / ACTIVE_CACHE_NAME if args.event_log else None,
+            )
+        except (OSError, ValueError) as e:
+            if not args.ref:
+                raise
+            print(f"Error: cannot read quest data at {args.ref}: {e}", file=sys.stderr)
+            return 1
+
+    # Surface state/handoff audit findings as dashboard warnings
+    if args.audit:
+        with metrics.stage("audit"):
+            limits, limit_warnings = load_limits(repo_root)
+            audits = audit_quests(repo_root / ".quest", limits, workers=args.jobs)
+        data.warnings.extend(
+            Diagnostic("allowlist-limit", message, ".ai/allowlist.json")
+            for message in limit_warnings
+        )
+        data.warnings.extend(audit_warnings(audits))
+
+    # Check handoff files against the schema (cached by content hash)
+    handoff_stats = []
+    if args.validate_handoffs:
+        schema_path = repo_root / SCHEMA_PATH
+        if schema_path.is_file():
+            with metrics.stage("handoffs"):
+                scan = scan_handoffs(
+                    repo_root / ".quest", schema_path, output_path.parent / CACHE_NAME
+                )
+            handoff_stats = role_stats(scan.results)
+            metrics.cache_hits["handoffs"] = scan.cached
+        else:
+            data.warnings.append(
+                Diagnostic(
+                    "handoff-schema-missing",
+                    f"Handoff schema not found: {SCHEMA_PATH}",
+                    SCHEMA_PATH.as_posix(),
+                )
+            )
+
+    # Artifact bytes and tokens per quest (unchanged files are not re-read)
+    artifact_scan = None
+    artifact_budget = (
+        artifacts.DEFAULT_BUDGET if args.artifact_budget is None else args.artifact_budget
+    )
+    if args.artifact_sizes:
+        with metrics.stage("artifacts"):
+            artifact_scan = artifacts.scan_artifacts(
+                repo_root / ".quest",
+                output_path.parent / artifacts.CACHE_NAME,
+                budget=artifact_budget,
+            )
+        metrics.cache_hits["artifacts"] = artifact_scan.cached
+        data.warnings.extend(
+            Diagnostic(
+                "artifact-budget",
+                f"Artifacts over budget: {quest.quest_id}: {quest.tokens} tokens"
+                f" (budget {artifact_budget}, largest {quest.largest})",
+                quest.quest_id,
+            )
+            for quest in artifact_scan.over_budget
+        )
+
+    # Record this build's counts and read back the history for trend charts
+    history = None
+    if (args.history or args.history_file) and not args.no_history:
+        history_file = Path(args.history_file or DEFAULT_HISTORY_FILE)
+        history_path = history_file if history_file.is_absolute() else repo_root / history_file
+        with metrics.stage("history"):
+            history = append_snapshot(history_path, take_snapshot(data))
+
+    # Lead time, iteration histograms and weekly throughput (one columnar pass)
+    analytics = None
+    if not args.no_analytics:
+        with metrics.stage("analytics"):
+            analytics = compute_analytics(
+                QuestTable.from_dashboard_data(data), data.generated_at.date()
+            )
+
+    # Time in each phase, replayed from the state.json history (new commits only)
+    phases = None
+    if args.phase_history:
+        with metrics.stage("phase_history"):
+            phases = phase_history.mine_phase_history(
+                repo_root,
+                _build_state_path(output_path, phase_history.CACHE_NAME, args.ref),
+                rev=args.ref or "HEAD",
+            )
+        metrics.cache_hits["phase_history"] = int(phases.incremental)
+
+    # Render per-quest detail pages (only changed pages are rewritten)
+    detail_links = None
+    pages = None
+    if args.detail_pages:
+        with metrics.stage("detail_pages"):
+            pages = write_detail_pages(
+                data,
+                repo_root,
+                output_path.parent / "quests",
+                index_href=f"../{output_path.name}",
+                workers=args.jobs,
+            )
+        detail_links = pages.links
+        metrics.cache_hits["detail_pages"] = pages.unchanged
+
+    # Keep the .quest/README.md index table in step with the same model
+    quest_index = None
+    if args.quest_index:
+        with metrics.stage("quest_index"):
+            quest_index = update_quest_index(repo_root, data)
+        metrics.cache_hits["quest_index"] = quest_index.rows - quest_index.rewritten
+
+    # Write older portfolio periods to content-addressed fragments
+    shards = []
+    if args.shard_portfolio:
+        with metrics.stage("shards"):
+            shards = write_portfolio_shards(
+                data, output_path.parent, args.shard_portfolio, detail_links
+            )
+
+    # Every distinct warning goes to the JSON report; the page links to it
+    if args.diagnostics_file is None:
+        diagnostics_path = _build_state_path(output_path, REPORT_NAME, args.ref)
+    elif Path(args.diagnostics_file).is_absolute():
+        diagnostics_path = Path(args.diagnostics_file)
+    else:
+        diagnostics_path = repo_root / args.diagnostics_file
+    try:
+        diagnostics_href = diagnostics_path.relative_to(output_path.parent).as_posix()
+    except ValueError:
+        diagnostics_href = None
 
     # Render HTML
-    html = render_dashboard(data, output_path, repo_root)
+    with metrics.stage("render"):
+        html = render_dashboard(
+            data,
+            output_path,
+            repo_root,
+            detail_links=detail_links,
+            history=history,
+            shard_by=args.shard_portfolio,
+            portfolio_shards=shards,
+            handoff_stats=handoff_stats,
+            analytics=analytics,
+            diagnostics_href=diagnostics_href,
+            phase_dwell=phases.dwell if phases is not None else (),
+            artifact_sizes=artifact_scan.quests if artifact_scan is not None else (),
+            artifact_budget=artifact_budget if artifact_scan is not None else None,
+        )
+
+    # Publish atomically so readers never see a torn index
+    with metrics.stage("write"):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(output_path, html)
+        write_report(diagnostics_path, data.warnings, data.generated_at)
+    metrics.output_bytes = len(html.encode("utf-8"))
 
-    # Write output
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(html, encoding="utf-8")
+    # Export build health and KPI gauges for node_exporter's textfile collector
+    if args.metrics_file:
+        metrics.git_processes = gitmeta.git_process_count() - git_processes_before
+        metrics.cache_hits["git_metadata"] = gitmeta.cache_hits()
+        metrics_path = Path(args.metrics_file)
+        if not metrics_path.is_absolute():
+            metrics_path = repo_root / metrics_path
+        write_metrics(metrics_path, format_metrics(metrics, data))
 
     # Print summary
     print(f"Dashboard built: {output_path}")
+    if args.ref:
+        print(f"  Source: {args.ref}")
     print(f"  Finished: {len(data.finished_quests)}")
     print(f"  In Progress: {len(data.active_quests)}")
     print(f"  Abandoned: {len(data.abandoned_quests)}")
+    if pages is not None:
+        print(
+            f"  Detail pages: {pages.written} written, {pages.unchanged} unchanged,"
+            f" {pages.removed} removed"
+        )
+    if args.shard_portfolio:
+        print(f"  Portfolio shards: {len(shards)}")
+    if quest_index is not None:
+        print(
+            f"  Quest index: {INDEX_PATH} {'updated' if quest_index.changed else 'unchanged'},"
+            f" {quest_index.rewritten} of {quest_index.rows} rows rewritten"
+        )
+    if handoff_stats:
+        invalid = sum(s.invalid for s in handoff_stats)
+        total = sum(s.files for s in handoff_stats)
+        print(f"  Handoff files: {invalid} of {total} invalid")
+    if phases is not None:
+        print(
+            f"  Phase history: {phases.quests} quests, {phases.new_commits} new commits,"
+            f" {phases.blobs_read} state blobs read"
+        )
+    if artifact_scan is not None:
+        print(
+            f"  Artifacts: {len(artifact_scan.over_budget)} of {len(artifact_scan.quests)}"
+            f" quests over {artifact_budget} tokens ({artifact_scan.measured} files measured)"
+        )
     print(f"\n  Open in browser: open {output_path}")
 
-    # Print warnings to stderr
-    for warning in data.warnings:
-        print(f"  Warning: {warning}", file=sys.stderr)
+    # Print the top warning groups to stderr (the report has all of them)
+    for line in summary_lines(group_diagnostics(data.warnings), diagnostics_path):
+        print(f"  {line}", file=sys.stderr)
 
     return 0
 
@@ -0,0 +1,152 @@
+"""Advisory build lock with request coalescing.
+
+When several quests finish together, each triggers a dashboard build. Rather
+than racing N full builds on the same output, builders coordinate through two
+files in the output directory:
+
+- ``.build.lock``: advisory lock held by the one process currently building
+- ``.build.pending``: queued requests, one line each (the options to build
+  with); "inputs may have changed, build again"
+
+Every request first appends its line to the pending marker, then tries to
+take the lock without blocking. If the lock is busy, the request returns
+immediately: the running builder will see the marker and do one follow-up
+build for each distinct request that arrived meanwhile. A burst of
+identical requests therefore costs at most about two builds, and a request
+with different options (another ``--output``, ``--ref`` or flag set) is
+built with its own options rather than dropped.
+
+The builder claims the marker (renames it) *before* building, so requests
+arriving mid-build start a new one. After releasing the lock it checks the
+marker once more, closing the window where a request failed to get the
+lock just before it was released.
+
+This module must stay cheap to import (stdlib only); see ``stamp``.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+LOCK_NAME = ".build.lock"
+PENDING_NAME = ".build.pending"
+CLAIMED_SUFFIX = ".claimed"
+
+
+class BuildLock:
+    """Non-blocking advisory lock on a file (flock on POSIX, msvcrt on Windows)."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: int | None = None
+
+    def try_acquire(self) -> bool:
+        """Take the lock if it is free. Returns False if another holder has it."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Release the lock (no-op if not held)."""
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+def run_coalesced(
+    output_dir: Path, request: str, build: Callable[[str], int]
+) -> tuple[int | None, int]:
+    """Run build() under the output directory's lock, coalescing concurrent requests.
+
+    Args:
+        output_dir: Directory holding the lock and pending marker
+        request: This request's build options, serialized on one line
+        build: Performs one full build for a request and returns its exit code
+
+    Returns:
+        Tuple of (exit code of the last build, number of builds run). The
+        exit code is None when this request was handed to a running builder.
+    """
+    if "\n" in request:
+        raise ValueError("build request must be a single line")
+    pending = output_dir / PENDING_NAME
+    lock = BuildLock(output_dir / LOCK_NAME)
+    _append_request(pending, request)
+
+    result: int | None = None
+    builds = 0
+    while lock.try_acquire():
+        try:
+            while requests := _claim(pending):
+                for queued in requests:
+                    result = build(queued)
+                    builds += 1
+        finally:
+            lock.release()
+        # A request may have touched the marker and failed to get the lock
+        # just before we released it; loop to pick it up.
+        if not pending.exists():
+            break
+    return result, builds
+
+
+def _append_request(path: Path, request: str) -> None:
+    """Append one request line to the marker, surviving a concurrent claim.
+
+    A builder may rename the marker between our open and our write. If the
+    file we wrote to is no longer the marker, append again: a request may
+    then be built twice, but never lost.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = (request + "\n").encode("utf-8")
+    while True:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            os.write(fd, line)
+            written = os.fstat(fd).st_ino
+        finally:
+            os.close(fd)
+        try:
+            if os.stat(path).st_ino == written:
+                return
+        except FileNotFoundError:
+            pass
+
+
+def _claim(path: Path) -> list[str]:
+    """Take the marker; its distinct requests in arrival order (empty if absent)."""
+    claimed = path.with_name(path.name + CLAIMED_SUFFIX)
+    try:
+        os.replace(path, claimed)
+    except FileNotFoundError:
+        return []
+    try:
+        text = claimed.read_text(encoding="utf-8")
+    finally:
+        claimed.unlink(missing_ok=True)
+    return list(dict.fromkeys(line for line in text.splitlines() if line))
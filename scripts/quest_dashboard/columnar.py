@@ -0,0 +1,313 @@
+"""Columnar quest table for large aggregates.
+
+``DashboardData`` keeps one dataclass per quest, each with its own strings
+and date objects. That is fine for a single repo but costs hundreds of
+bytes per quest in org-wide aggregates. ``QuestTable`` stores the same
+data column-wise:
+- ``array``-backed ordinal dates, month indexes and UTC timestamps
+- Small-int codes for kind, status, phase and chart category
+- Interned vocabularies for status and phase strings
+- One concatenated string buffer plus offsets per text field
+
+Conversion to and from the dataclasses is lossless, and the stats and
+chart helpers in ``render.py`` accept a ``QuestTable`` directly.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Union
+
+from .models import ActiveQuest, DashboardData, JournalEntry
+
+UTC = timezone.utc
+
+# Row kinds (which DashboardData list a row belongs to)
+KIND_FINISHED = 0
+KIND_ABANDONED = 1
+KIND_ACTIVE = 2
+
+# Chart categories, in the order used by the category column
+CATEGORIES = ("finished", "abandoned", "in_progress", "blocked", "unknown")
+_CATEGORY_CODE = {name: code for code, name in enumerate(CATEGORIES)}
+
+# Sentinel for missing optional integers (pr_number, iterations)
+_MISSING = -1
+
+# Sentinel utc_offset for naive updated_at values (stored as if UTC)
+_NAIVE = -(2**31)
+
+# Text fields stored in string buffers
+# (journal_path is "" for active rows, quest_path is "" for journals/None)
+_TEXT_FIELDS = (
+    "quest_id",
+    "slug",
+    "title",
+    "elevator_pitch",
+    "journal_path",
+    "quest_path",
+)
+
+
+def active_category(status: str) -> str:
+    """Chart category for an active quest status.
+
+    Active quests are counted as blocked, unknown, or in progress; any other
+    recognised status (e.g. a stale "Completed") counts as in progress.
+    """
+    lower = status.lower()
+    if "block" in lower:
+        return "blocked"
+    if lower in ("completed", "finished", "abandoned", "in progress", "in_progress"):
+        return "in_progress"
+    return "unknown"
+
+
+class StringTable:
+    """Interned vocabulary mapping strings to small integer codes."""
+
+    __slots__ = ("values", "_codes")
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+        for value in values:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        """Return the code for value, adding it to the table if new."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self._codes[value] = code
+        return code
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class TextColumn:
+    """Variable-length strings stored as one buffer plus end offsets."""
+
+    __slots__ = ("buffer", "offsets")
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        parts: list[str] = []
+        self.offsets = array("Q")
+        end = 0
+        for value in values:
+            parts.append(value)
+            end += len(value)
+            self.offsets.append(end)
+        self.buffer = "".join(parts)
+
+    def __getitem__(self, index: int) -> str:
+        start = self.offsets[index - 1] if index > 0 else 0
+        return self.buffer[start : self.offsets[index]]
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+
+def _int_or_missing(value: int | None) -> int:
+    return _MISSING if value is None else value
+
+
+def _missing_to_none(value: int) -> int | None:
+    return None if value == _MISSING else value
+
+
+class QuestTable:
+    """Column-oriented, string-interned storage for many quests.
+
+    Rows are ordered finished, then abandoned, then active, each group in
+    its original list order, so ``to_dashboard_data()`` round-trips.
+    """
+
+    __slots__ = (
+        "kind",
+        "status",
+        "phase",
+        "category",
+        "day",
+        "month",
+        "timestamp",
+        "utc_offset",
+        "pr_number",
+        "plan_iterations",
+        "fix_iterations",
+        "statuses",
+        "phases",
+        "text",
+    )
+
+    def __init__(self) -> None:
+        self.kind = array("B")  # KIND_* code
+        self.status = array("H")  # code into self.statuses
+        self.phase = array("H")  # code into self.phases (0 = "" for journals)
+        self.category = array("B")  # code into CATEGORIES
+        self.day = array("l")  # date.toordinal() of completion/update date
+        self.month = array("l")  # year * 12 + (month - 1)
+        self.timestamp = array("d")  # updated_at POSIX time (active rows only)
+        self.utc_offset = array("l")  # updated_at UTC offset seconds (or _NAIVE)
+        self.pr_number = array("l")
+        self.plan_iterations = array("l")
+        self.fix_iterations = array("l")
+        self.statuses = StringTable()
+        self.phases = StringTable([""])
+        self.text: dict[str, TextColumn] = {}
+
+    @classmethod
+    def from_quests(
+        cls,
+        finished: Iterable[JournalEntry],
+        abandoned: Iterable[JournalEntry],
+        active: Iterable[ActiveQuest],
+    ) -> QuestTable:
+        """Build a table from the three dataclass lists."""
+        table = cls()
+        text: dict[str, list[str]] = {name: [] for name in _TEXT_FIELDS}
+
+        def add_journal(entry: JournalEntry, kind: int) -> None:
+            table.kind.append(kind)
+            table.status.append(table.statuses.code(entry.status))
+            table.phase.append(0)
+            table.category.append(kind)  # finished/abandoned share codes 0/1
+            table.day.append(entry.completed_date.toordinal())
+            table.month.append(
+                entry.completed_date.year * 12 + entry.completed_date.month - 1
+            )
+            table.timestamp.append(0.0)
+            table.utc_offset.append(0)
+            table.pr_number.append(_int_or_missing(entry.pr_number))
+            table.plan_iterations.append(_int_or_missing(entry.plan_iterations))
+            table.fix_iterations.append(_int_or_missing(entry.fix_iterations))
+            text["quest_id"].append(entry.quest_id)
+            text["slug"].append(entry.slug)
+            text["title"].append(entry.title)
+            text["elevator_pitch"].append(entry.elevator_pitch)
+            text["journal_path"].append(entry.journal_path.as_posix())
+            text["quest_path"].append("")
+
+        for entry in finished:
+            add_journal(entry, KIND_FINISHED)
+        for entry in abandoned:
+            add_journal(entry, KIND_ABANDONED)
+
+        for quest in active:
+            offset = quest.updated_at.utcoffset()
+            aware = quest.updated_at if offset is not None else quest.updated_at.replace(
+                tzinfo=UTC
+            )
+            table.kind.append(KIND_ACTIVE)
+            table.status.append(table.statuses.code(quest.status))
+            table.phase.append(table.phases.code(quest.phase))
+            table.category.append(_CATEGORY_CODE[active_category(quest.status)])
+            table.day.append(quest.updated_at.toordinal())
+            table.month.append(quest.updated_at.year * 12 + quest.updated_at.month - 1)
+            table.timestamp.append(aware.timestamp())
+            table.utc_offset.append(
+                _NAIVE if offset is None else int(offset.total_seconds())
+            )
+            table.pr_number.append(_MISSING)
+            table.plan_iterations.append(_int_or_missing(quest.plan_iterations))
+            table.fix_iterations.append(_int_or_missing(quest.fix_iterations))
+            text["quest_id"].append(quest.quest_id)
+            text["slug"].append(quest.slug)
+            text["title"].append(quest.title)
+            text["elevator_pitch"].append(quest.elevator_pitch)
+            text["journal_path"].append("")
+            text["quest_path"].append(
+                quest.quest_path.as_posix() if quest.quest_path else ""
+            )
+
+        table.text = {name: TextColumn(values) for name, values in text.items()}
+        return table
+
+    @classmethod
+    def from_dashboard_data(cls, data: DashboardData) -> QuestTable:
+        """Build a table from an existing DashboardData."""
+        return cls.from_quests(
+            data.finished_quests, data.abandoned_quests, data.active_quests
+        )
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def row(self, index: int) -> Union[JournalEntry, ActiveQuest]:
+        """Materialize one row back into its dataclass."""
+        text = {name: column[index] for name, column in self.text.items()}
+        if self.kind[index] == KIND_ACTIVE:
+            offset = self.utc_offset[index]
+            if offset == _NAIVE:
+                updated_at = datetime.fromtimestamp(self.timestamp[index], tz=UTC)
+                updated_at = updated_at.replace(tzinfo=None)
+            else:
+                tz = timezone(timedelta(seconds=offset))
+                updated_at = datetime.fromtimestamp(self.timestamp[index], tz=tz)
+            return ActiveQuest(
+                quest_id=text["quest_id"],
+                slug=text["slug"],
+                title=text["title"],
+                elevator_pitch=text["elevator_pitch"],
+                status=self.statuses[self.status[index]],
+                phase=self.phases[self.phase[index]],
+                updated_at=updated_at,
+                plan_iterations=_missing_to_none(self.plan_iterations[index]),
+                fix_iterations=_missing_to_none(self.fix_iterations[index]),
+                quest_path=Path(text["quest_path"]) if text["quest_path"] else None,
+            )
+        return JournalEntry(
+            quest_id=text["quest_id"],
+            slug=text["slug"],
+            title=text["title"],
+            elevator_pitch=text["elevator_pitch"],
+            status=self.statuses[self.status[index]],
+            completed_date=date.fromordinal(self.day[index]),
+            journal_path=Path(text["journal_path"]),
+            pr_number=_missing_to_none(self.pr_number[index]),
+            plan_iterations=_missing_to_none(self.plan_iterations[index]),
+            fix_iterations=_missing_to_none(self.fix_iterations[index]),
+        )
+
+    def __iter__(self) -> Iterator[Union[JournalEntry, ActiveQuest]]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def to_dashboard_data(self, **kwargs) -> DashboardData:
+        """Materialize a DashboardData; kwargs pass through (warnings, etc.)."""
+        groups: dict[int, list] = {KIND_FINISHED: [], KIND_ABANDONED: [], KIND_ACTIVE: []}
+        for index in range(len(self)):
+            groups[self.kind[index]].append(self.row(index))
+        return DashboardData(
+            finished_quests=groups[KIND_FINISHED],
+            active_quests=groups[KIND_ACTIVE],
+            abandoned_quests=groups[KIND_ABANDONED],
+            **kwargs,
+        )
+
+    def category_counts(self) -> dict[str, int]:
+        """Count rows per chart category without materializing rows."""
+        raw = self.category.tobytes()
+        return {name: raw.count(bytes((code,))) for code, name in enumerate(CATEGORIES)}
+
+    def monthly_category_counts(self) -> dict[str, dict[str, int]]:
+        """Count rows per ``YYYY-MM`` month and chart category."""
+        counts: dict[int, list[int]] = {}
+        for month, category in zip(self.month, self.category):
+            bucket = counts.get(month)
+            if bucket is None:
+                bucket = counts[month] = [0] * len(CATEGORIES)
+            bucket[category] += 1
+
+        return {
+            f"{month // 12:04d}-{month % 12 + 1:02d}": dict(zip(CATEGORIES, bucket))
+            for month, bucket in counts.items()
+        }
@@ -0,0 +1,115 @@
+"""Grouping, capping and reporting of build diagnostics.
+
+Loaders and build stages record ``Diagnostic`` values (code, file, message)
+in ``DashboardData.warnings``. A broken journal format can produce one per
+file, so nothing shows them one by one:
+- ``group_diagnostics`` drops exact repeats and groups by code, most
+  frequent first, keeping a few samples per group
+- The HTML page and stderr show only the top groups (``summary_lines``),
+  so their size does not grow with the number of broken files
+- ``write_report`` writes every distinct diagnostic to a JSON report
+  (``diagnostics.json`` next to the output)
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
+
+from .fsutil import write_atomic
+from .models import Diagnostic, DiagnosticGroup
+
+REPORT_NAME = "diagnostics.json"
+REPORT_VERSION = 1
+
+# Groups and samples per group shown on the page and on stderr
+MAX_GROUPS = 8
+SAMPLES_PER_GROUP = 3
+
+# Longer messages (e.g. embedded exception text) are cut in the summary
+MAX_MESSAGE_CHARS = 300
+
+
+def group_diagnostics(
+    diagnostics: Iterable[Diagnostic], samples: int = SAMPLES_PER_GROUP
+) -> list[DiagnosticGroup]:
+    """Group distinct diagnostics by code, most frequent code first.
+
+    Args:
+        diagnostics: Diagnostics in the order they were recorded
+        samples: Diagnostics kept per group, first recorded first
+
+    Returns:
+        Groups sorted by count (descending), then code
+    """
+    seen: set[Diagnostic] = set()
+    counts: dict[str, int] = {}
+    kept: dict[str, list[Diagnostic]] = {}
+    for diagnostic in diagnostics:
+        if diagnostic in seen:
+            continue
+        seen.add(diagnostic)
+        counts[diagnostic.code] = counts.get(diagnostic.code, 0) + 1
+        group = kept.setdefault(diagnostic.code, [])
+        if len(group) < samples:
+            group.append(diagnostic)
+    return [
+        DiagnosticGroup(code=code, count=count, samples=tuple(kept[code]))
+        for code, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    ]
+
+
+def shorten(message: str, limit: int = MAX_MESSAGE_CHARS) -> str:
+    """Cut a message to at most limit characters, marking the cut."""
+    return message if len(message) <= limit else message[: limit - 1] + "…"
+
+
+def summary_lines(
+    groups: list[DiagnosticGroup], report_path: Path | None = None
+) -> list[str]:
+    """Plain-text summary of the top groups, for stderr."""
+    lines = []
+    for group in groups[:MAX_GROUPS]:
+        lines.append(f"Warning [{group.code}] x{group.count}")
+        lines.extend(f"  {shorten(d.message)}" for d in group.samples)
+        if group.count > len(group.samples):
+            lines.append(f"  ... and {group.count - len(group.samples)} more")
+    hidden = groups[MAX_GROUPS:]
+    if hidden:
+        lines.append(
+            f"... and {sum(g.count for g in hidden)} more in {len(hidden)} other codes"
+        )
+    if report_path is not None and groups:
+        lines.append(f"Full list: {report_path}")
+    return lines
+
+
+def build_report(diagnostics: list[Diagnostic], generated_at: datetime) -> dict:
+    """Every distinct diagnostic, grouped by code, as a JSON-ready dict."""
+    groups = group_diagnostics(diagnostics, samples=len(diagnostics))
+    return {
+        "version": REPORT_VERSION,
+        "generated_at": generated_at.isoformat(),
+        "total": len(diagnostics),
+        "distinct": sum(g.count for g in groups),
+        "groups": [
+            {
+                "code": group.code,
+                "count": group.count,
+                "diagnostics": [{"file": d.file, "message": d.message} for d in group.samples],
+            }
+            for group in groups
+        ],
+    }
+
+
+def write_report(path: Path, diagnostics: list[Diagnostic], generated_at: datetime) -> None:
+    """Atomically write the full diagnostics report (also when there are none).
+
+    Writing an empty report keeps a stale one from outliving its problems.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = build_report(diagnostics, generated_at)
+    write_atomic(path, json.dumps(report, indent=2, ensure_ascii=False) + "\n")
@@ -0,0 +1,383 @@
+"""Diff sizer for the ``review_mode: auto`` fast-review decision.
+
+Step 5 of the quest workflow picks fast or full code review by diff size:
+fast when the change touches at most ``fast_review_thresholds.max_files``
+files and ``max_loc`` added plus deleted lines. This module computes
+that from git instead of having an agent read the diff:
+
+- ``git diff --numstat -z <base>`` gives per-file added/deleted lines of
+  the working tree against the quest's base, renames included. Untracked,
+  non-ignored files count as added in full (the builder's new files are
+  usually not staged yet). Binary files count as files with 0 lines.
+- The base is ``--base``, else ``base_commit`` from the quest's
+  state.json, else the merge base of HEAD with the default branch
+  (``origin/HEAD``, ``main`` or ``master``), else HEAD.
+- Paths matching ``fast_review_thresholds.exclude`` globs (plus
+  ``.quest/*``) are left out. A glob without ``/`` matches the file name
+  in any directory; ``*`` also matches across directories.
+
+The verdict is written to ``<quest>/phase_03_review/review_mode.json``
+for the orchestrator to read:
+
+    {"v": 1, "verdict": "fast", "reason": "3 files, 120 LOC within 5 files, 200 LOC",
+     "review_mode": "auto", "files": 3, "loc": 120, ...}
+
+Usage:
+    PYTHONPATH=scripts python3 -m quest_dashboard.diffsize .quest/<id>
+    PYTHONPATH=scripts python3 -m quest_dashboard.diffsize .quest/<id> --base main --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from .fsutil import write_atomic
+from .gitmeta import run_git
+
+VERDICT_PATH = Path("phase_03_review") / "review_mode.json"
+VERDICT_VERSION = 1
+
+DEFAULT_MAX_FILES = 5
+DEFAULT_MAX_LOC = 200
+DEFAULT_REVIEW_MODE = "auto"
+
+# Quest artifacts are never part of the change under review
+ALWAYS_EXCLUDED = (".quest/*",)
+
+_DEFAULT_BRANCHES = ("main", "master")
+_GIT_TIMEOUT = 30
+
+# Bytes read from an untracked file to decide whether it is binary
+_BINARY_SNIFF_BYTES = 8000
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewConfig:
+    """Review settings from ``.ai/allowlist.json``."""
+
+    review_mode: str = DEFAULT_REVIEW_MODE
+    max_files: int = DEFAULT_MAX_FILES
+    max_loc: int = DEFAULT_MAX_LOC
+    exclude: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class FileChange:
+    """Line counts for one changed file."""
+
+    path: str
+    added: int
+    deleted: int
+    binary: bool = False
+    untracked: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class DiffSize:
+    """Changed files of the working tree, counted against a base commit."""
+
+    base: str  # Commit the working tree was compared against
+    base_source: str  # "--base", "state.json", "merge-base <branch>" or "HEAD"
+    changes: list[FileChange]  # Counted files
+    excluded: list[str] = field(default_factory=list)  # Paths left out by exclude globs
+
+    @property
+    def files(self) -> int:
+        return len(self.changes)
+
+    @property
+    def loc(self) -> int:
+        return sum(c.added + c.deleted for c in self.changes)
+
+
+def load_review_config(repo_root: Path) -> tuple[ReviewConfig, list[str]]:
+    """Read review_mode and fast_review_thresholds, falling back to defaults.
+
+    Args:
+        repo_root: Repository root containing ``.ai/allowlist.json``
+
+    Returns:
+        Tuple of (config, warnings for unusable values)
+    """
+    warnings: list[str] = []
+    try:
+        allowlist = json.loads((repo_root / ".ai" / "allowlist.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ReviewConfig(), warnings
+    if not isinstance(allowlist, dict):
+        return ReviewConfig(), warnings
+
+    review_mode = allowlist.get("review_mode", DEFAULT_REVIEW_MODE)
+    if review_mode not in ("auto", "manual", "fast", "full"):
+        warnings.append(f"allowlist review_mode is not valid: '{review_mode}' (using auto)")
+        review_mode = DEFAULT_REVIEW_MODE
+
+    thresholds = allowlist.get("fast_review_thresholds")
+    thresholds = thresholds if isinstance(thresholds, dict) else {}
+    limits = {}
+    for key, default in (("max_files", DEFAULT_MAX_FILES), ("max_loc", DEFAULT_MAX_LOC)):
+        raw = thresholds.get(key)
+        if raw is None:
+            limits[key] = default
+        elif isinstance(raw, int) and not isinstance(raw, bool) and raw >= 1:
+            limits[key] = raw
+        else:
+            warnings.append(
+                f"allowlist fast_review_thresholds.{key} is not a positive integer: "
+                f"'{raw}' (using default {default})"
+            )
+            limits[key] = default
+
+    exclude = thresholds.get("exclude", [])
+    if not isinstance(exclude, list) or not all(isinstance(p, str) for p in exclude):
+        warnings.append("allowlist fast_review_thresholds.exclude is not a list of globs (ignored)")
+        exclude = []
+
+    config = ReviewConfig(review_mode, limits["max_files"], limits["max_loc"], tuple(exclude))
+    return config, warnings
+
+
+def size_diff(
+    repo_root: Path,
+    quest_dir: Path | None = None,
+    base: str | None = None,
+    exclude: tuple[str, ...] = (),
+) -> DiffSize:
+    """Count changed files and lines of the working tree against the quest base.
+
+    Args:
+        repo_root: Repository root
+        quest_dir: Quest directory whose state.json may record ``base_commit``
+        base: Explicit base revision (wins over everything else)
+        exclude: Extra exclude globs, e.g. from ReviewConfig
+
+    Returns:
+        DiffSize
+
+    Raises:
+        RuntimeError: git failed or the base does not resolve
+    """
+    base_rev, base_source = _resolve_base(repo_root, quest_dir, base)
+    result = run_git(
+        ["diff", "--numstat", "-z", "--find-renames", base_rev, "--"], repo_root, _GIT_TIMEOUT
+    )
+    if result is None or result.returncode != 0:
+        detail = result.stderr.strip() if result is not None else "git could not be run"
+        raise RuntimeError(f"git diff against {base_rev} failed: {detail}")
+    changes = parse_numstat(result.stdout)
+
+    untracked = run_git(
+        ["ls-files", "--others", "--exclude-standard", "-z"], repo_root, _GIT_TIMEOUT
+    )
+    if untracked is not None and untracked.returncode == 0:
+        changes.extend(
+            _untracked_change(repo_root, path) for path in untracked.stdout.split("\0") if path
+        )
+
+    patterns = ALWAYS_EXCLUDED + tuple(exclude)
+    counted = [c for c in changes if not _excluded(c.path, patterns)]
+    excluded = sorted(c.path for c in changes if _excluded(c.path, patterns))
+    return DiffSize(base_rev, base_source, counted, excluded)
+
+
+def parse_numstat(output: str) -> list[FileChange]:
+    """Parse ``git diff --numstat -z`` output.
+
+    Each record is ``added<TAB>deleted<TAB>path<NUL>``; a rename has an
+    empty path followed by ``old<NUL>new<NUL>``. Binary files show ``-``.
+    """
+    changes = []
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields):
+        record = fields[i]
+        i += 1
+        if not record:
+            continue
+        added, deleted, path = record.split("\t", 2)
+        if not path:  # Rename: the new path is the second of the next two fields
+            path = fields[i + 1]
+            i += 2
+        binary = added == "-"
+        changes.append(
+            FileChange(path, 0 if binary else int(added), 0 if binary else int(deleted), binary)
+        )
+    return changes
+
+
+def decide(size: DiffSize, config: ReviewConfig) -> tuple[str, str]:
+    """Pick the review path.
+
+    Args:
+        size: Sized diff
+        config: Review settings
+
+    Returns:
+        Tuple of (verdict "fast" or "full", human-readable reason)
+    """
+    if config.review_mode in ("fast", "full"):
+        return config.review_mode, f"review_mode is {config.review_mode}"
+    if config.review_mode == "manual":
+        return "full", "review_mode is manual"
+    measured = f"{size.files} files, {size.loc} LOC"
+    limits = f"{config.max_files} files, {config.max_loc} LOC"
+    if size.files <= config.max_files and size.loc <= config.max_loc:
+        return "fast", f"{measured} within {limits}"
+    return "full", f"{measured} exceeds {limits}"
+
+
+def verdict_document(
+    size: DiffSize, config: ReviewConfig, now: datetime | None = None
+) -> dict:
+    """Build the JSON verdict written to the quest directory."""
+    verdict, reason = decide(size, config)
+    now = now or datetime.now(tz=timezone.utc)
+    return {
+        "v": VERDICT_VERSION,
+        "generated_at": now.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "verdict": verdict,
+        "reason": reason,
+        "review_mode": config.review_mode,
+        "thresholds": {"max_files": config.max_files, "max_loc": config.max_loc},
+        "base": size.base,
+        "base_source": size.base_source,
+        "files": size.files,
+        "loc": size.loc,
+        "added": sum(c.added for c in size.changes),
+        "deleted": sum(c.deleted for c in size.changes),
+        "changes": [
+            {
+                "path": c.path,
+                "added": c.added,
+                "deleted": c.deleted,
+                **({"binary": True} if c.binary else {}),
+                **({"untracked": True} if c.untracked else {}),
+            }
+            for c in size.changes
+        ],
+        "excluded": size.excluded,
+    }
+
+
+def _resolve_base(repo_root: Path, quest_dir: Path | None, base: str | None) -> tuple[str, str]:
+    """Return (commit id, where it came from)."""
+    rev, source = base, "--base"
+    if not rev and quest_dir is not None:
+        try:
+            state = json.loads((quest_dir / "state.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = None
+        recorded = state.get("base_commit") if isinstance(state, dict) else None
+        rev, source = (recorded, "state.json") if isinstance(recorded, str) else (None, "")
+
+    if rev:
+        commit = _rev_parse(repo_root, rev)
+        if commit is None:
+            raise RuntimeError(f"Base {rev!r} ({source}) is not a commit")
+        return commit, source
+
+    for branch in _default_branches(repo_root):
+        result = run_git(["merge-base", "HEAD", branch], repo_root, _GIT_TIMEOUT)
+        if result is not None and result.returncode == 0 and result.stdout.strip():
+            return result.stdout.strip(), f"merge-base {branch}"
+    commit = _rev_parse(repo_root, "HEAD")
+    if commit is None:
+        raise RuntimeError(f"{repo_root} is not a git repository with commits")
+    return commit, "HEAD"
+
+
+def _default_branches(repo_root: Path) -> list[str]:
+    """``origin/HEAD``'s target, then main and master."""
+    branches = []
+    result = run_git(
+        ["symbolic-ref", "--quiet", "--short", "refs/remotes/origin/HEAD"], repo_root, _GIT_TIMEOUT
+    )
+    if result is not None and result.returncode == 0 and result.stdout.strip():
+        branches.append(result.stdout.strip())
+    branches.extend(_DEFAULT_BRANCHES)
+    return branches
+
+
+def _rev_parse(repo_root: Path, rev: str) -> str | None:
+    result = run_git(
+        ["rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"], repo_root, _GIT_TIMEOUT
+    )
+    if result is None or result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _untracked_change(repo_root: Path, path: str) -> FileChange:
+    """An untracked file counts as added in full (binary files as 0 lines)."""
+    try:
+        data = (repo_root / path).read_bytes()
+    except OSError:
+        return FileChange(path, 0, 0, untracked=True)
+    if b"\0" in data[:_BINARY_SNIFF_BYTES]:
+        return FileChange(path, 0, 0, binary=True, untracked=True)
+    lines = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+    return FileChange(path, lines, 0, untracked=True)
+
+
+def _excluded(path: str, patterns: tuple[str, ...]) -> bool:
+    name = path.rsplit("/", 1)[-1]
+    return any(
+        fnmatchcase(path, pattern) or ("/" not in pattern and fnmatchcase(name, pattern))
+        for pattern in patterns
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Exit code 2 if the diff cannot be sized."""
+    parser = argparse.ArgumentParser(
+        description="Size the quest's diff and write the fast/full review verdict"
+    )
+    parser.add_argument("quest_dir", help="Quest directory, e.g. .quest/<id>")
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--base", default=None, help="Base revision. Default: state.json base_commit or merge base."
+    )
+    parser.add_argument("--json", action="store_true", help="Print the verdict as JSON.")
+    parser.add_argument(
+        "--no-write", action="store_true", help=f"Do not write <quest_dir>/{VERDICT_PATH}."
+    )
+    args = parser.parse_args(argv)
+
+    repo_root = Path(args.repo_root).resolve()
+    quest_dir = Path(args.quest_dir)
+    if not quest_dir.is_absolute():
+        quest_dir = repo_root / quest_dir
+    config, config_warnings = load_review_config(repo_root)
+    for warning in config_warnings:
+        print(f"[WARN] {warning}", file=sys.stderr)
+
+    try:
+        size = size_diff(repo_root, quest_dir, args.base, config.exclude)
+    except RuntimeError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 2
+
+    document = verdict_document(size, config)
+    if not args.no_write:
+        verdict_path = quest_dir / VERDICT_PATH
+        verdict_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(verdict_path, json.dumps(document, indent=2) + "\n")
+
+    if args.json:
+        print(json.dumps(document, indent=2))
+    else:
+        print(
+            f"{document['verdict']}: {document['reason']} "
+            f"(base {size.base[:12]} from {size.base_source}, {len(size.excluded)} excluded)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,561 @@
+"""Generated, token-budgeted review context digest (``.ai/context_digest.md``).
+
+Reviewers read the digest on every plan and code review, so it should be
+short and current. This module builds it from the repository instead of
+by hand:
+
+- **Module Map**: each top-level directory with the first line of its
+  README, and each source module (``.py`` docstring, ``.sh`` header
+  comment) with its one-line summary, grouped by directory
+- **Test Layout**: test directories, their file counts and naming
+  pattern, and the runner configured in ``pyproject.toml``
+- **Conventions**: headings, first sentences and bullets of
+  ``CONTRIBUTING.md``
+- **Review Priorities**, **Testing Expectations** and **Style and Change
+  Scope** are policy, not derivable: they are carried over from the
+  existing digest verbatim (defaults on first run) and never trimmed
+
+The digest is fitted to a token budget (estimated offline as one token per
+four characters): lines are dropped from the end of the least important
+section first (Conventions, then Test Layout, then Module Map) and
+replaced with a "... N more" line. The budget is best-effort: the policy
+sections are never trimmed, so they alone can exceed it.
+
+Generation is incremental and deterministic. Files come from
+``git ls-files`` (tracked plus untracked, not ignored); per-file summaries
+are cached by size and mtime in ``.quest/.context-digest-cache.json``.
+The digest header records a hash of every summarized file's content,
+the budget and the carried-over sections, so a run whose inputs are
+unchanged writes nothing, on any machine. ``--check`` exits 1 when the
+digest is out of date.
+
+Usage:
+    PYTHONPATH=scripts python3 -m quest_dashboard.digest
+    PYTHONPATH=scripts python3 -m quest_dashboard.digest --max-tokens 800 --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from .fsutil import write_atomic
+from .gitmeta import run_git
+from .tokens import CHARS_PER_TOKEN, estimate_tokens
+
+DIGEST_PATH = Path(".ai") / "context_digest.md"
+CACHE_PATH = Path(".quest") / ".context-digest-cache.json"
+CACHE_VERSION = 1
+DIGEST_VERSION = 1
+
+DEFAULT_MAX_TOKENS = 1200
+
+TITLE = "# Codex Review Context Digest"
+PURPOSE = (
+    "Purpose: Provide the minimum stable context for reviews. "
+    "Read this before reviewing plans or code."
+)
+
+# Hand-written policy sections carried over from the existing digest
+PINNED_SECTIONS: dict[str, tuple[str, ...]] = {
+    "Review Priorities": (
+        "1. Correctness and regressions",
+        "2. Security and data handling",
+        "3. Missing or insufficient tests",
+        "4. Architecture boundary violations",
+        "5. Maintainability issues that cause bugs",
+    ),
+    "Testing Expectations": (
+        "- Bug fixes use TDD when practical (red → green → verify).",
+        "- Do not hit network in unit tests; mock at API boundaries.",
+    ),
+    "Style and Change Scope": (
+        "- Prefer minimal, focused changes.",
+        "- Avoid broad refactors unless preventing a real bug.",
+    ),
+}
+
+# Documents pointed to in Reference Docs when they exist
+REFERENCE_DOCS = ("AGENTS.md", "CONTRIBUTING.md", "docs/architecture/", "README.md")
+
+SOURCE_SUFFIXES = (".py", ".sh")
+TEST_DIR_NAMES = ("tests", "test")
+
+_HEADER_RE = re.compile(r"<!-- generated by quest_dashboard\.digest: sources ([0-9a-f]+)")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s")
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+
+
+@dataclass(frozen=True, slots=True)
+class DigestUpdate:
+    """What one generation run did."""
+
+    changed: bool  # The digest on disk was out of date (and was rewritten, if writing)
+    fingerprint: str  # Hash of the inputs recorded in the digest header
+    tokens: int  # Estimated tokens of the digest
+    sources: int  # Files summarized
+    parsed: int  # Files read this run (cache misses)
+    trimmed: int  # Lines dropped to fit the budget
+
+
+@dataclass(slots=True)
+class _Section:
+    title: str
+    lines: list[str]
+    omitted: int = 0
+
+
+def generate_digest(
+    repo_root: Path,
+    digest_path: Path | None = None,
+    max_tokens: int = DEFAULT_MAX_TOKENS,
+    cache_path: Path | None = None,
+    write: bool = True,
+) -> DigestUpdate:
+    """Regenerate the digest if any summarized source changed.
+
+    Args:
+        repo_root: Repository root
+        digest_path: Digest to write (default: ``.ai/context_digest.md``)
+        max_tokens: Token budget for the whole digest
+        cache_path: Per-file summary cache (default: ``.quest/.context-digest-cache.json``)
+        write: False only reports whether the digest is out of date
+
+    Returns:
+        DigestUpdate
+    """
+    digest_path = digest_path or repo_root / DIGEST_PATH
+    cache_path = cache_path or repo_root / CACHE_PATH
+    files = _list_files(repo_root)
+    cache = _load_cache(cache_path)
+
+    summaries: dict[str, str] = {}
+    hashes: dict[str, str] = {}
+    parsed = 0
+    new_cache: dict[str, list] = {}
+    for rel in _summarized_files(files):
+        try:
+            stat = (repo_root / rel).stat()
+        except OSError:
+            continue
+        fingerprint = [stat.st_size, stat.st_mtime_ns]
+        cached = cache.get(rel)
+        if cached is not None and cached[:2] == fingerprint:
+            digest, summary = cached[2], cached[3]
+        else:
+            try:
+                data = (repo_root / rel).read_bytes()
+            except OSError:
+                continue
+            parsed += 1
+            digest = hashlib.sha256(data).hexdigest()
+            summary = _summarize(rel, data.decode("utf-8", errors="replace"))
+        new_cache[rel] = [*fingerprint, digest, summary]
+        hashes[rel] = digest
+        summaries[rel] = summary
+
+    existing = _read_text(digest_path) or ""
+    pinned = {
+        title: _pinned_section(existing, title) or [f"## {title}", *default]
+        for title, default in PINNED_SECTIONS.items()
+    }
+    tests = sorted(rel for rel in files if _is_test_file(rel))
+    pyproject = _read_text(repo_root / "pyproject.toml") or ""
+    references = [doc for doc in REFERENCE_DOCS if _exists(repo_root, files, doc)]
+
+    inputs = [
+        DIGEST_VERSION,
+        max_tokens,
+        sorted(hashes.items()),
+        tests,
+        "[tool.pytest" in pyproject,
+        references,
+        pinned,
+    ]
+    fingerprint = hashlib.sha256(
+        json.dumps(inputs, sort_keys=True).encode("utf-8")
+    ).hexdigest()[:16]
+
+    if (match := _HEADER_RE.search(existing)) and match.group(1) == fingerprint:
+        _save_cache(cache_path, new_cache, cache)
+        return DigestUpdate(False, fingerprint, estimate_tokens(existing), len(hashes), parsed, 0)
+
+    text, trimmed = render_digest(
+        fingerprint, max_tokens, summaries, tests, references, pinned, pyproject
+    )
+    if write:
+        digest_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(digest_path, text)
+        _save_cache(cache_path, new_cache, cache)
+    return DigestUpdate(True, fingerprint, estimate_tokens(text), len(hashes), parsed, trimmed)
+
+
+def render_digest(
+    fingerprint: str,
+    max_tokens: int,
+    summaries: dict[str, str],
+    tests: list[str],
+    references: list[str],
+    pinned: dict[str, list[str]],
+    pyproject: str = "",
+) -> tuple[str, int]:
+    """Render the digest and trim it toward the budget.
+
+    Only Conventions, Test Layout and the Module Map are trimmed. The
+    carried-over policy sections are kept whole, so the budget is
+    best-effort: a digest whose pinned sections alone exceed it stays over.
+
+    Args:
+        fingerprint: Input hash recorded in the header
+        max_tokens: Token budget
+        summaries: Repo-relative path -> one-line summary
+        tests: Repo-relative test files
+        references: Reference documents that exist
+        pinned: Carried-over section title -> its heading line and body lines
+        pyproject: pyproject.toml text (for the test runner)
+
+    Returns:
+        Tuple of (digest text, lines trimmed)
+    """
+    header = [
+        TITLE,
+        "",
+        f"<!-- generated by quest_dashboard.digest: sources {fingerprint}, "
+        f"budget {max_tokens} tokens. Edit {', '.join(PINNED_SECTIONS)} here; "
+        "other sections are regenerated. -->",
+        "",
+        PURPOSE,
+    ]
+    module_map = _Section("Module Map", _module_map_lines(summaries))
+    test_layout = _Section("Test Layout", _test_layout_lines(tests, pyproject))
+    conventions = _Section(
+        "Conventions (from CONTRIBUTING.md)", _convention_lines(summaries.get("CONTRIBUTING.md"))
+    )
+    priorities, testing, style = (
+        _Section(pinned[title][0].removeprefix("## "), pinned[title][1:])
+        for title in PINNED_SECTIONS
+    )
+    sections = [
+        priorities,
+        module_map,
+        test_layout,
+        testing,
+        conventions,
+        style,
+        _Section("Reference Docs", [f"- {doc}" for doc in references]),
+    ]
+
+    def section_text(section: _Section) -> str:
+        lines = list(section.lines)
+        if section.omitted:
+            lines.append(_omitted_line(section.omitted))
+        return "\n".join([f"## {section.title}", *lines])
+
+    def section_size(section: _Section, body: int) -> int:
+        """len(section_text()) from the summed line lengths, or 0 if not rendered."""
+        if not section.lines and not section.omitted:
+            return 0
+        marker = 1 + len(_omitted_line(section.omitted)) if section.omitted else 0
+        return 2 + len("## " + section.title) + body + marker  # 2: the "\n\n" before it
+
+    # Lines are dropped against running sizes, so trimming is one pass over
+    # the dropped lines rather than one full render per line
+    budget_chars = max_tokens * CHARS_PER_TOKEN
+    bodies = [sum(len(line) + 1 for line in section.lines) for section in sections]
+    sizes = [section_size(section, body) for section, body in zip(sections, bodies)]
+    size = len("\n".join(header)) + sum(sizes) + 1
+    trimmed = 0
+    for section in (conventions, test_layout, module_map):
+        index = sections.index(section)
+        while size > budget_chars and section.lines:
+            bodies[index] -= len(section.lines.pop()) + 1
+            section.omitted += 1
+            trimmed += 1
+            new_size = section_size(section, bodies[index])
+            size += new_size - sizes[index]
+            sizes[index] = new_size
+
+    parts = ["\n".join(header)]
+    parts.extend(section_text(sec) for sec in sections if sec.lines or sec.omitted)
+    return "\n\n".join(parts) + "\n", trimmed
+
+
+def _omitted_line(count: int) -> str:
+    return f"- ... {count} more"
+
+
+def _module_map_lines(summaries: dict[str, str]) -> list[str]:
+    """Top-level directories first, then modules grouped by directory."""
+    lines = []
+    readmes = {
+        str(PurePosixPath(rel).parent): summary
+        for rel, summary in summaries.items()
+        if PurePosixPath(rel).name == "README.md" and summary
+    }
+    by_dir: dict[str, list[tuple[str, str]]] = defaultdict(list)
+    for rel, summary in summaries.items():
+        path = PurePosixPath(rel)
+        if path.suffix in SOURCE_SUFFIXES and not _is_test_file(rel):
+            by_dir[str(path.parent)].append((path.name, summary))
+
+    # Documented top-level directories without modules of their own
+    for directory, summary in sorted(readmes.items()):
+        if "/" not in directory and directory not in by_dir:
+            lines.append(f"- `{directory}/`: {summary}")
+    for directory in sorted(by_dir):
+        label = "(root)" if directory == "." else f"{directory}/"
+        described = readmes.get(directory)
+        lines.append(f"- `{label}`" + (f": {described}" if described else ""))
+        for name, summary in sorted(by_dir[directory]):
+            lines.append(f"  - `{name}`" + (f": {summary}" if summary else ""))
+    return lines
+
+
+def _test_layout_lines(tests: list[str], pyproject: str) -> list[str]:
+    by_dir: dict[str, list[str]] = defaultdict(list)
+    for rel in tests:
+        path = PurePosixPath(rel)
+        by_dir[str(path.parent)].append(path.name)
+    lines = []
+    if "[tool.pytest" in pyproject:
+        lines.append("- Runner: `python -m pytest` (configured in pyproject.toml)")
+    for directory in sorted(by_dir):
+        names = by_dir[directory]
+        lines.append(f"- `{directory}/`: {len(names)} files ({_name_pattern(names)})")
+    return lines
+
+
+def _name_pattern(names: list[str]) -> str:
+    """Describe test file names, e.g. ``test_*.py`` or ``test-*.sh, conftest.py``."""
+    patterns = set()
+    for name in names:
+        stem, dot, suffix = name.partition(".")
+        if stem.startswith(("test_", "test-")):
+            patterns.add(f"{stem[:5]}*{dot}{suffix}")
+        elif stem.endswith("_test"):
+            patterns.add(f"*_test{dot}{suffix}")
+        else:
+            patterns.add(name)
+    return ", ".join(f"`{p}`" for p in sorted(patterns))
+
+
+def _convention_lines(contributing: str | None) -> list[str]:
+    """Flattened CONTRIBUTING.md outline (its summary is the outline itself)."""
+    return contributing.splitlines() if contributing else []
+
+
+def _summarize(rel: str, text: str) -> str:
+    """One-line summary of a file (the whole outline for CONTRIBUTING.md)."""
+    name = PurePosixPath(rel).name
+    if rel == "CONTRIBUTING.md":
+        return "\n".join(_outline(text))
+    if name == "README.md":
+        return _first_paragraph_line(text)
+    if name.endswith(".py"):
+        try:
+            docstring = ast.get_docstring(ast.parse(text))
+        except (SyntaxError, ValueError):
+            docstring = None
+        return _first_sentence(docstring.strip().splitlines()[0]) if docstring else ""
+    if name.endswith(".sh"):
+        for line in text.splitlines()[:10]:
+            comment = line.lstrip("#").strip()
+            if line.startswith("#") and not line.startswith("#!") and comment:
+                return _first_sentence(comment)
+        return ""
+    return ""
+
+
+def _outline(text: str) -> list[str]:
+    """Headings with their first sentence, plus list items; code blocks skipped."""
+    lines = []
+    heading = None
+    described = False
+    in_code = False
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("```"):
+            in_code = not in_code
+            continue
+        if in_code or not line:
+            continue
+        if line.startswith("#"):
+            heading = line.lstrip("#").strip()
+            described = False
+            if raw.startswith("# "):
+                heading = None  # Document title
+            continue
+        item = re.match(r"^(?:[-*]|\d+\.)\s+(.*)", line)
+        if item:
+            indent = "  " if raw.startswith((" ", "\t")) else ""
+            lines.append(f"{indent}- {_plain(item.group(1))}")
+        elif heading and not described:
+            lines.append(f"- **{heading}**: {_first_sentence(_plain(line))}")
+            described = True
+    return lines
+
+
+def _first_paragraph_line(text: str) -> str:
+    in_code = False
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line.startswith("```"):
+            in_code = not in_code
+            continue
+        if in_code or not line or line.startswith(("#", "|", "<", "![", "---")):
+            continue
+        return _first_sentence(_plain(line))
+    return ""
+
+
+def _first_sentence(text: str) -> str:
+    return _SENTENCE_END_RE.split(text.strip(), maxsplit=1)[0]
+
+
+def _plain(text: str) -> str:
+    return _MARKDOWN_LINK_RE.sub(r"\1", text)
+
+
+def _pinned_section(digest: str, title: str) -> list[str] | None:
+    """Heading and body lines of a ``## <title>...`` section of the existing digest."""
+    lines = digest.splitlines()
+    for i, line in enumerate(lines):
+        if line.startswith(f"## {title}"):
+            body = []
+            for following in lines[i + 1 :]:
+                if following.startswith("## "):
+                    break
+                body.append(following)
+            while body and not body[-1].strip():
+                body.pop()
+            while body and not body[0].strip():
+                body.pop(0)
+            return [line, *body] if body else None
+    return None
+
+
+def _list_files(repo_root: Path) -> list[str]:
+    """Tracked and untracked-but-not-ignored files, repo-relative."""
+    result = run_git(
+        ["ls-files", "-z", "--cached", "--others", "--exclude-standard"], repo_root, 30
+    )
+    if result is not None and result.returncode == 0:
+        return sorted({path for path in result.stdout.split("\0") if path})
+    files = []
+    for root, dirs, names in os.walk(repo_root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "__pycache__")
+        rel_root = Path(root).relative_to(repo_root).as_posix()
+        files.extend(name if rel_root == "." else f"{rel_root}/{name}" for name in names)
+    return sorted(files)
+
+
+def _summarized_files(files: list[str]) -> list[str]:
+    """Files whose content feeds the digest: READMEs, sources, CONTRIBUTING.md."""
+    selected = []
+    for rel in files:
+        path = PurePosixPath(rel)
+        if any(part.startswith(".") for part in path.parts):
+            continue  # Tool configuration (.ai, .github, ...) is not the module map
+        if rel == "CONTRIBUTING.md" or path.name == "README.md" and len(path.parts) > 1:
+            selected.append(rel)
+        elif path.suffix in SOURCE_SUFFIXES and not _is_test_file(rel):
+            selected.append(rel)
+    return selected
+
+
+def _is_test_file(rel: str) -> bool:
+    path = PurePosixPath(rel)
+    if path.suffix not in SOURCE_SUFFIXES:
+        return False
+    return path.parts[0] in TEST_DIR_NAMES or path.name.startswith(("test_", "test-"))
+
+
+def _exists(repo_root: Path, files: list[str], doc: str) -> bool:
+    if doc.endswith("/"):
+        return any(rel.startswith(doc) for rel in files)
+    return doc in files or (repo_root / doc).is_file()
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _load_cache(cache_path: Path) -> dict[str, list]:
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return {}
+    files = cache.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(cache_path: Path, files: dict[str, list], previous: dict[str, list]) -> None:
+    if files == previous:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(cache_path, json.dumps({"version": CACHE_VERSION, "files": files}))
+    except OSError:
+        pass  # The cache only saves re-reading files
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. With --check, exit code 1 if the digest is stale."""
+    parser = argparse.ArgumentParser(
+        description="Generate the token-budgeted review context digest from the repository"
+    )
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--output", default=None, help=f"Digest path. Default: <repo-root>/{DIGEST_PATH}."
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=DEFAULT_MAX_TOKENS,
+        help=f"Best-effort token budget (1 token ~ {CHARS_PER_TOKEN} chars); the policy "
+        f"sections are never trimmed. Default: {DEFAULT_MAX_TOKENS}.",
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Do not write; exit 1 if the digest is out of date."
+    )
+    args = parser.parse_args(argv)
+    if args.max_tokens < 1:
+        parser.error("--max-tokens must be at least 1")
+
+    repo_root = Path(args.repo_root).resolve()
+    output = Path(args.output) if args.output else None
+    update = generate_digest(repo_root, output, args.max_tokens, write=not args.check)
+
+    if args.check:
+        state = "is out of date" if update.changed else "is current"
+        print(f"Digest {state} ({update.fingerprint})")
+        return 1 if update.changed else 0
+    state = "written" if update.changed else "unchanged"
+    print(
+        f"Digest {state}: ~{update.tokens} tokens, {update.sources} sources "
+        f"({update.parsed} read), {update.trimmed} lines trimmed"
+    )
+    if update.tokens > args.max_tokens:
+        print(
+            f"Warning: digest is over the {args.max_tokens}-token budget;"
+            " the policy sections are never trimmed",
+            file=sys.stderr,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Append-only quest event log (``.quest/events.ndjson``).
+
+``quest_state`` appends one compact JSON line per state change it applies:
+
+    {"v": 1, "ts": "2026-03-02T10:00:00Z", "quest": ".quest/<id>",
+     "quest_id": "<id>", "event": "transition", "from": "building",
+     "to": "reviewing", "changes": {"phase": "reviewing", ...}}
+
+Each line is written with one ``write()`` on an ``O_APPEND`` descriptor, so
+lines from concurrent writers never interleave. Readers tail the log from a
+byte offset and only consume complete lines; a torn or hand-edited line is
+skipped. The log is identified by its inode, so a truncated or replaced log
+is detected and read from the start.
+
+This module is standalone (stdlib only), like ``audit``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+EVENTS_NAME = "events.ndjson"
+EVENT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class EventTail:
+    """Events read from a log since a previous position."""
+
+    events: list[dict]
+    log_id: int | None  # Inode of the log (None when it does not exist)
+    offset: int  # Byte offset after the last complete line read
+    reset: bool  # The log was replaced, truncated or removed; events start from byte 0
+
+
+def append_event(log_path: Path, event: dict) -> None:
+    """Append one event as a single NDJSON line (created with its directory)."""
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps({"v": EVENT_VERSION, **event}, separators=(",", ":"), ensure_ascii=False)
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, (line + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def read_events(log_path: Path, log_id: int | None = None, offset: int = 0) -> EventTail:
+    """Read complete event lines written after offset.
+
+    Args:
+        log_path: Event log
+        log_id: log_id from the previous read (None = the log did not exist yet)
+        offset: offset from the previous read
+
+    Returns:
+        EventTail; pass its log_id and offset to the next call
+    """
+    try:
+        with log_path.open("rb") as f:
+            stat = os.fstat(f.fileno())
+            reset = (log_id is not None and log_id != stat.st_ino) or offset > stat.st_size
+            if reset:
+                offset = 0
+            f.seek(offset)
+            data = f.read()
+    except OSError:
+        return EventTail([], None, 0, log_id is not None)
+
+    complete = data[: data.rfind(b"\n") + 1]  # A line still being written waits
+    events = []
+    for line in complete.splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(event, dict) and isinstance(event.get("quest"), str):
+            events.append(event)
+    return EventTail(events, stat.st_ino, offset + len(complete), reset)
@@ -0,0 +1,21 @@
+"""Filesystem helpers shared by the Quest Dashboard writers."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write text via a sibling temp file and rename it into place.
+
+    Readers see either the old file or the complete new one, never a
+    partially written file.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,421 @@
+"""Pure-Python git metadata reader for the Quest Dashboard.
+
+Answers the questions the dashboard asks of git (where is the git dir,
+what is the origin remote) by reading files under ``.git`` directly,
+instead of forking a ``git`` process per question. Handles:
+- Regular checkouts (``.git/`` directory)
+- Worktrees and submodules (``.git`` file containing ``gitdir: <path>``)
+- Linked worktrees sharing config via ``commondir``
+
+Results are cached per repo root. Callers fall back to subprocess git
+only when this reader cannot answer (see ``loaders.detect_github_url``).
+All git processes go through ``run_git()`` or ``CatFileBatch``, which count
+them for build metrics and import ``subprocess`` lazily.
+
+``CatFileBatch`` keeps one ``git cat-file --batch`` process open and streams
+any number of objects (commits, trees, blobs) through it, so reading a whole
+tree at some commit costs one fork.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+# Matches "[section]" and '[section "subsection"]' headers
+_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+
+# Matches "Merge pull request #123" in merge commit subjects
+_MERGE_PR_RE = re.compile(r"Merge pull request #(\d+)")
+
+# Git processes spawned via run_git() (reported by build metrics)
+_git_process_count = 0
+
+
+@dataclass(frozen=True, slots=True)
+class GitMetadata:
+    """Metadata read from a repository's git directory."""
+
+    git_dir: Path  # Per-worktree git dir (HEAD lives here)
+    common_dir: Path  # Shared git dir (config, objects, refs live here)
+    remotes: dict[str, str] = field(default_factory=dict)  # name -> url
+
+
+def find_git_dir(repo_root: Path) -> Path | None:
+    """Locate the git directory for a working tree.
+
+    Walks up from repo_root looking for ``.git``. A ``.git`` directory is
+    returned as-is; a ``.git`` file (worktrees, submodules) is followed via
+    its ``gitdir:`` line.
+
+    Args:
+        repo_root: Working tree directory (or any directory inside it)
+
+    Returns:
+        Path to the git directory, or None if not found
+    """
+    for candidate in (repo_root, *repo_root.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            return _read_gitdir_file(dot_git)
+    return None
+
+
+def _read_gitdir_file(dot_git: Path) -> Path | None:
+    """Resolve a ``.git`` file of the form ``gitdir: <path>``."""
+    try:
+        content = dot_git.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+    if not content.startswith("gitdir:"):
+        return None
+
+    target = Path(content[len("gitdir:") :].strip())
+    if not target.is_absolute():
+        target = dot_git.parent / target
+    target = target.resolve()
+    return target if target.is_dir() else None
+
+
+def resolve_common_dir(git_dir: Path) -> Path:
+    """Return the shared git dir for linked worktrees, else git_dir itself."""
+    commondir_file = git_dir / "commondir"
+    if not commondir_file.is_file():
+        return git_dir
+
+    try:
+        target = Path(commondir_file.read_text(encoding="utf-8").strip())
+    except OSError:
+        return git_dir
+
+    if not target.is_absolute():
+        target = git_dir / target
+    target = target.resolve()
+    return target if target.is_dir() else git_dir
+
+
+def parse_git_config(content: str) -> dict[str, dict[str, str]]:
+    """Parse git config text into ``{section: {key: value}}``.
+
+    Section names are ``"remote.origin"`` style (subsection joined with a
+    dot). Keys are lower-cased as git does; subsection names keep their case.
+    Later values for the same key win, matching ``git config --get``.
+    Includes (``[include]``) are not followed.
+
+    Args:
+        content: Raw git config file content
+
+    Returns:
+        Nested dict of section -> key -> value
+    """
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+
+        match = _SECTION_RE.match(line)
+        if match:
+            name = match.group(1).lower()
+            if match.group(2) is not None:
+                name = f"{name}.{match.group(2)}"
+            current = sections.setdefault(name, {})
+            # A key may follow the header on the same line
+            line = line[match.end() :].strip()
+            if not line or line[0] in "#;":
+                continue
+
+        if current is None:
+            continue
+
+        key, sep, value = line.partition("=")
+        key = key.strip().lower()
+        current[key] = _parse_config_value(value) if sep else "true"
+
+    return sections
+
+
+def _parse_config_value(raw: str) -> str:
+    """Strip inline comments and quotes from a git config value."""
+    result: list[str] = []
+    in_quotes = False
+    i = 0
+    raw = raw.strip()
+    while i < len(raw):
+        ch = raw[i]
+        if ch == "\\" and i + 1 < len(raw):
+            result.append({"n": "\n", "t": "\t"}.get(raw[i + 1], raw[i + 1]))
+            i += 2
+            continue
+        if ch == '"':
+            in_quotes = not in_quotes
+        elif ch in "#;" and not in_quotes:
+            break
+        else:
+            result.append(ch)
+        i += 1
+    return "".join(result).strip()
+
+
+@lru_cache(maxsize=None)
+def _read_git_metadata_cached(repo_root: Path) -> GitMetadata | None:
+    git_dir = find_git_dir(repo_root)
+    if git_dir is None:
+        return None
+
+    common_dir = resolve_common_dir(git_dir)
+    config_path = common_dir / "config"
+    try:
+        config = parse_git_config(config_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    remotes = {
+        section[len("remote.") :]: values["url"]
+        for section, values in config.items()
+        if section.startswith("remote.") and "url" in values
+    }
+
+    return GitMetadata(git_dir=git_dir, common_dir=common_dir, remotes=remotes)
+
+
+def read_git_metadata(repo_root: Path) -> GitMetadata | None:
+    """Read git metadata for a repository, cached per resolved repo root.
+
+    Args:
+        repo_root: Repository root directory
+
+    Returns:
+        GitMetadata, or None if no readable git directory was found
+    """
+    return _read_git_metadata_cached(Path(repo_root).resolve())
+
+
+def clear_cache() -> None:
+    """Drop all cached git metadata (for tests and long-lived processes)."""
+    _read_git_metadata_cached.cache_clear()
+    _merge_pr_index_cached.cache_clear()
+
+
+def cache_hits() -> int:
+    """Return how many git metadata lookups were answered from the cache."""
+    return (
+        _read_git_metadata_cached.cache_info().hits
+        + _merge_pr_index_cached.cache_info().hits
+    )
+
+
+def run_git(args: list[str], cwd: Path, timeout: float):
+    """Run one git command, counting it for build metrics.
+
+    Args:
+        args: Arguments after ``git``
+        cwd: Working directory
+        timeout: Seconds before the process is abandoned
+
+    Returns:
+        subprocess.CompletedProcess, or None if git could not be run
+    """
+    import subprocess
+
+    global _git_process_count
+    _git_process_count += 1
+    try:
+        return subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, timeout=timeout
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+
+
+class CatFileBatch:
+    """One long-lived ``git cat-file --batch`` process.
+
+    Objects are requested one per line on stdin and answered in order, so
+    every read after the first costs a pipe round trip, not a fork;
+    ``read_many`` pipelines a batch so it costs about one round trip.
+    """
+
+    def __init__(self, repo_root: Path):
+        import subprocess
+
+        global _git_process_count
+        _git_process_count += 1
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=repo_root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def read(self, name: str) -> tuple[str, str, bytes] | None:
+        """Read one object by name (``<sha>``, ``<rev>:<path>``, ``<rev>^{commit}``).
+
+        Returns:
+            Tuple of (object id, type, content), or None if it does not exist
+
+        Raises:
+            OSError: The git process exited
+        """
+        return self.read_many([name])[0]
+
+    def read_many(self, names: list[str]) -> list[tuple[str, str, bytes] | None]:
+        """Read several objects, writing all requests before reading answers.
+
+        Requests are written from a helper thread so neither side blocks on
+        a full pipe. Results are in the order of names (None = missing).
+        """
+        import threading
+
+        wanted = [name for name in names if "\n" not in name]
+        failed: list[BaseException] = []
+
+        def write_requests() -> None:
+            try:
+                self._proc.stdin.write(b"".join(n.encode("utf-8") + b"\n" for n in wanted))
+                self._proc.stdin.flush()
+            except (OSError, ValueError) as e:
+                failed.append(e)
+
+        writer = None
+        if len(wanted) > 1:
+            writer = threading.Thread(target=write_requests, daemon=True)
+            writer.start()
+        else:
+            write_requests()  # One line cannot fill the pipe
+        try:
+            answers = iter([self._read_answer() for _ in wanted])
+        finally:
+            if writer is not None:
+                writer.join()
+        if failed:
+            raise OSError("git cat-file --batch exited") from failed[0]
+        return [None if "\n" in name else next(answers) for name in names]
+
+    def _read_answer(self) -> tuple[str, str, bytes] | None:
+        stdout = self._proc.stdout
+        header = stdout.readline()
+        if not header:
+            raise OSError("git cat-file --batch exited")
+        parts = header.split()
+        if len(parts) != 3:
+            return None  # "<name> missing" or "<name> ambiguous"
+        object_id, kind, size = parts
+        content = stdout.read(int(size))
+        stdout.read(1)  # Trailing newline
+        return object_id.decode("ascii"), kind.decode("ascii"), content
+
+    def close(self) -> None:
+        """Close stdin and reap the process."""
+        if self._proc.stdin and not self._proc.stdin.closed:
+            try:
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        try:
+            self._proc.wait(timeout=5)
+        except Exception:
+            self._proc.kill()
+            self._proc.wait()
+        if self._proc.stdout:
+            self._proc.stdout.close()
+
+    def __enter__(self) -> CatFileBatch:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def parse_tree(content: bytes, hash_size: int = 20) -> list[tuple[str, str, str]]:
+    """Parse a raw tree object into (mode, name, object id) entries.
+
+    Args:
+        content: Tree object body as returned by ``git cat-file``
+        hash_size: Raw object id length (20 for SHA-1, 32 for SHA-256)
+    """
+    entries = []
+    pos = 0
+    while pos < len(content):
+        space = content.index(b" ", pos)
+        nul = content.index(b"\0", space)
+        object_id = content[nul + 1 : nul + 1 + hash_size].hex()
+        entries.append(
+            (
+                content[pos:space].decode("ascii"),
+                content[space + 1 : nul].decode("utf-8", "surrogateescape"),
+                object_id,
+            )
+        )
+        pos = nul + 1 + hash_size
+    return entries
+
+
+def git_process_count() -> int:
+    """Return how many git processes this package has spawned."""
+    return _git_process_count
+
+
+@lru_cache(maxsize=None)
+def _merge_pr_index_cached(repo_root: Path, rev: str) -> dict[str, int]:
+    index: dict[str, int] = {}
+    # One process for the whole repo: each first-parent merge is listed
+    # with the files it brought in, newest first.
+    result = run_git(
+        [
+            "log",
+            "--merges",
+            "--first-parent",
+            "-m",
+            "--name-only",
+            "--format=%x00%s",
+            rev,
+            "--",
+        ],
+        repo_root,
+        timeout=30,
+    )
+    if result is None or result.returncode != 0:
+        return index
+
+    for record in result.stdout.split("\0"):
+        subject, _, files = record.partition("\n")
+        match = _MERGE_PR_RE.search(subject)
+        if not match:
+            continue
+        pr_number = int(match.group(1))
+        for name in files.splitlines():
+            name = name.strip()
+            if name:
+                # Newest merge wins, matching the old per-file `git log` lookup
+                index.setdefault(name, pr_number)
+
+    return index
+
+
+def merge_pr_index(repo_root: Path, rev: str = "HEAD") -> dict[str, int]:
+    """Map repo-relative paths to the PR number of the merge that added them.
+
+    Runs a single ``git log`` for the whole repository (cached per repo
+    root and revision) instead of one per journal. Returns an empty dict
+    without forking when repo_root is not inside a git working tree.
+
+    Args:
+        repo_root: Repository root directory
+        rev: Revision whose history is searched
+
+    Returns:
+        Dict of POSIX relative path -> PR number
+    """
+    repo_root = Path(repo_root).resolve()
+    if read_git_metadata(repo_root) is None:
+        return {}
+    return _merge_pr_index_cached(repo_root, rev)
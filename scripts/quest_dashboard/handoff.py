@@ -0,0 +1,330 @@
+"""Bulk validation of ``handoff*.json`` files against the handoff schema.
+
+``.ai/schemas/handoff.schema.json`` is compiled once into plain Python
+checks (types, enums, required keys, ``maxLength``, ``additionalProperties``)
+instead of interpreting the schema per file. Every
+``<quest>/phase_0*/handoff*.json`` is validated incrementally:
+
+- A file whose size and mtime match the cache reuses its recorded content hash
+- Results are cached by content hash, so identical or unchanged files are
+  never re-validated
+- The whole cache is dropped when the schema itself changes
+
+Per-role violation rates are shown in the dashboard's Handoff Contracts panel.
+
+Usage:
+    PYTHONPATH=scripts python3 -m quest_dashboard.handoff [--repo-root PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .audit import find_quest_dirs
+from .fsutil import write_atomic
+from .models import HandoffRoleStats
+
+SCHEMA_PATH = Path(".ai") / "schemas" / "handoff.schema.json"
+CACHE_NAME = ".handoff-cache.json"
+CACHE_VERSION = 1
+
+# Role used for files whose "role" cannot be read
+UNKNOWN_ROLE = "(unknown)"
+
+Check = Callable[[object, str], list[str]]
+
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "string": (str,),
+    "array": (list,),
+    "object": (dict,),
+    "boolean": (bool,),
+    "integer": (int,),
+    "number": (int, float),
+    "null": (type(None),),
+}
+
+
+def compile_schema(schema: dict) -> Check:
+    """Compile the JSON Schema subset used by the ``.ai/schemas`` documents.
+
+    Supports ``type`` (single or list), ``enum``, ``required``,
+    ``properties``, ``additionalProperties`` (``false`` or a schema),
+    ``items``, ``maxLength`` and ``minimum``. Unsupported keywords are
+    ignored.
+
+    Args:
+        schema: Parsed schema document
+
+    Returns:
+        check(value, path) -> list of violation messages (empty if valid)
+    """
+    checks: list[Check] = []
+
+    types = schema.get("type")
+    if types is not None:
+        names = [types] if isinstance(types, str) else list(types)
+        allowed = tuple(t for name in names for t in _JSON_TYPES.get(name, ()))
+        rejects_bool = "boolean" not in names  # bool is an int subclass
+        type_label = " or ".join(names)
+
+        def check_type(value, path):
+            if not isinstance(value, allowed) or (rejects_bool and isinstance(value, bool)):
+                return [f"{path}: expected {type_label}"]
+            return []
+
+        checks.append(check_type)
+
+    if "enum" in schema:
+        members = frozenset(schema["enum"])  # JSON enums here are str/None only
+        shown = ", ".join("null" if m is None else m for m in schema["enum"])
+
+        def check_enum(value, path):
+            try:
+                ok = value in members and not isinstance(value, bool)
+            except TypeError:
+                ok = False
+            return [] if ok else [f"{path}: {value!r} is not one of {shown}"]
+
+        checks.append(check_enum)
+
+    if "maxLength" in schema:
+        max_length = schema["maxLength"]
+
+        def check_max_length(value, path):
+            if isinstance(value, str) and len(value) > max_length:
+                return [f"{path}: longer than {max_length} characters"]
+            return []
+
+        checks.append(check_max_length)
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+
+        def check_minimum(value, path):
+            number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if number and value < minimum:
+                return [f"{path}: less than {minimum}"]
+            return []
+
+        checks.append(check_minimum)
+
+    required = tuple(schema.get("required", ()))
+    properties = {
+        name: compile_schema(sub) for name, sub in schema.get("properties", {}).items()
+    }
+    additional = schema.get("additionalProperties")
+    closed = additional is False
+    extra_check = compile_schema(additional) if isinstance(additional, dict) else None
+    if required or properties or closed or extra_check:
+
+        def check_object(value, path):
+            if not isinstance(value, dict):
+                return []  # Reported by the type check
+            errors = [f"{path}: missing required key '{k}'" for k in required if k not in value]
+            for key, item in value.items():
+                sub_check = properties.get(key)
+                if sub_check is not None:
+                    errors.extend(sub_check(item, f"{path}.{key}"))
+                elif extra_check is not None:
+                    errors.extend(extra_check(item, f"{path}.{key}"))
+                elif closed:
+                    errors.append(f"{path}: unexpected key '{key}'")
+            return errors
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_check = compile_schema(schema["items"])
+
+        def check_items(value, path):
+            if not isinstance(value, list):
+                return []
+            errors = []
+            for i, item in enumerate(value):
+                errors.extend(item_check(item, f"{path}[{i}]"))
+            return errors
+
+        checks.append(check_items)
+
+    def check(value, path="$"):
+        errors = []
+        for sub_check in checks:
+            errors.extend(sub_check(value, path))
+        return errors
+
+    return check
+
+
+@dataclass(frozen=True, slots=True)
+class HandoffResult:
+    """Validation outcome for one handoff file."""
+
+    path: str  # Relative to the .quest directory
+    role: str
+    violations: tuple[str, ...] = field(default_factory=tuple)
+
+
+@dataclass(frozen=True, slots=True)
+class HandoffScan:
+    """Results of one incremental scan."""
+
+    results: list[HandoffResult]
+    validated: int  # Files actually validated (cache misses)
+    cached: int  # Files answered from the cache
+
+
+def find_handoff_files(quest_root: Path) -> list[Path]:
+    """Return every ``phase_0*/handoff*.json`` in non-archived quests."""
+    files: list[Path] = []
+    for quest_dir in find_quest_dirs(quest_root):
+        files.extend(sorted(quest_dir.glob("phase_0*/handoff*.json")))
+    return files
+
+
+def scan_handoffs(
+    quest_root: Path, schema_path: Path, cache_path: Path | None = None
+) -> HandoffScan:
+    """Validate all handoff files, reusing cached results where possible.
+
+    Args:
+        quest_root: The ``.quest`` directory
+        schema_path: Path to handoff.schema.json
+        cache_path: JSON results cache (None = no caching)
+
+    Returns:
+        HandoffScan with one result per file
+    """
+    schema_bytes = schema_path.read_bytes()
+    schema_hash = hashlib.sha256(schema_bytes).hexdigest()
+    check = compile_schema(json.loads(schema_bytes))
+
+    cache = _load_cache(cache_path, schema_hash)
+    old_files: dict[str, list] = cache["files"]
+    old_results: dict[str, list] = cache["results"]
+    new_files: dict[str, list] = {}
+    new_results: dict[str, list] = {}
+
+    results: list[HandoffResult] = []
+    validated = 0
+    for path in find_handoff_files(quest_root):
+        rel = path.relative_to(quest_root).as_posix()
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+
+        # Stat match -> reuse the recorded hash without reading the file
+        entry = old_files.get(rel)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            digest = entry[2]
+            content = None
+        else:
+            try:
+                content = path.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha256(content).hexdigest()
+
+        outcome = new_results.get(digest) or old_results.get(digest)
+        if outcome is None:
+            if content is None:
+                content = path.read_bytes()
+            outcome = list(_validate(content, check))
+            validated += 1
+
+        new_files[rel] = [st.st_size, st.st_mtime_ns, digest]
+        new_results[digest] = outcome
+        results.append(HandoffResult(path=rel, role=outcome[0], violations=tuple(outcome[1])))
+
+    if cache_path is not None:
+        new_cache = {
+            "version": CACHE_VERSION,
+            "schema": schema_hash,
+            "files": new_files,
+            "results": new_results,
+        }
+        if new_cache != cache:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(cache_path, json.dumps(new_cache, sort_keys=True) + "\n")
+
+    return HandoffScan(results=results, validated=validated, cached=len(results) - validated)
+
+
+def role_stats(results: list[HandoffResult]) -> list[HandoffRoleStats]:
+    """Aggregate per-role file and violation counts, sorted by role."""
+    totals: dict[str, list[int]] = {}
+    for result in results:
+        counts = totals.setdefault(result.role, [0, 0])
+        counts[0] += 1
+        counts[1] += bool(result.violations)
+    return [
+        HandoffRoleStats(role=role, files=files, invalid=invalid)
+        for role, (files, invalid) in sorted(totals.items())
+    ]
+
+
+def _validate(content: bytes, check: Check) -> tuple[str, list[str]]:
+    """Return (role, violations) for one file's bytes."""
+    try:
+        value = json.loads(content)
+    except (ValueError, UnicodeDecodeError) as e:
+        return UNKNOWN_ROLE, [f"not valid JSON: {e}"]
+    role = value.get("role") if isinstance(value, dict) else None
+    return (role if isinstance(role, str) and role else UNKNOWN_ROLE), check(value, "$")
+
+
+def _load_cache(cache_path: Path | None, schema_hash: str) -> dict:
+    empty = {"version": CACHE_VERSION, "schema": schema_hash, "files": {}, "results": {}}
+    if cache_path is None:
+        return empty
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty
+    if (
+        not isinstance(cache, dict)
+        or cache.get("version") != CACHE_VERSION
+        or cache.get("schema") != schema_hash
+        or not isinstance(cache.get("files"), dict)
+        or not isinstance(cache.get("results"), dict)
+    ):
+        return empty
+    return cache
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Exit code 1 if any handoff file is invalid."""
+    parser = argparse.ArgumentParser(description="Validate handoff*.json files in bulk")
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help="Results cache path. Default: docs/dashboard/.handoff-cache.json "
+        "(shared with the dashboard build).",
+    )
+    args = parser.parse_args(argv)
+
+    repo_root = Path(args.repo_root).resolve()
+    quest_root = repo_root / ".quest"
+    cache_path = (
+        Path(args.cache) if args.cache else repo_root / "docs" / "dashboard" / CACHE_NAME
+    )
+    scan = scan_handoffs(quest_root, repo_root / SCHEMA_PATH, cache_path)
+
+    for result in scan.results:
+        for violation in result.violations:
+            print(f"[FAIL] {result.path}: {violation}")
+    for stats in role_stats(scan.results):
+        print(f"{stats.role}: {stats.invalid}/{stats.files} invalid")
+    print(f"{len(scan.results)} files ({scan.validated} validated, {scan.cached} cached)")
+    return 1 if any(r.violations for r in scan.results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
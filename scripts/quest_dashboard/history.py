@@ -0,0 +1,138 @@
+"""Append-only historical stats store for the Quest Dashboard.
+
+Every build appends one compact NDJSON line with its KPI counts and
+per-phase counts of active quests. Unlike ``_compute_monthly_buckets``,
+which can only show each quest's current or final status, this records
+how many quests were actually in progress or blocked on past days.
+
+The file is compacted once it grows past a size threshold:
+- Snapshots from the last ``RAW_RETENTION_DAYS`` days are kept as-is
+- Older snapshots keep only the last one per day
+- Snapshots older than ``DAILY_RETENTION_DAYS`` keep only the last per ISO week
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .fsutil import write_atomic
+from .models import DashboardData, StatsSnapshot
+from .render import compute_status_counts
+
+UTC = timezone.utc
+
+RAW_RETENTION_DAYS = 14
+DAILY_RETENTION_DAYS = 365
+
+# Compact when the history file grows past this size
+COMPACT_THRESHOLD_BYTES = 64 * 1024
+
+
+def take_snapshot(data: DashboardData) -> StatsSnapshot:
+    """Capture KPI counts and per-phase active counts for one build."""
+    phases: dict[str, int] = {}
+    for quest in data.active_quests:
+        key = quest.phase.lower().replace(" ", "_")
+        phases[key] = phases.get(key, 0) + 1
+
+    return StatsSnapshot(
+        taken_at=data.generated_at,
+        counts=compute_status_counts(data),
+        phases=dict(sorted(phases.items())),
+    )
+
+
+def append_snapshot(
+    history_path: Path,
+    snapshot: StatsSnapshot,
+    compact_threshold: int = COMPACT_THRESHOLD_BYTES,
+) -> list[StatsSnapshot]:
+    """Append a snapshot, compacting the store if it has grown too large.
+
+    Args:
+        history_path: NDJSON history file (created if missing)
+        snapshot: Snapshot to append
+        compact_threshold: File size in bytes that triggers compaction
+
+    Returns:
+        All snapshots in the store after the append, oldest first
+    """
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    with history_path.open("a", encoding="utf-8") as f:
+        f.write(_encode(snapshot) + "\n")
+
+    snapshots = load_history(history_path)
+    if history_path.stat().st_size > compact_threshold:
+        snapshots = compact(snapshots, now=snapshot.taken_at)
+        write_atomic(history_path, "".join(_encode(s) + "\n" for s in snapshots))
+    return snapshots
+
+
+def load_history(history_path: Path) -> list[StatsSnapshot]:
+    """Read all snapshots, oldest first. Unreadable lines are skipped."""
+    try:
+        lines = history_path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return []
+
+    snapshots = []
+    for line in lines:
+        try:
+            snapshots.append(_decode(line))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            continue  # Torn or hand-edited line; drop it rather than fail the build
+    snapshots.sort(key=lambda s: s.taken_at)
+    return snapshots
+
+
+def compact(
+    snapshots: Iterable[StatsSnapshot], now: datetime | None = None
+) -> list[StatsSnapshot]:
+    """Downsample old snapshots to one per day, then one per ISO week.
+
+    Args:
+        snapshots: Snapshots in any order
+        now: Reference time for retention windows (default: current UTC time)
+
+    Returns:
+        Compacted snapshots, oldest first
+    """
+    now = now or datetime.now(tz=UTC)
+    raw_cutoff = now - timedelta(days=RAW_RETENTION_DAYS)
+    daily_cutoff = now - timedelta(days=DAILY_RETENTION_DAYS)
+
+    kept: dict[object, StatsSnapshot] = {}
+    for snapshot in sorted(snapshots, key=lambda s: s.taken_at):
+        if snapshot.taken_at >= raw_cutoff:
+            key: object = snapshot.taken_at
+        elif snapshot.taken_at >= daily_cutoff:
+            key = snapshot.taken_at.date()
+        else:
+            key = snapshot.taken_at.isocalendar()[:2]
+        kept[key] = snapshot  # Later snapshots in the same bucket win
+
+    return sorted(kept.values(), key=lambda s: s.taken_at)
+
+
+def _encode(snapshot: StatsSnapshot) -> str:
+    return json.dumps(
+        {
+            "t": snapshot.taken_at.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "c": snapshot.counts,
+            "p": snapshot.phases,
+        },
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+
+
+def _decode(line: str) -> StatsSnapshot:
+    record = json.loads(line)
+    return StatsSnapshot(
+        taken_at=datetime.fromisoformat(record["t"].replace("Z", "+00:00")),
+        counts={str(k): int(v) for k, v in record["c"].items()},
+        phases={str(k): int(v) for k, v in record.get("p", {}).items()},
+    )
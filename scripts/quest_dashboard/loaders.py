@@ -3,17 +3,30 @@
 This module extracts quest data from:
 - docs/quest-journal/*.md (completed and abandoned quests)
 - .quest/*/state.json and quest_brief.md (active quests)
+
+Files are read through a source: ``FileSystemSource`` (the working tree,
+the default) or ``GitTreeSource`` (the same paths at any commit, streamed
+from one ``git cat-file --batch`` process without a checkout).
+
+``load_active_quests_from_events`` keeps parsed active quests in a cache and
+re-reads only the quests named in ``.quest/events.ndjson`` since the last
+build (see ``quest_state``), instead of every state file.
 """
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
-import subprocess
+import time
 from datetime import date, datetime, timezone
 from pathlib import Path
 
-from .models import ActiveQuest, DashboardData, JournalEntry
+from .events import EVENTS_NAME, read_events
+from .fsutil import write_atomic
+from .gitmeta import CatFileBatch, merge_pr_index, parse_tree, read_git_metadata, run_git
+from .models import ActiveQuest, DashboardData, Diagnostic, JournalEntry
 
 UTC = timezone.utc
 
@@ -31,31 +44,240 @@ _PHASE_ORDER = {
     "pending": 5,
 }
 
+# A "## Heading" line; any later line starting with "##" ends its section
+_SECTION_HEADING_RE = re.compile(r"^##[^\S\n]([^\n]*)", re.MULTILINE)
+
+# Parsed active quests cached by load_active_quests_from_events()
+ACTIVE_CACHE_NAME = ".active-quests-cache.json"
+ACTIVE_CACHE_VERSION = 2
+
+# Per-file parse time above which a warning is emitted. Extraction is linear
+# in file size, so exceeding this points at a pathological or huge file.
+PARSE_BUDGET_SECONDS = 0.5
+
+
+class FileSystemSource:
+    """Reads quest files from the working tree.
+
+    Sources take and return absolute paths under ``repo_root``, so parsing
+    code is the same for every source.
+    """
+
+    rev = "HEAD"  # History searched for PR merge commits
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+
+    def exists(self, path: Path) -> bool:
+        """Return True if path is a file or directory."""
+        return path.exists()
+
+    def journal_files(self, journal_dir: Path) -> list[Path]:
+        """``*.md`` files directly in journal_dir, sorted."""
+        return sorted(journal_dir.glob("*.md"))
+
+    def state_files(self, quest_dir: Path) -> list[Path]:
+        """state.json files below quest_dir, skipping archive trees."""
+        return find_state_files(quest_dir)
+
+    def read_text(self, path: Path) -> str:
+        return path.read_text(encoding="utf-8")
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class GitTreeSource(FileSystemSource):
+    """Reads quest files as they are at a commit, without checking it out.
+
+    The ref, the tree objects under ``docs/quest-journal`` and ``.quest``,
+    and every blob are streamed through one ``git cat-file --batch``
+    process, so loading costs one fork however many files there are.
+    Listing calls queue the blobs the loaders will read next, and those are
+    fetched in pipelined batches of PREFETCH_BLOBS rather than one round
+    trip per file.
+    """
+
+    PREFETCH_BLOBS = 256
+
+    def __init__(self, repo_root: Path, ref: str):
+        super().__init__(repo_root)
+        self.ref = ref
+        self._root = str(repo_root)
+        self._batch = CatFileBatch(repo_root)
+        try:
+            commit = self._batch.read(f"{ref}^{{commit}}")
+            if commit is None or commit[1] != "commit":
+                raise ValueError(f"Unknown git ref: {ref}")
+        except BaseException:
+            self._batch.close()
+            raise
+        self.rev = commit[0]
+        self._hash_size = len(self.rev) // 2
+        # rel dir -> {name: (mode, object id)}, or None if it is not a tree
+        self._trees: dict[str, dict[str, tuple[str, str]] | None] = {}
+        self._tree_ids: dict[str, str] = {}  # rel dir -> tree id, once its parent is read
+        self._upcoming: list[str] = []  # Blob ids in the order they will be read
+        self._upcoming_index: dict[str, int] = {}
+        self._blobs: dict[str, bytes] = {}
+
+    def _rel(self, path: Path) -> str:
+        text = str(path)
+        if text.startswith(self._root + os.sep):
+            return text[len(self._root) + 1 :].replace(os.sep, "/")
+        return path.relative_to(self.repo_root).as_posix()
+
+    def _load_trees(self, rel_dirs: list[str]) -> None:
+        missing = [d for d in rel_dirs if d not in self._trees]
+        names = [
+            self._tree_ids.get(d) or (f"{self.rev}:{d}" if d else f"{self.rev}^{{tree}}")
+            for d in missing
+        ]
+        for rel_dir, obj in zip(missing, self._batch.read_many(names)):
+            if obj is None or obj[1] != "tree":
+                self._trees[rel_dir] = None
+                continue
+            entries = {}
+            for mode, name, object_id in parse_tree(obj[2], self._hash_size):
+                entries[name] = (mode, object_id)
+                if mode == "40000":
+                    self._tree_ids[_join_rel(rel_dir, name)] = object_id
+            self._trees[rel_dir] = entries
+
+    def _tree(self, rel_dir: str) -> dict[str, tuple[str, str]] | None:
+        if rel_dir not in self._trees:
+            self._load_trees([rel_dir])
+        return self._trees[rel_dir]
+
+    def _entry(self, path: Path) -> tuple[str, str] | None:
+        parent, _, name = self._rel(path).rpartition("/")
+        tree = self._tree(parent)
+        return tree.get(name) if tree is not None else None
+
+    def _expect(self, blob_ids: list[str]) -> None:
+        """Queue blobs in the order the loaders will read them."""
+        self._upcoming = blob_ids
+        self._upcoming_index = {blob_id: i for i, blob_id in enumerate(blob_ids)}
+        self._blobs.clear()
+
+    def exists(self, path: Path) -> bool:
+        return self._entry(path) is not None
+
+    def journal_files(self, journal_dir: Path) -> list[Path]:
+        tree = self._tree(self._rel(journal_dir)) or {}
+        names = sorted(
+            name for name, (mode, _) in tree.items() if name.endswith(".md") and mode.startswith("100")
+        )
+        self._expect([tree[name][1] for name in names])
+        return [journal_dir / name for name in names]
+
+    def state_files(self, quest_dir: Path) -> list[Path]:
+        found: list[str] = []
+        level = [self._rel(quest_dir)]
+        while level:
+            self._load_trees(level)
+            next_level = []
+            for rel_dir in level:
+                tree = self._trees[rel_dir] or {}
+                if tree.get("state.json", ("",))[0].startswith("100"):
+                    found.append(rel_dir)
+                # "archive" is pruned, as in find_state_files
+                next_level.extend(
+                    _join_rel(rel_dir, name)
+                    for name, (mode, _) in tree.items()
+                    if mode == "40000" and name != "archive"
+                )
+            level = next_level
+
+        found.sort()
+        expected = []
+        for rel_dir in found:
+            tree = self._trees[rel_dir]
+            expected.append(tree["state.json"][1])
+            if "quest_brief.md" in tree:
+                expected.append(tree["quest_brief.md"][1])
+        self._expect(expected)
+        return [self.repo_root / rel_dir / "state.json" for rel_dir in found]
+
+    def read_text(self, path: Path) -> str:
+        entry = self._entry(path)
+        if entry is None or not entry[0].startswith("100"):
+            raise FileNotFoundError(f"{self._rel(path)} not found at {self.ref}")
+        blob_id = entry[1]
+        if blob_id not in self._blobs:
+            start = self._upcoming_index.get(blob_id)
+            if start is None:
+                chunk = [blob_id]
+            else:
+                chunk = self._upcoming[start : start + self.PREFETCH_BLOBS]
+            for chunk_id, obj in zip(chunk, self._batch.read_many(chunk)):
+                if obj is not None and obj[1] == "blob":
+                    self._blobs[chunk_id] = obj[2]
+        content = self._blobs.pop(blob_id, None)
+        if content is None:
+            raise FileNotFoundError(f"{self._rel(path)} not found at {self.ref}")
+        return content.decode("utf-8")
+
+    def close(self) -> None:
+        self._batch.close()
+
+
+def _join_rel(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
 
 def load_dashboard_data(
-    repo_root: Path, github_url: str | None = None
+    repo_root: Path,
+    github_url: str | None = None,
+    ref: str | None = None,
+    active_cache: Path | None = None,
 ) -> DashboardData:
     """Load all quest data and build the complete dashboard model.
 
     Args:
         repo_root: Repository root directory
         github_url: GitHub repo URL (auto-detected if None)
+        ref: Git ref (branch, tag, commit) to read quest data from instead
+            of the working tree
+        active_cache: Cache for load_active_quests_from_events(); when set
+            (working tree only), active quests are updated from the event log
 
     Returns:
         DashboardData with finished, active, and abandoned quests
+
+    Raises:
+        ValueError: ref does not name a commit
+        OSError: git could not be run for ref
     """
     journal_dir = repo_root / "docs" / "quest-journal"
     quest_dir = repo_root / ".quest"
 
-    warnings: list[str] = []
-
-    # Load journal entries
-    journal_entries, journal_warnings = load_journal_entries(journal_dir, repo_root)
-    warnings.extend(journal_warnings)
+    warnings: list[Diagnostic] = []
 
-    # Load active quests
-    active_quests, active_warnings = load_active_quests(quest_dir)
-    warnings.extend(active_warnings)
+    source = GitTreeSource(repo_root, ref) if ref else FileSystemSource(repo_root)
+    with source:
+        # Load journal entries
+        journal_entries, journal_warnings = load_journal_entries(
+            journal_dir, repo_root, source
+        )
+        warnings.extend(journal_warnings)
+
+        # Load active quests
+        if active_cache is not None and ref is None:
+            active_quests, active_warnings, states_parsed = load_active_quests_from_events(
+                quest_dir, active_cache
+            )
+        else:
+            active_quests, active_warnings = load_active_quests(quest_dir, source)
+            states_parsed = len(active_quests)
+        warnings.extend(active_warnings)
+    files_parsed = {"journal": len(journal_entries), "state": states_parsed}
 
     # Deduplicate: exclude active quests that already have journal entries
     # (Arbiter guidance: prevents a quest appearing in both Finished and In Progress)
@@ -81,72 +303,118 @@ def load_dashboard_data(
         abandoned_quests=abandoned,
         warnings=warnings,
         github_repo_url=github_url,
+        files_parsed=files_parsed,
     )
 
 
 def load_journal_entries(
-    journal_dir: Path, repo_root: Path
-) -> tuple[list[JournalEntry], list[str]]:
+    journal_dir: Path, repo_root: Path, source: FileSystemSource | None = None
+) -> tuple[list[JournalEntry], list[Diagnostic]]:
     """Load all journal entries from docs/quest-journal/*.md.
 
     Args:
         journal_dir: Path to docs/quest-journal directory
         repo_root: Repository root (for git log PR extraction)
+        source: Where files are read from (default: the working tree)
 
     Returns:
         Tuple of (journal entries, warnings)
     """
+    source = source or FileSystemSource(repo_root)
     entries: list[JournalEntry] = []
-    warnings: list[str] = []
-
-    if not journal_dir.exists():
-        warnings.append(f"Journal directory not found: {journal_dir}")
+    warnings: list[Diagnostic] = []
+
+    if not source.exists(journal_dir):
+        journal_display = _display_path(journal_dir, repo_root)
+        warnings.append(
+            Diagnostic(
+                "journal-dir-missing",
+                f"Journal directory not found: {journal_display}",
+                journal_display,
+            )
+        )
         return entries, warnings
 
-    for path in sorted(journal_dir.glob("*.md")):
+    for path in source.journal_files(journal_dir):
         # BUILDER GUIDANCE NOTE #1: Skip README.md
         if path.name == "README.md":
             continue
 
+        started = time.perf_counter()
         try:
-            entry = _parse_journal_entry(path, repo_root)
+            entry = _parse_journal_entry(path, repo_root, source)
             entries.append(entry)
         except Exception as e:
-            warnings.append(f"Failed to parse journal {path.name}: {e}")
+            warnings.append(
+                Diagnostic(
+                    "journal-parse",
+                    f"Failed to parse journal {path.name}: {e}",
+                    _display_path(path, repo_root),
+                )
+            )
+        _check_parse_budget(path.name, started, warnings, _display_path(path, repo_root))
 
     return entries, warnings
 
 
-def _parse_journal_entry(journal_path: Path, repo_root: Path) -> JournalEntry:
+def _check_parse_budget(
+    name: str, started: float, warnings: list[Diagnostic], file: str
+) -> None:
+    """Warn when one file took longer than PARSE_BUDGET_SECONDS to parse."""
+    elapsed = time.perf_counter() - started
+    if elapsed > PARSE_BUDGET_SECONDS:
+        warnings.append(
+            Diagnostic(
+                "slow-parse",
+                f"Slow parse: {name} took {elapsed:.2f}s "
+                f"(budget {PARSE_BUDGET_SECONDS:.2f}s); check it for pathological content",
+                file,
+            )
+        )
+
+
+def _display_path(path: Path, repo_root: Path) -> str:
+    """Path relative to repo_root when possible, for diagnostics."""
+    try:
+        return path.relative_to(repo_root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _parse_journal_entry(
+    journal_path: Path, repo_root: Path, source: FileSystemSource | None = None
+) -> JournalEntry:
     """Parse a single journal markdown file into a JournalEntry.
 
     Args:
         journal_path: Path to the journal markdown file
         repo_root: Repository root (for git log PR extraction)
+        source: Where the file is read from (default: the working tree)
 
     Returns:
         JournalEntry with extracted metadata
     """
-    content = journal_path.read_text(encoding="utf-8")
+    source = source or FileSystemSource(repo_root)
+    content = source.read_text(journal_path)
 
     # Extract quest_id (strip surrounding backticks per Arbiter guidance)
-    quest_id = _extract_metadata(content, "quest id") or _humanize_filename(
+    quest_id = extract_metadata(content, "quest id") or humanize_filename(
         journal_path.stem
     )
     quest_id = quest_id.strip("`")
 
     # Extract slug (fallback to quest_id)
-    slug = _extract_metadata(content, "slug") or quest_id
+    slug = extract_metadata(content, "slug") or quest_id
 
     # Extract title
-    title = _extract_title(content) or _humanize_filename(journal_path.stem)
+    title = extract_title(content) or humanize_filename(journal_path.stem)
 
     # Extract status and normalize
-    raw_status = _extract_metadata(content, "status") or "Completed"
-    status = _normalize_status(raw_status)
+    raw_status = extract_metadata(content, "status") or "Completed"
+    status = normalize_status(raw_status)
 
     # Extract completed date
-    completed_date = _extract_date(content, journal_path)
+    completed_date = extract_date(content, journal_path)
 
     # Extract elevator pitch from Summary section
     elevator_pitch = _extract_summary_pitch(content) or _extract_first_paragraph(
@@ -154,7 +422,7 @@ def _parse_journal_entry(journal_path: Path, repo_root: Path) -> JournalEntry:
     )
 
     # Extract PR number
-    pr_number = extract_pr_number(content, journal_path, repo_root)
+    pr_number = extract_pr_number(content, journal_path, repo_root, source.rev)
 
     # BUILDER GUIDANCE NOTE #2: Handle both bold and list-item iteration formats
     plan_iterations = _extract_iterations(content, "plan")
@@ -177,7 +445,7 @@ def _parse_journal_entry(journal_path: Path, repo_root: Path) -> JournalEntry:
     )
 
 
-def _extract_metadata(content: str, key: str) -> str | None:
+def extract_metadata(content: str, key: str) -> str | None:
     """Extract metadata value from bold or plain markdown patterns.
 
     Matches both:
@@ -203,7 +471,7 @@ def _extract_metadata(content: str, key: str) -> str | None:
     return match.group(1).strip() if match else None
 
 
-def _extract_title(content: str) -> str | None:
+def extract_title(content: str) -> str | None:
     """Extract title from journal heading.
 
     Tries in order:
@@ -223,7 +491,7 @@ def _extract_title(content: str) -> str | None:
     return None
 
 
-def _normalize_status(raw_status: str) -> str:
+def normalize_status(raw_status: str) -> str:
     """Normalize status string to 'Completed' or 'Abandoned'.
 
     BUILDER GUIDANCE NOTE #3: Use prefix matching, not exact equality.
@@ -248,7 +516,7 @@ def _normalize_status(raw_status: str) -> str:
     return "Completed"
 
 
-def _extract_date(content: str, journal_path: Path) -> date:
+def extract_date(content: str, journal_path: Path) -> date:
     """Extract completion date from metadata or filename.
 
     Tries in order:
@@ -259,7 +527,7 @@ def _extract_date(content: str, journal_path: Path) -> date:
     """
     # Try metadata fields
     for key in ["completed", "date"]:
-        date_str = _extract_metadata(content, key)
+        date_str = extract_metadata(content, key)
         if date_str:
             parsed = _parse_date_string(date_str)
             if parsed:
@@ -337,17 +605,51 @@ def _extract_summary_pitch(content: str) -> str | None:
 
     Returns the first paragraph under the ## Summary heading.
     """
-    # Find ## Summary section
-    match = re.search(
-        r"^##\s+Summary\s*$(.+?)(?=^##|\Z)", content, re.MULTILINE | re.DOTALL
-    )
-    if not match:
+    section = _split_sections(content, ("Summary",)).get("Summary")
+    if section is None:
         return None
-
-    section = match.group(1).strip()
     return _extract_first_paragraph(section)
 
 
+def _split_sections(content: str, names: tuple[str, ...] | None = None) -> dict[str, str]:
+    """Split markdown into ``## Heading`` -> body text in one linear pass.
+
+    A section runs until the next line starting with ``##`` (so ``###``
+    subheadings also end it). If a heading repeats, the first one wins.
+    Replaces lazy ``(.+?)(?=^##|\\Z)`` DOTALL scans, whose cost grows with
+    the length of the tail after the heading.
+
+    Args:
+        content: Markdown text
+        names: Only collect these headings, stopping once all are found
+            (None = every heading)
+    """
+    if names is None:
+        matches = (m for m in _SECTION_HEADING_RE.finditer(content))
+    else:
+        # One C-level search per wanted heading instead of visiting every heading
+        found = (_heading_re(name).search(content) for name in names)
+        matches = (m for m in found if m is not None)
+
+    sections: dict[str, str] = {}
+    for match in matches:
+        heading = match.group(1).strip()
+        if heading in sections:
+            continue
+        body_start = match.end() + 1
+        body_end = content.find("\n##", match.end())
+        if body_end == -1:
+            body_end = len(content)
+        sections[heading] = content[body_start:body_end]
+    return sections
+
+
+@functools.lru_cache(maxsize=None)
+def _heading_re(name: str) -> re.Pattern[str]:
+    """Pattern for the ``## name`` heading line, as _SECTION_HEADING_RE reads it."""
+    return re.compile(rf"^##[^\S\n]([^\S\n]*{re.escape(name)}[^\S\n]*)$", re.MULTILINE)
+
+
 def _extract_first_paragraph(content: str) -> str:
     """Extract the first non-empty paragraph from content.
 
@@ -367,9 +669,7 @@ def _extract_first_paragraph(content: str) -> str:
             continue
 
         # Skip metadata lines: **Key:** value (key followed by colon inside or outside bold)
-        if re.match(r"\*\*[^*]+:\s*\*\*", stripped) or re.match(
-            r"\*\*[^*]+\*\*\s*:", stripped
-        ):
+        if stripped.startswith("**") and _is_metadata_line(stripped):
             if paragraph_lines:
                 break
             continue
@@ -379,7 +679,25 @@ def _extract_first_paragraph(content: str) -> str:
     return " ".join(paragraph_lines) if paragraph_lines else ""
 
 
-def extract_pr_number(content: str, journal_path: Path, repo_root: Path) -> int | None:
+def _is_metadata_line(stripped: str) -> bool:
+    """Return True for ``**Key:** value`` or ``**Key**: value`` lines.
+
+    Plain string scanning, so long lines of ``*``, ``:`` or spaces cannot
+    trigger regex backtracking.
+    """
+    end = stripped.find("**", 2)
+    key = stripped[2:end]
+    if end == -1 or not key or "*" in key:
+        return False
+    key_stripped = key.rstrip()
+    if len(key_stripped) > 1 and key_stripped.endswith(":"):
+        return True
+    return stripped[end + 2 :].lstrip().startswith(":")
+
+
+def extract_pr_number(
+    content: str, journal_path: Path, repo_root: Path, rev: str = "HEAD"
+) -> int | None:
     """Extract PR number from journal metadata or git log.
 
     Tries in order:
@@ -391,12 +709,13 @@ def extract_pr_number(content: str, journal_path: Path, repo_root: Path) -> int
         content: Journal markdown content
         journal_path: Path to journal file
         repo_root: Repository root
+        rev: Revision whose merge history is searched
 
     Returns:
         PR number or None
     """
     # Try metadata field
-    pr_str = _extract_metadata(content, "pr")
+    pr_str = extract_metadata(content, "pr")
     if pr_str:
         # Try #123 pattern
         match = re.search(r"#(\d+)", pr_str)
@@ -408,25 +727,12 @@ def extract_pr_number(content: str, journal_path: Path, repo_root: Path) -> int
         if match:
             return int(match.group(1))
 
-    # Try git log as fallback
+    # Try merge history as fallback (one git log per repo, see gitmeta)
     try:
-        rel_path = journal_path.relative_to(repo_root)
-        result = subprocess.run(
-            ["git", "log", "--merges", "--format=%s", "--", str(rel_path)],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            # Match "Merge pull request #123" pattern specifically
-            match = re.search(r"Merge pull request #(\d+)", result.stdout)
-            if match:
-                return int(match.group(1))
-    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
-        pass
-
-    return None
+        rel_path = journal_path.relative_to(repo_root).as_posix()
+    except ValueError:
+        return None
+    return merge_pr_index(repo_root, rev).get(rel_path)
 
 
 def _extract_iterations(content: str, iteration_type: str) -> int | None:
@@ -446,12 +752,16 @@ def _extract_iterations(content: str, iteration_type: str) -> int | None:
     # Pattern matches both bold and list-item formats
     # Bold format: **Plan iterations:** 1 (colon is INSIDE the **)
     # List format: - Plan iterations: 1 (no **)
-    pattern = rf"(?:\*\*)?{re.escape(iteration_type)}\s+iterations:\s*(?:\*\*)?\s*(\d+)"
+    # (Whitespace is matched once around the optional ** so a long run of
+    # spaces cannot be split between two \s* in quadratically many ways.
+    # The pattern starts at the literal key, not an optional leading **,
+    # so the engine can skip ahead instead of trying every position.)
+    pattern = rf"{re.escape(iteration_type)}\s+iterations:\s*(?:\*\*\s*)?(\d+)"
     match = re.search(pattern, content, re.IGNORECASE)
     return int(match.group(1)) if match else None
 
 
-def _humanize_filename(stem: str) -> str:
+def humanize_filename(stem: str) -> str:
     """Convert filename stem to human-readable title.
 
     Example: "quest-journal-example" -> "Quest Journal Example"
@@ -459,38 +769,152 @@ def _humanize_filename(stem: str) -> str:
     return stem.replace("-", " ").replace("_", " ").title()
 
 
-def load_active_quests(quest_dir: Path) -> tuple[list[ActiveQuest], list[str]]:
+def load_active_quests(
+    quest_dir: Path, source: FileSystemSource | None = None
+) -> tuple[list[ActiveQuest], list[Diagnostic]]:
     """Load all active quests from .quest/*/state.json.
 
-    Skips archived quests (directories containing 'archive' in path).
+    Skips archived quests (directories named 'archive' are not descended into).
 
     Args:
         quest_dir: Path to .quest directory
+        source: Where files are read from (default: the working tree)
 
     Returns:
         Tuple of (active quests sorted by phase and date, warnings)
     """
+    source = source or FileSystemSource(quest_dir.parent)
     quests: list[ActiveQuest] = []
-    warnings: list[str] = []
-
-    if not quest_dir.exists():
-        warnings.append(f"Quest directory not found: {quest_dir}")
+    warnings: list[Diagnostic] = []
+
+    if not source.exists(quest_dir):
+        quest_display = _display_path(quest_dir, quest_dir.parent)
+        warnings.append(
+            Diagnostic(
+                "quest-dir-missing", f"Quest directory not found: {quest_display}", quest_display
+            )
+        )
         return quests, warnings
 
-    for state_path in quest_dir.rglob("state.json"):
-        # Skip archived quests -- check path parts to avoid false positives
-        # on quest slugs that happen to contain "archive"
-        if "archive" in state_path.relative_to(quest_dir).parts:
-            continue
-
-        try:
-            quest, quest_warnings = _parse_active_quest(state_path)
+    for state_path in source.state_files(quest_dir):
+        quest, quest_warnings = _load_active_quest(state_path, quest_dir.parent, source)
+        if quest is not None:
             quests.append(quest)
-            warnings.extend(quest_warnings)
-        except Exception as e:
-            warnings.append(f"Failed to parse quest state {state_path}: {e}")
+        warnings.extend(quest_warnings)
+
+    _sort_active_quests(quests)
+    return quests, warnings
 
-    # Sort by phase order (building before plan), then by updated_at descending
+
+def load_active_quests_from_events(
+    quest_dir: Path, cache_path: Path
+) -> tuple[list[ActiveQuest], list[Diagnostic], int]:
+    """Load active quests, re-parsing only those changed since the last build.
+
+    Parsed quests, their warnings and the read position in
+    ``.quest/events.ndjson`` are cached in cache_path. Without a usable
+    cache, or when the log was replaced, every state file is parsed (like
+    load_active_quests). Otherwise only these are parsed:
+    - Quests named by events appended since the last build
+    - Top-level quest directories that appeared since then (found with one
+      directory listing); vanished directories are dropped
+    - Cached quests whose state.json or quest_brief.md changed on disk
+      (one stat each), so edits made without ``quest_state`` still show up
+
+    Args:
+        quest_dir: Path to .quest directory
+        cache_path: Cache file (read and rewritten)
+
+    Returns:
+        Tuple of (active quests sorted by phase and date, warnings,
+        number of state files parsed)
+    """
+    if not quest_dir.is_dir():
+        quests, warnings = load_active_quests(quest_dir)
+        return quests, warnings, 0
+
+    cache = _load_active_cache(cache_path)
+    tail = read_events(
+        quest_dir / EVENTS_NAME,
+        cache["log_id"] if cache else None,
+        cache["offset"] if cache else 0,
+    )
+    if cache is None or tail.reset:
+        entries: dict[str, dict] = {}
+        stale = find_state_files(quest_dir)
+    else:
+        entries = cache["quests"]
+        names = {
+            entry.name
+            for entry in os.scandir(quest_dir)
+            if entry.is_dir() and entry.name != "archive"
+        }
+        known = {key.split("/", 1)[0] for key in entries}
+        entries = {key: value for key, value in entries.items() if key.split("/", 1)[0] in names}
+        stale = [
+            path for name in sorted(names - known) for path in find_state_files(quest_dir / name)
+        ]
+        for key, entry in entries.items():
+            state_path = quest_dir / key / "state.json"
+            if entry.get("stat") != _quest_file_stat(state_path):
+                stale.append(state_path)
+        for event in tail.events:
+            path = quest_dir.parent / event["quest"] / "state.json"
+            if ".." in path.parts or not path.is_relative_to(quest_dir):
+                continue  # is_relative_to is lexical; ".." could escape .quest
+            if "archive" not in path.relative_to(quest_dir).parts:  # Never load archives
+                stale.append(path)
+
+    parsed = 0
+    for state_path in dict.fromkeys(stale):
+        key = state_path.parent.relative_to(quest_dir).as_posix()
+        if not state_path.is_file():
+            entries.pop(key, None)
+            continue
+        quest, quest_warnings = _load_active_quest(state_path, quest_dir.parent)
+        entries[key] = {
+            "quest": _encode_active_quest(quest) if quest is not None else None,
+            "warnings": [[w.code, w.message, w.file] for w in quest_warnings],
+            "stat": _quest_file_stat(state_path),
+        }
+        parsed += 1
+
+    entries = dict(sorted(entries.items()))  # Same order whether parsed or cached
+    quests = [_decode_active_quest(e["quest"]) for e in entries.values() if e["quest"]]
+    warnings = [Diagnostic(*w) for e in entries.values() for w in e["warnings"]]
+    _sort_active_quests(quests)
+
+    if parsed or cache is None or tail.offset != cache["offset"]:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "version": ACTIVE_CACHE_VERSION,
+            "log_id": tail.log_id,
+            "offset": tail.offset,
+            "quests": entries,
+        }
+        write_atomic(cache_path, json.dumps(payload, separators=(",", ":")) + "\n")
+    return quests, warnings, parsed
+
+
+def _load_active_quest(
+    state_path: Path, repo_root: Path, source: FileSystemSource | None = None
+) -> tuple[ActiveQuest | None, list[Diagnostic]]:
+    """Parse one quest, turning a failure into a state-parse diagnostic."""
+    started = time.perf_counter()
+    state_file = _display_path(state_path, repo_root)
+    try:
+        quest, warnings = _parse_active_quest(state_path, repo_root, source)
+    except Exception as e:
+        quest = None
+        warnings = [
+            Diagnostic("state-parse", f"Failed to parse quest state {state_file}: {e}", state_file)
+        ]
+    _check_parse_budget(state_path.parent.name, started, warnings, state_file)
+    return quest, warnings
+
+
+def _sort_active_quests(quests: list[ActiveQuest]) -> None:
+    """Sort by phase order (building before plan), then by updated_at descending."""
     quests.sort(
         key=lambda q: (
             _PHASE_ORDER.get(q.phase.lower().replace(" ", "_"), 999),
@@ -498,23 +922,92 @@ def load_active_quests(quest_dir: Path) -> tuple[list[ActiveQuest], list[str]]:
         )
     )
 
-    return quests, warnings
+
+def _quest_file_stat(state_path: Path) -> list[list[int] | None]:
+    """(mtime_ns, size) of a quest's state.json and quest_brief.md; None if missing."""
+    stats: list[list[int] | None] = []
+    for path in (state_path, state_path.parent / "quest_brief.md"):
+        try:
+            st = path.stat()
+        except OSError:
+            stats.append(None)
+        else:
+            stats.append([st.st_mtime_ns, st.st_size])
+    return stats
+
+
+def _load_active_cache(cache_path: Path) -> dict | None:
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict) or cache.get("version") != ACTIVE_CACHE_VERSION:
+        return None
+    if not isinstance(cache.get("quests"), dict) or not isinstance(cache.get("offset"), int):
+        return None
+    return cache
+
+
+def _encode_active_quest(quest: ActiveQuest) -> dict:
+    return {
+        "quest_id": quest.quest_id,
+        "slug": quest.slug,
+        "title": quest.title,
+        "elevator_pitch": quest.elevator_pitch,
+        "status": quest.status,
+        "phase": quest.phase,
+        "updated_at": quest.updated_at.isoformat(),
+        "plan_iterations": quest.plan_iterations,
+        "fix_iterations": quest.fix_iterations,
+        "quest_path": quest.quest_path.as_posix() if quest.quest_path else None,
+    }
+
+
+def _decode_active_quest(record: dict) -> ActiveQuest:
+    return ActiveQuest(
+        **{
+            **record,
+            "updated_at": datetime.fromisoformat(record["updated_at"]),
+            "quest_path": Path(record["quest_path"]) if record["quest_path"] else None,
+        }
+    )
 
 
-def _parse_active_quest(state_path: Path) -> tuple[ActiveQuest, list[str]]:
+def find_state_files(quest_dir: Path) -> list[Path]:
+    """Find state.json files below quest_dir without walking archive trees.
+
+    Only a directory named exactly "archive" is pruned, so quest slugs that
+    merely contain the word are still found.
+    """
+    found: list[Path] = []
+    for root, dirs, files in os.walk(quest_dir):
+        dirs[:] = [d for d in dirs if d != "archive"]
+        if "state.json" in files:
+            found.append(Path(root) / "state.json")
+    return found
+
+
+def _parse_active_quest(
+    state_path: Path,
+    repo_root: Path | None = None,
+    source: FileSystemSource | None = None,
+) -> tuple[ActiveQuest, list[Diagnostic]]:
     """Parse a single quest state.json and quest_brief.md into an ActiveQuest.
 
     Args:
         state_path: Path to state.json file
+        repo_root: Repository root (for the relative quest_path); optional
+        source: Where files are read from (default: the working tree)
 
     Returns:
         Tuple of (ActiveQuest with extracted data, list of warnings)
     """
     quest_dir = state_path.parent
-    warnings: list[str] = []
+    warnings: list[Diagnostic] = []
 
     # Load state.json
-    state_data = json.loads(state_path.read_text(encoding="utf-8"))
+    source = source or FileSystemSource(repo_root or quest_dir.parent)
+    state_data = json.loads(source.read_text(state_path))
 
     quest_id = state_data.get("quest_id", quest_dir.name)
     slug = state_data.get("slug", quest_id)
@@ -525,8 +1018,8 @@ def _parse_active_quest(state_path: Path) -> tuple[ActiveQuest, list[str]]:
     fix_iteration = state_data.get("fix_iteration")
 
     # Normalize status and phase for display
-    status = _normalize_display_label(raw_status)
-    phase = _normalize_display_label(raw_phase)
+    status = normalize_display_label(raw_status)
+    phase = normalize_display_label(raw_phase)
 
     # Parse updated_at
     if updated_at_str:
@@ -536,13 +1029,14 @@ def _parse_active_quest(state_path: Path) -> tuple[ActiveQuest, list[str]]:
 
     # Load quest_brief.md
     brief_path = quest_dir / "quest_brief.md"
-    if brief_path.exists():
-        brief_content = brief_path.read_text(encoding="utf-8")
-        title = _extract_brief_title(brief_content) or slug
+    if source.exists(brief_path):
+        brief_content = source.read_text(brief_path)
+        title = extract_brief_title(brief_content) or slug
         elevator_pitch = _extract_brief_pitch(brief_content) or ""
     else:
         msg = f"Missing quest_brief.md for quest {quest_id} ({quest_dir.name})"
-        warnings.append(msg)
+        brief_file = _relative_quest_path(brief_path, repo_root) or brief_path
+        warnings.append(Diagnostic("brief-missing", msg, brief_file.as_posix()))
         title = slug
         elevator_pitch = ""
 
@@ -557,12 +1051,23 @@ def _parse_active_quest(state_path: Path) -> tuple[ActiveQuest, list[str]]:
             updated_at=updated_at,
             plan_iterations=plan_iteration,
             fix_iterations=fix_iteration,
+            quest_path=_relative_quest_path(quest_dir, repo_root),
         ),
         warnings,
     )
 
 
-def _normalize_display_label(raw_value: str) -> str:
+def _relative_quest_path(quest_dir: Path, repo_root: Path | None) -> Path | None:
+    """Return quest_dir relative to repo_root, or None if not computable."""
+    if repo_root is None:
+        return None
+    try:
+        return quest_dir.relative_to(repo_root)
+    except ValueError:
+        return None
+
+
+def normalize_display_label(raw_value: str) -> str:
     """Normalize a status or phase value for display.
 
     Examples:
@@ -572,7 +1077,7 @@ def _normalize_display_label(raw_value: str) -> str:
     return raw_value.replace("_", " ").title()
 
 
-def _extract_brief_title(content: str) -> str | None:
+def extract_brief_title(content: str) -> str | None:
     """Extract title from quest_brief.md heading.
 
     Tries:
@@ -600,25 +1105,10 @@ def _extract_brief_pitch(content: str) -> str | None:
     2. First paragraph under "## Requirements" section
     3. First paragraph of entire brief
     """
-    # Try Original Prompt section
-    match = re.search(
-        r"^##\s+User Input \(Original Prompt\)\s*$(.+?)(?=^##|\Z)",
-        content,
-        re.MULTILINE | re.DOTALL,
-    )
-    if match:
-        section = match.group(1).strip()
-        pitch = _extract_first_paragraph(section)
-        if pitch:
-            return pitch
-
-    # Try Requirements section
-    match = re.search(
-        r"^##\s+Requirements\s*$(.+?)(?=^##|\Z)", content, re.MULTILINE | re.DOTALL
-    )
-    if match:
-        section = match.group(1).strip()
-        pitch = _extract_first_paragraph(section)
+    headings = ("User Input (Original Prompt)", "Requirements")
+    sections = _split_sections(content, headings)
+    for heading in headings:
+        pitch = _extract_first_paragraph(sections.get(heading, ""))
         if pitch:
             return pitch
 
@@ -629,38 +1119,46 @@ def _extract_brief_pitch(content: str) -> str | None:
 def detect_github_url(repo_root: Path) -> str:
     """Auto-detect GitHub repository URL from git remote.
 
+    Reads the origin remote from .git/config directly (see gitmeta). Only
+    forks ``git remote get-url`` when the git directory cannot be read.
+
     Args:
         repo_root: Repository root directory
 
     Returns:
         GitHub HTTPS URL or empty string if detection fails
     """
-    try:
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0:
-            remote_url = result.stdout.strip()
+    metadata = read_git_metadata(repo_root)
+    if metadata is not None:
+        remote_url = metadata.remotes.get("origin", "")
+    else:
+        remote_url = _git_remote_url_subprocess(repo_root)
+
+    return _normalize_github_url(remote_url)
 
-            # Convert SSH URL to HTTPS
-            if remote_url.startswith("git@github.com:"):
-                remote_url = remote_url.replace(
-                    "git@github.com:", "https://github.com/"
-                )
 
-            # Remove .git suffix
-            if remote_url.endswith(".git"):
-                remote_url = remote_url[:-4]
+def _git_remote_url_subprocess(repo_root: Path) -> str:
+    """Ask git for the origin URL (fallback when .git cannot be read)."""
+    result = run_git(["remote", "get-url", "origin"], repo_root, timeout=5)
+    if result is not None and result.returncode == 0:
+        return result.stdout.strip()
+    return ""
 
-            # Validate it's a GitHub URL
-            if "github.com" in remote_url:
-                return remote_url
 
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+def _normalize_github_url(remote_url: str) -> str:
+    """Convert a git remote URL to a GitHub HTTPS URL, or "" if not GitHub."""
+    remote_url = remote_url.strip()
+
+    # Convert SSH URL to HTTPS
+    if remote_url.startswith("git@github.com:"):
+        remote_url = remote_url.replace("git@github.com:", "https://github.com/")
+
+    # Remove .git suffix
+    if remote_url.endswith(".git"):
+        remote_url = remote_url[:-4]
+
+    # Validate it's a GitHub URL
+    if "github.com" in remote_url:
+        return remote_url
 
     return ""
@@ -0,0 +1,141 @@
+"""Prometheus textfile metrics for dashboard builds.
+
+Writes a ``.prom`` file for node_exporter's textfile collector so build
+health (stage durations, files parsed, cache hits, git processes, output
+size, warnings) and quest throughput (the KPI row counts) can be alerted
+on without scraping the HTML.
+
+The file is replaced atomically; the collector only reads ``*.prom`` files,
+so the temporary sibling is never scraped.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .fsutil import write_atomic
+from .models import DashboardData
+from .render import compute_status_counts
+
+PREFIX = "quest_dashboard"
+
+
+@dataclass(slots=True)
+class BuildMetrics:
+    """Mutable collector for one build's timings and counters."""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    stages: dict[str, float] = field(default_factory=dict)  # stage -> seconds
+    cache_hits: dict[str, int] = field(default_factory=dict)  # cache -> hits
+    git_processes: int = 0
+    output_bytes: int = 0
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a build stage; repeated stages accumulate."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def elapsed(self) -> float:
+        """Seconds since the collector was created."""
+        return time.perf_counter() - self.started_at
+
+
+def format_metrics(
+    metrics: BuildMetrics, data: DashboardData, finished_at: float | None = None
+) -> str:
+    """Render build and KPI metrics in the Prometheus text exposition format.
+
+    Args:
+        metrics: Collected build timings and counters
+        data: Dashboard data the build rendered (for KPI gauges)
+        finished_at: Unix time of build completion (default: now)
+
+    Returns:
+        Text suitable for a node_exporter ``.prom`` file
+    """
+    counts = compute_status_counts(data)
+    lines: list[str] = []
+
+    def family(name: str, kind: str, help_text: str, samples: Mapping[str, float] | float):
+        lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+        if isinstance(samples, Mapping):
+            label = _LABELS[name]
+            for key in sorted(samples):
+                value = _format_value(samples[key])
+                lines.append(f'{PREFIX}_{name}{{{label}="{_escape_label(key)}"}} {value}')
+        else:
+            lines.append(f"{PREFIX}_{name} {_format_value(samples)}")
+
+    family(
+        "build_duration_seconds", "gauge", "Wall time of the last build.", metrics.elapsed()
+    )
+    family(
+        "build_stage_duration_seconds",
+        "gauge",
+        "Wall time of each stage of the last build.",
+        metrics.stages,
+    )
+    family(
+        "build_last_success_timestamp_seconds",
+        "gauge",
+        "Unix time the last build finished.",
+        finished_at if finished_at is not None else time.time(),
+    )
+    family(
+        "files_parsed", "gauge", "Source files parsed by the last build.", data.files_parsed
+    )
+    family(
+        "cache_hits", "gauge", "Cache hits during the last build.", metrics.cache_hits
+    )
+    family(
+        "git_processes",
+        "gauge",
+        "git processes spawned by the last build.",
+        metrics.git_processes,
+    )
+    family(
+        "output_bytes", "gauge", "Size of the dashboard HTML in bytes.", metrics.output_bytes
+    )
+    family("warnings", "gauge", "Warnings emitted by the last build.", len(data.warnings))
+    family("quests_total", "gauge", "Quests shown on the dashboard.", sum(counts.values()))
+    family(
+        "quests",
+        "gauge",
+        "Quests by dashboard status (the KPI row).",
+        counts,
+    )
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics(path: Path, text: str) -> None:
+    """Atomically replace the metrics file (creating parent directories)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, text)
+
+
+# Label name for each labelled metric family
+_LABELS = {
+    "build_stage_duration_seconds": "stage",
+    "files_parsed": "kind",
+    "cache_hits": "cache",
+    "quests": "status",
+}
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return f"{value:.6f}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -3,7 +3,15 @@
 This module defines frozen dataclasses representing:
 - JournalEntry: A completed or abandoned quest from docs/quest-journal/*.md
 - ActiveQuest: An in-progress quest from .quest/*/state.json
+- Diagnostic: One build warning with a stable code and the file it concerns
 - DashboardData: The complete dashboard model with all three status groups
+- StatsSnapshot: One build's KPI and per-phase counts, for historical trends
+- PortfolioShard: One lazily loaded period of the portfolio (sharded output)
+- HandoffRoleStats: Schema violation counts for one role's handoff files
+- QuestAnalytics: Lead-time percentiles, iteration histograms and throughput
+- DiagnosticGroup: Distinct diagnostics with one code, for the capped summary
+- PhaseDwell: How long quests stayed in one phase, mined from git history
+- QuestArtifactSize: One quest's phase artifact bytes/tokens and their growth
 """
 
 from __future__ import annotations
@@ -44,6 +52,19 @@ class ActiveQuest:
     updated_at: datetime
     plan_iterations: int | None = None
     fix_iterations: int | None = None
+    quest_path: Path | None = None  # Quest directory, relative to repo root
+
+
+@dataclass(frozen=True, slots=True)
+class Diagnostic:
+    """One build warning. Diagnostics with the same code are grouped."""
+
+    code: str  # Stable kebab-case kind, e.g. "journal-parse"
+    message: str  # Human-readable, names the file itself
+    file: str = ""  # File or quest the warning concerns ("" = not file-specific)
+
+    def __str__(self) -> str:
+        return self.message
 
 
 @dataclass(frozen=True, slots=True)
@@ -53,6 +74,80 @@ class DashboardData:
     finished_quests: list[JournalEntry]  # status == "Completed"
     active_quests: list[ActiveQuest]
     abandoned_quests: list[JournalEntry]  # status == "Abandoned"
-    warnings: list[str] = field(default_factory=list)
+    warnings: list[Diagnostic] = field(default_factory=list)
     generated_at: datetime = field(default_factory=lambda: datetime.now(tz=UTC))
     github_repo_url: str = ""
+    files_parsed: dict[str, int] = field(default_factory=dict)  # "journal"/"state" -> count
+
+
+@dataclass(frozen=True, slots=True)
+class StatsSnapshot:
+    """KPI and per-phase counts recorded by one dashboard build."""
+
+    taken_at: datetime
+    counts: dict[str, int]  # finished, abandoned, in_progress, blocked, unknown
+    phases: dict[str, int] = field(default_factory=dict)  # active quests per phase
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioShard:
+    """A content-addressed portfolio fragment for one past year or quarter."""
+
+    period: str  # "2025" or "2025-Q3"
+    href: str  # Relative to the index page, e.g. "portfolio/2025.<hash>.html"
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class HandoffRoleStats:
+    """handoff*.json files written by one role and how many violate the schema."""
+
+    role: str
+    files: int
+    invalid: int
+
+
+@dataclass(frozen=True, slots=True)
+class QuestAnalytics:
+    """Cycle-time, iteration and throughput aggregates across all quests."""
+
+    lead_time_days: dict[str, float]  # "p50", "p75", ... -> days (empty if no samples)
+    lead_time_samples: int  # Finished quests with a start date in their id
+    plan_iterations: dict[str, int]  # "0".."5", "6+" -> quests
+    fix_iterations: dict[str, int]
+    weekly_throughput: list[tuple[str, int]]  # (week start "YYYY-MM-DD", finished)
+
+
+@dataclass(frozen=True, slots=True)
+class DiagnosticGroup:
+    """Distinct diagnostics sharing one code, with the first few kept as samples."""
+
+    code: str
+    count: int  # Distinct diagnostics (exact repeats are counted once)
+    samples: tuple[Diagnostic, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseDwell:
+    """Time quests spent in one phase before moving on (closed intervals only)."""
+
+    phase: str  # Raw state.json phase, e.g. "plan", "code_review"
+    samples: int  # Completed stays in this phase
+    median_hours: float
+    p90_hours: float
+    total_hours: float
+
+
+@dataclass(frozen=True, slots=True)
+class QuestArtifactSize:
+    """Size of one quest's phase artifacts, with growth across iterations."""
+
+    quest_id: str  # Quest directory relative to .quest/
+    files: int
+    bytes: int
+    tokens: int  # Approximate (four characters per token)
+    largest: str  # Largest artifact by tokens, relative to the quest directory
+    largest_tokens: int
+    plan_tokens: tuple[int, ...]  # phase_01 token total per plan iteration, oldest first
+    fix_tokens: tuple[int, ...]  # phase_03 token total per fix iteration, oldest first
+    over_budget: bool
@@ -0,0 +1,268 @@
+"""Archive pack files: one compressed file per archived quest.
+
+Archived quests (``.quest/archive/<id>/``) are never modified again, yet each
+one keeps dozens of small files and directories around forever. ``compact``
+packs every archived quest directory into ``.quest/archive/<id>.qpack`` and
+removes the directory.
+
+A pack is a deflate-compressed ZIP file. Its central directory is the member
+index, so ``state.json``, ``quest_brief.md`` or a single log can be read with
+random access: one seek and one decompress, with no extraction.
+``iter_archived`` yields the same reader interface for packs and for
+directories that have not been compacted yet, so history tooling does not
+need to care which form an archived quest is in.
+
+Only the archive readers use packs: ``iter_archived`` and the quest id
+resolver. The dashboard takes finished quests from the journal and
+``audit`` checks active transitions, so both skip ``archive/`` in either
+form and packing an archived quest changes neither of them.
+
+This module is standalone (stdlib only), like ``audit``.
+
+Usage:
+    python3 -m quest_dashboard.packs compact [--repo-root PATH] [--keep]
+    python3 -m quest_dashboard.packs list [--repo-root PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import zipfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+ARCHIVE_DIR = "archive"
+PACK_SUFFIX = ".qpack"
+
+
+class QuestPack:
+    """Read-only access to the members of one packed quest."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.quest_id = path.name[: -len(PACK_SUFFIX)]
+        self._zip = zipfile.ZipFile(path)
+
+    def names(self) -> list[str]:
+        """Member paths relative to the quest directory, sorted."""
+        return sorted(info.filename for info in self._zip.infolist() if not info.is_dir())
+
+    def has(self, name: str) -> bool:
+        """Return True if the pack holds the member."""
+        try:
+            self._zip.getinfo(name)
+        except KeyError:
+            return False
+        return True
+
+    def read_bytes(self, name: str) -> bytes:
+        """Read one member. Raises FileNotFoundError if it is absent."""
+        try:
+            return self._zip.read(name)
+        except KeyError:
+            raise FileNotFoundError(f"{self.path}: no member {name}") from None
+
+    def read_text(self, name: str) -> str:
+        """Read one member as UTF-8 text."""
+        return self.read_bytes(name).decode("utf-8")
+
+    def read_json(self, name: str = "state.json") -> object:
+        """Read and parse one JSON member."""
+        return json.loads(self.read_bytes(name))
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self) -> QuestPack:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ArchiveDir(QuestPack):
+    """The QuestPack interface over an archived quest that is not packed yet."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.quest_id = path.name
+
+    def names(self) -> list[str]:
+        return sorted(p.relative_to(self.path).as_posix() for p in _files(self.path))
+
+    def has(self, name: str) -> bool:
+        return (self.path / name).is_file()
+
+    def read_bytes(self, name: str) -> bytes:
+        return (self.path / name).read_bytes()
+
+    def close(self) -> None:
+        pass
+
+
+@dataclass(frozen=True, slots=True)
+class PackResult:
+    """Outcome of packing one archived quest directory."""
+
+    quest_id: str
+    members: int
+    source_bytes: int
+    pack_bytes: int
+    removed: bool  # Source directory deleted after the pack was verified
+
+
+def iter_archived(quest_root: Path) -> Iterator[QuestPack]:
+    """Yield a reader for every archived quest, packed or not, by quest id.
+
+    A quest present both as a pack and a directory (``compact --keep``) is
+    read from the pack. Readers are closed when the iteration moves on.
+    """
+    archive = quest_root / ARCHIVE_DIR
+    if not archive.is_dir():
+        return
+    for entry in sorted(archive.iterdir(), key=lambda p: p.name):
+        if entry.is_dir():
+            if entry.with_name(entry.name + PACK_SUFFIX).is_file():
+                continue
+            reader: QuestPack = ArchiveDir(entry)
+        elif entry.name.endswith(PACK_SUFFIX) and entry.is_file():
+            try:
+                reader = QuestPack(entry)
+            except (OSError, zipfile.BadZipFile):
+                continue
+        else:
+            continue
+        with reader:
+            yield reader
+
+
+def pack_quest_dir(quest_dir: Path, remove: bool = True) -> PackResult:
+    """Pack one archived quest directory into a sibling ``<id>.qpack``.
+
+    The pack is written under a temporary name, re-read to verify every
+    member's CRC, and only then renamed into place and the directory removed.
+
+    Args:
+        quest_dir: ``.quest/archive/<id>`` directory
+        remove: Delete the directory once the pack is in place
+
+    Returns:
+        PackResult describing the pack
+
+    Raises:
+        FileExistsError: A pack for this quest already exists
+        OSError: The pack could not be written or verified
+    """
+    pack_path = quest_dir.with_name(quest_dir.name + PACK_SUFFIX)
+    if pack_path.exists():
+        raise FileExistsError(f"Pack already exists: {pack_path}")
+
+    files = _files(quest_dir)
+    source_bytes = sum(p.stat().st_size for p in files)
+    tmp_path = pack_path.with_name(f".{pack_path.name}.tmp-{os.getpid()}")
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as pack:
+            for path in files:
+                pack.write(path, path.relative_to(quest_dir).as_posix())
+        with zipfile.ZipFile(tmp_path) as pack:
+            bad = pack.testzip()
+            if bad is not None or len(pack.infolist()) != len(files):
+                raise OSError(f"Pack verification failed for {quest_dir}: {bad or 'member count'}")
+        os.replace(tmp_path, pack_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if remove:
+        shutil.rmtree(quest_dir)
+    return PackResult(
+        quest_id=quest_dir.name,
+        members=len(files),
+        source_bytes=source_bytes,
+        pack_bytes=pack_path.stat().st_size,
+        removed=remove,
+    )
+
+
+def compact_archive(quest_root: Path, remove: bool = True) -> tuple[list[PackResult], list[str]]:
+    """Pack every unpacked directory under ``.quest/archive``.
+
+    Args:
+        quest_root: The ``.quest`` directory
+        remove: Delete each directory once its pack is verified
+
+    Returns:
+        Tuple of (results for packed quests, warnings)
+    """
+    results: list[PackResult] = []
+    warnings: list[str] = []
+    archive = quest_root / ARCHIVE_DIR
+    if not archive.is_dir():
+        return results, warnings
+    for quest_dir in sorted(p for p in archive.iterdir() if p.is_dir()):
+        if quest_dir.with_name(quest_dir.name + PACK_SUFFIX).exists():
+            if remove:
+                warnings.append(f"Already packed, directory left in place: {quest_dir.name}")
+            continue
+        try:
+            results.append(pack_quest_dir(quest_dir, remove=remove))
+        except OSError as e:
+            warnings.append(f"Could not pack {quest_dir.name}: {e}")
+    return results, warnings
+
+
+def _files(directory: Path) -> list[Path]:
+    """Regular files under directory, sorted, skipping symlinks."""
+    files = []
+    for root, dirs, names in os.walk(directory):
+        dirs.sort()
+        for name in sorted(names):
+            path = Path(root) / name
+            if path.is_file() and not path.is_symlink():
+                files.append(path)
+    return files
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Pack archived quests into .qpack files")
+    parser.add_argument("command", choices=("compact", "list"))
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--keep", action="store_true", help="compact: keep the directories after packing."
+    )
+    args = parser.parse_args(argv)
+    quest_root = Path(args.repo_root).resolve() / ".quest"
+
+    if args.command == "list":
+        for reader in iter_archived(quest_root):
+            phase = "?"
+            if reader.has("state.json"):
+                try:
+                    state = reader.read_json("state.json")
+                    phase = state.get("phase", "?") if isinstance(state, dict) else "?"
+                except ValueError:
+                    pass
+            kind = "dir" if isinstance(reader, ArchiveDir) else "pack"
+            print(f"{reader.quest_id}\t{kind}\t{phase}\t{len(reader.names())} files")
+        return 0
+
+    results, warnings = compact_archive(quest_root, remove=not args.keep)
+    for result in results:
+        print(
+            f"Packed {result.quest_id}: {result.members} files, "
+            f"{result.source_bytes} -> {result.pack_bytes} bytes"
+        )
+    for warning in warnings:
+        print(f"Warning: {warning}", file=sys.stderr)
+    print(f"{len(results)} quests packed")
+    return 1 if warnings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
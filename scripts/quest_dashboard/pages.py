@@ -0,0 +1,593 @@
+"""Per-quest detail pages for the Quest Dashboard static-site mode.
+
+Renders one lightweight HTML page per quest next to the index:
+- Finished/abandoned quests show their full journal (docs/quest-journal/*.md)
+- Active quests show their quest_brief.md
+
+Pages render concurrently in a worker pool. Each page's inputs (source
+file bytes plus the card metadata shown on the page) are hashed, and the
+hashes are kept in a manifest beside the pages. A page is only rewritten
+when its hash changes, so rebuilding a large site after one journal edit
+touches one page plus the index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+from .fsutil import write_atomic
+from .models import ActiveQuest, DashboardData, JournalEntry
+from .render import badge_for, compute_pr_link
+
+# Bump when the page template or markdown converter changes, so every
+# page is re-rendered once even though its sources did not change.
+PAGE_FORMAT_VERSION = "1"
+
+MANIFEST_NAME = ".pages-manifest.json"
+
+# Below this many pages a process pool costs more than it saves
+_MIN_PARALLEL_PAGES = 64
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass(frozen=True, slots=True)
+class PageBuildResult:
+    """Outcome of a detail-page build."""
+
+    links: dict[str, str]  # quest_id -> href relative to the index page
+    written: int
+    unchanged: int
+    removed: int
+
+
+def detail_page_filename(quest_id: str) -> str:
+    """Return a filesystem-safe page filename for a quest id."""
+    safe = _UNSAFE_FILENAME_CHARS.sub("-", quest_id).strip(".-") or "quest"
+    return f"{safe}.html"
+
+
+def write_detail_pages(
+    data: DashboardData,
+    repo_root: Path,
+    pages_dir: Path,
+    index_href: str = "../index.html",
+    workers: int | None = None,
+) -> PageBuildResult:
+    """Render per-quest detail pages, rewriting only pages whose inputs changed.
+
+    Args:
+        data: Dashboard data with all quests
+        repo_root: Repository root (journal and brief paths are relative to it)
+        pages_dir: Directory to write pages into (created if missing); must
+            sit next to the index page, since links are relative to its parent
+        index_href: Link from each page back to the dashboard index
+        workers: Worker process count (None = os.cpu_count(), 1 = serial)
+
+    Returns:
+        PageBuildResult with detail links and write counts
+    """
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = pages_dir / MANIFEST_NAME
+    old_manifest = _load_manifest(manifest_path)
+
+    quests: list[Union[JournalEntry, ActiveQuest]] = [
+        *data.finished_quests,
+        *data.abandoned_quests,
+        *data.active_quests,
+    ]
+
+    jobs = []
+    links: dict[str, str] = {}
+    seen_filenames: set[str] = set()
+    for quest in quests:
+        filename = detail_page_filename(quest.quest_id)
+        if filename in seen_filenames:
+            continue  # Duplicate quest ids keep the first quest's page
+        seen_filenames.add(filename)
+        links[quest.quest_id] = f"{pages_dir.name}/{filename}"
+        source = _source_path(quest, repo_root)
+        jobs.append(
+            (
+                str(pages_dir / filename),
+                str(source) if source else None,
+                _page_metadata(quest, data.github_repo_url),
+                index_href,
+                old_manifest.get(filename),
+            )
+        )
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 1 and len(jobs) >= _MIN_PARALLEL_PAGES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_build_page, jobs, chunksize=32))
+    else:
+        results = [_build_page(job) for job in jobs]
+
+    new_manifest = {}
+    written = 0
+    for (page_path, *_), (digest, changed) in zip(jobs, results):
+        new_manifest[Path(page_path).name] = digest
+        written += changed
+
+    # Remove pages for quests that no longer exist
+    removed = 0
+    for filename in old_manifest.keys() - new_manifest.keys():
+        try:
+            (pages_dir / filename).unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+
+    if new_manifest != old_manifest:
+        write_atomic(
+            manifest_path, json.dumps(new_manifest, indent=0, sort_keys=True) + "\n"
+        )
+
+    return PageBuildResult(
+        links=links,
+        written=written,
+        unchanged=len(jobs) - written,
+        removed=removed,
+    )
+
+
+def _source_path(quest: Union[JournalEntry, ActiveQuest], repo_root: Path) -> Path | None:
+    """Return the markdown source for a quest's detail page, if any."""
+    if isinstance(quest, JournalEntry):
+        return repo_root / quest.journal_path
+    if quest.quest_path is not None:
+        return repo_root / quest.quest_path / "quest_brief.md"
+    return None
+
+
+def _page_metadata(
+    quest: Union[JournalEntry, ActiveQuest], github_url: str
+) -> dict[str, str]:
+    """Collect the (picklable) card metadata shown on a detail page."""
+    badge_class, badge_text = badge_for(quest.status)
+    meta = {
+        "quest_id": quest.quest_id,
+        "title": quest.title,
+        "badge_class": badge_class,
+        "badge_text": badge_text,
+    }
+    if isinstance(quest, JournalEntry):
+        meta["Completion Date"] = quest.completed_date.strftime("%b %d, %Y")
+        if quest.pr_number:
+            meta["pr_href"] = compute_pr_link(quest.pr_number, github_url)
+            meta["pr_number"] = str(quest.pr_number)
+    else:
+        meta["Phase"] = quest.phase
+        meta["Updated"] = quest.updated_at.strftime("%b %d, %Y")
+    if quest.plan_iterations is not None or quest.fix_iterations is not None:
+        meta["Iterations"] = (
+            f"plan {quest.plan_iterations or 0} / fix {quest.fix_iterations or 0}"
+        )
+    return meta
+
+
+def _build_page(job: tuple) -> tuple[str, bool]:
+    """Worker: hash a page's inputs and (re)write it if the hash changed.
+
+    Returns:
+        Tuple of (input hash, whether the page file was written)
+    """
+    page_path, source_path, meta, index_href, old_digest = job
+
+    source = b""
+    if source_path is not None:
+        try:
+            source = Path(source_path).read_bytes()
+        except OSError:
+            source = b""
+
+    hasher = hashlib.sha256()
+    hasher.update(PAGE_FORMAT_VERSION.encode())
+    hasher.update(json.dumps([meta, index_href], sort_keys=True).encode("utf-8"))
+    hasher.update(b"\0")
+    hasher.update(source)
+    digest = hasher.hexdigest()
+
+    page = Path(page_path)
+    if digest == old_digest and page.exists():
+        return digest, False
+
+    markdown = source.decode("utf-8", errors="replace")
+    write_atomic(page, render_detail_page(meta, markdown, index_href))
+    return digest, True
+
+
+def render_detail_page(meta: dict[str, str], markdown: str, index_href: str) -> str:
+    """Render a single detail page from card metadata and markdown source."""
+    skip = {"quest_id", "title", "badge_class", "badge_text", "pr_href", "pr_number"}
+    meta_items = [f"<span><b>Quest ID:</b> {html.escape(meta['quest_id'])}</span>"]
+    for label, value in meta.items():
+        if label not in skip:
+            meta_items.append(f"<span><b>{label}:</b> {html.escape(value)}</span>")
+    if "pr_href" in meta:
+        meta_items.append(
+            f'<span><b>PR:</b> <a href="{meta["pr_href"]}">#{meta["pr_number"]}</a></span>'
+        )
+
+    meta_html = "\n      ".join(meta_items)
+    body = render_markdown(markdown) if markdown.strip() else (
+        '<p class="empty-state">No journal or brief available for this quest.</p>'
+    )
+    title = html.escape(meta["title"])
+
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>{title} - Quest Portfolio</title>
+  <style>
+{_PAGE_CSS}
+  </style>
+</head>
+<body>
+  <main class="page">
+    <nav><a href="{html.escape(index_href)}">&larr; Quest Portfolio</a></nav>
+    <header>
+      <h1>{title}</h1>
+      <span class="badge badge--{meta["badge_class"]}">{meta["badge_text"]}</span>
+    </header>
+    <p class="quest-meta">
+      {meta_html}
+    </p>
+    <article class="markdown">
+{body}
+    </article>
+  </main>
+</body>
+</html>
+"""
+
+
+_PAGE_CSS = """    body {
+      font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+      background: #0a0f1d;
+      color: #cbd5e1;
+      line-height: 1.6;
+      margin: 0;
+      padding: 2rem 1rem;
+    }
+    .page { max-width: 900px; margin: 0 auto; }
+    a { color: #60a5fa; }
+    nav { margin-bottom: 1.5rem; font-size: 0.9rem; }
+    header { display: flex; gap: 1rem; align-items: center; }
+    h1, h2, h3, h4 { color: #f8fafc; line-height: 1.3; }
+    .quest-meta {
+      display: grid;
+      gap: 4px;
+      font-size: 0.85rem;
+      color: #94a3b8;
+      border-bottom: 1px solid rgba(148, 163, 184, 0.22);
+      padding-bottom: 1rem;
+    }
+    .quest-meta b { color: #e2e8f0; }
+    .badge {
+      font-size: 0.75rem;
+      font-weight: 600;
+      padding: 0.25rem 0.75rem;
+      border-radius: 12px;
+      letter-spacing: 0.05em;
+      border: 1px solid currentColor;
+    }
+    .badge--finished { color: #34d399; }
+    .badge--in-progress { color: #60a5fa; }
+    .badge--blocked { color: #f59e0b; }
+    .badge--abandoned { color: #f87171; }
+    .badge--unknown { color: #a78bfa; }
+    pre {
+      background: rgba(15, 23, 42, 0.84);
+      padding: 1rem;
+      border-radius: 8px;
+      overflow-x: auto;
+    }
+    code { font-family: ui-monospace, Menlo, Monaco, Consolas, monospace; font-size: 0.85em; }
+    table { border-collapse: collapse; }
+    th, td { border: 1px solid rgba(148, 163, 184, 0.22); padding: 0.3rem 0.6rem; }
+    blockquote { border-left: 3px solid #334155; margin-left: 0; padding-left: 1rem; }
+    .empty-state { font-style: italic; color: #94a3b8; }"""
+
+
+def _load_manifest(path: Path) -> dict[str, str]:
+    """Load the page hash manifest, treating a missing/corrupt file as empty."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+# ---------------------------------------------------------------------------
+# Minimal markdown -> HTML conversion
+#
+# Covers what journals and briefs actually use: headings, paragraphs,
+# bullet/numbered lists, fenced code, blockquotes, tables, rules, and
+# inline code/bold/italic/links. All text is HTML-escaped; links are only
+# emitted for https:// or relative targets.
+# ---------------------------------------------------------------------------
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_BULLET_RE = re.compile(r"^\s*[-*+]\s+(.*)$")
+_ORDERED_RE = re.compile(r"^\s*\d+[.)]\s+(.*)$")
+_RULE_RE = re.compile(r"^\s*([-*_])(\s*\1){2,}\s*$")
+_TABLE_SEP_RE = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+_BACKTICKS_RE = re.compile(r"`+")
+
+# Inline rules are matched by delimiter scans rather than lazy ``(.+?)``
+# patterns: each opener looks up the next closer with a forward search whose
+# result is reused by later openers, so hostile text (thousands of unclosed
+# '*', '_', '[' or backticks) costs linear time. Openers are zero-width so
+# that every position is tried, as re.sub would.
+_LINK_OPEN_RE = re.compile(r"\[")
+_LINK_LABEL_END_RE = re.compile(r"\]")
+_LINK_TARGET_END_RE = re.compile(r"[)\s]")
+_BOLD_OPEN_RE = re.compile(r"(?=\*\*|__)")
+_BOLD_CLOSE_RES = {"*": re.compile(r"\*\*"), "_": re.compile(r"__")}
+_ITALIC_OPEN_RE = re.compile(r"(?<![\w*])(?=\*(?!\s))|(?<!\w)(?=_(?!\s))")
+_ITALIC_CLOSE_RES = {"*": re.compile(r"(?<!\s)\*(?!\w)"), "_": re.compile(r"(?<!\s)_(?!\w)")}
+
+
+# Deeper quotes are flattened into the innermost blockquote, which keeps
+# the recursion bounded for hostile input like a line of 1000 '>' characters
+MAX_QUOTE_DEPTH = 8
+
+
+def render_markdown(text: str) -> str:
+    """Convert markdown to escaped, safe HTML."""
+    return _render_markdown(text, depth=0)
+
+
+def _render_markdown(text: str, depth: int) -> str:
+    lines = text.replace("\r\n", "\n").split("\n")
+    out: list[str] = []
+    paragraph: list[str] = []
+    i = 0
+
+    def flush_paragraph() -> None:
+        if paragraph:
+            out.append(f"<p>{_render_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if stripped.startswith("```") or stripped.startswith("~~~"):
+            flush_paragraph()
+            fence = stripped[:3]
+            code_lines = []
+            i += 1
+            while i < len(lines) and not lines[i].strip().startswith(fence):
+                code_lines.append(lines[i])
+                i += 1
+            out.append(f"<pre><code>{html.escape(chr(10).join(code_lines))}</code></pre>")
+            i += 1
+            continue
+
+        if not stripped:
+            flush_paragraph()
+            i += 1
+            continue
+
+        heading = _HEADING_RE.match(stripped)
+        if heading:
+            flush_paragraph()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{_render_inline(heading.group(2))}</h{level}>")
+            i += 1
+            continue
+
+        if _RULE_RE.match(stripped):
+            flush_paragraph()
+            out.append("<hr>")
+            i += 1
+            continue
+
+        if stripped.startswith(">"):
+            flush_paragraph()
+            quoted = []
+            while i < len(lines) and lines[i].strip().startswith(">"):
+                quoted.append(lines[i].strip()[1:].lstrip())
+                i += 1
+            if depth + 1 >= MAX_QUOTE_DEPTH:
+                quoted = [_strip_quote_markers(q) for q in quoted]
+            inner = _render_markdown(chr(10).join(quoted), depth + 1)
+            out.append(f"<blockquote>{inner}</blockquote>")
+            continue
+
+        if (
+            stripped.startswith("|")
+            and i + 1 < len(lines)
+            and _TABLE_SEP_RE.match(lines[i + 1])
+        ):
+            flush_paragraph()
+            header = _split_table_row(stripped)
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                rows.append(_split_table_row(lines[i].strip()))
+                i += 1
+            head_html = "".join(f"<th>{_render_inline(c)}</th>" for c in header)
+            body_html = "".join(
+                "<tr>" + "".join(f"<td>{_render_inline(c)}</td>" for c in row) + "</tr>"
+                for row in rows
+            )
+            out.append(
+                f"<table><thead><tr>{head_html}</tr></thead><tbody>{body_html}</tbody></table>"
+            )
+            continue
+
+        for item_re, tag in ((_BULLET_RE, "ul"), (_ORDERED_RE, "ol")):
+            if item_re.match(line):
+                flush_paragraph()
+                items = []
+                while i < len(lines):
+                    match = item_re.match(lines[i])
+                    if match:
+                        items.append(match.group(1))
+                    elif lines[i].strip() and lines[i].startswith((" ", "\t")) and items:
+                        items[-1] += " " + lines[i].strip()  # Continuation line
+                    else:
+                        break
+                    i += 1
+                items_html = "".join(f"<li>{_render_inline(item)}</li>" for item in items)
+                out.append(f"<{tag}>{items_html}</{tag}>")
+                break
+        else:
+            paragraph.append(stripped)
+            i += 1
+
+    flush_paragraph()
+    return "\n".join(out)
+
+
+def _strip_quote_markers(line: str) -> str:
+    while line.startswith(">"):
+        line = line[1:].lstrip()
+    return line
+
+
+def _split_table_row(row: str) -> list[str]:
+    return [cell.strip() for cell in row.strip().strip("|").split("|")]
+
+
+def _render_inline(text: str) -> str:
+    """Render inline markdown; code spans are protected from other rules.
+
+    A code span opens with a run of backticks and closes at the next run of
+    the same length; a run without a partner is literal text.
+    """
+    runs = [(m.start(), m.end()) for m in _BACKTICKS_RE.finditer(text)]
+    partner: list[int | None] = [None] * len(runs)
+    next_by_length: dict[int, int] = {}
+    for i in range(len(runs) - 1, -1, -1):
+        length = runs[i][1] - runs[i][0]
+        partner[i] = next_by_length.get(length)
+        next_by_length[length] = i
+
+    parts = []
+    last = 0
+    i = 0
+    while i < len(runs):
+        j = partner[i]
+        if j is None:
+            i += 1
+            continue
+        start, content_start = runs[i]
+        content_end, end = runs[j]
+        parts.append(_render_inline_text(text[last:start]))
+        parts.append(f"<code>{html.escape(text[content_start:content_end].strip())}</code>")
+        last = end
+        i = j + 1
+    parts.append(_render_inline_text(text[last:]))
+    return "".join(parts)
+
+
+def _render_inline_text(text: str) -> str:
+    escaped = html.escape(text, quote=True)
+    escaped = _replace_links(escaped)
+    escaped = _replace_delimited(escaped, _BOLD_OPEN_RE, _BOLD_CLOSE_RES, 2, "strong")
+    escaped = _replace_delimited(escaped, _ITALIC_OPEN_RE, _ITALIC_CLOSE_RES, 1, "em")
+    return escaped
+
+
+def _forward_search(pattern: re.Pattern[str], text: str):
+    """search(pos) -> start of the first match at or after pos, or len(text).
+
+    pos must never decrease. A result is reused while pos has not passed
+    it, so a run of openers sharing one closer (or none) scans it once.
+    """
+    found = -1
+
+    def search(pos: int) -> int:
+        nonlocal found
+        if found < pos:
+            match = pattern.search(text, pos)
+            found = match.start() if match else len(text)
+        return found
+
+    return search
+
+
+def _replace_links(text: str) -> str:
+    """``[label](target)`` -> an anchor for safe targets, the bare label otherwise."""
+    label_end = _forward_search(_LINK_LABEL_END_RE, text)
+    target_end = _forward_search(_LINK_TARGET_END_RE, text)
+    parts = []
+    last = 0
+    for opener in _LINK_OPEN_RE.finditer(text):
+        start = opener.start()
+        if start < last:
+            continue
+        close = label_end(start + 1)
+        if close == start + 1 or text[close + 1 : close + 2] != "(":
+            continue
+        end = target_end(close + 2)
+        if end == close + 2 or text[end : end + 1] != ")":
+            continue
+        label, target = text[start + 1 : close], html.unescape(text[close + 2 : end])
+        parts.append(text[last:start])
+        if _is_safe_href(target):
+            parts.append(f'<a href="{html.escape(target)}">{label}</a>')
+        else:
+            parts.append(label)
+        last = end + 1
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _replace_delimited(
+    text: str,
+    opener_re: re.Pattern[str],
+    closer_res: dict[str, re.Pattern[str]],
+    width: int,
+    tag: str,
+) -> str:
+    """Wrap ``<d>content<d>`` in tag, pairing each opener with the first closer.
+
+    Args:
+        text: Escaped inline text
+        opener_re: Zero-width match before every delimiter that may open
+        closer_res: Closing delimiter pattern by delimiter character
+        width: Delimiter length (2 for bold, 1 for italic)
+        tag: HTML element to emit
+    """
+    closers = {char: _forward_search(pattern, text) for char, pattern in closer_res.items()}
+    parts = []
+    last = 0
+    for opener in opener_re.finditer(text):
+        start = opener.start()
+        if start < last:
+            continue
+        close = closers[text[start]](start + width + 1)  # Content is never empty
+        if close == len(text):
+            continue
+        parts.append(text[last:start])
+        parts.append(f"<{tag}>{text[start + width : close]}</{tag}>")
+        last = close + width
+    parts.append(text[last:])
+    return "".join(parts)
+
+
+def _is_safe_href(target: str) -> bool:
+    """Allow https:// URLs and scheme-less relative paths only."""
+    if target.startswith("https://"):
+        return True
+    if target.startswith("//") or ":" in target.split("/", 1)[0]:
+        return False
+    return True
@@ -0,0 +1,242 @@
+"""Time-in-phase mining from the git history of quest state files.
+
+``ActiveQuest`` only knows a quest's current phase. Every commit that
+touched a ``.quest/**/state.json`` recorded the phase at that moment, so
+the history holds each quest's full path through plan, review, build and
+fix. This module replays it into per-phase dwell times.
+
+Mining is incremental, with results cached next to the output
+(``.phase-history-cache.json``):
+- ``git log --raw`` lists changed state files with their blob ids, so no
+  per-commit ``git show`` is needed. When the cached tip is an ancestor of
+  the current one, only ``tip..HEAD`` is listed.
+- Blob contents never change, so the phase read from each blob is cached
+  by blob id. New blobs are read in one pipelined ``CatFileBatch``.
+- Observations per quest are cached, so a build processes only new
+  commits. A rewritten history is re-listed but re-reads no known blob.
+
+A phase's dwell time runs from the first observation of it (the state's
+``updated_at``, or the commit time) to the first observation of the next
+phase. A quest's current phase is still open and is not counted.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from .analytics import percentile
+from .fsutil import write_atomic
+from .gitmeta import CatFileBatch, read_git_metadata, run_git
+from .models import PhaseDwell
+
+CACHE_NAME = ".phase-history-cache.json"
+CACHE_VERSION = 1
+
+_STATE_PATHSPEC = ":(glob).quest/**/state.json"
+_COMMIT_MARK = "\x01"
+
+# Observations per quest: [[timestamp, phase], ...], consecutive repeats removed
+Observations = dict[str, list[list]]
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseHistory:
+    """Mined dwell times plus what the run had to do."""
+
+    dwell: list[PhaseDwell]
+    quests: int  # Quests with at least one observation
+    new_commits: int  # Commits listed by this run
+    blobs_read: int  # State blobs not found in the cache
+    incremental: bool  # Cache reused: only commits after its tip were listed
+
+
+def mine_phase_history(
+    repo_root: Path, cache_path: Path | None = None, rev: str = "HEAD"
+) -> PhaseHistory:
+    """Replay state.json history up to rev into per-phase dwell times.
+
+    Args:
+        repo_root: Repository root
+        cache_path: Cache file (read and rewritten); None disables caching
+        rev: Revision whose history is mined
+
+    Returns:
+        PhaseHistory (empty when repo_root is not a git repository)
+    """
+    empty = PhaseHistory([], 0, 0, 0, False)
+    if read_git_metadata(repo_root) is None:
+        return empty
+    tip = _resolve(repo_root, rev)
+    if tip is None:
+        return empty
+
+    cache = _load_cache(cache_path)
+    observations: Observations = cache["observations"]
+    blob_phases: dict[str, list] = cache["blobs"]
+    commits: list = []
+    blobs_read = 0
+    incremental = cache["tip"] == tip
+    if not incremental:
+        since = cache["tip"]
+        if since and _is_ancestor(repo_root, since, tip):
+            incremental = True
+            commits = _list_commits(repo_root, f"{since}..{tip}")
+        else:
+            observations = {}  # New or rewritten history: replay it all
+            commits = _list_commits(repo_root, tip)
+        blobs_read = _read_phases(repo_root, commits, blob_phases)
+        _observe(observations, commits, blob_phases)
+        if cache_path is not None:
+            _write_cache(cache_path, tip, observations, blob_phases)
+
+    return PhaseHistory(
+        dwell=dwell_times(observations),
+        quests=len(observations),
+        new_commits=len(commits),
+        blobs_read=blobs_read,
+        incremental=incremental,
+    )
+
+
+def dwell_times(observations: Observations) -> list[PhaseDwell]:
+    """Per-phase dwell distributions, phases with the most total time first."""
+    samples: dict[str, list[float]] = {}
+    for timeline in observations.values():
+        ordered = sorted(timeline, key=lambda item: item[0])
+        for (entered, phase), (left, _) in zip(ordered, ordered[1:]):
+            samples.setdefault(phase, []).append(max(left - entered, 0) / 3600)
+
+    result = []
+    for phase, hours in samples.items():
+        hours.sort()
+        result.append(
+            PhaseDwell(
+                phase=phase,
+                samples=len(hours),
+                median_hours=round(percentile(hours, 50), 1),
+                p90_hours=round(percentile(hours, 90), 1),
+                total_hours=round(sum(hours), 1),
+            )
+        )
+    result.sort(key=lambda d: (-d.total_hours, d.phase))
+    return result
+
+
+def _resolve(repo_root: Path, rev: str) -> str | None:
+    result = run_git(["rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}"], repo_root, 10)
+    if result is None or result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def _is_ancestor(repo_root: Path, ancestor: str, descendant: str) -> bool:
+    result = run_git(["merge-base", "--is-ancestor", ancestor, descendant], repo_root, 30)
+    return result is not None and result.returncode == 0
+
+
+def _list_commits(repo_root: Path, revision_range: str) -> list[tuple[int, list[tuple[str, str]]]]:
+    """(commit time, [(quest, blob id), ...]) per commit, oldest first."""
+    result = run_git(
+        [
+            "log",
+            "--reverse",
+            "--no-renames",
+            "--raw",
+            "--no-abbrev",
+            f"--format={_COMMIT_MARK}%ct",
+            revision_range,
+            "--",
+            _STATE_PATHSPEC,
+        ],
+        repo_root,
+        timeout=300,
+    )
+    if result is None or result.returncode != 0:
+        return []
+
+    commits: list[tuple[int, list[tuple[str, str]]]] = []
+    for line in result.stdout.splitlines():
+        if line.startswith(_COMMIT_MARK):
+            commits.append((int(line[1:]), []))
+        elif line.startswith(":") and commits:
+            meta, _, path = line.partition("\t")
+            blob = meta.split()[3]
+            if blob.strip("0"):  # Deletions (all-zero id) carry no phase
+                commits[-1][1].append((_quest_key(path), blob))
+    return commits
+
+
+def _quest_key(path: str) -> str:
+    """Quest directory name; ``archive/<id>`` maps to the same quest as ``<id>``."""
+    return path.rsplit("/", 2)[-2]
+
+
+def _read_phases(repo_root: Path, commits: list, blob_phases: dict[str, list]) -> int:
+    """Read unseen state blobs into blob_phases ([phase, updated_at or None])."""
+    wanted = sorted({blob for _, changes in commits for _, blob in changes} - blob_phases.keys())
+    if not wanted:
+        return 0
+    with CatFileBatch(repo_root) as batch:
+        for blob, obj in zip(wanted, batch.read_many(wanted)):
+            blob_phases[blob] = _parse_state(obj[2]) if obj is not None else [None, None]
+    return len(wanted)
+
+
+def _parse_state(content: bytes) -> list:
+    try:
+        state = json.loads(content)
+    except ValueError:
+        return [None, None]
+    if not isinstance(state, dict) or not isinstance(state.get("phase"), str):
+        return [None, None]
+    updated_at = None
+    if isinstance(state.get("updated_at"), str):
+        try:
+            updated_at = datetime.fromisoformat(state["updated_at"].replace("Z", "+00:00"))
+            updated_at = updated_at.timestamp() if updated_at.tzinfo else None
+        except ValueError:
+            updated_at = None
+    return [state["phase"], updated_at]
+
+
+def _observe(observations: Observations, commits: Iterable, blob_phases: dict[str, list]) -> None:
+    """Append each commit's phases, skipping repeats of the current phase."""
+    for committed_at, changes in commits:
+        for quest, blob in changes:
+            phase, updated_at = blob_phases.get(blob, (None, None))
+            if phase is None:
+                continue
+            timeline = observations.setdefault(quest, [])
+            if timeline and timeline[-1][1] == phase:
+                continue
+            timeline.append([updated_at if updated_at is not None else committed_at, phase])
+
+
+def _load_cache(cache_path: Path | None) -> dict:
+    empty = {"tip": None, "observations": {}, "blobs": {}}
+    if cache_path is None:
+        return empty
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return empty
+    return {key: cache.get(key) or default for key, default in empty.items()}
+
+
+def _write_cache(
+    cache_path: Path, tip: str, observations: Observations, blob_phases: dict[str, list]
+) -> None:
+    cache = {
+        "version": CACHE_VERSION,
+        "tip": tip,
+        "observations": observations,
+        "blobs": blob_phases,
+    }
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(cache_path, json.dumps(cache, separators=(",", ":")) + "\n")
@@ -0,0 +1,286 @@
+"""Generated quest index table in ``.quest/README.md``.
+
+``.quest/README.md`` is the fast-scanning index of all quests. This module
+renders its table from the same ``DashboardData`` the dashboard is built
+from: one row per quest with its id, status, phase, start and last-update
+dates, and a link to its journal entry (or, while it is active, its quest
+folder).
+
+Only the block between the index markers is generated::
+
+    <!-- quest-index:start -->
+    | Quest | Status | Phase | Started | Updated | Link |
+    ...
+    <!-- quest-index:end -->
+
+Everything outside the markers is hand-written and kept as it is. A
+README without markers gets the block inserted after its title; a missing
+README is created with a short template.
+
+Updates are incremental. A fingerprint of each quest's generated row is
+cached in ``.quest/.quest-index-cache.json``; when it is unchanged and the
+README still has a row for that quest, the existing row is kept verbatim
+(hand edits included). Only rows of quests that changed are rewritten,
+rows of removed quests are dropped, and the file is not touched at all
+when nothing changed.
+
+Usage:
+    PYTHONPATH=scripts python3 -m quest_dashboard.quest_index [--repo-root PATH] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from .analytics import quest_start_day
+from .fsutil import write_atomic
+from .loaders import load_dashboard_data
+from .models import ActiveQuest, DashboardData, JournalEntry
+
+INDEX_PATH = Path(".quest") / "README.md"
+CACHE_PATH = Path(".quest") / ".quest-index-cache.json"
+CACHE_VERSION = 1
+
+START_MARKER = "<!-- quest-index:start -->"
+END_MARKER = "<!-- quest-index:end -->"
+
+HEADER = (
+    "| Quest | Status | Phase | Started | Updated | Link |\n"
+    "|-------|--------|-------|---------|---------|------|"
+)
+
+TEMPLATE = f"""# Quests
+
+Index of every quest in this repository, newest first. The table is
+generated from the quest dashboard model; edit outside the markers only.
+
+{START_MARKER}
+{END_MARKER}
+
+## Notes
+
+Hand-written notes go here. They are kept when the index is regenerated.
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class IndexUpdate:
+    """Outcome of one index update."""
+
+    changed: bool  # README content differs from what was on disk
+    rows: int  # Quests in the table
+    rewritten: int  # Rows generated anew (the rest were kept verbatim)
+    removed: int  # Rows dropped because their quest is gone
+
+
+def update_quest_index(
+    repo_root: Path,
+    data: DashboardData,
+    index_path: Path | None = None,
+    cache_path: Path | None = None,
+    write: bool = True,
+) -> IndexUpdate:
+    """Bring the generated table in the quest index up to date.
+
+    Args:
+        repo_root: Repository root (links are made relative to the index)
+        data: Dashboard model from loaders.load_dashboard_data()
+        index_path: README to update. Default: ``.quest/README.md``
+        cache_path: Row fingerprint cache. Default:
+            ``.quest/.quest-index-cache.json``; None with an explicit
+            index_path disables caching
+        write: False to compute the update without writing anything
+
+    Returns:
+        IndexUpdate describing what changed
+    """
+    if index_path is None:
+        index_path = repo_root / INDEX_PATH
+        cache_path = repo_root / CACHE_PATH
+    try:
+        current = index_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        current = None
+
+    before, existing_rows, after = _split(current if current is not None else TEMPLATE)
+    cached = _load_cache(cache_path)
+    link_base = index_path.parent.resolve()
+    repo_root = repo_root.resolve()
+
+    rows: list[str] = []
+    fingerprints: dict[str, str] = {}
+    rewritten = 0
+    for quest_id, row in _generate_rows(data, repo_root, link_base):
+        fingerprint = hashlib.sha256(row.encode("utf-8")).hexdigest()[:16]
+        fingerprints[quest_id] = fingerprint
+        kept = existing_rows.get(quest_id)
+        if kept is not None and cached.get(quest_id) == fingerprint:
+            rows.append(kept)
+        else:
+            rows.append(row)
+            rewritten += kept != row
+    removed = len(existing_rows.keys() - fingerprints.keys())
+
+    table = "\n".join([HEADER, *rows])
+    text = f"{before}{START_MARKER}\n{table}\n{END_MARKER}{after}"
+    changed = text != current
+    if write:
+        if changed:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(index_path, text)
+        if cache_path is not None and fingerprints != cached:
+            new_cache = {"version": CACHE_VERSION, "rows": fingerprints}
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(cache_path, json.dumps(new_cache, sort_keys=True) + "\n")
+
+    return IndexUpdate(changed=changed, rows=len(rows), rewritten=rewritten, removed=removed)
+
+
+def _generate_rows(
+    data: DashboardData, repo_root: Path, link_base: Path
+) -> list[tuple[str, str]]:
+    """(quest_id, markdown row) for every quest, most recently updated first."""
+    entries: list[tuple[date, str, str]] = []
+    for quest in data.active_quests:
+        updated = quest.updated_at.date()
+        entries.append((updated, quest.quest_id, _active_row(quest, repo_root, link_base)))
+    for entry in [*data.finished_quests, *data.abandoned_quests]:
+        row = _journal_row(entry, repo_root, link_base)
+        entries.append((entry.completed_date, entry.quest_id, row))
+    entries.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [(quest_id, row) for _, quest_id, row in entries]
+
+
+def _active_row(quest: ActiveQuest, repo_root: Path, link_base: Path) -> str:
+    link = "-"
+    if quest.quest_path is not None:
+        href = _relative_href(repo_root / quest.quest_path, link_base)
+        link = f"[folder]({href}/)"
+    return _row(
+        quest.quest_id,
+        quest.status,
+        quest.phase,
+        quest_start_day(quest.quest_id),
+        quest.updated_at.date(),
+        link,
+    )
+
+
+def _journal_row(entry: JournalEntry, repo_root: Path, link_base: Path) -> str:
+    href = _relative_href(repo_root / entry.journal_path, link_base)
+    return _row(
+        entry.quest_id,
+        entry.status,
+        "-",
+        quest_start_day(entry.quest_id),
+        entry.completed_date,
+        f"[journal]({href})",
+    )
+
+
+def _row(
+    quest_id: str, status: str, phase: str, started: date | None, updated: date, link: str
+) -> str:
+    cells = [
+        f"`{quest_id}`",
+        _cell(status),
+        _cell(phase),
+        started.isoformat() if started else "-",
+        updated.isoformat(),
+        link,
+    ]
+    return "| " + " | ".join(cells) + " |"
+
+
+def _cell(text: str) -> str:
+    """Table-safe cell text: pipes escaped, line breaks flattened."""
+    return " ".join(text.split()).replace("|", "\\|") or "-"
+
+
+def _relative_href(target: Path, base: Path) -> str:
+    """Posix href of target relative to the index directory."""
+    return Path(os.path.relpath(target, base)).as_posix()
+
+
+def _split(text: str) -> tuple[str, dict[str, str], str]:
+    """Split a README into (text before the block, rows by quest id, text after).
+
+    Without markers, the block goes after the first ``# `` title line (or
+    at the top) and the rest of the file follows it unchanged.
+    """
+    start = text.find(START_MARKER)
+    end = text.find(END_MARKER, start + 1) if start >= 0 else -1
+    if start < 0 or end < 0:
+        lines = text.splitlines(keepends=True)
+        cut = next((i + 1 for i, line in enumerate(lines) if line.startswith("# ")), 0)
+        before = "".join(lines[:cut])
+        if before and not before.endswith("\n"):
+            before += "\n"
+        rest = "".join(lines[cut:])
+        return (before + "\n" if before else ""), {}, "\n" + (rest if rest else "")
+
+    rows: dict[str, str] = {}
+    for line in text[start + len(START_MARKER):end].splitlines():
+        cells = line.split("|")
+        if len(cells) < 3 or not line.startswith("|"):
+            continue
+        key = cells[1].strip().strip("`")
+        if key and key != "Quest" and not set(key) <= set("-: "):
+            rows[key] = line.rstrip()
+    return text[:start], rows, text[end + len(END_MARKER):]
+
+
+def _load_cache(cache_path: Path | None) -> dict[str, str]:
+    if cache_path is None:
+        return {}
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(cache, dict)
+        or cache.get("version") != CACHE_VERSION
+        or not isinstance(cache.get("rows"), dict)
+    ):
+        return {}
+    return cache["rows"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. With --check, exit code 1 if the index is out of date."""
+    parser = argparse.ArgumentParser(description="Regenerate the .quest/README.md quest index")
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Write nothing; exit 1 if the index table is out of date.",
+    )
+    args = parser.parse_args(argv)
+
+    repo_root = Path(args.repo_root).resolve()
+    data = load_dashboard_data(repo_root, github_url="")
+    update = update_quest_index(repo_root, data, write=not args.check)
+
+    if args.check:
+        if update.changed:
+            print(f"Quest index is out of date: {INDEX_PATH}")
+            return 1
+        print(f"Quest index is up to date ({update.rows} quests)")
+        return 0
+    state = "updated" if update.changed else "unchanged"
+    print(
+        f"{INDEX_PATH} {state}: {update.rows} quests, {update.rewritten} rows rewritten,"
+        f" {update.removed} removed"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+"""State-transition helper: validate, write state.json, log the event.
+
+Agents used to rewrite ``.quest/<id>/state.json`` by hand after running
+``validate-quest-state.sh``, which forks ``jq`` for every check, and nothing
+recorded how a quest got where it is. ``quest-state`` does the whole step
+in one process:
+
+1. ``transition`` checks the move against ``audit.TRANSITIONS`` with the
+   same artifact, handoff-verdict and iteration-bound checks as
+   ``validate-quest-state.sh`` (failures abort, bound warnings do not).
+   ``update`` changes fields without a phase change and is not validated.
+2. The new state is written atomically (temp file and rename), keeping
+   every field it does not change, with ``updated_at`` set to now.
+3. One event is appended to the repo-wide ``.quest/events.ndjson`` (see
+   ``events``). Builds run with ``--event-log`` tail it and re-read only
+   the quests it names.
+
+Usage:
+    quest-state transition .quest/<id> building --status in_progress --role builder_agent
+    quest-state transition .quest/<id> fixing --increment fix_iteration
+    quest-state update .quest/<id> --status blocked
+    (or: PYTHONPATH=scripts python3 -m quest_dashboard.quest_state ...)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .audit import PHASES, AuditFinding, audit_quest, load_limits
+from .events import EVENTS_NAME, append_event
+from .fsutil import write_atomic
+
+UTC = timezone.utc
+
+STATUSES = ("pending", "in_progress", "complete", "blocked")
+COUNTERS = ("plan_iteration", "fix_iteration")
+
+
+@dataclass(frozen=True, slots=True)
+class StateChange:
+    """Outcome of one transition or update."""
+
+    applied: bool  # False when a validation check failed (nothing written)
+    findings: tuple[AuditFinding, ...]  # Failures, or warn-only bound checks
+    state: dict | None = None  # The state as written
+    event: dict | None = None  # The event as logged
+
+
+def apply_change(
+    quest_dir: Path,
+    target: str | None = None,
+    status: str | None = None,
+    role: str | None = None,
+    verdict: str | None = None,
+    increment: tuple[str, ...] = (),
+    now: datetime | None = None,
+) -> StateChange:
+    """Validate and apply a state change, then log it.
+
+    Args:
+        quest_dir: Quest directory (holding state.json), usually .quest/<id>
+        target: Phase to transition to; None updates fields only
+        status: New ``status`` value
+        role: New ``last_role`` value
+        verdict: New ``last_verdict`` value
+        increment: Counters to add one to (``plan_iteration``, ``fix_iteration``)
+        now: Timestamp for ``updated_at`` and the event (default: now, UTC)
+
+    Returns:
+        StateChange; nothing is written unless ``applied`` is True
+    """
+    quest_dir = quest_dir.resolve()
+    quest_root = _quest_root(quest_dir)
+    findings: tuple[AuditFinding, ...] = ()
+    if target is not None:
+        limits, _ = load_limits(quest_root.parent)
+        findings = audit_quest(quest_dir, limits, target=target).findings
+        if any(f.level == "fail" for f in findings):
+            return StateChange(False, findings)
+
+    state_path = quest_dir / "state.json"
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        state = None
+    if not isinstance(state, dict):
+        return StateChange(False, (AuditFinding("fail", "state.json is not a valid JSON object"),))
+
+    now = now or datetime.now(tz=UTC)
+    updated_at = now.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+    previous = dict(state)
+    fields = {"phase": target, "status": status, "last_role": role, "last_verdict": verdict}
+    state.update({key: value for key, value in fields.items() if value is not None})
+    for key in increment:
+        value = state.get(key)
+        state[key] = (int(value) if str(value).isdigit() else 0) + 1
+    state["updated_at"] = updated_at
+
+    write_atomic(state_path, json.dumps(state, indent=2, ensure_ascii=False) + "\n")
+    event = {
+        "ts": updated_at,
+        "quest": quest_dir.relative_to(quest_root.parent).as_posix(),
+        "quest_id": state.get("quest_id", quest_dir.name),
+        "event": "transition" if target is not None else "update",
+        "from": previous.get("phase"),
+        "to": state.get("phase"),
+        "changes": {
+            key: value
+            for key, value in state.items()
+            if key != "updated_at" and previous.get(key) != value
+        },
+    }
+    append_event(quest_root / EVENTS_NAME, event)
+    return StateChange(True, findings, state, event)
+
+
+def _quest_root(quest_dir: Path) -> Path:
+    """The ``.quest`` directory above quest_dir (its parent if there is none)."""
+    for parent in quest_dir.parents:
+        if parent.name == ".quest":
+            return parent
+    return quest_dir.parent
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Exit code 1 if validation failed."""
+    parser = argparse.ArgumentParser(
+        description="Apply a validated quest state transition and log it to .quest/events.ndjson"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    transition = commands.add_parser("transition", help="Validate and apply a phase transition.")
+    transition.add_argument("quest_dir", help="Quest directory, e.g. .quest/<id>")
+    transition.add_argument("target", choices=PHASES, help="Phase to transition to.")
+    update = commands.add_parser("update", help="Change fields without a phase change.")
+    update.add_argument("quest_dir", help="Quest directory, e.g. .quest/<id>")
+    for command in (transition, update):
+        command.add_argument("--status", choices=STATUSES, default=None, help="New status.")
+        command.add_argument("--role", default=None, help="New last_role, e.g. builder_agent.")
+        command.add_argument("--verdict", default=None, help="New last_verdict, e.g. approve.")
+        command.add_argument(
+            "--increment",
+            action="append",
+            choices=COUNTERS,
+            default=[],
+            help="Add one to this counter (repeatable).",
+        )
+    args = parser.parse_args(argv)
+
+    quest_dir = Path(args.quest_dir)
+    if not (quest_dir / "state.json").is_file():
+        print(f"Error: no state.json in {quest_dir}", file=sys.stderr)
+        return 2
+
+    change = apply_change(
+        quest_dir,
+        target=getattr(args, "target", None),
+        status=args.status,
+        role=args.role,
+        verdict=args.verdict,
+        increment=tuple(args.increment),
+    )
+    for finding in change.findings:
+        stream = sys.stdout if finding.level == "fail" else sys.stderr
+        print(f"[{finding.level.upper()}] {finding.message}", file=stream)
+    if not change.applied:
+        print("State not modified.")
+        return 1
+    event = change.event
+    print(f"{event['quest_id']}: {event['from']} -> {event['to']} ({event['ts']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
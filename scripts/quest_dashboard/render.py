@@ -16,11 +16,25 @@ import json
 import logging
 import re
 from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from datetime import date, datetime
 from pathlib import Path
 from typing import Union
 
-from .models import ActiveQuest, DashboardData, JournalEntry
+from .columnar import CATEGORIES, QuestTable, active_category
+from .diagnostics import MAX_GROUPS, group_diagnostics, shorten
+from .models import (
+    ActiveQuest,
+    DashboardData,
+    DiagnosticGroup,
+    JournalEntry,
+    HandoffRoleStats,
+    PhaseDwell,
+    PortfolioShard,
+    QuestAnalytics,
+    QuestArtifactSize,
+    StatsSnapshot,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +51,42 @@ _BADGE_TEXT = {
 }
 
 
-def render_dashboard(data: DashboardData, output_path: Path, repo_root: Path) -> str:
+def render_dashboard(
+    data: DashboardData,
+    output_path: Path,
+    repo_root: Path,
+    detail_links: Mapping[str, str] | None = None,
+    history: Sequence[StatsSnapshot] | None = None,
+    shard_by: str | None = None,
+    portfolio_shards: Sequence[PortfolioShard] = (),
+    handoff_stats: Sequence[HandoffRoleStats] = (),
+    analytics: QuestAnalytics | None = None,
+    diagnostics_href: str | None = None,
+    phase_dwell: Sequence[PhaseDwell] = (),
+    artifact_sizes: Sequence[QuestArtifactSize] = (),
+    artifact_budget: int | None = None,
+) -> str:
     """Render the complete dashboard HTML.
 
     Args:
         data: Dashboard data with all quests
         output_path: Where the HTML will be written (for computing relative links)
         repo_root: Repository root (for computing relative links)
+        detail_links: Optional quest_id -> relative href of per-quest detail pages
+        history: Optional build snapshots for the historical WIP chart
+        shard_by: "year" or "quarter" to inline only the current period's
+            cards and lazy-load portfolio_shards for older periods
+        portfolio_shards: Fragments written by shards.write_portfolio_shards()
+        handoff_stats: Per-role schema violation counts from handoff.role_stats()
+        analytics: Lead-time, iteration and throughput aggregates from
+            analytics.compute_analytics()
+        diagnostics_href: Relative href of the full diagnostics report, linked
+            from the (capped) warnings summary
+        phase_dwell: Per-phase dwell times from
+            phase_history.mine_phase_history()
+        artifact_sizes: Per-quest artifact sizes from artifacts.scan_artifacts()
+        artifact_budget: Token budget the sizes were checked against (for the
+            panel subtitle)
 
     Returns:
         Complete HTML document as string
@@ -54,10 +97,20 @@ def render_dashboard(data: DashboardData, output_path: Path, repo_root: Path) ->
     hero = _render_hero(data)
     kpi_row = _render_kpi_row(data)
     charts_section = _render_charts_section()
-    portfolio_section = _render_portfolio_section(data, data.github_repo_url)
-    warnings_html = _render_warnings(data.warnings)
+    history_points = _compute_history_points(history or [])
+    history_section = _render_history_section(history_points)
+    handoff_section = _render_handoff_section(handoff_stats)
+    analytics_section = _render_analytics_section(analytics)
+    phase_dwell_section = _render_phase_dwell_section(phase_dwell)
+    artifact_section = _render_artifact_section(artifact_sizes, artifact_budget)
+    portfolio_section = _render_portfolio_section(
+        data, data.github_repo_url, detail_links, shard_by, portfolio_shards
+    )
+    warnings_html = _render_warnings(group_diagnostics(data.warnings), diagnostics_href)
     footer = _render_footer(data.generated_at)
     chart_config = _render_chart_config(data, chart_js_loaded)
+    history_chart_config = _render_history_chart_config(history_points, chart_js_loaded)
+    analytics_chart_config = _render_analytics_chart_config(analytics, chart_js_loaded)
 
     return f"""<!doctype html>
 <html lang="en">
@@ -76,11 +129,18 @@ def render_dashboard(data: DashboardData, output_path: Path, repo_root: Path) ->
 {hero}
 {kpi_row}
 {charts_section}
+{history_section}
+{analytics_section}
+{phase_dwell_section}
+{artifact_section}
+{handoff_section}
 {portfolio_section}
 {warnings_html}
 {footer}
   </div>
 {chart_config}
+{history_chart_config}
+{analytics_chart_config}
 </body>
 </html>
 """
@@ -292,6 +352,42 @@ def _render_css() -> str:
       position: relative;
     }
 
+    .panel--wide {
+      grid-column: 1 / -1;
+    }
+
+    .panel--table {
+      min-height: 0;
+    }
+
+    .data-table {
+      width: 100%;
+      border-collapse: collapse;
+      font-size: 0.9rem;
+      color: var(--text-1);
+    }
+
+    .data-table th,
+    .data-table td {
+      padding: 0.5rem 0.75rem;
+      border-bottom: 1px solid var(--line);
+      text-align: left;
+    }
+
+    .data-table th {
+      color: var(--text-2);
+      font-weight: 600;
+    }
+
+    .data-table .num {
+      text-align: right;
+      font-variant-numeric: tabular-nums;
+    }
+
+    .data-table .rate--bad {
+      color: var(--status-abandoned);
+    }
+
     /* Quest Portfolio section */
     .quests-section {
       background: var(--surface-0);
@@ -353,6 +449,15 @@ def _render_css() -> str:
       flex: 1;
     }
 
+    .quest-card-title a {
+      color: inherit;
+      text-decoration: none;
+    }
+
+    .quest-card-title a:hover {
+      color: var(--status-in-progress);
+    }
+
     .badge {
       font-size: 0.75rem;
       font-weight: 600;
@@ -424,6 +529,32 @@ def _render_css() -> str:
       text-decoration: underline;
     }
 
+    /* Lazily loaded portfolio shards */
+    .portfolio-shard {
+      margin-top: 2rem;
+    }
+
+    .shard-header {
+      display: flex;
+      align-items: baseline;
+      gap: 1rem;
+      margin-bottom: 1rem;
+    }
+
+    .shard-header h3 {
+      font-size: 1.1rem;
+      color: var(--text-0);
+    }
+
+    .shard-load {
+      color: var(--text-2);
+      font-size: 0.85rem;
+    }
+
+    .portfolio-shard.is-loaded .shard-load {
+      display: none;
+    }
+
     /* Empty state */
     .empty-state {
       text-align: center;
@@ -460,6 +591,29 @@ def _render_css() -> str:
       margin-bottom: 0.25rem;
     }
 
+    .warnings-title a {
+      margin-left: 0.5rem;
+      color: var(--text-1);
+      text-transform: none;
+      letter-spacing: normal;
+      font-weight: 400;
+    }
+
+    .warnings-code {
+      font-family: ui-monospace, SFMono-Regular, Menlo, monospace;
+      font-weight: 600;
+    }
+
+    .warnings-count,
+    .warnings-more {
+      color: var(--text-2);
+    }
+
+    .warnings-samples {
+      list-style: none;
+      margin: 0.25rem 0 0.5rem 1rem;
+    }
+
     /* Footer */
     .footer {
       text-align: center;
@@ -558,23 +712,19 @@ def _render_chart_js() -> tuple[str, bool]:
     return f"  <script>\n{chart_js_source}\n  </script>", True
 
 
-def _render_kpi_row(data: DashboardData) -> str:
+def _render_kpi_row(data: Union[DashboardData, QuestTable]) -> str:
     """Render the 5 KPI cards row below the hero.
 
     Cards: Total Quests, Finished, In Progress, Blocked, Abandoned.
-    Uses _classify_status() so counts agree with the doughnut chart.
+    Uses compute_status_counts() so counts agree with the doughnut chart.
+    Accepts a DashboardData or a columnar QuestTable.
     """
-    blocked_count = 0
-    in_progress_count = 0
-    for q in data.active_quests:
-        cls = _classify_status(q.status)
-        if cls == "blocked":
-            blocked_count += 1
-        elif cls != "unknown":
-            in_progress_count += 1
-    finished_count = len(data.finished_quests)
-    abandoned_count = len(data.abandoned_quests)
-    total = finished_count + len(data.active_quests) + abandoned_count
+    counts = compute_status_counts(data)
+    blocked_count = counts["blocked"]
+    in_progress_count = counts["in_progress"]
+    finished_count = counts["finished"]
+    abandoned_count = counts["abandoned"]
+    total = sum(counts.values())
 
     return f"""    <div class="kpi-grid">
       <article class="kpi-card">
@@ -622,10 +772,381 @@ def _render_charts_section() -> str:
     </div>"""
 
 
-def _compute_monthly_buckets(data: DashboardData) -> OrderedDict[str, dict[str, int]]:
+def _compute_history_points(
+    history: Sequence[StatsSnapshot],
+) -> OrderedDict[str, StatsSnapshot]:
+    """Reduce build snapshots to the last snapshot per day.
+
+    Returns:
+        OrderedDict keyed by 'YYYY-MM-DD' strings (sorted chronologically).
+    """
+    points: dict[str, StatsSnapshot] = {}
+    for snapshot in sorted(history, key=lambda s: s.taken_at):
+        points[snapshot.taken_at.strftime("%Y-%m-%d")] = snapshot
+    return OrderedDict(sorted(points.items()))
+
+
+def _render_history_section(points: OrderedDict[str, StatsSnapshot]) -> str:
+    """Emit the historical WIP panel, or nothing when there is no history."""
+    if not points:
+        return ""
+
+    return """    <div class="panel-grid">
+      <div class="panel panel--wide">
+        <h2>Active Work Over Time</h2>
+        <p class="panel-subtitle">Quests in progress and blocked as recorded by each day's build</p>
+        <div class="chart-wrap">
+          <canvas id="chart-history-wip"></canvas>
+          <noscript>Chart requires JavaScript</noscript>
+        </div>
+      </div>
+    </div>"""
+
+
+def _render_analytics_section(analytics: QuestAnalytics | None) -> str:
+    """Emit lead-time, iteration and weekly throughput panels."""
+    if analytics is None:
+        return ""
+
+    if analytics.lead_time_samples:
+        lead_rows = "\n".join(
+            f"""            <tr><td>{name.upper()}</td><td class="num">{days:g} days</td></tr>"""
+            for name, days in analytics.lead_time_days.items()
+        )
+        lead_body = f"""        <table class="data-table">
+          <thead>
+            <tr><th>Percentile</th><th class="num">Lead time</th></tr>
+          </thead>
+          <tbody>
+{lead_rows}
+          </tbody>
+        </table>"""
+    else:
+        lead_body = """        <p class="panel-subtitle">No finished quests with a dated quest id yet</p>"""
+
+    iteration_rows = "\n".join(
+        f"""            <tr><td>{html.escape(label)}</td><td class="num">{plan}</td><td class="num">{analytics.fix_iterations.get(label, 0)}</td></tr>"""
+        for label, plan in analytics.plan_iterations.items()
+    )
+
+    return f"""    <div class="panel-grid">
+      <div class="panel panel--table">
+        <h2>Lead Time</h2>
+        <p class="panel-subtitle">Quest start to journal completion across {analytics.lead_time_samples} finished quests</p>
+{lead_body}
+      </div>
+      <div class="panel panel--table">
+        <h2>Iterations per Quest</h2>
+        <p class="panel-subtitle">Quests by number of plan and fix iterations</p>
+        <table class="data-table">
+          <thead>
+            <tr><th>Iterations</th><th class="num">Plan</th><th class="num">Fix</th></tr>
+          </thead>
+          <tbody>
+{iteration_rows}
+          </tbody>
+        </table>
+      </div>
+      <div class="panel panel--wide">
+        <h2>Weekly Throughput</h2>
+        <p class="panel-subtitle">Quests finished per week (weeks start on Monday)</p>
+        <div class="chart-wrap">
+          <canvas id="chart-weekly-throughput"></canvas>
+          <noscript>Chart requires JavaScript</noscript>
+        </div>
+      </div>
+    </div>"""
+
+
+def _render_analytics_chart_config(
+    analytics: QuestAnalytics | None, chart_js_available: bool
+) -> str:
+    """Generate the Chart.js bar chart of finished quests per week."""
+    if not chart_js_available or analytics is None:
+        return ""
+
+    labels = [week for week, _ in analytics.weekly_throughput]
+    counts = [count for _, count in analytics.weekly_throughput]
+
+    return f"""  <script>
+document.addEventListener('DOMContentLoaded', function() {{
+  // Throughput chart: finished quests per week
+  var throughputCtx = document.getElementById('chart-weekly-throughput');
+  if (throughputCtx) {{
+    new Chart(throughputCtx, {{
+      type: 'bar',
+      data: {{
+        labels: {json.dumps(labels)},
+        datasets: [{{
+          label: 'Finished',
+          data: {json.dumps(counts)},
+          backgroundColor: getComputedStyle(document.documentElement).getPropertyValue('--status-finished').trim()
+        }}]
+      }},
+      options: {{
+        responsive: true,
+        maintainAspectRatio: false,
+        scales: {{
+          x: {{
+            ticks: {{ color: '#94a3b8' }},
+            grid: {{ color: 'rgba(148, 163, 184, 0.1)' }}
+          }},
+          y: {{
+            beginAtZero: true,
+            ticks: {{ color: '#94a3b8', stepSize: 1 }},
+            grid: {{ color: 'rgba(148, 163, 184, 0.1)' }}
+          }}
+        }},
+        plugins: {{
+          legend: {{ display: false }}
+        }}
+      }}
+    }});
+  }}
+}});
+  </script>"""
+
+
+def _format_hours(hours: float) -> str:
+    """Human-readable duration: hours below two days, days above."""
+    if hours < 48:
+        return f"{hours:.1f} h"
+    return f"{hours / 24:.1f} days"
+
+
+def _render_phase_dwell_section(dwell: Sequence[PhaseDwell]) -> str:
+    """Emit the time-in-phase panel: dwell distribution per phase."""
+    if not dwell:
+        return ""
+
+    rows = "\n".join(
+        f"""            <tr>
+              <td>{html.escape(d.phase.replace("_", " ").title())}</td>
+              <td class="num">{d.samples}</td>
+              <td class="num">{_format_hours(d.median_hours)}</td>
+              <td class="num">{_format_hours(d.p90_hours)}</td>
+              <td class="num">{_format_hours(d.total_hours)}</td>
+            </tr>"""
+        for d in dwell
+    )
+
+    return f"""    <div class="panel-grid">
+      <div class="panel panel--wide panel--table">
+        <h2>Time in Phase</h2>
+        <p class="panel-subtitle">Completed stays per phase, mined from state.json history (current phases excluded)</p>
+        <table class="data-table">
+          <thead>
+            <tr><th>Phase</th><th class="num">Stays</th><th class="num">Median</th><th class="num">P90</th><th class="num">Total</th></tr>
+          </thead>
+          <tbody>
+{rows}
+          </tbody>
+        </table>
+      </div>
+    </div>"""
+
+
+def _format_tokens(tokens: int) -> str:
+    """Compact token count: 950, 12.3k."""
+    return f"{tokens / 1000:.1f}k" if tokens >= 1000 else str(tokens)
+
+
+def _format_growth(totals: Sequence[int]) -> str:
+    """Token totals per iteration joined by arrows, or a dash when none were seen."""
+    if not totals:
+        return "&mdash;"
+    return " &rarr; ".join(_format_tokens(t) for t in totals)
+
+
+def _render_artifact_section(
+    sizes: Sequence[QuestArtifactSize], budget: int | None, limit: int = 15
+) -> str:
+    """Emit the artifact size panel: largest quests and their iteration growth."""
+    if not sizes:
+        return ""
+
+    ordered = sorted(sizes, key=lambda s: (not s.over_budget, -s.tokens, s.quest_id))
+    rows = []
+    for s in ordered[:limit]:
+        tokens_class = "num rate--bad" if s.over_budget else "num"
+        rows.append(f"""            <tr>
+              <td>{html.escape(s.quest_id)}</td>
+              <td class="num">{s.files}</td>
+              <td class="num">{s.bytes / 1024:.1f} KiB</td>
+              <td class="{tokens_class}">{_format_tokens(s.tokens)}</td>
+              <td>{html.escape(s.largest)} ({_format_tokens(s.largest_tokens)})</td>
+              <td>{_format_growth(s.plan_tokens)}</td>
+              <td>{_format_growth(s.fix_tokens)}</td>
+            </tr>""")
+    rows_html = "\n".join(rows)
+    over = sum(s.over_budget for s in sizes)
+    subtitle = f"{len(sizes)} quests, {_format_tokens(sum(s.tokens for s in sizes))} tokens"
+    if budget is not None:
+        subtitle += f"; {over} over the {_format_tokens(budget)}-token budget"
+    if len(sizes) > limit:
+        subtitle += f"; largest {limit} shown"
+
+    return f"""    <div class="panel-grid">
+      <div class="panel panel--wide panel--table">
+        <h2>Artifact Sizes</h2>
+        <p class="panel-subtitle">{subtitle}</p>
+        <table class="data-table">
+          <thead>
+            <tr><th>Quest</th><th class="num">Files</th><th class="num">Size</th><th class="num">Tokens</th><th>Largest</th><th>Plan iterations</th><th>Fix iterations</th></tr>
+          </thead>
+          <tbody>
+{rows_html}
+          </tbody>
+        </table>
+      </div>
+    </div>"""
+
+
+def _render_handoff_section(stats: Sequence[HandoffRoleStats]) -> str:
+    """Emit the handoff contract panel: schema violation rate per role."""
+    if not stats:
+        return ""
+
+    rows = []
+    for s in stats:
+        rate = s.invalid / s.files if s.files else 0.0
+        rate_class = "num rate--bad" if s.invalid else "num"
+        rows.append(f"""            <tr>
+              <td>{html.escape(s.role)}</td>
+              <td class="num">{s.files}</td>
+              <td class="num">{s.invalid}</td>
+              <td class="{rate_class}">{rate:.0%}</td>
+            </tr>""")
+    rows_html = "\n".join(rows)
+    total = sum(s.files for s in stats)
+    invalid = sum(s.invalid for s in stats)
+
+    return f"""    <div class="panel-grid">
+      <div class="panel panel--wide panel--table">
+        <h2>Handoff Contracts</h2>
+        <p class="panel-subtitle">{invalid} of {total} handoff files violate handoff.schema.json</p>
+        <table class="data-table">
+          <thead>
+            <tr><th>Role</th><th class="num">Files</th><th class="num">Invalid</th><th class="num">Violation rate</th></tr>
+          </thead>
+          <tbody>
+{rows_html}
+          </tbody>
+        </table>
+      </div>
+    </div>"""
+
+
+def _render_history_chart_config(
+    points: OrderedDict[str, StatsSnapshot], chart_js_available: bool
+) -> str:
+    """Generate the Chart.js line chart for recorded WIP and blocked counts.
+
+    Plots in-progress and blocked KPI counts, plus one dashed series per
+    active phase, from the historical stats store.
+    """
+    if not chart_js_available or not points:
+        return ""
+
+    labels = list(points.keys())
+    in_progress_series = [s.counts.get("in_progress", 0) for s in points.values()]
+    blocked_series = [s.counts.get("blocked", 0) for s in points.values()]
+    phase_names = sorted({name for s in points.values() for name in s.phases})
+
+    dataset_js = []
+    for label, series, color_var in (
+        ("In Progress", in_progress_series, "--status-in-progress"),
+        ("Blocked", blocked_series, "--status-blocked"),
+    ):
+        dataset_js.append(f"""          {{
+            label: {json.dumps(label)},
+            data: {json.dumps(series)},
+            borderColor: getComputedStyle(document.documentElement).getPropertyValue('{color_var}').trim(),
+            fill: false,
+            tension: 0.25,
+            borderWidth: 2,
+            pointRadius: 2
+          }}""")
+    for name in phase_names:
+        series = [s.phases.get(name, 0) for s in points.values()]
+        label = "Phase: " + name.replace("_", " ").title()
+        dataset_js.append(f"""          {{
+            label: {json.dumps(label)},
+            data: {json.dumps(series)},
+            borderColor: 'rgba(148, 163, 184, 0.6)',
+            borderDash: [4, 4],
+            fill: false,
+            tension: 0.25,
+            borderWidth: 1,
+            pointRadius: 0,
+            hidden: true
+          }}""")
+    datasets_block = ",\n".join(dataset_js)
+
+    return f"""  <script>
+document.addEventListener('DOMContentLoaded', function() {{
+  // History chart: recorded WIP per day (from the stats history store)
+  var historyCtx = document.getElementById('chart-history-wip');
+  if (historyCtx) {{
+    new Chart(historyCtx, {{
+      type: 'line',
+      data: {{
+        labels: {json.dumps(labels)},
+        datasets: [
+{datasets_block}
+        ]
+      }},
+      options: {{
+        responsive: true,
+        maintainAspectRatio: false,
+        scales: {{
+          x: {{
+            ticks: {{ color: '#94a3b8' }},
+            grid: {{ color: 'rgba(148, 163, 184, 0.1)' }}
+          }},
+          y: {{
+            beginAtZero: true,
+            ticks: {{ color: '#94a3b8', stepSize: 1 }},
+            grid: {{ color: 'rgba(148, 163, 184, 0.1)' }}
+          }}
+        }},
+        plugins: {{
+          legend: {{
+            labels: {{ color: '#cbd5e1', padding: 12, boxWidth: 12 }}
+          }}
+        }}
+      }}
+    }});
+  }}
+}});
+  </script>"""
+
+
+def compute_status_counts(data: Union[DashboardData, QuestTable]) -> dict[str, int]:
+    """Count quests per chart category.
+
+    Returns:
+        Dict with keys 'finished', 'abandoned', 'in_progress', 'blocked',
+        'unknown'. Active quests are split by ``active_category()``.
+    """
+    if isinstance(data, QuestTable):
+        return data.category_counts()
+
+    counts = dict.fromkeys(CATEGORIES, 0)
+    counts["finished"] = len(data.finished_quests)
+    counts["abandoned"] = len(data.abandoned_quests)
+    for q in data.active_quests:
+        counts[active_category(q.status)] += 1
+    return counts
+
+
+def _compute_monthly_buckets(
+    data: Union[DashboardData, QuestTable],
+) -> OrderedDict[str, dict[str, int]]:
     """Group all quests by month for the time-progression chart.
 
     Tracks all 5 statuses: finished, abandoned, in_progress, blocked, unknown.
+    Accepts a DashboardData or a columnar QuestTable.
 
     Returns:
         OrderedDict keyed by 'YYYY-MM' strings (sorted chronologically),
@@ -633,34 +1154,27 @@ def _compute_monthly_buckets(data: DashboardData) -> OrderedDict[str, dict[str,
         "blocked": int, "unknown": int}``.
         Gaps between min and max months are filled with zeros.
     """
-    empty_bucket = {
-        "finished": 0,
-        "abandoned": 0,
-        "in_progress": 0,
-        "blocked": 0,
-        "unknown": 0,
-    }
-    raw: dict[str, dict[str, int]] = {}
-
-    for quest in data.finished_quests:
-        key = quest.completed_date.strftime("%Y-%m")
-        raw.setdefault(key, dict(empty_bucket))
-        raw[key]["finished"] += 1
-
-    for quest in data.abandoned_quests:
-        key = quest.completed_date.strftime("%Y-%m")
-        raw.setdefault(key, dict(empty_bucket))
-        raw[key]["abandoned"] += 1
-
-    for quest in data.active_quests:
-        key = quest.updated_at.strftime("%Y-%m")
-        raw.setdefault(key, dict(empty_bucket))
-        if "block" in quest.status.lower():
-            raw[key]["blocked"] += 1
-        elif _classify_status(quest.status) == "unknown":
-            raw[key]["unknown"] += 1
-        else:
-            raw[key]["in_progress"] += 1
+    empty_bucket = dict.fromkeys(CATEGORIES, 0)
+    raw: dict[str, dict[str, int]]
+
+    if isinstance(data, QuestTable):
+        raw = data.monthly_category_counts()
+    else:
+        raw = {}
+        for quest in data.finished_quests:
+            key = quest.completed_date.strftime("%Y-%m")
+            raw.setdefault(key, dict(empty_bucket))
+            raw[key]["finished"] += 1
+
+        for quest in data.abandoned_quests:
+            key = quest.completed_date.strftime("%Y-%m")
+            raw.setdefault(key, dict(empty_bucket))
+            raw[key]["abandoned"] += 1
+
+        for quest in data.active_quests:
+            key = quest.updated_at.strftime("%Y-%m")
+            raw.setdefault(key, dict(empty_bucket))
+            raw[key][active_category(quest.status)] += 1
 
     if not raw:
         return OrderedDict()
@@ -683,28 +1197,13 @@ def _compute_monthly_buckets(data: DashboardData) -> OrderedDict[str, dict[str,
     return result
 
 
-def _classify_status(status: str) -> str:
-    """Classify a quest status string into a known category.
-
-    Returns one of: 'finished', 'in_progress', 'blocked', 'abandoned', 'unknown'.
-    """
-    lower = status.lower()
-    if lower in ("completed", "finished"):
-        return "finished"
-    if "block" in lower:
-        return "blocked"
-    if lower in ("abandoned",):
-        return "abandoned"
-    if lower in ("in progress", "in_progress"):
-        return "in_progress"
-    return "unknown"
-
-
-def _render_chart_config(data: DashboardData, chart_js_available: bool) -> str:
+def _render_chart_config(
+    data: Union[DashboardData, QuestTable], chart_js_available: bool
+) -> str:
     """Generate inline JavaScript that creates Chart.js instances.
 
     Args:
-        data: Dashboard data with all quests.
+        data: Dashboard data (or columnar QuestTable) with all quests.
         chart_js_available: Whether Chart.js was successfully loaded.
 
     Returns:
@@ -714,19 +1213,12 @@ def _render_chart_config(data: DashboardData, chart_js_available: bool) -> str:
     if not chart_js_available:
         return ""
 
-    finished_count = len(data.finished_quests)
-    abandoned_count = len(data.abandoned_quests)
-    blocked_count = 0
-    in_progress_count = 0
-    unknown_count = 0
-    for q in data.active_quests:
-        cls = _classify_status(q.status)
-        if cls == "blocked":
-            blocked_count += 1
-        elif cls == "unknown":
-            unknown_count += 1
-        else:
-            in_progress_count += 1
+    counts = compute_status_counts(data)
+    finished_count = counts["finished"]
+    abandoned_count = counts["abandoned"]
+    blocked_count = counts["blocked"]
+    in_progress_count = counts["in_progress"]
+    unknown_count = counts["unknown"]
 
     # Compute monthly buckets for time-progression chart
     buckets = _compute_monthly_buckets(data)
@@ -856,12 +1348,10 @@ document.addEventListener('DOMContentLoaded', function() {{
   </script>"""
 
 
-def _render_portfolio_section(
+def portfolio_entries(
     data: DashboardData,
-    github_url: str,
-) -> str:
-    """Render the unified Quest Portfolio section with all quests."""
-    # Merge all quests into a single list with sort keys
+) -> list[tuple[date, Union[JournalEntry, ActiveQuest]]]:
+    """Merge all quests into one list of (sort date, quest), newest first."""
     all_quests: list[tuple[date, Union[JournalEntry, ActiveQuest]]] = []
 
     for q in data.finished_quests:
@@ -875,51 +1365,139 @@ def _render_portfolio_section(
 
     # Sort descending by date (most recent first)
     all_quests.sort(key=lambda x: x[0], reverse=True)
+    return all_quests
+
+
+def portfolio_period(day: date, shard_by: str) -> str:
+    """Return the shard period for a date: "2026" (year) or "2026-Q1" (quarter).
+
+    Periods of the same granularity sort chronologically as strings.
+    """
+    if shard_by == "quarter":
+        return f"{day.year}-Q{(day.month - 1) // 3 + 1}"
+    return str(day.year)
+
 
+def _render_portfolio_section(
+    data: DashboardData,
+    github_url: str,
+    detail_links: Mapping[str, str] | None = None,
+    shard_by: str | None = None,
+    shards: Sequence[PortfolioShard] = (),
+) -> str:
+    """Render the unified Quest Portfolio section with all quests.
+
+    When shard_by is set, only cards from the current period are inlined;
+    older periods become placeholders that fetch their shard on demand.
+    """
+    all_quests = portfolio_entries(data)
     total = len(all_quests)
 
-    if not all_quests:
+    if shard_by:
+        current = portfolio_period(data.generated_at.date(), shard_by)
+        all_quests = [
+            (day, quest)
+            for day, quest in all_quests
+            if portfolio_period(day, shard_by) >= current
+        ]
+
+    if not all_quests and not shards:
         cards_html = '      <div class="empty-state">No quests in this category</div>'
+    elif not all_quests:
+        cards_html = ""
     else:
         cards = [
-            _render_quest_card(quest, github_url)
+            render_quest_card(
+                quest, github_url, (detail_links or {}).get(quest.quest_id)
+            )
             for _, quest in all_quests
         ]
         cards_html = (
             f'      <div class="quest-grid">\n' + "\n".join(cards) + "\n      </div>"
         )
 
+    shards_html = _render_portfolio_shards(shards) if shards else ""
+
     return f"""    <section class="quests-section" id="quest-portfolio">
       <div class="quests-header">
         <h2>Quest Portfolio</h2>
         <p class="panel-subtitle">{total} quests represented</p>
       </div>
-{cards_html}
+{cards_html}{shards_html}
     </section>"""
 
 
-def _render_quest_card(
+def _render_portfolio_shards(shards: Sequence[PortfolioShard]) -> str:
+    """Render shard placeholders, the shard manifest, and the lazy loader.
+
+    Each placeholder fetches its fragment when scrolled near (or when its
+    Load link is clicked). Fetching requires the dashboard to be served
+    over HTTP(S); under any other protocol (``file://``) the loader stays
+    out of the way and the Load link opens the fragment directly.
+    """
+    placeholders = []
+    for shard in shards:
+        href = html.escape(shard.href)
+        period = html.escape(shard.period)
+        placeholders.append(f"""      <section class="portfolio-shard" data-src="{href}">
+        <div class="shard-header">
+          <h3>{period}</h3>
+          <span class="panel-subtitle">{shard.count} quests</span>
+          <a class="shard-load" href="{href}">Load</a>
+        </div>
+        <div class="quest-grid"></div>
+      </section>""")
+
+    manifest = json.dumps(
+        [{"period": s.period, "href": s.href, "count": s.count} for s in shards]
+    ).replace("</", "<\\/")
+
+    return "\n" + "\n".join(placeholders) + f"""
+      <script type="application/json" id="portfolio-shards">{manifest}</script>
+      <script>
+(function() {{
+  var shards = document.querySelectorAll('.portfolio-shard[data-src]');
+  if (!/^https?:$/.test(location.protocol)) return;
+  function load(el) {{
+    if (el.getAttribute('data-loaded')) return;
+    el.setAttribute('data-loaded', '1');
+    fetch(el.getAttribute('data-src')).then(function(r) {{
+      if (!r.ok) throw new Error(r.status);
+      return r.text();
+    }}).then(function(text) {{
+      el.querySelector('.quest-grid').innerHTML = text;
+      el.classList.add('is-loaded');
+    }}).catch(function() {{
+      el.removeAttribute('data-loaded');
+    }});
+  }}
+  shards.forEach(function(el) {{
+    var link = el.querySelector('.shard-load');
+    if (link) link.addEventListener('click', function(e) {{ e.preventDefault(); load(el); }});
+  }});
+  if ('IntersectionObserver' in window) {{
+    var io = new IntersectionObserver(function(entries) {{
+      entries.forEach(function(entry) {{
+        if (entry.isIntersecting) {{ io.unobserve(entry.target); load(entry.target); }}
+      }});
+    }}, {{ rootMargin: '600px' }});
+    shards.forEach(function(el) {{ io.observe(el); }});
+  }}
+}})();
+      </script>"""
+
+
+def render_quest_card(
     quest: Union[JournalEntry, ActiveQuest],
     github_url: str,
+    detail_href: str | None = None,
 ) -> str:
     """Render a single quest card for any quest type.
 
     Handles both JournalEntry (finished/abandoned) and ActiveQuest (in-progress/blocked).
+    When detail_href is given, the title links to the quest's detail page.
     """
-    # Determine badge class and text
-    status_lower = quest.status.lower()
-    badge_text = _BADGE_TEXT.get(status_lower, "UNKNOWN")
-
-    if status_lower in ("completed", "finished"):
-        badge_class = "finished"
-    elif "block" in status_lower:
-        badge_class = "blocked"
-    elif status_lower == "abandoned":
-        badge_class = "abandoned"
-    elif status_lower in ("in progress", "in_progress"):
-        badge_class = "in-progress"
-    else:
-        badge_class = "unknown"
+    badge_class, badge_text = badge_for(quest.status)
 
     # Build metadata spans
     if isinstance(quest, JournalEntry) and github_url:
@@ -950,16 +1528,20 @@ def _render_quest_card(
 
     # Add PR link if available (JournalEntry only)
     if isinstance(quest, JournalEntry) and quest.pr_number:
-        pr_link = _compute_pr_link(quest.pr_number, github_url)
+        pr_link = compute_pr_link(quest.pr_number, github_url)
         meta_items.append(
             f'<span><b>PR:</b> <a href="{pr_link}">#{quest.pr_number}</a></span>'
         )
 
     meta_html = "\n            ".join(meta_items)
 
+    title_html = html.escape(quest.title)
+    if detail_href:
+        title_html = f'<a href="{html.escape(detail_href)}">{title_html}</a>'
+
     return f"""        <article class="quest-card">
           <div class="quest-card-header">
-            <h3 class="quest-card-title">{html.escape(quest.title)}</h3>
+            <h3 class="quest-card-title">{title_html}</h3>
             <span class="badge badge--{badge_class}">{badge_text}</span>
           </div>
           <p class="quest-pitch">{html.escape(quest.elevator_pitch)}</p>
@@ -969,17 +1551,67 @@ def _render_quest_card(
         </article>"""
 
 
-def _render_warnings(warnings: list[str]) -> str:
-    """Render warnings section if there are any warnings."""
-    if not warnings:
+def badge_for(status: str) -> tuple[str, str]:
+    """Return the (CSS modifier, display text) badge pair for a status."""
+    status_lower = status.lower()
+    badge_text = _BADGE_TEXT.get(status_lower, "UNKNOWN")
+
+    if status_lower in ("completed", "finished"):
+        badge_class = "finished"
+    elif "block" in status_lower:
+        badge_class = "blocked"
+    elif status_lower == "abandoned":
+        badge_class = "abandoned"
+    elif status_lower in ("in progress", "in_progress"):
+        badge_class = "in-progress"
+    else:
+        badge_class = "unknown"
+
+    return badge_class, badge_text
+
+
+def _render_warnings(groups: list[DiagnosticGroup], report_href: str | None = None) -> str:
+    """Render the top warning groups with a few samples each.
+
+    Output size is bounded by MAX_GROUPS and the samples kept per group, no
+    matter how many files produced warnings; the rest is counted and left
+    to the JSON report.
+    """
+    if not groups:
         return ""
 
-    warnings_items = "\n".join(f"      <li>{html.escape(w)}</li>" for w in warnings)
+    items = []
+    for group in groups[:MAX_GROUPS]:
+        samples = "\n".join(
+            f"          <li>{html.escape(shorten(d.message))}</li>" for d in group.samples
+        )
+        more = group.count - len(group.samples)
+        if more:
+            samples += f"""\n          <li class="warnings-more">and {more:,} more</li>"""
+        items.append(
+            f"""      <li><span class="warnings-code">{html.escape(group.code)}</span> <span class="warnings-count">&times;{group.count:,}</span>
+        <ul class="warnings-samples">
+{samples}
+        </ul>
+      </li>"""
+        )
+    hidden = groups[MAX_GROUPS:]
+    if hidden:
+        items.append(
+            f"""      <li class="warnings-more">and {sum(g.count for g in hidden):,} more in {len(hidden)} other codes</li>"""
+        )
 
+    items_html = "\n".join(items)
+    total = sum(g.count for g in groups)
+    report_link = (
+        f""" <a href="{html.escape(report_href, quote=True)}">Full report</a>"""
+        if report_href
+        else ""
+    )
     return f"""    <div class="warnings">
-      <div class="warnings-title">Build Warnings</div>
+      <div class="warnings-title">Build Warnings ({total:,}){report_link}</div>
       <ul class="warnings-list">
-{warnings_items}
+{items_html}
       </ul>
     </div>"""
 
@@ -1019,7 +1651,7 @@ def _sanitize_url(url: str) -> str:
     return html.escape(url)
 
 
-def _compute_pr_link(pr_number: int, github_url: str) -> str:
+def compute_pr_link(pr_number: int, github_url: str) -> str:
     """Compute the link to a pull request.
 
     Args:
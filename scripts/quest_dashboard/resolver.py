@@ -0,0 +1,392 @@
+"""Persistent quest id -> location -> phase index for resuming quests.
+
+Resuming ``/quest <quest-id>`` needs the quest's directory, which may be
+live (``.quest/<id>/``), archived (``.quest/archive/<id>/``) or packed
+(``.quest/archive/<id>.qpack``), and its recorded phase. Without an index
+that means walking the whole ``.quest`` tree.
+
+The index lives in ``.quest/.quest-ids.json`` and maps each quest id to its
+path, phase, status and slug. It is kept current the way the dashboard
+loaders keep their active-quest cache:
+
+- The first lookup walks live quests with the loaders' state-file search
+  and reads archived ones through ``packs.iter_archived`` (warm-up)
+- Later lookups tail ``.quest/events.ndjson`` and re-read only the quests
+  ``quest-state`` changed since the previous lookup
+- A known id resolves with one dictionary lookup and one stat. When its
+  directory has moved into the archive (or been packed), the entry heals
+  itself from ``archive/<id>``; only an id that is found nowhere triggers
+  a full rescan, in which unchanged state files are not re-read
+
+An id the index does not know yet (quests are created by hand) is first
+looked for at ``<id>/`` and ``archive/<id>[.qpack]``, and a full quest id is
+never answered with a different quest. Other queries match ids or slugs
+by prefix, then by substring, then by similarity (``difflib``).
+
+Usage:
+    PYTHONPATH=scripts python3 -m quest_dashboard.resolver <quest-id-or-slug> [--json]
+    quest-resolve <quest-id-or-slug>
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import re
+import sys
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from .events import EVENTS_NAME, read_events
+from .fsutil import write_atomic
+from .loaders import find_state_files
+from .packs import ARCHIVE_DIR, PACK_SUFFIX, QuestPack, iter_archived
+
+INDEX_NAME = ".quest-ids.json"
+INDEX_VERSION = 1
+
+_QUEST_ID_RE = re.compile(r".+_\d{4}-\d{2}-\d{2}__\d{4}")
+
+# Similarity below which a fuzzy match is not suggested
+FUZZY_CUTOFF = 0.6
+MAX_FUZZY = 5
+
+
+@dataclass(frozen=True, slots=True)
+class QuestLocation:
+    """Where one quest lives and the phase it was last recorded in."""
+
+    quest_id: str
+    path: str  # Relative to .quest/, e.g. "<id>", "archive/<id>", "archive/<id>.qpack"
+    phase: str  # Raw state.json phase ("" if unreadable)
+    status: str  # Raw state.json status ("" if unreadable)
+    slug: str
+
+    @property
+    def archived(self) -> bool:
+        return self.path.split("/", 1)[0] == ARCHIVE_DIR
+
+    @property
+    def packed(self) -> bool:
+        return self.path.endswith(PACK_SUFFIX)
+
+
+@dataclass(frozen=True, slots=True)
+class Resolution:
+    """Quests matching one query, best first."""
+
+    query: str
+    matches: list[QuestLocation]
+    how: str  # "exact", "prefix", "substring", "fuzzy" or "none"
+    rescanned: bool  # The tree was walked (warm-up, healing or an unknown id)
+
+    @property
+    def unique(self) -> QuestLocation | None:
+        """The one match, if the query is unambiguous."""
+        return self.matches[0] if len(self.matches) == 1 else None
+
+
+def resolve(quest_root: Path, query: str) -> Resolution:
+    """Find the quest a query names, updating the persistent index as needed.
+
+    Args:
+        quest_root: The ``.quest`` directory
+        query: Full quest id, or a prefix, fragment or misspelling of an id or slug
+
+    Returns:
+        Resolution with every match (several when the query is ambiguous)
+    """
+    index = _QuestIndex.load(quest_root)
+    rescanned = index.warm_up()
+    index.apply_events()
+
+    location = index.locate(query) or index.probe(query)
+    if location is None and not rescanned and (query in index.records or is_quest_id(query)):
+        rescanned = index.rescan()  # Moved elsewhere, or created somewhere unexpected
+        location = index.locate(query)
+    if location is not None:
+        index.save()
+        return Resolution(query, [location], "exact", rescanned)
+
+    how, matches = _match(index.quests.values(), query)
+    if not matches and not rescanned:
+        rescanned = index.rescan()  # Possibly a quest created without quest-state
+        location = index.locate(query)
+        if location is not None:
+            index.save()
+            return Resolution(query, [location], "exact", rescanned)
+        how, matches = _match(index.quests.values(), query)
+    index.save()
+    return Resolution(query, matches, how, rescanned)
+
+
+def is_quest_id(query: str) -> bool:
+    """Return True if query has the full ``<slug>_YYYY-MM-DD__HHMM`` quest id form."""
+    return _QUEST_ID_RE.fullmatch(query) is not None
+
+
+def _match(entries, query: str) -> tuple[str, list[QuestLocation]]:
+    """Prefix, then substring, then fuzzy matches on ids and slugs."""
+    entries = sorted(entries, key=lambda e: e.quest_id, reverse=True)  # Newest id first
+    needle = query.lower()
+    for how, test in (
+        ("prefix", lambda text: text.startswith(needle)),
+        ("substring", lambda text: needle in text),
+    ):
+        found = [e for e in entries if test(e.quest_id.lower()) or test(e.slug.lower())]
+        if found:
+            return how, found
+
+    by_name: dict[str, list[QuestLocation]] = {}
+    for entry in entries:
+        by_name.setdefault(entry.quest_id.lower(), []).append(entry)
+        by_name.setdefault(entry.slug.lower(), []).append(entry)
+    close = difflib.get_close_matches(needle, list(by_name), n=MAX_FUZZY, cutoff=FUZZY_CUTOFF)
+    found = list(dict.fromkeys(e for name in close for e in by_name[name]))
+    return ("fuzzy", found) if found else ("none", [])
+
+
+class _QuestIndex:
+    """The on-disk index plus the operations that keep it current."""
+
+    def __init__(self, quest_root: Path, data: dict | None):
+        self.quest_root = quest_root
+        self.path = quest_root / INDEX_NAME
+        self.loaded = data is not None
+        data = data or {"log_id": None, "offset": 0, "quests": {}}
+        self.log_id: int | None = data["log_id"]
+        self.offset: int = data["offset"]
+        self.records: dict[str, list] = data["quests"]  # id -> [path, phase, status, slug, mtime]
+        self.dirty = not self.loaded
+
+    @classmethod
+    def load(cls, quest_root: Path) -> _QuestIndex:
+        try:
+            data = json.loads((quest_root / INDEX_NAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != INDEX_VERSION
+            or not isinstance(data.get("quests"), dict)
+            or not isinstance(data.get("offset"), int)
+        ):
+            data = None
+        return cls(quest_root, data)
+
+    @property
+    def quests(self) -> dict[str, QuestLocation]:
+        return {quest_id: self._location(quest_id) for quest_id in self.records}
+
+    def warm_up(self) -> bool:
+        """Build the index on first use. Returns True if the tree was walked."""
+        if self.loaded:
+            return False
+        tail = read_events(self.quest_root / EVENTS_NAME)  # Skip history already on disk
+        self.log_id, self.offset = tail.log_id, tail.offset
+        return self.rescan()
+
+    def apply_events(self) -> None:
+        """Re-read the quests quest-state changed since the previous lookup."""
+        tail = read_events(self.quest_root / EVENTS_NAME, self.log_id, self.offset)
+        if (tail.log_id, tail.offset) != (self.log_id, self.offset):
+            self.log_id, self.offset = tail.log_id, tail.offset
+            self.dirty = True
+        for event in tail.events:
+            quest = event.get("quest")
+            if not isinstance(quest, str):
+                continue
+            quest_dir = self.quest_root.parent / quest
+            if ".." in quest_dir.parts:
+                continue  # is_relative_to is lexical; ".." could escape .quest
+            if quest_dir.is_relative_to(self.quest_root) and quest_dir != self.quest_root:
+                self._read(quest_dir.relative_to(self.quest_root).as_posix(), quest_dir.name)
+
+    def locate(self, quest_id: str) -> QuestLocation | None:
+        """Entry for an exact id, healed if its directory moved into the archive."""
+        record = self.records.get(quest_id)
+        if record is None:
+            return None
+        if not self._exists(record[0]):
+            for path in (
+                f"{ARCHIVE_DIR}/{quest_id}{PACK_SUFFIX}",
+                f"{ARCHIVE_DIR}/{quest_id}",
+                quest_id,
+            ):
+                if path != record[0] and self._exists(path):
+                    self._read(path, quest_id)
+                    break
+            else:
+                return None
+        return self._location(quest_id) if quest_id in self.records else None
+
+    def probe(self, quest_id: str) -> QuestLocation | None:
+        """Look for an id the index does not know yet where quests are created or archived.
+
+        Quests are created by hand, not through quest-state, so a new quest
+        is usually missing from the index. Three stats find it.
+        """
+        if quest_id in self.records or not quest_id or "/" in quest_id or quest_id[0] == ".":
+            return None
+        for path in (
+            quest_id,
+            f"{ARCHIVE_DIR}/{quest_id}{PACK_SUFFIX}",
+            f"{ARCHIVE_DIR}/{quest_id}",
+        ):
+            if self._exists(path):
+                self._read(path, quest_id)
+                return self._location(quest_id) if quest_id in self.records else None
+        return None
+
+    def rescan(self) -> bool:
+        """Walk live and archived quests; unchanged state files are not re-read."""
+        previous = {record[0]: (quest_id, record) for quest_id, record in self.records.items()}
+        self.records = {}
+        for state_path in find_state_files(self.quest_root):
+            quest_dir = state_path.parent
+            rel = quest_dir.relative_to(self.quest_root).as_posix()
+            self._read(rel, quest_dir.name, previous)
+        for reader in iter_archived(self.quest_root):
+            rel = reader.path.relative_to(self.quest_root).as_posix()
+            self._read(rel, reader.quest_id, previous, reader)
+        self.dirty = True
+        return True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {
+            "version": INDEX_VERSION,
+            "log_id": self.log_id,
+            "offset": self.offset,
+            "quests": dict(sorted(self.records.items())),
+        }
+        try:
+            write_atomic(self.path, json.dumps(payload, separators=(",", ":")) + "\n")
+        except OSError:
+            return  # A read-only checkout still resolves, just without the index
+        self.dirty = False
+
+    def _location(self, quest_id: str) -> QuestLocation:
+        path, phase, status, slug, _ = self.records[quest_id]
+        return QuestLocation(quest_id, path, phase, status, slug)
+
+    def _exists(self, path: str) -> bool:
+        target = self.quest_root / path
+        if path.endswith(PACK_SUFFIX):
+            return target.is_file()
+        return (target / "state.json").is_file()
+
+    def _read(
+        self,
+        path: str,
+        default_id: str,
+        previous: dict[str, tuple[str, list]] | None = None,
+        reader: QuestPack | None = None,
+    ) -> None:
+        """Record the quest at path (relative to .quest/), reusing an unchanged entry.
+
+        Args:
+            path: Quest directory or pack, relative to the .quest directory
+            default_id: Quest id when state.json has none
+            previous: Entries of the index being rebuilt, by path
+            reader: Open archive reader for path, if the caller has one
+        """
+        target = self.quest_root / path
+        packed = path.endswith(PACK_SUFFIX)
+        try:
+            mtime = (target if packed else target / "state.json").stat().st_mtime_ns
+        except OSError:
+            return
+        if previous and path in previous and previous[path][1][4] == mtime:
+            quest_id, record = previous[path]
+            self.records[quest_id] = record
+            return
+
+        try:
+            if reader is not None:
+                state = reader.read_json("state.json")
+            elif packed:
+                with QuestPack(target) as pack:
+                    state = pack.read_json("state.json")
+            else:
+                state = json.loads((target / "state.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError, zipfile.BadZipFile):
+            state = {}
+        if not isinstance(state, dict):
+            state = {}
+
+        quest_id = str(state.get("quest_id") or default_id)
+        for stale in [k for k, r in self.records.items() if r[0] == path and k != quest_id]:
+            del self.records[stale]  # The quest at this path was renamed
+        self.records[quest_id] = [
+            path,
+            str(state.get("phase", "")),
+            str(state.get("status", "")),
+            str(state.get("slug", quest_id)),
+            mtime,
+        ]
+        self.dirty = True
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Exit 0 if resolved, 1 if nothing matches, 2 if ambiguous.
+
+    A full quest id resolves only exactly; look-alikes are listed as candidates (exit 2).
+    """
+    parser = argparse.ArgumentParser(
+        description="Resolve a quest id, id prefix or slug to its directory and phase"
+    )
+    parser.add_argument("query", help="Quest id, id prefix, or (part of) a slug")
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument("--json", action="store_true", help="Print matches as JSON.")
+    args = parser.parse_args(argv)
+
+    quest_root = Path(args.repo_root).resolve() / ".quest"
+    result = resolve(quest_root, args.query)
+
+    # A full quest id that exists nowhere must not resume a look-alike quest
+    resolved = result.unique is not None and (
+        result.how == "exact" or not is_quest_id(args.query)
+    )
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "query": result.query,
+                    "match": result.how,
+                    "resolved": resolved,
+                    "quests": [
+                        {
+                            "quest_id": m.quest_id,
+                            "path": f".quest/{m.path}",
+                            "phase": m.phase,
+                            "status": m.status,
+                            "archived": m.archived,
+                        }
+                        for m in result.matches
+                    ],
+                },
+                indent=2,
+            )
+        )
+    elif resolved:
+        m = result.unique
+        print(f".quest/{m.path}\t{m.quest_id}\t{m.phase or '-'}\t{m.status or '-'}")
+    elif result.matches:
+        label = "No exact match for" if is_quest_id(args.query) else "Ambiguous"
+        print(f"{label} quest '{args.query}' ({result.how} match), candidates:")
+        for m in result.matches:
+            print(f"  {m.quest_id}\t{m.phase or '-'}\t.quest/{m.path}")
+    else:
+        print(f"No quest matches '{args.query}'", file=sys.stderr)
+
+    if resolved:
+        return 0
+    return 2 if result.matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,461 @@
+"""Full-text search over quest journals, briefs, plans and reviews.
+
+Answers questions like "which quest touched the rate limiter" without
+grepping every file. An SQLite FTS5 index (``.search-index.sqlite`` next to
+the dashboard) holds:
+- Journal bodies (``docs/quest-journal/*.md``)
+- ``quest_brief.md``, ``phase_01_plan/plan.md`` and ``phase_*/review*.md``
+  of every quest under ``.quest`` (archive trees are skipped)
+
+Each run updates the index incrementally: files are fingerprinted by size
+and mtime, and only new or changed files are read and re-indexed. State
+files are fingerprinted too (not indexed), so each quest keeps the same
+status and date the dashboard uses: the journal's status and completion
+date, or for quests without a journal the state's chart category
+(``columnar.CATEGORIES``) and ``updated_at`` day.
+
+Results are ranked with BM25 (title matches weigh more), one row per quest
+with a snippet from its best-matching file.
+
+Usage:
+    PYTHONPATH=scripts python3 -m quest_dashboard.search "rate limiter"
+        [--status finished] [--since 2026-01-01] [--until 2026-03-31]
+        [--limit 20] [--no-update] [--repo-root PATH] [--index PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+from .audit import find_quest_dirs
+from .columnar import CATEGORIES, active_category
+from .loaders import (
+    extract_brief_title,
+    extract_date,
+    extract_metadata,
+    extract_title,
+    humanize_filename,
+    normalize_display_label,
+    normalize_status,
+)
+
+INDEX_NAME = ".search-index.sqlite"
+INDEX_VERSION = 1  # Stored as PRAGMA user_version; a mismatch rebuilds the index
+
+JOURNAL_DIR = Path("docs") / "quest-journal"
+
+# BM25 column weights for (title, body)
+_TITLE_WEIGHT = 5.0
+_BODY_WEIGHT = 1.0
+
+# Tokens of context around the matched terms in each snippet
+_SNIPPET_TOKENS = 12
+
+_SCHEMA = f"""
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    quest_id TEXT NOT NULL,
+    status TEXT,
+    day TEXT
+);
+CREATE INDEX files_quest ON files (quest_id);
+CREATE TABLE quests (
+    quest_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    day TEXT
+);
+CREATE VIRTUAL TABLE docs USING fts5(title, body, tokenize = 'porter unicode61');
+PRAGMA user_version = {INDEX_VERSION};
+"""
+
+# Quest status and day: a journal wins over the quest's state file
+_REBUILD_QUESTS = (
+    "DELETE FROM quests",
+    "INSERT OR IGNORE INTO quests SELECT quest_id, status, day FROM files WHERE kind = 'journal'",
+    "INSERT OR IGNORE INTO quests SELECT quest_id, status, day FROM files WHERE kind = 'state'",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexUpdate:
+    """What one incremental index update did."""
+
+    indexed: int  # New or changed files read
+    unchanged: int  # Files whose fingerprint matched
+    removed: int  # Files that no longer exist
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    """One matching quest and the snippet from its best-matching file."""
+
+    quest_id: str
+    status: str  # One of columnar.CATEGORIES
+    day: date | None  # Completion date, or last update for active quests
+    path: str  # Best-matching file, relative to the repo root
+    snippet: str  # Matched terms wrapped in [brackets]
+    rank: float  # BM25 score (lower is better)
+
+
+def open_index(index_path: Path) -> sqlite3.Connection:
+    """Open (creating or rebuilding if outdated) the search index.
+
+    Raises:
+        RuntimeError: This Python's SQLite was built without FTS5
+    """
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(index_path, timeout=30)
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    except sqlite3.DatabaseError:
+        version = None  # Not an SQLite file
+    if version != INDEX_VERSION:
+        conn.close()
+        index_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(index_path, timeout=30)
+        try:
+            conn.executescript(_SCHEMA)
+        except sqlite3.OperationalError as e:  # "no such module: fts5"
+            conn.close()
+            index_path.unlink(missing_ok=True)
+            raise RuntimeError(f"SQLite FTS5 not available ({e})") from e
+    return conn
+
+
+def update_index(conn: sqlite3.Connection, repo_root: Path) -> IndexUpdate:
+    """Bring the index up to date with the working tree.
+
+    Args:
+        conn: Connection from open_index()
+        repo_root: Repository root
+
+    Returns:
+        IndexUpdate counts
+    """
+    current = _collect_files(repo_root)
+    known = {
+        path: (file_id, mtime_ns, size, quest_id)
+        for file_id, path, mtime_ns, size, quest_id in conn.execute(
+            "SELECT id, path, mtime_ns, size, quest_id FROM files"
+        )
+    }
+    removed = [path for path in known if path not in current]
+    changed = [
+        path
+        for path, (_, _, fingerprint) in current.items()
+        if path not in known or known[path][1:3] != fingerprint
+    ]
+
+    with conn:
+        for path in removed:
+            file_id = known[path][0]
+            conn.execute("DELETE FROM docs WHERE rowid = ?", (file_id,))
+            conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+        # State files first: the other files of a quest directory take its quest id
+        quest_ids = {
+            current[path][1]: quest_id
+            for path, (_, _, _, quest_id) in known.items()
+            if path in current and current[path][0] == "state"
+        }
+        changed.sort(key=lambda path: current[path][0] != "state")
+        for path in changed:
+            kind, quest_dir, fingerprint = current[path]
+            content = (repo_root / path).read_text(encoding="utf-8", errors="replace")
+            if kind == "journal":
+                quest_id, status, day, title = _journal_meta(content, Path(path))
+            elif kind == "state":
+                quest_id, status, day = _state_meta(content, Path(quest_dir).name)
+                title = None
+                if quest_ids.get(quest_dir, quest_id) != quest_id:
+                    conn.execute(
+                        "UPDATE files SET quest_id = ? WHERE path LIKE ? ESCAPE '\\'",
+                        (quest_id, _like_prefix(quest_dir)),
+                    )
+                quest_ids[quest_dir] = quest_id
+            else:
+                quest_id = quest_ids.get(quest_dir, Path(quest_dir).name)
+                status = day = None
+                title = extract_brief_title(content)
+
+            row = (*fingerprint, kind, quest_id, status, day)
+            if path in known:
+                file_id = known[path][0]
+                conn.execute(
+                    "UPDATE files SET mtime_ns = ?, size = ?, kind = ?, quest_id = ?,"
+                    " status = ?, day = ? WHERE id = ?",
+                    (*row, file_id),
+                )
+                conn.execute("DELETE FROM docs WHERE rowid = ?", (file_id,))
+            else:
+                file_id = conn.execute(
+                    "INSERT INTO files (mtime_ns, size, kind, quest_id, status, day, path)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (*row, path),
+                ).lastrowid
+            if kind != "state":
+                conn.execute(
+                    "INSERT INTO docs (rowid, title, body) VALUES (?, ?, ?)",
+                    (file_id, title or "", content),
+                )
+
+        if removed or any(current[path][0] in ("journal", "state") for path in changed):
+            for statement in _REBUILD_QUESTS:
+                conn.execute(statement)
+
+    return IndexUpdate(
+        indexed=len(changed), unchanged=len(current) - len(changed), removed=len(removed)
+    )
+
+
+def search(
+    conn: sqlite3.Connection,
+    query: str,
+    statuses: tuple[str, ...] = (),
+    since: date | None = None,
+    until: date | None = None,
+    limit: int = 20,
+) -> list[SearchHit]:
+    """Rank quests matching query, best first.
+
+    Args:
+        conn: Connection from open_index()
+        query: FTS5 query ("rate limiter", "limit*", '"rate limiter" NOT redis');
+            text that is not valid query syntax is searched as plain words
+        statuses: Keep only quests in these categories (columnar.CATEGORIES)
+        since: Keep only quests dated on or after this day
+        until: Keep only quests dated on or before this day
+        limit: Maximum number of quests returned
+
+    Returns:
+        One SearchHit per matching quest, best first
+    """
+    filters = ""
+    params: list[object] = []
+    if statuses:
+        filters += f" AND q.status IN ({', '.join('?' * len(statuses))})"
+        params.extend(statuses)
+    if since is not None:
+        filters += " AND q.day >= ?"
+        params.append(since.isoformat())
+    if until is not None:
+        filters += " AND q.day <= ?"
+        params.append(until.isoformat())
+
+    # Auxiliary functions such as snippet() cannot run under a window or
+    # GROUP BY, so rank every matching file first and keep each quest's best
+    rank_sql = f"""
+        SELECT docs.rowid, f.quest_id, q.status, q.day, f.path,
+            bm25(docs, {_TITLE_WEIGHT}, {_BODY_WEIGHT}) AS rank
+        FROM docs
+        JOIN files f ON f.id = docs.rowid
+        JOIN quests q ON q.quest_id = f.quest_id
+        WHERE docs MATCH ?{filters}
+        ORDER BY rank, f.quest_id
+    """
+    try:
+        match, rows = query, conn.execute(rank_sql, (query, *params))
+    except sqlite3.OperationalError:
+        # Not FTS5 syntax (e.g. "rate-limiter", "C++"): search the words as phrases
+        match = " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+        try:
+            rows = conn.execute(rank_sql, (match, *params))
+        except sqlite3.OperationalError:
+            return []
+
+    best: dict[str, tuple] = {}
+    for row in rows:
+        if row[1] not in best:
+            best[row[1]] = row
+            if len(best) == limit:
+                break
+    if not best:
+        return []
+
+    rowids = [row[0] for row in best.values()]
+    snippets = dict(
+        conn.execute(
+            f"""SELECT rowid, snippet(docs, -1, '[', ']', '…', {_SNIPPET_TOKENS}) FROM docs
+            WHERE docs MATCH ? AND rowid IN ({', '.join('?' * len(rowids))})""",
+            (match, *rowids),
+        )
+    )
+    return [
+        SearchHit(
+            quest_id=quest_id,
+            status=status,
+            day=date.fromisoformat(day) if day else None,
+            path=path,
+            snippet=" ".join(snippets.get(rowid, "").split()),
+            rank=rank,
+        )
+        for rowid, quest_id, status, day, path, rank in best.values()
+    ]
+
+
+def _collect_files(repo_root: Path) -> dict[str, tuple[str, str, tuple[int, int]]]:
+    """Indexed files by repo-relative path: (kind, quest dir, (mtime_ns, size)).
+
+    The quest dir is repo-relative, or "" for journals.
+    """
+    found: dict[str, tuple[str, str, tuple[int, int]]] = {}
+
+    def add(kind: str, path: Path, quest_dir: str = "") -> None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return
+        rel = path.relative_to(repo_root).as_posix()
+        found[rel] = (kind, quest_dir, (stat.st_mtime_ns, stat.st_size))
+
+    journal_dir = repo_root / JOURNAL_DIR
+    if journal_dir.is_dir():
+        for path in sorted(journal_dir.glob("*.md")):
+            if path.name != "README.md":
+                add("journal", path)
+
+    for quest_dir in find_quest_dirs(repo_root / ".quest"):
+        rel_dir = quest_dir.relative_to(repo_root).as_posix()
+        add("state", quest_dir / "state.json", rel_dir)
+        for kind, pattern in (
+            ("brief", "quest_brief.md"),
+            ("plan", "phase_01_plan/plan.md"),
+            ("review", "phase_*/review*.md"),
+        ):
+            for path in sorted(quest_dir.glob(pattern)):
+                add(kind, path, rel_dir)
+    return found
+
+
+def _journal_meta(content: str, journal_path: Path) -> tuple[str, str, str, str | None]:
+    """(quest id, category, completion day, title), as the journal loader reads them."""
+    quest_id = extract_metadata(content, "quest id") or humanize_filename(journal_path.stem)
+    status = normalize_status(extract_metadata(content, "status") or "Completed")
+    return (
+        quest_id.strip("`"),
+        "abandoned" if status == "Abandoned" else "finished",
+        extract_date(content, journal_path).isoformat(),
+        extract_title(content),
+    )
+
+
+def _state_meta(content: str, dir_name: str) -> tuple[str, str, str | None]:
+    """(quest id, category, updated_at day) of an active quest's state.json."""
+    try:
+        state = json.loads(content)
+    except ValueError:
+        state = None
+    if not isinstance(state, dict):
+        return dir_name, "unknown", None
+    day = None
+    if isinstance(state.get("updated_at"), str):
+        try:
+            day = datetime.fromisoformat(state["updated_at"].replace("Z", "+00:00")).date()
+        except ValueError:
+            pass
+    status = normalize_display_label(str(state.get("status", "in_progress")))
+    return (
+        str(state.get("quest_id", dir_name)),
+        active_category(status),
+        day.isoformat() if day else None,
+    )
+
+
+def _like_prefix(directory: str) -> str:
+    """LIKE pattern for every path below directory (with '\\' as escape)."""
+    escaped = directory.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}/%"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Exit code 1 if nothing matched."""
+    parser = argparse.ArgumentParser(
+        description="Full-text search over quest journals, briefs, plans and reviews"
+    )
+    parser.add_argument(
+        "query",
+        nargs="?",
+        help="FTS5 query, e.g. 'rate limiter' or '\"rate limiter\" NOT redis'. "
+        "Omit to only update the index.",
+    )
+    parser.add_argument(
+        "--status",
+        action="append",
+        choices=CATEGORIES,
+        default=[],
+        help="Only quests in this category (repeatable).",
+    )
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=None,
+        help="Only quests dated on or after this day (YYYY-MM-DD).",
+    )
+    parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        default=None,
+        help="Only quests dated on or before this day (YYYY-MM-DD).",
+    )
+    parser.add_argument("--limit", type=int, default=20, help="Maximum quests listed. Default: 20.")
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--index",
+        default=None,
+        help=f"Index path. Default: docs/dashboard/{INDEX_NAME}.",
+    )
+    parser.add_argument(
+        "--no-update",
+        action="store_true",
+        help="Query the index as it is, without checking files for changes.",
+    )
+    args = parser.parse_args(argv)
+    if args.limit < 1:
+        parser.error("--limit must be at least 1")
+
+    repo_root = Path(args.repo_root).resolve()
+    index_path = Path(args.index) if args.index else repo_root / "docs" / "dashboard" / INDEX_NAME
+    try:
+        conn = open_index(index_path)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    try:
+        if not args.no_update:
+            update = update_index(conn, repo_root)
+            if update.indexed or update.removed or not args.query:
+                print(
+                    f"Index: {update.indexed} indexed, {update.unchanged} unchanged,"
+                    f" {update.removed} removed",
+                    file=sys.stderr,
+                )
+        if not args.query:
+            return 0
+
+        started = time.perf_counter()
+        hits = search(conn, args.query, tuple(args.status), args.since, args.until, args.limit)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    finally:
+        conn.close()
+
+    for hit in hits:
+        day = hit.day.isoformat() if hit.day else "-"
+        print(f"{hit.quest_id}\t{hit.status}\t{day}\t{hit.path}")
+        print(f"    {hit.snippet}")
+    print(f"{len(hits)} quests ({elapsed_ms:.1f} ms)", file=sys.stderr)
+    return 0 if hits else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
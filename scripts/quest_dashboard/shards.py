@@ -0,0 +1,89 @@
+"""Year- or quarter-sharded portfolio fragments for the Quest Dashboard.
+
+With thousands of quests, inlining every card makes index.html slow to
+download and parse. Sharding keeps only the current period's cards in the
+index and writes each older period to its own HTML fragment:
+
+    portfolio/<period>.<sha12>.html
+
+Fragment names are content-addressed, so a period whose quests did not
+change keeps the same file (and stays cached by browsers and CDNs). Only
+the fragment containing an edited quest gets a new name. Fragments no
+longer referenced by the index are removed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping
+from pathlib import Path
+
+from .fsutil import write_atomic
+from .models import DashboardData, PortfolioShard
+from .render import portfolio_entries, portfolio_period, render_quest_card
+
+SHARD_DIR_NAME = "portfolio"
+SHARD_CHOICES = ("year", "quarter")
+
+
+def write_portfolio_shards(
+    data: DashboardData,
+    output_dir: Path,
+    shard_by: str,
+    detail_links: Mapping[str, str] | None = None,
+) -> list[PortfolioShard]:
+    """Write one fragment per past period and prune stale fragments.
+
+    Args:
+        data: Dashboard data
+        output_dir: Directory containing index.html
+        shard_by: "year" or "quarter"
+        detail_links: Optional quest_id -> detail page href (see pages.py)
+
+    Returns:
+        Shards for past periods, newest first, for render_dashboard()
+    """
+    if shard_by not in SHARD_CHOICES:
+        raise ValueError(f"shard_by must be one of {SHARD_CHOICES}, got {shard_by!r}")
+
+    links = detail_links or {}
+    current = portfolio_period(data.generated_at.date(), shard_by)
+
+    # Entries are newest first, so cards within each period stay in order
+    groups: dict[str, list[str]] = {}
+    for day, quest in portfolio_entries(data):
+        period = portfolio_period(day, shard_by)
+        if period >= current:
+            continue
+        groups.setdefault(period, []).append(
+            render_quest_card(quest, data.github_repo_url, links.get(quest.quest_id))
+        )
+
+    shard_dir = output_dir / SHARD_DIR_NAME
+    shards: list[PortfolioShard] = []
+    keep: set[str] = set()
+
+    for period in sorted(groups, reverse=True):
+        content = "\n".join(groups[period]) + "\n"
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+        filename = f"{period}.{digest}.html"
+        keep.add(filename)
+
+        path = shard_dir / filename
+        if not path.exists():
+            shard_dir.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, content)
+        shards.append(
+            PortfolioShard(
+                period=period,
+                href=f"{SHARD_DIR_NAME}/{filename}",
+                count=len(groups[period]),
+            )
+        )
+
+    if shard_dir.is_dir():
+        for stale in shard_dir.glob("*.html"):
+            if stale.name not in keep:
+                stale.unlink(missing_ok=True)
+
+    return shards
@@ -0,0 +1,202 @@
+"""Build stamp for the ``--if-changed`` no-op path.
+
+A stamp records a fingerprint of everything a dashboard build reads and
+the size/mtime of the output it wrote. When a hook runs the build again
+and neither has changed, the build can exit before importing the loaders,
+the renderer, or ``subprocess``.
+
+The fingerprint covers:
+- File size and mtime of everything under ``docs/quest-journal``, ``.quest``
+  and ``.ai/schemas`` (``--validate-handoffs``), and of ``.ai/allowlist.json``
+  (``--audit`` iteration bounds)
+- Directory mtimes in those trees (catches additions and removals)
+- Git HEAD, config, packed-refs and the checked-out branch ref (remote URL
+  and merge-commit PR numbers come from git), plus the loose ref files a
+  ``--ref`` option could name
+- The dashboard package's own source files
+- The CLI options that shape the output
+
+Files the build itself writes into an input tree (``--quest-index``
+updates ``.quest/README.md`` and its row cache) are left out, and so is
+the mtime of the directory they are renamed into; otherwise every
+index update would force one extra rebuild.
+
+This module must stay cheap to import: stdlib only. ``gitmeta`` (which
+pulls in dataclasses) is imported only when ``.git`` is not a directory:
+worktree and submodule checkouts, or a root outside any checkout.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+STAMP_VERSION = 1
+
+# Trees the loaders read, relative to the repo root
+INPUT_DIRS = ("docs/quest-journal", ".quest", ".ai/schemas")
+
+# Single files the build reads, relative to the repo root
+INPUT_FILES = (".ai/allowlist.json",)
+
+# Build outputs inside INPUT_DIRS, relative to the repo root
+GENERATED_FILES = (".quest/README.md", ".quest/.quest-index-cache.json")
+
+
+def compute_fingerprint(repo_root: Path, options: dict[str, object]) -> str:
+    """Hash the build inputs using stat data only (no file contents are read).
+
+    Args:
+        repo_root: Repository root
+        options: CLI options that affect the output (must be JSON-serializable)
+
+    Returns:
+        Hex digest identifying this combination of inputs
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+
+    for rel_dir in INPUT_DIRS:
+        skip = {
+            os.path.relpath(generated, rel_dir)
+            for generated in GENERATED_FILES
+            if generated.startswith(f"{rel_dir}/")
+        }
+        _hash_tree(digest, repo_root / rel_dir, rel_dir, skip=skip)
+    for rel_file in INPUT_FILES:
+        _hash_stat(digest, repo_root / rel_file, rel_file)
+
+    ref = options.get("ref")
+    for path in _git_state_files(repo_root, ref if isinstance(ref, str) else None):
+        _hash_stat(digest, path, str(path))
+
+    _hash_tree(digest, Path(__file__).resolve().parent, "<package>", suffix=".py")
+    return digest.hexdigest()
+
+
+def read_stamp(stamp_path: Path) -> dict | None:
+    """Load a stamp file, or None if it is missing or unreadable."""
+    try:
+        stamp = json.loads(stamp_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(stamp, dict) or stamp.get("version") != STAMP_VERSION:
+        return None
+    return stamp
+
+
+def is_up_to_date(stamp_path: Path, fingerprint: str, output_path: Path) -> bool:
+    """Return True if the stamp matches the inputs and the output is untouched."""
+    stamp = read_stamp(stamp_path)
+    if stamp is None or stamp.get("inputs") != fingerprint:
+        return False
+    return stamp.get("output") == _output_stat(output_path)
+
+
+def write_stamp(stamp_path: Path, fingerprint: str, output_path: Path) -> None:
+    """Record the input fingerprint and the just-written output's stat."""
+    # Deferred: fsutil is only needed after a real build
+    from .fsutil import write_atomic
+
+    stamp = {
+        "version": STAMP_VERSION,
+        "inputs": fingerprint,
+        "output": _output_stat(output_path),
+    }
+    stamp_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(stamp_path, json.dumps(stamp, indent=2) + "\n")
+
+
+def _output_stat(output_path: Path) -> list[int] | None:
+    try:
+        st = output_path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _hash_tree(
+    digest,
+    root: Path,
+    label: str,
+    suffix: str | None = None,
+    skip: set[str] | frozenset[str] = frozenset(),
+) -> None:
+    """Feed (relative path, size, mtime) of every entry under root to digest.
+
+    Files in skip (paths relative to root) are ignored, as are the mtimes
+    of their directories; the listings still catch additions and removals.
+    """
+    skip_dirs = {os.path.dirname(path) or "." for path in skip}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            digest.update(f"{label}:missing:{directory}\n".encode("utf-8"))
+            continue
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(Path(entry.path))
+                    continue
+                if suffix and not entry.name.endswith(suffix):
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            rel = os.path.relpath(entry.path, root)
+            if rel in skip:
+                continue
+            digest.update(f"{label}:{rel}:{st.st_size}:{st.st_mtime_ns}\n".encode("utf-8"))
+
+        rel_dir = os.path.relpath(directory, root)
+        if rel_dir not in skip_dirs:
+            _hash_stat(digest, directory, f"{label}:dir:{rel_dir}")
+
+
+def _hash_stat(digest, path: Path, label: str) -> None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        digest.update(f"{label}:absent\n".encode("utf-8"))
+        return
+    digest.update(f"{label}:{st.st_size}:{st.st_mtime_ns}\n".encode("utf-8"))
+
+
+def _git_state_files(repo_root: Path, ref: str | None = None) -> list[Path]:
+    """Git files whose changes can alter the dashboard (remote URL, merges).
+
+    With ref (``--ref``), the loose files it may resolve to are included,
+    so moving a branch or tag invalidates the stamp. A commit id matches
+    none of them and never moves.
+    """
+    git_dir = repo_root / ".git"
+    if git_dir.is_dir():
+        common_dir = git_dir
+    else:
+        from .gitmeta import find_git_dir, resolve_common_dir
+
+        found = find_git_dir(repo_root)
+        if found is None:
+            return []
+        git_dir, common_dir = found, resolve_common_dir(found)
+    files = [git_dir / "HEAD", common_dir / "config", common_dir / "packed-refs"]
+    if ref:
+        files.extend(
+            common_dir / prefix / ref
+            for prefix in ("", "refs", "refs/tags", "refs/heads", "refs/remotes")
+        )
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return files
+    if head.startswith("ref: "):
+        files.append(common_dir / head[len("ref: ") :])
+    return files
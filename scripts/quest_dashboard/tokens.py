@@ -0,0 +1,10 @@
+"""Offline token estimate shared by the context digest and artifact sizes."""
+
+from __future__ import annotations
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Offline token estimate: one token per four characters, rounded up."""
+    return -(-len(text) // CHARS_PER_TOKEN)
@@ -0,0 +1,542 @@
+"""Single-process runner for the quest configuration validators.
+
+CI used to run ``validate-quest-config.sh``, ``validate-manifest.sh`` and
+``validate-handoff-contracts.sh`` one after another, each re-reading
+``.ai/allowlist.json``, ``.quest-manifest`` and the role files through its
+own ``grep``/``jq`` forks. This module ports their checks:
+
+- ``gitignore``: ``.quest/`` is ignored
+- ``allowlist-json``: ``.ai/allowlist.json`` parses
+- ``allowlist-schema``: it matches ``.ai/schemas/allowlist.schema.json``
+  (compiled with ``handoff.compile_schema``; no ``ajv`` needed)
+- ``roles``: role files have their required ``##`` sections
+- ``manifest``: every framework file is listed in ``.quest-manifest``;
+  entries for missing files warn
+- ``handoff-contracts``: the role-file and workflow contract checks
+
+Every artifact is read once into a ``ConfigSet`` shared by all checks,
+which then run concurrently. Each check is timed; the results print as
+``[PASS]``/``[WARN]``/``[FAIL]`` lines like the shell scripts, or as a JSON
+report, and can be written as JUnit XML for CI. The shell scripts delegate
+here when the package and Python 3.10+ are available (set
+``QUEST_VALIDATE_SHELL=1`` to run their own checks instead).
+
+Usage:
+    PYTHONPATH=scripts python3 -m quest_dashboard.validate
+    PYTHONPATH=scripts python3 -m quest_dashboard.validate --check manifest --json
+    PYTHONPATH=scripts python3 -m quest_dashboard.validate --junit validation.xml
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from .handoff import compile_schema
+
+ALLOWLIST_PATH = ".ai/allowlist.json"
+ALLOWLIST_SCHEMA_PATH = ".ai/schemas/allowlist.schema.json"
+MANIFEST_PATH = ".quest-manifest"
+AGENT_ROLES_DIR = ".skills/quest/agents"
+QUEST_AGENT_PATH = ".ai/roles/quest_agent.md"
+WORKFLOW_PATH = ".skills/quest/delegation/workflow.md"
+
+# Files the installer manages; each must be listed in .quest-manifest.
+# As with ``find -path``, ``*`` also matches across directories.
+MANIFEST_PATTERNS = (
+    ".ai/*.md",
+    ".ai/*.json",
+    ".ai/roles/*.md",
+    ".ai/schemas/*.json",
+    ".ai/templates/*.md",
+    ".skills/*.md",
+    ".skills/*/*.md",
+    ".skills/*/*/*.md",
+    ".agents/*/*/*.md",
+    ".claude/*.md",
+    ".claude/agents/*.md",
+    ".claude/hooks/*.sh",
+    ".claude/skills/*/*.md",
+    "scripts/validate-quest-config.sh",
+)
+
+# Manifest sections that list files (``[directories]`` lists directories)
+MANIFEST_FILE_SECTIONS = ("copy-as-is", "user-customized", "merge-carefully")
+
+# Role files that carry a handoff contract
+HANDOFF_ROLES = (
+    "planner.md",
+    "plan-reviewer.md",
+    "arbiter.md",
+    "builder.md",
+    "code-reviewer.md",
+    "fixer.md",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSet:
+    """Every config artifact the checks need, read once."""
+
+    repo_root: Path
+    gitignore: str | None
+    allowlist: object  # Parsed allowlist (None if missing or invalid)
+    allowlist_error: str | None  # "missing" or "invalid"
+    schema: object  # Parsed allowlist schema (None if missing or invalid)
+    schema_error: str | None
+    manifest: str | None
+    agent_roles: dict[str, str] | None  # File name -> text; None without the directory
+    quest_agent: str | None
+    workflow: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class CheckFinding:
+    """One line of check output: "pass", "warn" or "fail"."""
+
+    level: str
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class CheckResult:
+    """Findings and wall time of one check."""
+
+    name: str
+    findings: tuple[CheckFinding, ...]
+    seconds: float
+
+    @property
+    def failed(self) -> bool:
+        return any(f.level == "fail" for f in self.findings)
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationRun:
+    """Results of one run, in check order."""
+
+    results: list[CheckResult]
+    load_seconds: float  # Time spent reading the artifacts
+    seconds: float  # Wall time of the whole run
+
+    @property
+    def failed(self) -> bool:
+        return any(r.failed for r in self.results)
+
+
+def load_config(repo_root: Path) -> ConfigSet:
+    """Read every config artifact the checks use.
+
+    Args:
+        repo_root: Repository root
+
+    Returns:
+        ConfigSet; missing files are None rather than errors
+    """
+    allowlist, allowlist_error = _read_json(repo_root / ALLOWLIST_PATH)
+    schema, schema_error = _read_json(repo_root / ALLOWLIST_SCHEMA_PATH)
+    roles_dir = repo_root / AGENT_ROLES_DIR
+    agent_roles = None
+    if roles_dir.is_dir():
+        agent_roles = {
+            path.name: text
+            for path in sorted(roles_dir.rglob("*.md"))
+            if path.name != "README.md"
+            and path.is_file()
+            and (text := _read_text(path)) is not None
+        }
+    return ConfigSet(
+        repo_root=repo_root,
+        gitignore=_read_text(repo_root / ".gitignore"),
+        allowlist=allowlist,
+        allowlist_error=allowlist_error,
+        schema=schema,
+        schema_error=schema_error,
+        manifest=_read_text(repo_root / MANIFEST_PATH),
+        agent_roles=agent_roles,
+        quest_agent=_read_text(repo_root / QUEST_AGENT_PATH),
+        workflow=_read_text(repo_root / WORKFLOW_PATH),
+    )
+
+
+def check_gitignore(config: ConfigSet) -> list[CheckFinding]:
+    """``.quest/`` (or ``.quest``) must be a line of ``.gitignore``."""
+    # A narrower entry such as .quest/cache.json leaves quest state committable
+    lines = (config.gitignore or "").splitlines()
+    if any(line.strip() in (".quest/", ".quest") for line in lines):
+        return [CheckFinding("pass", ".quest/ is in .gitignore")]
+    return [
+        CheckFinding(
+            "fail",
+            ".quest/ is NOT in .gitignore - add '.quest/' to prevent committing ephemeral state",
+        )
+    ]
+
+
+def check_allowlist_json(config: ConfigSet) -> list[CheckFinding]:
+    """The allowlist must exist and parse as JSON."""
+    if config.allowlist_error == "missing":
+        return [CheckFinding("fail", f"{ALLOWLIST_PATH} does not exist")]
+    if config.allowlist_error == "invalid":
+        return [CheckFinding("fail", f"{ALLOWLIST_PATH} is invalid JSON")]
+    return [CheckFinding("pass", f"{ALLOWLIST_PATH} is valid JSON")]
+
+
+def check_allowlist_schema(config: ConfigSet) -> list[CheckFinding]:
+    """The allowlist must satisfy its schema."""
+    if config.schema_error == "missing":
+        return [CheckFinding("fail", f"Schema file {ALLOWLIST_SCHEMA_PATH} does not exist")]
+    if config.schema_error == "invalid" or not isinstance(config.schema, dict):
+        return [CheckFinding("fail", f"Schema file {ALLOWLIST_SCHEMA_PATH} is invalid JSON")]
+    if config.allowlist_error is not None:
+        return [CheckFinding("fail", "allowlist.json cannot be validated: missing or invalid JSON")]
+    violations = compile_schema(config.schema)(config.allowlist, "$")
+    if not violations:
+        return [CheckFinding("pass", "allowlist.json validates against schema")]
+    return [
+        CheckFinding("fail", f"allowlist.json does not validate against schema: {violation}")
+        for violation in violations
+    ]
+
+
+def check_roles(config: ConfigSet) -> list[CheckFinding]:
+    """Role files must have the sections the orchestrator relies on."""
+    if config.agent_roles is None:
+        return [CheckFinding("fail", f"{AGENT_ROLES_DIR}/ directory does not exist")]
+    if config.quest_agent is None:
+        return [CheckFinding("fail", f"{QUEST_AGENT_PATH} does not exist")]
+    if not config.agent_roles:
+        return [CheckFinding("fail", f"No role files found in {AGENT_ROLES_DIR}/")]
+
+    findings = []
+    role_files = [*config.agent_roles.items(), ("quest_agent.md", config.quest_agent)]
+    for filename, text in role_files:
+        headings = [line for line in text.splitlines() if line.startswith("## ")]
+
+        def has(*names: str) -> bool:
+            return any(h.startswith(f"## {name}") for h in headings for name in names)
+
+        missing = []
+        if not has("Role", "Overview"):
+            missing.append("Role/Overview")
+        if not has("Tool", "Instances"):
+            missing.append("Tool/Instances")
+        if not has("Context Required", "Context Available", "Overview"):
+            missing.append("Context Required/Context Available/Overview")
+        if not has("Output Contract"):
+            missing.append("Output Contract")
+        # quest_agent.md's Routing Rules table stands in for these two
+        if filename != "quest_agent.md":
+            if not has("Responsibilities"):
+                missing.append("Responsibilities")
+            if not has("Allowed Actions"):
+                missing.append("Allowed Actions")
+
+        if missing:
+            findings.append(
+                CheckFinding("fail", f"{filename} missing sections: {', '.join(missing)}")
+            )
+        else:
+            findings.append(CheckFinding("pass", f"{filename} has all required sections"))
+    return findings
+
+
+def check_manifest(config: ConfigSet) -> list[CheckFinding]:
+    """Framework files must be listed in the manifest; listed files should exist."""
+    if config.manifest is None:
+        return [CheckFinding("fail", f"{MANIFEST_PATH} not found")]
+
+    listed: set[str] = set()
+    listed_files: list[str] = []
+    section = None
+    for raw in config.manifest.splitlines():
+        line = raw.strip()
+        if not line or raw.startswith("#"):
+            continue
+        if raw.startswith("["):
+            section = line.strip("[]")
+            continue
+        listed.add(line)
+        if section in MANIFEST_FILE_SECTIONS:
+            listed_files.append(line)
+
+    missing = sorted(_framework_files(config.repo_root) - listed)
+    findings = [
+        CheckFinding("fail", f"Missing from {MANIFEST_PATH}: {path}") for path in missing
+    ]
+    if not missing:
+        findings.append(CheckFinding("pass", f"All Quest files are listed in {MANIFEST_PATH}"))
+
+    stale = [path for path in listed_files if not (config.repo_root / path).is_file()]
+    findings.extend(CheckFinding("warn", f"Stale entry (file not found): {path}") for path in stale)
+    if not stale:
+        findings.append(CheckFinding("pass", "No stale entries in manifest"))
+    return findings
+
+
+def check_handoff_contracts(config: ConfigSet) -> list[CheckFinding]:
+    """Role files use the text handoff contract; the workflow is Codex-only."""
+    roles = config.agent_roles or {}
+    missing = [name for name in HANDOFF_ROLES if name not in roles]
+    if missing:
+        return [
+            CheckFinding("fail", f"Missing role file: {AGENT_ROLES_DIR}/{name}") for name in missing
+        ]
+
+    findings = []
+    texts = {name: roles[name] for name in HANDOFF_ROLES}
+
+    json_roles = [name for name, text in texts.items() if '"role":' in text]
+    if json_roles:
+        findings.append(
+            CheckFinding("fail", f"JSON contracts in role files: {', '.join(json_roles)}")
+        )
+    else:
+        findings.append(CheckFinding("pass", "No JSON contracts found in role files"))
+
+    with_marker = sum(1 for text in texts.values() if "---HANDOFF---" in text.splitlines())
+    if with_marker == len(HANDOFF_ROLES):
+        findings.append(
+            CheckFinding("pass", f"All {len(HANDOFF_ROLES)} role files have ---HANDOFF--- format")
+        )
+    else:
+        # Role files define the contract; a literal example is optional
+        findings.append(
+            CheckFinding(
+                "warn",
+                f"Found {with_marker}/{len(HANDOFF_ROLES)} role files with ---HANDOFF--- format",
+            )
+        )
+
+    contradictions = [name for name, text in texts.items() if "Context Is In Your Prompt" in text]
+    if contradictions:
+        findings.append(
+            CheckFinding(
+                "fail", f"'Context Is In Your Prompt' found in: {', '.join(contradictions)}"
+            )
+        )
+    else:
+        findings.append(CheckFinding("pass", "No 'Context Is In Your Prompt' found"))
+
+    if config.workflow is None:
+        findings.append(CheckFinding("fail", f"{WORKFLOW_PATH} does not exist"))
+        return findings
+    lines = config.workflow.splitlines()
+    task_calls = sum(1 for line in lines if re.search(r"Task tool with.*agent", line))
+    if task_calls:
+        findings.append(
+            CheckFinding(
+                "fail", f"Found {task_calls} Task tool invocations (should be 0, Codex-only)"
+            )
+        )
+    else:
+        codex_calls = sum(1 for line in lines if "mcp__codex__codex" in line)
+        findings.append(
+            CheckFinding("pass", f"No Task tool invocations found (Codex-only: {codex_calls})")
+        )
+
+    example_has_artifacts = any(
+        "ARTIFACTS" in "\n".join(lines[i : i + 11])
+        for i, line in enumerate(lines)
+        if "Example minimal prompt" in line
+    )
+    if example_has_artifacts:
+        findings.append(CheckFinding("pass", "Minimal example includes ARTIFACTS"))
+    else:
+        findings.append(CheckFinding("fail", "Minimal example missing ARTIFACTS"))
+    return findings
+
+
+CHECKS: dict[str, Callable[[ConfigSet], list[CheckFinding]]] = {
+    "gitignore": check_gitignore,
+    "allowlist-json": check_allowlist_json,
+    "allowlist-schema": check_allowlist_schema,
+    "roles": check_roles,
+    "manifest": check_manifest,
+    "handoff-contracts": check_handoff_contracts,
+}
+
+# What each shell script ran
+SUITES: dict[str, tuple[str, ...]] = {
+    "config": ("gitignore", "allowlist-json", "allowlist-schema", "roles"),
+}
+
+
+def run_checks(
+    repo_root: Path, names: tuple[str, ...] = tuple(CHECKS), jobs: int | None = None
+) -> ValidationRun:
+    """Load the config once and run the named checks concurrently.
+
+    Args:
+        repo_root: Repository root
+        names: Checks to run (keys of CHECKS), reported in this order
+        jobs: Worker threads (default: one per check)
+
+    Returns:
+        ValidationRun with per-check findings and timings
+    """
+    started = time.perf_counter()
+    config = load_config(repo_root)
+    load_seconds = time.perf_counter() - started
+
+    def timed(name: str) -> CheckResult:
+        check_started = time.perf_counter()
+        findings = tuple(CHECKS[name](config))
+        return CheckResult(name, findings, time.perf_counter() - check_started)
+
+    with ThreadPoolExecutor(max_workers=jobs or max(len(names), 1)) as pool:
+        results = list(pool.map(timed, names))
+    return ValidationRun(results, load_seconds, time.perf_counter() - started)
+
+
+def format_report(run: ValidationRun) -> str:
+    """Render a plain-text report in the style of the shell validators."""
+    lines = ["=== Quest Configuration Validation ==="]
+    for result in run.results:
+        lines.append("")
+        lines.append(f"--- {result.name} ({result.seconds * 1000:.1f} ms)")
+        lines.extend(f"[{f.level.upper()}] {f.message}" for f in result.findings)
+    failed = sum(1 for r in run.results if r.failed)
+    lines.append("")
+    lines.append(
+        f"{len(run.results)} check(s) in {run.seconds * 1000:.1f} ms "
+        f"(config loaded in {run.load_seconds * 1000:.1f} ms)"
+    )
+    lines.append(f"{failed} check(s) failed" if failed else "All validations passed!")
+    return "\n".join(lines) + "\n"
+
+
+def json_report(run: ValidationRun) -> dict:
+    """Machine-readable report with per-check timings."""
+    return {
+        "failed": sum(1 for r in run.results if r.failed),
+        "load_seconds": round(run.load_seconds, 6),
+        "seconds": round(run.seconds, 6),
+        "checks": [
+            {
+                "name": r.name,
+                "failed": r.failed,
+                "seconds": round(r.seconds, 6),
+                "findings": [{"level": f.level, "message": f.message} for f in r.findings],
+            }
+            for r in run.results
+        ],
+    }
+
+
+def junit_report(run: ValidationRun) -> str:
+    """JUnit XML with one test case per check."""
+    suite = ET.Element(
+        "testsuite",
+        name="quest-config",
+        tests=str(len(run.results)),
+        failures=str(sum(1 for r in run.results if r.failed)),
+        errors="0",
+        time=f"{run.seconds:.6f}",
+    )
+    for result in run.results:
+        case = ET.SubElement(
+            suite, "testcase", classname="quest-config", name=result.name,
+            time=f"{result.seconds:.6f}",
+        )
+        failures = [f.message for f in result.findings if f.level == "fail"]
+        if failures:
+            failure = ET.SubElement(case, "failure", message=failures[0])
+            failure.text = "\n".join(failures)
+        output = ET.SubElement(case, "system-out")
+        output.text = "\n".join(f"[{f.level.upper()}] {f.message}" for f in result.findings)
+    ET.indent(suite)
+    return ET.tostring(suite, encoding="unicode", xml_declaration=True) + "\n"
+
+
+def _read_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _read_json(path: Path) -> tuple[object, str | None]:
+    """Return (parsed JSON, None) or (None, "missing" | "invalid")."""
+    text = _read_text(path)
+    if text is None:
+        return None, "missing" if not path.is_file() else "invalid"
+    try:
+        return json.loads(text), None
+    except ValueError:
+        return None, "invalid"
+
+
+def _framework_files(repo_root: Path) -> set[str]:
+    """Repo-relative files matching MANIFEST_PATTERNS."""
+    found: set[str] = set()
+    walked: set[str] = set()
+    for pattern in MANIFEST_PATTERNS:
+        parts = pattern.split("/")
+        wildcard = next((i for i, part in enumerate(parts) if "*" in part), len(parts))
+        base = "/".join(parts[:wildcard])
+        if wildcard == len(parts):
+            if (repo_root / base).is_file():
+                found.add(base)
+            continue
+        if base in walked or not (repo_root / base).is_dir():
+            continue
+        walked.add(base)
+        for root, _dirs, files in os.walk(repo_root / base):
+            rel_root = Path(root).relative_to(repo_root).as_posix()
+            for name in files:
+                rel = f"{rel_root}/{name}"
+                if any(fnmatchcase(rel, p) for p in MANIFEST_PATTERNS):
+                    found.add(rel)
+    return found
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point. Exit code 1 if any check fails."""
+    parser = argparse.ArgumentParser(
+        description="Run the quest configuration, manifest and handoff-contract checks"
+    )
+    parser.add_argument("--repo-root", default=".", help="Repository root. Default: cwd.")
+    parser.add_argument(
+        "--check",
+        action="append",
+        choices=(*CHECKS, *SUITES),
+        default=[],
+        help="Run only this check or suite (repeatable). Default: all.",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit a JSON report.")
+    parser.add_argument("--junit", default=None, help="Also write a JUnit XML report here.")
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Worker threads. Default: one per check."
+    )
+    args = parser.parse_args(argv)
+
+    names = tuple(CHECKS)
+    if args.check:
+        selected = {name for choice in args.check for name in SUITES.get(choice, (choice,))}
+        names = tuple(name for name in CHECKS if name in selected)
+
+    run = run_checks(Path(args.repo_root).resolve(), names, args.jobs)
+
+    if args.json:
+        print(json.dumps(json_report(run), indent=2))
+    else:
+        print(format_report(run), end="")
+    if args.junit:
+        Path(args.junit).write_text(junit_report(run), encoding="utf-8")
+
+    return 1 if run.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 #!/usr/bin/env bash
 # Quest Installer Script
 # Installs and updates Quest in any repository
-# Usage: quest_installer.sh [--branch <name>] [--check|--force|--help]
+# Usage: quest_installer.sh [--branch <name>] [--jobs <n>] [--check|--force|--help]
 #
 # Copyright (c) 2026 Quest Authors
 # License: MIT
@@ -14,7 +14,9 @@ set -e
 
 UPSTREAM_REPO="KjellKod/quest"
 UPSTREAM_BRANCH="main"
-RAW_BASE="https://raw.githubusercontent.com/${UPSTREAM_REPO}"
+# QUEST_RAW_BASE / QUEST_UPSTREAM_SHA point the installer at a mirror (or a
+# local stand-in server in tests) instead of GitHub
+RAW_BASE="${QUEST_RAW_BASE:-https://raw.githubusercontent.com/${UPSTREAM_REPO}}"
 SCRIPT_NAME="$(basename "$0")"
 
 # Resolve script path reliably (handles both direct execution and sourcing)
@@ -26,6 +28,7 @@ DRY_RUN=false
 FORCE_MODE=false
 SKIP_SELF_UPDATE=false
 SOURCE_EXPLICIT=false
+FETCH_JOBS=8
 
 # State variables (set during execution)
 IS_GIT_REPO=false
@@ -33,6 +36,10 @@ HAS_QUEST=false
 LOCAL_VERSION=""
 UPSTREAM_SHA=""
 LATEST_RELEASE=""
+CHECKSUM_CMD=""
+
+# Changed files are downloaded here up front by prefetch_files()
+PREFETCH_DIR=".quest-fetch.$$"
 
 # Dry-run summary counters
 DRY_RUN_WOULD_CREATE=0
@@ -47,6 +54,7 @@ DRY_RUN_MODIFIED=0
 
 cleanup() {
   rm -f ".quest-checksums.tmp.$$" ".quest-temp.$$" 2>/dev/null
+  rm -rf "$PREFETCH_DIR" 2>/dev/null
 }
 trap cleanup EXIT
 
@@ -138,6 +146,10 @@ UPSTREAM_CHECKSUM_VALUES=()
 UPDATED_CHECKSUM_FILES=()
 UPDATED_CHECKSUM_VALUES=()
 
+# Current checksums of local manifest files (computed in one batch)
+CURRENT_CHECKSUM_FILES=()
+CURRENT_CHECKSUM_VALUES=()
+
 ###############################################################################
 # Color Output
 ###############################################################################
@@ -376,6 +388,7 @@ ${BOLD}Usage:${NC}
 
 ${BOLD}Options:${NC}
   --branch <name>  Use a specific upstream branch (default: main)
+  --jobs <n>       Concurrent downloads for changed files (default: 8)
   --check          Dry-run mode: show what would change without modifying files
   --force          Non-interactive mode: accept safe defaults, skip modified files
   --help           Show this help message
@@ -425,6 +438,8 @@ check_prerequisites() {
   if $missing; then
     exit 1
   fi
+
+  CHECKSUM_CMD=$(get_checksum_cmd) || exit 1
 }
 
 ###############################################################################
@@ -446,18 +461,72 @@ get_checksum_cmd() {
 # Calculate SHA256 checksum of a file
 get_file_checksum() {
   local file="$1"
-  local cmd
-  cmd=$(get_checksum_cmd)
+  local cmd="${CHECKSUM_CMD:-$(get_checksum_cmd)}"
   $cmd "$file" 2>/dev/null | cut -d' ' -f1
 }
 
 # Calculate SHA256 checksum of content from stdin
 get_content_checksum() {
-  local cmd
-  cmd=$(get_checksum_cmd)
+  local cmd="${CHECKSUM_CMD:-$(get_checksum_cmd)}"
   $cmd | cut -d' ' -f1
 }
 
+# Checksum every existing manifest file with a single checksum process
+# (instead of one fork per file during installation)
+compute_local_checksums() {
+  CURRENT_CHECKSUM_FILES=()
+  CURRENT_CHECKSUM_VALUES=()
+
+  local existing=()
+  local filepath
+  for filepath in "${COPY_AS_IS[@]}" "${USER_CUSTOMIZED[@]}" "${MERGE_CAREFULLY[@]}"; do
+    if [ -f "$filepath" ]; then
+      existing+=("$filepath")
+    fi
+  done
+
+  if [ ${#existing[@]} -eq 0 ]; then
+    return 0
+  fi
+
+  # Output format: checksum  filepath (two spaces between)
+  local line
+  while IFS= read -r line; do
+    CURRENT_CHECKSUM_FILES+=("${line#*  }")
+    CURRENT_CHECKSUM_VALUES+=("${line%% *}")
+  done < <($CHECKSUM_CMD -- "${existing[@]}" 2>/dev/null)
+}
+
+# Get the current checksum of a local file (batch result, else computed now)
+get_local_checksum() {
+  local target="$1"
+  local i
+  for i in "${!CURRENT_CHECKSUM_FILES[@]}"; do
+    if [ "${CURRENT_CHECKSUM_FILES[$i]}" = "$target" ]; then
+      echo "${CURRENT_CHECKSUM_VALUES[$i]}"
+      return 0
+    fi
+  done
+  get_file_checksum "$target"
+}
+
+# Check if checksums.txt shows the local file already matches upstream,
+# in which case it does not need to be downloaded at all
+upstream_matches_local() {
+  local filepath="$1"
+
+  if [ ! -f "$filepath" ]; then
+    return 1
+  fi
+
+  local upstream_checksum
+  if ! upstream_checksum=$(get_upstream_checksum "$filepath"); then
+    return 1
+  fi
+
+  [ "$(get_local_checksum "$filepath")" = "$upstream_checksum" ]
+}
+
 # Load checksums from .quest-checksums file
 load_local_checksums() {
   LOCAL_CHECKSUM_FILES=()
@@ -614,7 +683,7 @@ is_file_pristine() {
   fi
 
   local current_checksum
-  current_checksum=$(get_file_checksum "$filepath")
+  current_checksum=$(get_local_checksum "$filepath")
 
   if [ "$current_checksum" = "$stored_checksum" ]; then
     return 0  # Pristine
@@ -647,6 +716,12 @@ detect_repo_state() {
 }
 
 fetch_latest_release() {
+  # Mirrors and test stand-ins have no release tags
+  if [ -n "${QUEST_RAW_BASE:-}" ]; then
+    LATEST_RELEASE="unreleased"
+    return
+  fi
+
   # Get the latest release tag from GitHub
   local tags
   tags=$(git ls-remote --tags "https://github.com/${UPSTREAM_REPO}.git" 2>/dev/null | grep -v '\^{}' | awk '{print $2}' | sed 's|refs/tags/||' | sort -V | tail -1)
@@ -659,6 +734,12 @@ fetch_latest_release() {
 }
 
 fetch_upstream_version() {
+  if [ -n "${QUEST_UPSTREAM_SHA:-}" ]; then
+    UPSTREAM_SHA="$QUEST_UPSTREAM_SHA"
+    log_info "Upstream version: ${UPSTREAM_SHA:0:8}"
+    return
+  fi
+
   # Use git ls-remote to get the SHA of the main branch
   # This is simpler and more reliable than parsing GitHub API JSON
   local remote_info
@@ -716,11 +797,69 @@ fetch_file_to_temp() {
     return 1
   fi
 
+  # Already downloaded by prefetch_files()
+  local prefetched="${PREFETCH_DIR}/${remote_path}"
+  if [ -f "$prefetched" ]; then
+    mv "$prefetched" "$temp_file"
+    return 0
+  fi
+
   local url="${RAW_BASE}/${UPSTREAM_SHA}/${remote_path}"
 
   curl -fsSL "$url" -o "$temp_file"
 }
 
+# Check if the installed curl supports an option (e.g. --parallel)
+curl_supports() {
+  curl --help all 2>/dev/null | grep -q -- "$1"
+}
+
+# Download every file that may differ from upstream in one curl process.
+# Transfers run concurrently and reuse keep-alive connections; files that
+# checksums.txt shows are already current are not requested at all. Anything
+# that fails here is fetched again, one by one, by fetch_file_to_temp().
+prefetch_files() {
+  local config=""
+  local count=0
+  local filepath
+  for filepath in "${COPY_AS_IS[@]}" "${USER_CUSTOMIZED[@]}" "${MERGE_CAREFULLY[@]}"; do
+    if upstream_matches_local "$filepath"; then
+      continue
+    fi
+    config+="url = \"${RAW_BASE}/${UPSTREAM_SHA}/${filepath}\""$'\n'
+    config+="output = \"${PREFETCH_DIR}/${filepath}\""$'\n'
+    count=$((count + 1))
+  done
+
+  if [ "$count" -eq 0 ]; then
+    log_info "All files match upstream checksums - nothing to download"
+    return 0
+  fi
+
+  log_info "Downloading $count file(s) (up to $FETCH_JOBS at a time)..."
+
+  local options=(-fsSL --create-dirs)
+  if [ "$FETCH_JOBS" -gt 1 ] && curl_supports "--parallel-max"; then
+    options+=(--parallel --parallel-max "$FETCH_JOBS")
+  fi
+  if curl_supports "--remove-on-error"; then
+    options+=(--remove-on-error)
+  fi
+
+  mkdir -p "$PREFETCH_DIR"
+  printf '%s' "$config" | curl "${options[@]}" --config - 2>/dev/null || true
+
+  # Drop downloads that do not match checksums.txt (e.g. truncated transfers)
+  local prefetched upstream_checksum
+  for filepath in "${COPY_AS_IS[@]}" "${USER_CUSTOMIZED[@]}" "${MERGE_CAREFULLY[@]}"; do
+    prefetched="${PREFETCH_DIR}/${filepath}"
+    if [ -f "$prefetched" ] && upstream_checksum=$(get_upstream_checksum "$filepath") &&
+       [ "$(get_file_checksum "$prefetched")" != "$upstream_checksum" ]; then
+      rm -f "$prefetched"
+    fi
+  done
+}
+
 # Create parent directories for a file path
 ensure_parent_dir() {
   local filepath="$1"
@@ -825,7 +964,7 @@ install_copy_as_is() {
   local count=0
   local total=${#COPY_AS_IS[@]}
   for filepath in "${COPY_AS_IS[@]}"; do
-    ((count++))
+    count=$((count + 1))
     install_copy_as_is_file "$filepath" "$count" "$total"
   done
   # Clear progress line (stderr for immediate flush)
@@ -844,6 +983,13 @@ install_copy_as_is_file() {
     printf "\r  Checking: %-60s" "$filepath" >&2
   fi
 
+  # Already current per checksums.txt - nothing to download
+  if upstream_matches_local "$filepath"; then
+    set_updated_checksum "$filepath" "$(get_local_checksum "$filepath")"
+    $DRY_RUN && DRY_RUN_UP_TO_DATE=$((DRY_RUN_UP_TO_DATE + 1))
+    return 0
+  fi
+
   # Fetch upstream content to temp file (preserves trailing newlines)
   local temp_file=".quest-temp.$$"
   if ! fetch_file_to_temp "$filepath" "$temp_file" 2>/dev/null; then
@@ -861,7 +1007,7 @@ install_copy_as_is_file() {
     ensure_parent_dir "$filepath"
     if $DRY_RUN; then
       log_action "Create: $filepath"
-      ((DRY_RUN_WOULD_CREATE++))
+      DRY_RUN_WOULD_CREATE=$((DRY_RUN_WOULD_CREATE + 1))
     else
       mv "$temp_file" "$filepath"
       log_success "Created: $filepath"
@@ -873,13 +1019,13 @@ install_copy_as_is_file() {
 
   # File exists - check if it matches upstream
   local local_checksum
-  local_checksum=$(get_file_checksum "$filepath")
+  local_checksum=$(get_local_checksum "$filepath")
 
   if [ "$local_checksum" = "$upstream_checksum" ]; then
     rm -f "$temp_file"
     # Already up to date - just ensure checksum is stored
     set_updated_checksum "$filepath" "$upstream_checksum"
-    $DRY_RUN && ((DRY_RUN_UP_TO_DATE++))
+    $DRY_RUN && DRY_RUN_UP_TO_DATE=$((DRY_RUN_UP_TO_DATE + 1))
     return 0
   fi
 
@@ -887,7 +1033,7 @@ install_copy_as_is_file() {
   if is_file_pristine "$filepath"; then
     if $DRY_RUN; then
       log_action "Update: $filepath"
-      ((DRY_RUN_WOULD_UPDATE++))
+      DRY_RUN_WOULD_UPDATE=$((DRY_RUN_WOULD_UPDATE + 1))
     else
       mv "$temp_file" "$filepath"
       log_success "Updated: $filepath"
@@ -903,7 +1049,7 @@ install_copy_as_is_file() {
     # Clear progress line before warning
     printf "\r%-80s\r" "" >&2
     log_warn "Modified: $filepath (would prompt to overwrite/skip)"
-    ((DRY_RUN_MODIFIED++))
+    DRY_RUN_MODIFIED=$((DRY_RUN_MODIFIED + 1))
     return 0
   fi
 
@@ -978,7 +1124,7 @@ install_user_customized() {
   local count=0
   local total=${#USER_CUSTOMIZED[@]}
   for filepath in "${USER_CUSTOMIZED[@]}"; do
-    ((count++))
+    count=$((count + 1))
     install_user_customized_file "$filepath" "$count" "$total"
   done
   # Clear progress line (stderr for immediate flush)
@@ -997,6 +1143,11 @@ install_user_customized_file() {
     printf "\r  Checking: %-60s" "$filepath" >&2
   fi
 
+  # Already current per checksums.txt - nothing to download
+  if upstream_matches_local "$filepath"; then
+    return 0
+  fi
+
   # Fetch upstream content to temp file
   local temp_file=".quest-temp.$$"
   if ! fetch_file_to_temp "$filepath" "$temp_file" 2>/dev/null; then
@@ -1020,7 +1171,7 @@ install_user_customized_file() {
 
   # Case 2: File exists - check if upstream has changes
   local local_checksum upstream_checksum
-  local_checksum=$(get_file_checksum "$filepath")
+  local_checksum=$(get_local_checksum "$filepath")
   upstream_checksum=$(get_file_checksum "$temp_file")
 
   if [ "$local_checksum" = "$upstream_checksum" ]; then
@@ -1057,7 +1208,7 @@ install_merge_carefully() {
   local count=0
   local total=${#MERGE_CAREFULLY[@]}
   for filepath in "${MERGE_CAREFULLY[@]}"; do
-    ((count++))
+    count=$((count + 1))
     install_merge_carefully_file "$filepath" "$count" "$total"
   done
   # Clear progress line (stderr for immediate flush)
@@ -1076,6 +1227,11 @@ install_merge_carefully_file() {
     printf "\r  Checking: %-60s" "$filepath" >&2
   fi
 
+  # Already current per checksums.txt - nothing to download
+  if upstream_matches_local "$filepath"; then
+    return 0
+  fi
+
   # Fetch upstream content to temp file
   local temp_file=".quest-temp.$$"
   if ! fetch_file_to_temp "$filepath" "$temp_file" 2>/dev/null; then
@@ -1099,7 +1255,7 @@ install_merge_carefully_file() {
 
   # Case 2: File exists - check if upstream has changes
   local local_checksum upstream_checksum
-  local_checksum=$(get_file_checksum "$filepath")
+  local_checksum=$(get_local_checksum "$filepath")
   upstream_checksum=$(get_file_checksum "$temp_file")
 
   if [ "$local_checksum" = "$upstream_checksum" ]; then
@@ -1193,8 +1349,7 @@ update_gitignore() {
   fi
 
   # Check if .quest/ is already in .gitignore
-  if grep -q "^\.quest/" ".gitignore" 2>/dev/null || \
-     grep -q "^\.quest$" ".gitignore" 2>/dev/null; then
+  if grep -qxE "[[:space:]]*\.quest/?[[:space:]]*" ".gitignore" 2>/dev/null; then
     return
   fi
 
@@ -1249,6 +1404,13 @@ check_self_update() {
 
   log_info "Checking for installer updates..."
 
+  # checksums.txt lists the installer: skip the download when it matches
+  local listed_checksum
+  if listed_checksum=$(get_upstream_checksum "scripts/quest_installer.sh") &&
+     [ "$(get_file_checksum "$SCRIPT_PATH")" = "$listed_checksum" ]; then
+    return 0
+  fi
+
   # Fetch upstream installer
   local upstream_script
   if ! upstream_script=$(fetch_file "scripts/quest_installer.sh" 2>/dev/null); then
@@ -1440,6 +1602,10 @@ run_install() {
   # Create directories
   create_directories
 
+  # Checksum local files in one batch, then download only changed files
+  compute_local_checksums
+  prefetch_files
+
   # Install files by category
   install_copy_as_is
   install_user_customized
@@ -1488,6 +1654,14 @@ parse_args() {
         SOURCE_EXPLICIT=true
         shift 2
         ;;
+      --jobs)
+        if ! [[ "${2:-}" =~ ^[1-9][0-9]*$ ]]; then
+          log_error "--jobs requires a positive number"
+          exit 1
+        fi
+        FETCH_JOBS="$2"
+        shift 2
+        ;;
       --skip-self-update)
         SKIP_SELF_UPDATE=true
         shift
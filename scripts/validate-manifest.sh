@@ -6,6 +6,14 @@
 
 set -e
 
+# Delegate to the single-process Python runner when it is available
+# (QUEST_VALIDATE_SHELL=1 runs the checks below instead).
+if [ -z "${QUEST_VALIDATE_SHELL:-}" ] && [ -f "$PWD/scripts/quest_dashboard/validate.py" ] && \
+   python3 -c 'import sys; sys.exit(sys.version_info < (3, 10))' 2>/dev/null; then
+  PYTHONPATH="$PWD/scripts${PYTHONPATH:+:$PYTHONPATH}" \
+    exec python3 -m quest_dashboard.validate --repo-root "$PWD" --check manifest
+fi
+
 MANIFEST=".quest-manifest"
 ERRORS=0
 
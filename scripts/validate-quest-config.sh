@@ -85,6 +85,14 @@ case "${1:-}" in
     uninstall_hook
     ;;
 esac
+# Delegate to the single-process Python runner when it is available
+# (QUEST_VALIDATE_SHELL=1 runs the checks below instead).
+if [ -z "${QUEST_VALIDATE_SHELL:-}" ] && [ -f "$REPO_ROOT/scripts/quest_dashboard/validate.py" ] && \
+   python3 -c 'import sys; sys.exit(sys.version_info < (3, 10))' 2>/dev/null; then
+  PYTHONPATH="$REPO_ROOT/scripts${PYTHONPATH:+:$PYTHONPATH}" \
+    exec python3 -m quest_dashboard.validate --repo-root "$REPO_ROOT" --check config
+fi
+
 ERRORS=0
 
 # Colors for output (disabled if not a terminal)
@@ -1,5 +1,6 @@
 """Integration test for the quest dashboard build process."""
 
+import json
 import subprocess
 import sys
 from pathlib import Path
@@ -99,6 +100,10 @@ def test_build_with_custom_output_path(tmp_path):
     assert "<!doctype html>" in html.lower()
     assert "Quest Portfolio Dashboard" in html
 
+    # The full warnings report is written next to the output, even when empty
+    report = json.loads((custom_output.parent / "diagnostics.json").read_text(encoding="utf-8"))
+    assert report["total"] == sum(len(g["diagnostics"]) for g in report["groups"])
+
 
 def test_build_with_github_url_flag(tmp_path):
     """Test that --github-url flag produces PR links using the supplied URL base.
@@ -129,7 +134,7 @@ def test_build_with_github_url_flag(tmp_path):
         "from pathlib import Path\n"
         "from quest_dashboard.models import DashboardData, JournalEntry\n"
         "\n"
-        "def fake_loader(repo_root, github_url=None):\n"
+        "def fake_loader(repo_root, github_url=None, ref=None, active_cache=None):\n"
         "    return DashboardData(\n"
         "        finished_quests=[JournalEntry(\n"
         "            quest_id='pr-test-001', slug='pr-test',\n"
@@ -169,3 +174,104 @@ def test_build_with_github_url_flag(tmp_path):
     # The fixture has github_repo_url=None, so this can only pass
     # if --github-url is correctly wired through the CLI to the renderer.
     assert "https://github.com/test-owner/test-repo/pull/99" in html
+
+
+# Budget for the package's own import time on the --if-changed no-op path: the
+# cumulative microseconds of every top-level quest_dashboard* entry reported by
+# -X importtime (buildlock with the package __init__, stamp, and anything stamp
+# imports lazily), summed
+NOOP_IMPORT_BUDGET_US = 30_000
+
+# Modules the no-op path must never import
+NOOP_FORBIDDEN_MODULES = {
+    "subprocess",
+    "quest_dashboard.loaders",
+    "quest_dashboard.render",
+    "quest_dashboard.pages",
+    "quest_dashboard.history",
+}
+
+
+def test_if_changed_noop_skips_heavy_imports(tmp_path):
+    """Benchmark: an unchanged --if-changed run stays within its import budget.
+
+    The first run builds and writes the stamp; the second must exit before
+    importing the loaders, renderer or subprocess.
+    """
+    repo_root = tmp_path / "repo"
+    journal = repo_root / "docs" / "quest-journal"
+    journal.mkdir(parents=True)
+    (journal / "one.md").write_text("# Quest Journal: One\n", encoding="utf-8")
+    script_path = (
+        Path(__file__).resolve().parents[2]
+        / "scripts"
+        / "quest_dashboard"
+        / "build_quest_dashboard.py"
+    )
+    cmd = [
+        sys.executable,
+        "-X",
+        "importtime",
+        str(script_path),
+        "--repo-root",
+        str(repo_root),
+        "--output",
+        str(tmp_path / "site" / "index.html"),
+        "--if-changed",
+    ]
+
+    first = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    second = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+
+    assert first.returncode == 0, first.stderr
+    assert "Dashboard built" in first.stdout
+    assert not (tmp_path / "site" / "stats-history.ndjson").exists()  # History is opt-in
+    assert second.returncode == 0, second.stderr
+    assert "Dashboard up to date" in second.stdout
+
+    imported = set()
+    package_us = 0
+    for line in second.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        imported.add(name.strip())
+        top_level = not name[1:].startswith(" ")  # Nested imports are indented
+        if top_level and name.strip().split(".")[0] == "quest_dashboard":
+            package_us += int(cumulative)
+
+    assert not NOOP_FORBIDDEN_MODULES & imported
+    assert package_us < NOOP_IMPORT_BUDGET_US
+
+    # Touching an input invalidates the stamp
+    (journal / "two.md").write_text("# Quest Journal: Two\n", encoding="utf-8")
+    third = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    assert "Dashboard built" in third.stdout
+
+
+def test_ref_build_keeps_its_own_report_and_history(tmp_path):
+    """A --ref build never writes the working-tree build's diagnostics or history."""
+    repo_root = Path(__file__).resolve().parents[2]
+    script_path = repo_root / "scripts" / "quest_dashboard" / "build_quest_dashboard.py"
+    cmd = [sys.executable, str(script_path), "--ref", "HEAD", "--no-lock"]
+
+    built = subprocess.run(
+        [*cmd, "--output", str(tmp_path / "release.html")],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert built.returncode == 0, built.stderr
+    assert (tmp_path / "release.diagnostics.json").is_file()
+    assert not (tmp_path / "diagnostics.json").exists()
+
+    rejected = subprocess.run(
+        [*cmd, "--history", "--output", str(tmp_path / "release.html")],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert rejected.returncode == 2
+    assert "--ref --history needs an explicit --history-file" in rejected.stderr
@@ -0,0 +1,176 @@
+"""Integration tests for scripts/quest_installer.sh against a local upstream stand-in."""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+INSTALLER = REPO_ROOT / "scripts" / "quest_installer.sh"
+
+pytestmark = pytest.mark.skipif(
+    not (shutil.which("bash") and shutil.which("curl") and shutil.which("git")),
+    reason="installer needs bash, curl and git",
+)
+
+_MANIFEST = """\
+[copy-as-is]
+.ai/quest.md
+.ai/roles/builder.md
+.ai/roles/planner.md
+scripts/tool.sh
+
+[user-customized]
+.ai/allowlist.json
+
+[merge-carefully]
+.claude/settings.json
+
+[directories]
+.quest
+"""
+
+_FILES = {
+    ".ai/quest.md": b"# Quest\n",
+    ".ai/roles/builder.md": b"# Builder\n",
+    ".ai/roles/planner.md": b"# Planner\n",
+    "scripts/tool.sh": b"#!/bin/sh\necho tool\n",
+    ".ai/allowlist.json": b"{}\n",
+    ".claude/settings.json": b'{"hooks": {}}\n',
+}
+
+
+def _tree(files, with_checksums):
+    tree = {
+        ".quest-manifest": _MANIFEST.encode(),
+        "scripts/quest_installer.sh": INSTALLER.read_bytes(),
+        **files,
+    }
+    if with_checksums:
+        tree["checksums.txt"] = "".join(
+            f"{hashlib.sha256(content).hexdigest()}  {path}\n"
+            for path, content in sorted(tree.items())
+        ).encode()
+    return tree
+
+
+class _Upstream:
+    """Serves {sha: {path: bytes}} as /<sha>/<path> and logs every request."""
+
+    def __init__(self):
+        self.trees = {}
+        self.requests = []  # (path, client port)
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive
+
+            def do_GET(self):
+                upstream.requests.append((self.path, self.client_address[1]))
+                sha, _, rel = self.path.lstrip("/").partition("/")
+                body = upstream.trees.get(sha, {}).get(rel)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def fetched(self, sha):
+        prefix = f"/{sha}/"
+        return Counter(path[len(prefix) :] for path, _ in self.requests if path.startswith(prefix))
+
+
+@pytest.fixture
+def upstream():
+    server = _Upstream()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+def _install(target, upstream, sha, *args):
+    env = {
+        **os.environ,
+        "QUEST_RAW_BASE": upstream.base,
+        "QUEST_UPSTREAM_SHA": sha,
+        "NO_COLOR": "1",
+    }
+    return subprocess.run(
+        ["bash", str(INSTALLER), "--force", *args],
+        cwd=target,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        stdin=subprocess.DEVNULL,
+    )
+
+
+def test_fresh_install_fetches_each_file_once_over_shared_connections(tmp_path, upstream):
+    """Without checksums.txt every file is downloaded once, in one batch."""
+    upstream.trees["sha1"] = _tree(_FILES, with_checksums=False)
+    target = tmp_path / "repo"
+    target.mkdir()
+
+    result = _install(target, upstream, "sha1", "--jobs", "1")
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    for path, content in _FILES.items():
+        assert (target / path).read_bytes() == content
+    fetched = upstream.fetched("sha1")
+    assert all(fetched[path] == 1 for path in _FILES), fetched
+    ports = {port for path, port in upstream.requests if path[len("/sha1/") :] in _FILES}
+    assert len(ports) == 1  # One keep-alive connection for the whole batch
+
+
+def test_update_downloads_only_files_whose_checksums_changed(tmp_path, upstream):
+    """With checksums.txt, identical local files are never requested."""
+    upstream.trees["sha1"] = _tree(_FILES, with_checksums=True)
+    changed = {**_FILES, ".ai/roles/planner.md": b"# Planner v2\n"}
+    upstream.trees["sha2"] = _tree(changed, with_checksums=True)
+    target = tmp_path / "repo"
+    target.mkdir()
+    assert _install(target, upstream, "sha1").returncode == 0
+
+    result = _install(target, upstream, "sha2")
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert (target / ".ai/roles/planner.md").read_bytes() == b"# Planner v2\n"
+    assert sorted(upstream.fetched("sha2")) == [
+        ".ai/roles/planner.md",
+        ".quest-manifest",
+        "checksums.txt",
+    ]
+    stored = (target / ".quest-checksums").read_text()
+    planner_checksum = hashlib.sha256(changed[".ai/roles/planner.md"]).hexdigest()
+    assert f"{planner_checksum}  .ai/roles/planner.md" in stored
+
+
+def test_check_mode_counts_without_writing(tmp_path, upstream):
+    """--check reports pending creations and leaves the target untouched."""
+    upstream.trees["sha1"] = _tree(_FILES, with_checksums=True)
+    target = tmp_path / "repo"
+    target.mkdir()
+
+    result = _install(target, upstream, "sha1", "--check")
+
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Files to create:  5" in result.stdout  # copy-as-is incl. the installer
+    assert list(target.iterdir()) == []
@@ -0,0 +1,155 @@
+"""Unit tests for quest_dashboard.analytics module."""
+
+import random
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from quest_dashboard.analytics import (
+    THROUGHPUT_WEEKS,
+    _start_days,
+    compute_analytics,
+    quest_start_day,
+)
+from quest_dashboard.columnar import QuestTable
+from quest_dashboard.models import ActiveQuest, DashboardData, JournalEntry
+from quest_dashboard.render import _render_analytics_section
+
+TODAY = date(2026, 3, 4)  # A Wednesday
+
+
+def _journal(quest_id, completed, plan=None, fix=None, status="Completed"):
+    return JournalEntry(
+        quest_id=quest_id,
+        slug=quest_id,
+        title=quest_id,
+        elevator_pitch="",
+        status=status,
+        completed_date=completed,
+        journal_path=Path(f"docs/quest-journal/{quest_id}.md"),
+        plan_iterations=plan,
+        fix_iterations=fix,
+    )
+
+
+def _table(finished, abandoned=(), active=()):
+    return QuestTable.from_quests(finished, abandoned, active)
+
+
+def test_quest_start_day_reads_the_id_suffix():
+    """Only a well-formed trailing _YYYY-MM-DD__HHMM suffix counts."""
+    assert quest_start_day("ci-validation_2026-02-04__1532") == date(2026, 2, 4)
+    assert quest_start_day("x_2026-02-04__1532_2026-03-01__0900") == date(2026, 3, 1)
+    assert quest_start_day("bad-date_2026-02-30__1532") is None
+    assert quest_start_day("no-suffix") is None
+    assert quest_start_day("_2026-02-04__15321") is None
+    assert quest_start_day("") is None
+
+
+def test_start_day_scan_matches_per_row_parsing():
+    """The single buffer scan agrees with parsing each id on its own."""
+    ids = [
+        "a_2026-01-01__0100",
+        "",
+        "_2026-01-02__0200",  # Suffix only
+        "b_2026-01-03__03002026-01-04__0400",  # Date-like run before the suffix
+        "",
+        "c_2026-13-01__0100",  # Invalid month
+        "d__2026-01-05__0500",
+        "x",
+        "e_2026-01-06__0600",
+    ]
+    finished = [_journal(quest_id, TODAY) for quest_id in ids]
+
+    starts = _start_days(_table(finished))
+
+    expected = [quest_start_day(quest_id) for quest_id in ids]
+    assert [date.fromordinal(s) if s > 0 else None for s in starts] == expected
+
+
+def test_lead_time_histograms_and_weekly_throughput():
+    """Finished quests feed lead times and throughput; every row feeds histograms."""
+    finished = [
+        _journal("a_2026-02-20__0900", date(2026, 3, 2), plan=1, fix=0),  # 10 days
+        _journal("b_2026-02-28__0900", date(2026, 3, 2), plan=2, fix=9),  # 2 days
+        _journal("c_2026-02-01__0900", date(2026, 2, 5), plan=6),  # 4 days
+        _journal("no-suffix", date(2026, 2, 4)),
+        _journal("ancient_2020-01-01__0000", date(2020, 1, 2)),  # Outside the window
+    ]
+    abandoned = [_journal("z_2026-01-01__0000", date(2026, 3, 3), plan=1, status="Abandoned")]
+    active = [
+        ActiveQuest(
+            quest_id="q_2026-03-01__0800",
+            slug="q",
+            title="q",
+            elevator_pitch="",
+            status="In Progress",
+            phase="Building",
+            updated_at=datetime(2026, 3, 4, 8, 0, tzinfo=timezone.utc),
+            plan_iterations=3,
+        )
+    ]
+
+    result = compute_analytics(_table(finished, abandoned, active), TODAY, use_numpy=False)
+
+    assert result.lead_time_samples == 4
+    assert result.lead_time_days == {"p50": 3.0, "p75": 5.5, "p90": 8.2, "p95": 9.1}
+    assert result.plan_iterations == {"0": 0, "1": 2, "2": 1, "3": 1, "4": 0, "5": 0, "6+": 1}
+    assert result.fix_iterations == {"0": 1, "1": 0, "2": 0, "3": 0, "4": 0, "5": 0, "6+": 1}
+    assert len(result.weekly_throughput) == THROUGHPUT_WEEKS
+    assert result.weekly_throughput[-1] == ("2026-03-02", 2)
+    assert result.weekly_throughput[-5] == ("2026-02-02", 2)
+    assert sum(count for _, count in result.weekly_throughput) == 4
+
+
+def test_empty_table_renders_no_lead_time_rows():
+    """No quests yields zero bins, no percentiles and an explanatory panel."""
+    result = compute_analytics(_table([]), TODAY, use_numpy=False)
+
+    assert result.lead_time_samples == 0 and result.lead_time_days == {}
+    assert set(result.plan_iterations.values()) == {0}
+    panel = _render_analytics_section(result)
+    assert "chart-weekly-throughput" in panel
+    assert "No finished quests with a dated quest id yet" in panel
+
+
+def test_numpy_path_matches_pure_python():
+    """NumPy is an accelerator only: both paths return identical analytics."""
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    start = date(2025, 6, 1)
+    finished = []
+    for i in range(2_000):
+        begun = start + timedelta(days=rng.randrange(250))
+        quest_id = f"q{i}_{begun.isoformat()}__{rng.randrange(2400):04d}"
+        if i % 13 == 0:
+            quest_id = f"q{i}"
+        finished.append(
+            _journal(
+                quest_id,
+                begun + timedelta(days=rng.randrange(-2, 40)),
+                plan=rng.choice([None, 0, 1, 2, 3, 7]),
+                fix=rng.choice([None, 0, 1, 4, 12]),
+            )
+        )
+    table = _table(finished)
+
+    assert compute_analytics(table, TODAY, use_numpy=True) == compute_analytics(
+        table, TODAY, use_numpy=False
+    )
+
+
+def test_analytics_section_lists_percentiles_and_bins():
+    """The panel shows each percentile and a row per iteration bin."""
+    data = DashboardData(
+        finished_quests=[_journal("a_2026-02-20__0900", date(2026, 3, 2), plan=1, fix=0)],
+        active_quests=[],
+        abandoned_quests=[],
+    )
+    result = compute_analytics(QuestTable.from_dashboard_data(data), TODAY)
+
+    panel = _render_analytics_section(result)
+
+    assert '<td>P95</td><td class="num">10 days</td>' in panel
+    assert panel.count("<tr>") == 2 + len(result.lead_time_days) + len(result.plan_iterations)
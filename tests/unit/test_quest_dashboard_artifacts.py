@@ -0,0 +1,125 @@
+"""Unit tests for quest_dashboard.artifacts module."""
+
+import json
+import os
+
+import pytest
+
+from quest_dashboard.artifacts import CACHE_NAME, main, scan_artifacts
+from quest_dashboard.render import _render_artifact_section
+
+
+def _write(quest_dir, rel, chars):
+    path = quest_dir / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x" * chars, encoding="utf-8")
+    return path
+
+
+def _state(quest_dir, plan_iteration=1, fix_iteration=0):
+    quest_dir.mkdir(parents=True, exist_ok=True)
+    (quest_dir / "state.json").write_text(
+        json.dumps(
+            {
+                "quest_id": quest_dir.name,
+                "plan_iteration": plan_iteration,
+                "fix_iteration": fix_iteration,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.fixture
+def quest_root(tmp_path):
+    root = tmp_path / ".quest"
+    q1 = root / "q1"
+    _state(q1)
+    _write(q1, "phase_01_plan/plan.md", 4000)  # 1000 tokens
+    _write(q1, "phase_01_plan/review_claude.md", 2002)  # 501 tokens
+    _write(q1, "phase_02_implementation/handoff.json", 400)
+    q2 = root / "q2"
+    _state(q2)
+    _write(q2, "phase_01_plan/plan.md", 40)
+    _state(root / "archive" / "old")
+    _write(root / "archive" / "old", "phase_01_plan/plan.md", 40)
+    _state(root / "empty")
+    return root
+
+
+def test_sizes_per_quest_largest_first(quest_root):
+    """Bytes, tokens and the largest file per quest; archived and empty quests are skipped."""
+    scan = scan_artifacts(quest_root, budget=1500)
+
+    q1, q2 = scan.quests
+    assert (q1.quest_id, q1.files, q1.bytes, q1.tokens) == ("q1", 3, 6402, 1601)
+    assert (q1.largest, q1.largest_tokens) == ("phase_01_plan/plan.md", 1000)
+    assert (q1.plan_tokens, q1.fix_tokens) == ((1501,), ())
+    assert (q2.quest_id, q2.tokens, q2.over_budget) == ("q2", 10, False)
+    assert [q.quest_id for q in scan.over_budget] == ["q1"]
+    assert (scan.measured, scan.cached) == (4, 0)
+
+
+def test_unchanged_files_are_not_reread(quest_root, tmp_path):
+    """Stat-matched files reuse their token count; an edit is measured again."""
+    cache = tmp_path / CACHE_NAME
+    scan_artifacts(quest_root, cache)
+    os.utime(cache, ns=(0, 0))
+
+    again = scan_artifacts(quest_root, cache)
+    assert (again.measured, again.cached) == (0, 4)
+    assert cache.stat().st_mtime_ns == 0
+
+    _write(quest_root / "q2", "phase_01_plan/plan.md", 80)
+    edited = scan_artifacts(quest_root, cache)
+    assert (edited.measured, edited.cached) == (1, 3)
+    assert edited.quests[1].tokens == 20
+
+
+def test_growth_across_iterations_survives_overwrites(quest_root, tmp_path):
+    """Each iteration keeps the largest total seen, although the files are overwritten."""
+    cache = tmp_path / CACHE_NAME
+    q1 = quest_root / "q1"
+    scan_artifacts(quest_root, cache)
+
+    _state(q1, plan_iteration=2)
+    _write(q1, "phase_01_plan/plan.md", 6000)
+    scan_artifacts(quest_root, cache)
+
+    _state(q1, plan_iteration=2, fix_iteration=1)
+    _write(q1, "phase_03_review/review_codex.md", 800)
+    scan = scan_artifacts(quest_root, cache)
+
+    assert (scan.quests[0].plan_tokens, scan.quests[0].fix_tokens) == ((1501, 2001), (200,))
+
+
+def test_artifact_panel_puts_over_budget_quests_first(quest_root):
+    """Over-budget quests lead the table and are marked; an empty scan renders nothing."""
+    scan = scan_artifacts(quest_root, budget=1500)
+
+    panel = _render_artifact_section(scan.quests, 1500)
+
+    assert "2 quests, 1.6k tokens; 1 over the 1.5k-token budget" in panel
+    assert panel.index(">q1<") < panel.index(">q2<")
+    assert '<td class="num rate--bad">1.6k</td>' in panel
+    assert "phase_01_plan/plan.md (1.0k)" in panel
+    assert _render_artifact_section([], 1500) == ""
+
+
+def test_cli_exit_code_reflects_budget(quest_root, tmp_path, capsys):
+    """Exit 1 while any quest is over budget."""
+    args = ["--repo-root", str(tmp_path), "--cache", str(tmp_path / CACHE_NAME)]
+
+    assert main(args) == 0
+    assert main([*args, "--budget", "1000"]) == 1
+    assert "[OVER] q1: 1601 tokens in 3 files" in capsys.readouterr().out
+
+
+def test_build_rejects_a_budget_without_artifact_sizes(capsys):
+    """--artifact-budget alone would be ignored, so the dashboard CLI refuses it."""
+    from quest_dashboard.build_quest_dashboard import parse_args
+
+    with pytest.raises(SystemExit):
+        parse_args(["--artifact-budget", "1000"])
+    assert "--artifact-budget requires --artifact-sizes" in capsys.readouterr().err
+    assert parse_args(["--artifact-sizes", "--artifact-budget", "1000"]).artifact_budget == 1000
@@ -0,0 +1,181 @@
+"""Unit tests for quest_dashboard.audit module."""
+
+import json
+from pathlib import Path
+
+from quest_dashboard import audit
+from quest_dashboard.audit import (
+    IterationLimits,
+    audit_quest,
+    audit_quests,
+    audit_warnings,
+    format_report,
+    load_limits,
+)
+from quest_dashboard.models import Diagnostic
+
+
+def _quest(root: Path, name: str, phase: str, plan_iter=1, fix_iter=0, files=()):
+    quest_dir = root / ".quest" / name
+    quest_dir.mkdir(parents=True)
+    (quest_dir / "state.json").write_text(
+        json.dumps(
+            {"quest_id": name, "phase": phase, "plan_iteration": plan_iter, "fix_iteration": fix_iter}
+        ),
+        encoding="utf-8",
+    )
+    for rel_path, content in dict(files).items():
+        path = quest_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content if isinstance(content, str) else json.dumps(content))
+    return quest_dir
+
+
+_PLAN = {"phase_01_plan/plan.md": "# Plan"}
+_APPROVED = {**_PLAN, "phase_01_plan/handoff_arbiter.json": {"next": "builder"}}
+_REVIEWS = {
+    "phase_03_review/review_claude.md": "ok",
+    "phase_03_review/review_codex.md": "ok",
+}
+
+
+def test_building_quest_entered_via_approved_plan(tmp_path):
+    """A building quest passes when some predecessor transition is satisfied."""
+    quest_dir = _quest(tmp_path, "q1", "building", files=_APPROVED)
+    missing_plan = _quest(tmp_path, "q2", "building")
+
+    result = audit_quest(quest_dir)
+
+    assert not result.findings
+    assert result.transition.endswith("->building")
+    assert audit_quest(missing_plan).findings[0].message == (
+        "Missing artifact: phase_01_plan/plan.md"
+    )
+
+
+def test_target_mode_matches_shell_semantic_checks(tmp_path):
+    """--target applies the arbiter verdict check like validate-quest-state.sh."""
+    quest_dir = _quest(
+        tmp_path,
+        "q1",
+        "plan_reviewed",
+        files={**_PLAN, "phase_01_plan/handoff_arbiter.json": {"next": "planner"}},
+    )
+
+    result = audit_quest(quest_dir, target="building")
+    invalid = audit_quest(quest_dir, target="complete")
+
+    assert result.failed
+    assert "next=planner, expected builder" in result.findings[0].message
+    assert "Invalid transition: plan_reviewed -> complete" in invalid.findings[0].message
+
+
+def test_complete_requires_both_reviews_clean(tmp_path):
+    """reviewing->complete needs next=null in both review handoffs."""
+    clean = _quest(
+        tmp_path,
+        "clean",
+        "complete",
+        files={
+            **_REVIEWS,
+            "phase_03_review/handoff_claude.json": {"next": None},
+            "phase_03_review/handoff_codex.json": {},
+        },
+    )
+    dirty = _quest(
+        tmp_path,
+        "dirty",
+        "complete",
+        files={
+            **_REVIEWS,
+            "phase_03_review/handoff_claude.json": {"next": None},
+            "phase_03_review/handoff_codex.json": "{not json",
+        },
+    )
+
+    assert not audit_quest(clean).findings
+    assert "not both clean" in audit_quest(dirty).findings[0].message
+
+
+def test_iteration_bounds_warn_only(tmp_path):
+    """Fix iterations at the allowlist bound warn without failing."""
+    quest_dir = _quest(
+        tmp_path,
+        "q1",
+        "fixing",
+        fix_iter=3,
+        files={**_REVIEWS, "phase_03_review/handoff_codex.json": {"next": "fixer"}},
+    )
+
+    result = audit_quest(quest_dir, limits=IterationLimits(max_fix=3))
+
+    assert not result.failed
+    assert [f.level for f in result.findings] == ["warn"]
+    assert audit_warnings([result]) == [
+        Diagnostic(
+            "audit-warn",
+            "Audit warn: q1: Fix iteration 3 >= max 3 (iteration bounds exceeded)",
+            "q1",
+        )
+    ]
+
+
+def test_invalid_state_and_iteration_values(tmp_path):
+    """Broken state.json and non-integer iterations fail."""
+    broken = tmp_path / ".quest" / "broken"
+    broken.mkdir(parents=True)
+    (broken / "state.json").write_text("{", encoding="utf-8")
+    odd = _quest(tmp_path, "odd", "plan", plan_iter="two")
+
+    assert audit_quest(broken).findings[0].message == "state.json is not valid JSON"
+    assert "plan_iteration is not a valid integer" in audit_quest(odd).findings[0].message
+
+
+def test_each_json_file_parsed_once(tmp_path, monkeypatch):
+    """Handoff files shared by several checks are parsed a single time."""
+    quest_dir = _quest(
+        tmp_path,
+        "q1",
+        "complete",
+        files={
+            **_REVIEWS,
+            "phase_03_review/handoff_claude.json": {"next": None},
+            "phase_03_review/handoff_codex.json": {"next": None},
+        },
+    )
+    calls = []
+    real_loads = json.loads
+    monkeypatch.setattr(audit.json, "loads", lambda s: calls.append(1) or real_loads(s))
+
+    audit_quest(quest_dir)
+
+    assert len(calls) == 3  # state.json + two review handoffs
+
+
+def test_parallel_audit_matches_serial(tmp_path):
+    """Process-pool auditing returns the same results as serial auditing."""
+    for i in range(70):
+        _quest(tmp_path, f"q{i:03d}", "building", files=_PLAN if i % 2 else {})
+    _quest(tmp_path / ".quest", "archive/old", "building")
+
+    serial = audit_quests(tmp_path / ".quest", workers=1)
+    parallel = audit_quests(tmp_path / ".quest", workers=2)
+
+    assert serial == parallel
+    assert len(serial) == 70
+    assert sum(a.failed for a in serial) == 35
+    assert "70 quests, 35 failed" in format_report(serial)
+
+
+def test_load_limits_from_allowlist(tmp_path):
+    """Gates come from the allowlist; invalid values fall back with a warning."""
+    (tmp_path / ".ai").mkdir()
+    (tmp_path / ".ai" / "allowlist.json").write_text(
+        json.dumps({"gates": {"max_plan_iterations": 6, "max_fix_iterations": "x"}}),
+        encoding="utf-8",
+    )
+
+    limits, warnings = load_limits(tmp_path)
+
+    assert limits == IterationLimits(max_plan=6, max_fix=3)
+    assert "max_fix_iterations is not a valid integer" in warnings[0]
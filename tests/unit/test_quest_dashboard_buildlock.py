@@ -0,0 +1,84 @@
+"""Unit tests for quest_dashboard.buildlock module."""
+
+import threading
+import time
+
+from quest_dashboard.buildlock import PENDING_NAME, BuildLock, run_coalesced
+
+
+def test_lock_is_exclusive(tmp_path):
+    """A second holder cannot take the lock until the first releases it."""
+    first = BuildLock(tmp_path / ".build.lock")
+    second = BuildLock(tmp_path / ".build.lock")
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    first.release()
+    assert second.try_acquire()
+    second.release()
+
+
+def test_single_request_builds_once(tmp_path):
+    """An uncontended request runs exactly one build and clears the marker."""
+    built = []
+    result, builds = run_coalesced(tmp_path, "req", lambda request: built.append(request) or 0)
+
+    assert (result, builds, built) == (0, 1, ["req"])
+    assert not (tmp_path / PENDING_NAME).exists()
+
+
+def test_burst_coalesces_into_two_builds(tmp_path):
+    """Twenty requests arriving during a build cost one follow-up build."""
+    builds = []
+    started = threading.Event()
+
+    def build(request):
+        builds.append(request)
+        started.set()
+        time.sleep(0.3)
+        return 0
+
+    outcomes = []
+    first = threading.Thread(
+        target=lambda: outcomes.append(run_coalesced(tmp_path, "same", build))
+    )
+    first.start()
+    assert started.wait(5)
+
+    burst = [
+        threading.Thread(target=lambda: outcomes.append(run_coalesced(tmp_path, "same", build)))
+        for _ in range(20)
+    ]
+    for thread in burst:
+        thread.start()
+    for thread in [first, *burst]:
+        thread.join(10)
+
+    assert len(builds) == 2
+    assert sorted(n for _, n in outcomes) == [0] * 20 + [2]
+    assert [r for r, _ in outcomes].count(None) == 20
+
+
+def test_queued_requests_keep_their_own_options(tmp_path):
+    """Different requests queued during a build each get one build with their options."""
+    builds = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def build(request):
+        builds.append(request)
+        started.set()
+        release.wait(5)
+        return 0
+
+    first = threading.Thread(target=run_coalesced, args=(tmp_path, "head", build))
+    first.start()
+    assert started.wait(5)
+
+    for request in ("release", "head", "release"):
+        assert run_coalesced(tmp_path, request, build) == (None, 0)
+    release.set()
+    first.join(10)
+
+    assert builds == ["head", "release", "head"]
+    assert not (tmp_path / PENDING_NAME).exists()
@@ -0,0 +1,194 @@
+"""Unit tests for quest_dashboard.columnar module."""
+
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from quest_dashboard.columnar import QuestTable, TextColumn
+from quest_dashboard.models import ActiveQuest, DashboardData, JournalEntry
+from quest_dashboard.render import (
+    _compute_monthly_buckets,
+    _render_chart_config,
+    _render_kpi_row,
+    compute_status_counts,
+)
+
+UTC = timezone.utc
+
+
+def _sample_data() -> DashboardData:
+    finished = [
+        JournalEntry(
+            quest_id="f1",
+            slug="f1-slug",
+            title="Finished One",
+            elevator_pitch="Pitch with unicode — dash.",
+            status="Completed",
+            completed_date=date(2026, 1, 10),
+            journal_path=Path("docs/quest-journal/f1.md"),
+            pr_number=12,
+            plan_iterations=2,
+            fix_iterations=None,
+        ),
+    ]
+    abandoned = [
+        JournalEntry(
+            quest_id="a1",
+            slug="a1",
+            title="Abandoned One",
+            elevator_pitch="",
+            status="Abandoned",
+            completed_date=date(2026, 3, 2),
+            journal_path=Path("docs/quest-journal/a1.md"),
+        ),
+    ]
+    active = [
+        ActiveQuest(
+            quest_id="q1",
+            slug="q1",
+            title="Active",
+            elevator_pitch="Building things.",
+            status="In Progress",
+            phase="Building",
+            updated_at=datetime(2026, 2, 12, 10, 30, tzinfo=UTC),
+            plan_iterations=1,
+            fix_iterations=0,
+        ),
+        ActiveQuest(
+            quest_id="q2",
+            slug="q2",
+            title="Blocked",
+            elevator_pitch="Waiting.",
+            status="Blocked",
+            phase="Plan",
+            updated_at=datetime(
+                2026, 2, 1, 8, 0, tzinfo=timezone(timedelta(hours=-5))
+            ),
+        ),
+        ActiveQuest(
+            quest_id="q3",
+            slug="q3",
+            title="Odd",
+            elevator_pitch="",
+            status="Paused",
+            phase="Plan",
+            updated_at=datetime(2026, 2, 3, 9, 0),
+        ),
+    ]
+    return DashboardData(
+        finished_quests=finished, active_quests=active, abandoned_quests=abandoned
+    )
+
+
+def test_round_trip_preserves_dataclasses():
+    """Converting to a table and back yields equal dataclasses."""
+    data = _sample_data()
+
+    table = QuestTable.from_dashboard_data(data)
+    restored = table.to_dashboard_data()
+
+    assert len(table) == 5
+    assert restored.finished_quests == data.finished_quests
+    assert restored.abandoned_quests == data.abandoned_quests
+    assert restored.active_quests == data.active_quests
+    # Naive datetimes stay naive
+    assert restored.active_quests[2].updated_at.tzinfo is None
+
+
+def test_status_and_phase_are_interned():
+    """Repeated status/phase strings share one vocabulary entry."""
+    table = QuestTable.from_dashboard_data(_sample_data())
+
+    assert table.phases.values == ["", "Building", "Plan"]
+    assert table.statuses.values.count("Completed") == 1
+    assert table.phase[3] == table.phase[4]
+
+
+def test_text_column_offsets():
+    """Text columns slice values back out of one shared buffer."""
+    column = TextColumn(["alpha", "", "gamma"])
+
+    assert column.buffer == "alphagamma"
+    assert [column[i] for i in range(len(column))] == ["alpha", "", "gamma"]
+
+
+def test_render_stats_accept_table_directly():
+    """Stats and chart helpers produce identical output for both models."""
+    data = _sample_data()
+    table = QuestTable.from_dashboard_data(data)
+
+    assert compute_status_counts(table) == compute_status_counts(data)
+    assert compute_status_counts(table) == {
+        "finished": 1,
+        "abandoned": 1,
+        "in_progress": 1,
+        "blocked": 1,
+        "unknown": 1,
+    }
+    assert _compute_monthly_buckets(table) == _compute_monthly_buckets(data)
+    assert _render_kpi_row(table) == _render_kpi_row(data)
+    assert _render_chart_config(table, True) == _render_chart_config(data, True)
+
+
+def _synthetic_quests(n: int) -> DashboardData:
+    statuses = ["In Progress", "Blocked"]
+    phases = ["Plan", "Building", "Reviewing", "Fixing"]
+    finished = [
+        JournalEntry(
+            quest_id=f"finished-quest-{i:07d}_2026-01-01__1200",
+            slug=f"finished-quest-{i:07d}",
+            title=f"Finished quest number {i}",
+            elevator_pitch=f"Quest {i} shipped a focused improvement to the system.",
+            status="Completed",
+            completed_date=date(2020, 1, 1) + timedelta(days=i % 2000),
+            journal_path=Path(f"docs/quest-journal/finished-quest-{i:07d}.md"),
+            pr_number=i,
+            plan_iterations=i % 4,
+            fix_iterations=i % 3,
+        )
+        for i in range(n // 2)
+    ]
+    active = [
+        ActiveQuest(
+            quest_id=f"active-quest-{i:07d}_2026-01-01__1200",
+            slug=f"active-quest-{i:07d}",
+            title=f"Active quest number {i}",
+            elevator_pitch=f"Quest {i} is working on an improvement to the system.",
+            status=statuses[i % 2],
+            phase=phases[i % 4],
+            updated_at=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(minutes=i),
+            plan_iterations=i % 4,
+            fix_iterations=i % 3,
+        )
+        for i in range(n - n // 2)
+    ]
+    return DashboardData(finished_quests=finished, active_quests=active, abandoned_quests=[])
+
+
+def _traced_size(build):
+    tracemalloc.start()
+    try:
+        obj = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return obj, size
+
+
+def test_memory_benchmark_against_dataclasses():
+    """Benchmark: the columnar table uses well under half the dataclass memory.
+
+    Measures allocations while building N quests as dataclasses (as loaders
+    do) versus converting them into a QuestTable and dropping the originals.
+    """
+    n = 20_000
+
+    _, dataclass_bytes = _traced_size(lambda: _synthetic_quests(n))
+
+    # Dataclasses built for conversion are freed before measuring
+    table, table_bytes = _traced_size(
+        lambda: QuestTable.from_dashboard_data(_synthetic_quests(n))
+    )
+
+    assert len(table) == n
+    assert table_bytes < dataclass_bytes / 2
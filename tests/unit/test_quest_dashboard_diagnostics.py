@@ -0,0 +1,88 @@
+"""Unit tests for quest_dashboard.diagnostics module."""
+
+import json
+from datetime import datetime, timezone
+
+from quest_dashboard.diagnostics import (
+    MAX_GROUPS,
+    SAMPLES_PER_GROUP,
+    group_diagnostics,
+    summary_lines,
+    write_report,
+)
+from quest_dashboard.models import Diagnostic
+from quest_dashboard.render import _render_warnings
+
+GENERATED_AT = datetime(2026, 3, 4, 12, 0, tzinfo=timezone.utc)
+
+
+def _broken_journals(count: int) -> list[Diagnostic]:
+    return [
+        Diagnostic(
+            "journal-parse",
+            f"Failed to parse journal j{i}.md: bad date",
+            f"docs/quest-journal/j{i}.md",
+        )
+        for i in range(count)
+    ]
+
+
+def test_group_dedupes_and_orders_by_count():
+    """Exact repeats count once; the most frequent code comes first."""
+    brief = Diagnostic("brief-missing", "Missing quest_brief.md for quest q1 (q1)", "q1")
+    diagnostics = [brief, *_broken_journals(5), brief, brief]
+
+    groups = group_diagnostics(diagnostics)
+
+    assert [(g.code, g.count) for g in groups] == [("journal-parse", 5), ("brief-missing", 1)]
+    assert len(groups[0].samples) == SAMPLES_PER_GROUP
+    assert groups[0].samples[0].file == "docs/quest-journal/j0.md"
+
+
+def test_rendered_warnings_stay_bounded():
+    """Thousands of broken files render the same handful of lines as a few dozen."""
+    extra_codes = [
+        Diagnostic(f"code-{i:02d}", f"problem {i}", f"f{i}") for i in range(MAX_GROUPS + 2)
+    ]
+
+    small = _render_warnings(group_diagnostics(_broken_journals(50) + extra_codes), "d.json")
+    large = _render_warnings(group_diagnostics(_broken_journals(5_000) + extra_codes), "d.json")
+
+    assert large.count("<li") == small.count("<li")
+    assert len(large) < 4_000
+    assert "and 4,997 more" in large
+    assert "and 3 more in 3 other codes" in large
+    assert 'Build Warnings (5,010) <a href="d.json">Full report</a>' in large
+    assert _render_warnings([]) == ""
+
+
+def test_report_keeps_every_distinct_diagnostic(tmp_path):
+    """The JSON report holds the full list, grouped, with raw and distinct totals."""
+    diagnostics = _broken_journals(1_000)
+    diagnostics.append(diagnostics[0])
+    path = tmp_path / "out" / "diagnostics.json"
+
+    write_report(path, diagnostics, GENERATED_AT)
+
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert (report["total"], report["distinct"]) == (1_001, 1_000)
+    assert report["generated_at"] == "2026-03-04T12:00:00+00:00"
+    [group] = report["groups"]
+    assert group["code"] == "journal-parse" and group["count"] == 1_000
+    assert group["diagnostics"][999] == {
+        "file": "docs/quest-journal/j999.md",
+        "message": "Failed to parse journal j999.md: bad date",
+    }
+
+    write_report(path, [], GENERATED_AT)
+    assert json.loads(path.read_text(encoding="utf-8"))["groups"] == []
+
+
+def test_summary_lines_cap_stderr_output(tmp_path):
+    """stderr gets the same capped summary and points to the report."""
+    lines = summary_lines(group_diagnostics(_broken_journals(200)), tmp_path / "r.json")
+
+    assert lines[0] == "Warning [journal-parse] x200"
+    assert lines[-2] == "  ... and 197 more"
+    assert lines[-1] == f"Full list: {tmp_path / 'r.json'}"
+    assert summary_lines([]) == []
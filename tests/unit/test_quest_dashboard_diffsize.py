@@ -0,0 +1,157 @@
+"""Unit tests for quest_dashboard.diffsize module."""
+
+import json
+import os
+import subprocess
+
+import pytest
+
+from quest_dashboard.diffsize import (
+    VERDICT_PATH,
+    ReviewConfig,
+    decide,
+    load_review_config,
+    main,
+    parse_numstat,
+    size_diff,
+)
+
+
+def _git(root, *args):
+    return subprocess.run(
+        ["git", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        text=True,
+        env={
+            **os.environ,
+            "GIT_AUTHOR_NAME": "t",
+            "GIT_AUTHOR_EMAIL": "t@example.com",
+            "GIT_COMMITTER_NAME": "t",
+            "GIT_COMMITTER_EMAIL": "t@example.com",
+            "GIT_CONFIG_GLOBAL": os.devnull,
+        },
+    ).stdout.strip()
+
+
+def _write(root, rel, lines):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("".join(f"line {i}\n" for i in range(lines)), encoding="utf-8")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """main with two files, then a quest branch with one commit on top."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _write(tmp_path, "src/app.py", 10)
+    _write(tmp_path, "src/old_name.py", 20)
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    _git(tmp_path, "checkout", "-q", "-b", "quest")
+    _write(tmp_path, "src/app.py", 14)  # +4
+    _git(tmp_path, "mv", "src/old_name.py", "src/new_name.py")
+    _git(tmp_path, "commit", "-q", "-am", "work")
+    quest_dir = tmp_path / ".quest" / "q1"
+    quest_dir.mkdir(parents=True)
+    (quest_dir / "state.json").write_text('{"quest_id": "q1"}', encoding="utf-8")
+    return tmp_path
+
+
+def test_counts_committed_uncommitted_and_untracked_changes_since_the_merge_base(repo):
+    """Renames cost no lines; untracked files count in full; .quest is never counted."""
+    _write(repo, "src/app.py", 16)  # 2 more, not committed
+    _write(repo, "tests/test_app.py", 7)  # Untracked
+    (repo / "logo.png").write_bytes(b"\x89PNG\0\0")
+
+    size = size_diff(repo, repo / ".quest" / "q1")
+
+    assert size.base_source == "merge-base main"
+    assert {c.path: (c.added, c.deleted) for c in size.changes} == {
+        "src/app.py": (6, 0),
+        "src/new_name.py": (0, 0),
+        "tests/test_app.py": (7, 0),
+        "logo.png": (0, 0),
+    }
+    assert (size.files, size.loc) == (4, 13)
+    assert size.excluded == [".quest/q1/state.json"]
+
+
+def test_base_from_state_json_and_exclude_globs(repo):
+    """base_commit in state.json wins over the merge base; globs match names anywhere."""
+    head = _git(repo, "rev-parse", "HEAD")
+    (repo / ".quest" / "q1" / "state.json").write_text(
+        json.dumps({"quest_id": "q1", "base_commit": head}), encoding="utf-8"
+    )
+    _write(repo, "web/package-lock.json", 900)
+    _write(repo, "src/app.py", 15)
+
+    size = size_diff(repo, repo / ".quest" / "q1", exclude=("package-lock.json",))
+
+    assert (size.base, size.base_source) == (head, "state.json")
+    assert [(c.path, c.added) for c in size.changes] == [("src/app.py", 1)]
+    assert "web/package-lock.json" in size.excluded
+
+    with pytest.raises(RuntimeError, match="is not a commit"):
+        size_diff(repo, base="no-such-branch")
+
+
+def test_parse_numstat_renames_and_binaries():
+    """-z output: renames carry old and new paths, binaries show dashes."""
+    output = "3\t1\tsrc/a.py\0" "0\t0\t\0src/old.py\0src/new.py\0" "-\t-\tlogo.png\0"
+
+    assert [(c.path, c.added, c.deleted, c.binary) for c in parse_numstat(output)] == [
+        ("src/a.py", 3, 1, False),
+        ("src/new.py", 0, 0, False),
+        ("logo.png", 0, 0, True),
+    ]
+
+
+def test_review_config_and_verdict(tmp_path):
+    """Thresholds are inclusive; fast/full/manual modes override the size."""
+    (tmp_path / ".ai").mkdir()
+    (tmp_path / ".ai" / "allowlist.json").write_text(
+        json.dumps(
+            {
+                "review_mode": "auto",
+                "fast_review_thresholds": {
+                    "max_files": 2,
+                    "max_loc": "many",
+                    "exclude": ["*.lock"],
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    config, warnings = load_review_config(tmp_path)
+
+    assert config == ReviewConfig("auto", 2, 200, ("*.lock",))
+    assert warnings == [
+        "allowlist fast_review_thresholds.max_loc is not a positive integer: "
+        "'many' (using default 200)"
+    ]
+
+    class Size:
+        files, loc = 2, 200
+
+    assert decide(Size, config) == ("fast", "2 files, 200 LOC within 2 files, 200 LOC")
+    Size.loc = 201
+    assert decide(Size, config)[0] == "full"
+    assert decide(Size, ReviewConfig("fast")) == ("fast", "review_mode is fast")
+    assert decide(Size, ReviewConfig("manual")) == ("full", "review_mode is manual")
+
+
+def test_cli_writes_verdict_into_the_quest(repo, capsys):
+    """The verdict file is what the orchestrator reads; --no-write leaves it out."""
+    assert main([".quest/q1", "--repo-root", str(repo)]) == 0
+
+    verdict = json.loads((repo / ".quest" / "q1" / VERDICT_PATH).read_text(encoding="utf-8"))
+    assert verdict["verdict"] == "fast"
+    assert (verdict["files"], verdict["loc"], verdict["thresholds"]) == (
+        2, 4, {"max_files": 5, "max_loc": 200}
+    )
+    assert capsys.readouterr().out.startswith("fast: 2 files, 4 LOC within 5 files, 200 LOC")
+
+    assert main([".quest/q1", "--repo-root", str(repo), "--base", "nope", "--no-write"]) == 2
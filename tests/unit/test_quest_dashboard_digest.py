@@ -0,0 +1,147 @@
+"""Unit tests for quest_dashboard.digest module."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from quest_dashboard.digest import (
+    DIGEST_PATH,
+    PINNED_SECTIONS,
+    generate_digest,
+    main,
+    render_digest,
+)
+from quest_dashboard.tokens import estimate_tokens
+
+
+def _write(root: Path, rel: str, text: str) -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _write(tmp_path, "src/README.md", "# Source\n\nApplication code. More words here.\n")
+    _write(tmp_path, "src/app/__init__.py", '"""App package."""\n')
+    _write(tmp_path, "src/app/core.py", '"""Core logic for orders.\n\nDetails.\n"""\n')
+    _write(tmp_path, "scripts/deploy.sh", "#!/bin/bash\n# Deploy the app to staging\nexit 0\n")
+    _write(tmp_path, "tests/unit/test_core.py", "def test_x():\n    pass\n")
+    _write(tmp_path, "tests/unit/test_app.py", "")
+    _write(tmp_path, "pyproject.toml", "[tool.pytest.ini_options]\ntestpaths = ['tests']\n")
+    _write(
+        tmp_path,
+        "CONTRIBUTING.md",
+        "# Contributing\n\n## Style\n\nUse type hints. Always.\n\n"
+        "```bash\nmake lint\n```\n\n- Run `make lint`\n- Keep functions small\n",
+    )
+    return tmp_path
+
+
+def test_digest_sections_come_from_the_repository(repo):
+    """Module map, test layout and CONTRIBUTING.md outline, with default policy sections."""
+    update = generate_digest(repo)
+
+    text = (repo / DIGEST_PATH).read_text(encoding="utf-8")
+    assert update.changed and update.sources == 5 and update.trimmed == 0
+    assert "- `scripts/`\n  - `deploy.sh`: Deploy the app to staging" in text
+    assert (
+        "- `src/app/`\n  - `__init__.py`: App package.\n  - `core.py`: Core logic for orders."
+    ) in text
+    assert "- Runner: `python -m pytest` (configured in pyproject.toml)" in text
+    assert "- `tests/unit/`: 2 files (`test_*.py`)" in text
+    assert "- **Style**: Use type hints.\n- Run `make lint`\n- Keep functions small" in text
+    assert "make lint\n```" not in text
+    assert "## Review Priorities\n1. Correctness and regressions" in text
+    assert "## Reference Docs\n- CONTRIBUTING.md" in text
+    assert update.tokens == estimate_tokens(text)
+
+
+def test_unchanged_sources_write_nothing_and_read_nothing(repo):
+    """Cached summaries answer unchanged files; a content change regenerates."""
+    generate_digest(repo)
+    digest = repo / DIGEST_PATH
+    os.utime(digest, ns=(0, 0))
+
+    again = generate_digest(repo)
+    assert (again.changed, again.parsed) == (False, 0)
+    assert digest.stat().st_mtime_ns == 0
+
+    _write(repo, "src/app/core.py", '"""Core logic for orders and refunds."""\n')
+    edited = generate_digest(repo)
+    assert (edited.changed, edited.parsed) == (True, 1)
+    assert "Core logic for orders and refunds." in digest.read_text(encoding="utf-8")
+
+
+def test_policy_sections_are_carried_over_verbatim(repo):
+    """Hand-edited policy survives regeneration; other hand edits do not."""
+    generate_digest(repo)
+    digest = repo / DIGEST_PATH
+    text = digest.read_text(encoding="utf-8")
+    text = text.replace(
+        "## Review Priorities\n", "## Review Priorities (ours)\n1. Latency budgets\n"
+    )
+    digest.write_text(text + "\n## Scratch\nnotes\n", encoding="utf-8")
+
+    assert generate_digest(repo).changed
+    regenerated = digest.read_text(encoding="utf-8")
+    assert "## Review Priorities (ours)\n1. Latency budgets\n1. Correctness" in regenerated
+    assert "## Scratch" not in regenerated
+
+
+def test_budget_trims_least_important_sections_first(repo):
+    """Conventions go before the module map; the result fits the budget."""
+    for i in range(40):
+        _write(repo, f"src/app/mod_{i:02}.py", f'"""Module number {i} of the app."""\n')
+
+    update = generate_digest(repo, max_tokens=400)
+
+    text = (repo / DIGEST_PATH).read_text(encoding="utf-8")
+    assert update.tokens <= 400 and update.trimmed > 0
+    assert "## Conventions (from CONTRIBUTING.md)\n- ... 3 more" in text
+    assert "`mod_00.py`: Module number 0 of the app." in text
+    assert "## Review Priorities" in text and "## Style and Change Scope" in text
+
+
+def _best_trim_time(modules):
+    """Fastest of three renders of a digest that must drop most modules."""
+    summaries = {f"pkg/mod_{i}.py": f"Module number {i}." for i in range(modules)}
+    pinned = {title: [f"## {title}", *body] for title, body in PINNED_SECTIONS.items()}
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        text, trimmed = render_digest("fp", 1200, summaries, [], [], pinned)
+        timings.append(time.perf_counter() - started)
+    assert trimmed > modules // 2 and f"- ... {trimmed} more" in text
+    return min(timings)
+
+
+def test_trimming_scales_linearly():
+    """Benchmark: 4x the modules costs about 4x the time (quadratic would be 16x)."""
+    small = _best_trim_time(2_000)
+    large = _best_trim_time(8_000)
+
+    assert large < 8 * small + 0.01
+
+
+def test_budget_is_best_effort_for_policy_sections(repo, capsys):
+    """Policy sections are never trimmed; the CLI warns when they alone exceed the budget."""
+    assert main(["--repo-root", str(repo), "--max-tokens", "50"]) == 0
+
+    text = (repo / DIGEST_PATH).read_text(encoding="utf-8")
+    assert "## Review Priorities\n1. Correctness and regressions" in text
+    assert "over the 50-token budget" in capsys.readouterr().err
+
+
+def test_cli_check_exit_codes(repo, capsys):
+    """--check never writes and exits 1 while the digest is out of date."""
+    assert main(["--repo-root", str(repo), "--check"]) == 1
+    assert not (repo / DIGEST_PATH).exists()
+
+    assert main(["--repo-root", str(repo)]) == 0
+    assert main(["--repo-root", str(repo), "--check"]) == 0
+    assert main(["--repo-root", str(repo), "--check", "--max-tokens", "500"]) == 1
+    assert "Digest is out of date" in capsys.readouterr().out
@@ -0,0 +1,194 @@
+"""Unit tests for quest_dashboard.gitmeta module."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from quest_dashboard import gitmeta
+from quest_dashboard.gitmeta import (
+    find_git_dir,
+    merge_pr_index,
+    parse_git_config,
+    read_git_metadata,
+)
+from quest_dashboard.loaders import detect_github_url
+
+
+@pytest.fixture(autouse=True)
+def _clear_gitmeta_cache():
+    """Each test builds its own fake repo; never reuse cached metadata."""
+    gitmeta.clear_cache()
+    yield
+    gitmeta.clear_cache()
+
+
+def _write_config(git_dir: Path, url: str) -> None:
+    git_dir.mkdir(parents=True, exist_ok=True)
+    (git_dir / "config").write_text(
+        "[core]\n"
+        "\tbare = false\n"
+        '[remote "origin"]\n'
+        f"\turl = {url}\n"
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n",
+        encoding="utf-8",
+    )
+
+
+def test_parse_git_config_sections_and_values():
+    """Test that sections, subsections, quotes and comments are handled."""
+    config = parse_git_config(
+        "# comment\n"
+        "[core]\n"
+        "  bare = false ; trailing comment\n"
+        '[remote "Upstream"]\n'
+        '  url = "git@github.com:owner/repo.git"\n'
+        "[branch \"main\"] remote = origin\n"
+        "[Alias]\n"
+        "  flag\n"
+    )
+
+    assert config["core"]["bare"] == "false"
+    assert config["remote.Upstream"]["url"] == "git@github.com:owner/repo.git"
+    assert config["branch.main"]["remote"] == "origin"
+    assert config["alias"]["flag"] == "true"
+
+
+def test_read_metadata_from_git_directory(tmp_path):
+    """Test that remotes are read from a regular .git directory."""
+    _write_config(tmp_path / ".git", "https://github.com/owner/repo.git")
+
+    metadata = read_git_metadata(tmp_path)
+
+    assert metadata is not None
+    assert metadata.git_dir == tmp_path / ".git"
+    assert metadata.remotes == {"origin": "https://github.com/owner/repo.git"}
+
+
+def test_read_metadata_follows_worktree_gitdir_file(tmp_path):
+    """Test that a .git file and commondir resolve to the shared config."""
+    main_git = tmp_path / "main" / ".git"
+    _write_config(main_git, "git@github.com:owner/worktree-repo.git")
+
+    wt_git = main_git / "worktrees" / "feature"
+    wt_git.mkdir(parents=True)
+    (wt_git / "commondir").write_text("../..\n", encoding="utf-8")
+
+    worktree = tmp_path / "feature"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {wt_git}\n", encoding="utf-8")
+
+    metadata = read_git_metadata(worktree)
+
+    assert metadata is not None
+    assert metadata.git_dir == wt_git.resolve()
+    assert metadata.common_dir == main_git.resolve()
+    assert metadata.remotes["origin"] == "git@github.com:owner/worktree-repo.git"
+
+
+def test_find_git_dir_returns_none_outside_repo(tmp_path):
+    """Test that a directory with no .git anywhere above it yields None."""
+    assert find_git_dir(tmp_path) is None
+
+
+def test_detect_github_url_does_not_fork_git(tmp_path):
+    """Test that detect_github_url answers from .git/config without subprocess."""
+    _write_config(tmp_path / ".git", "git@github.com:owner/repo.git")
+
+    with patch(
+        "subprocess.run",
+        side_effect=AssertionError("git should not be spawned"),
+    ):
+        url = detect_github_url(tmp_path)
+
+    assert url == "https://github.com/owner/repo"
+
+
+def test_detect_github_url_non_github_remote(tmp_path):
+    """Test that non-GitHub remotes produce an empty URL."""
+    _write_config(tmp_path / ".git", "https://gitlab.com/owner/repo.git")
+
+    assert detect_github_url(tmp_path) == ""
+
+
+def test_merge_pr_index_single_git_log(tmp_path):
+    """Test that merged journals map to the PR number of their merge commit."""
+
+    def git(*args):
+        subprocess.run(
+            ["git", *args],
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+            env={
+                **os.environ,
+                "GIT_AUTHOR_NAME": "t",
+                "GIT_AUTHOR_EMAIL": "t@example.com",
+                "GIT_COMMITTER_NAME": "t",
+                "GIT_COMMITTER_EMAIL": "t@example.com",
+                "GIT_CONFIG_GLOBAL": os.devnull,
+            },
+        )
+
+    git("init", "-q", "-b", "main")
+    (tmp_path / "README.md").write_text("root\n", encoding="utf-8")
+    git("add", "README.md")
+    git("commit", "-q", "-m", "initial")
+    git("checkout", "-q", "-b", "feature")
+    journal = tmp_path / "docs" / "quest-journal" / "feature.md"
+    journal.parent.mkdir(parents=True)
+    journal.write_text("# Quest Journal: Feature\n", encoding="utf-8")
+    git("add", "docs")
+    git("commit", "-q", "-m", "add journal")
+    git("checkout", "-q", "main")
+    git("merge", "-q", "--no-ff", "feature", "-m", "Merge pull request #42 from o/feature")
+
+    index = merge_pr_index(tmp_path)
+
+    assert index == {"docs/quest-journal/feature.md": 42}
+
+
+def test_merge_pr_index_skips_subprocess_without_git_dir(tmp_path):
+    """Test that no git process is spawned when there is no repository."""
+    with patch.object(gitmeta, "read_git_metadata", return_value=None), patch(
+        "subprocess.run",
+        side_effect=AssertionError("git should not be spawned"),
+    ):
+        assert merge_pr_index(tmp_path) == {}
+
+
+def test_run_git_counts_processes(tmp_path):
+    """Test that every git process spawned through run_git is counted."""
+    before = gitmeta.git_process_count()
+
+    gitmeta.run_git(["--version"], tmp_path, timeout=10)
+
+    assert gitmeta.git_process_count() == before + 1
+
+
+def test_cat_file_batch_streams_objects_through_one_process(tmp_path):
+    """Blobs and trees are read from one long-lived git process."""
+
+    def git(*args, stdin=None):
+        return subprocess.run(
+            ["git", *args], cwd=tmp_path, input=stdin, check=True, capture_output=True
+        ).stdout.decode("ascii").strip()
+
+    git("init", "-q")
+    blob = git("hash-object", "-w", "--stdin", stdin=b"line one\nline two")
+    git("update-index", "--add", "--cacheinfo", f"100644,{blob},notes.md")
+    tree = git("write-tree")
+    before = gitmeta.git_process_count()
+
+    with gitmeta.CatFileBatch(tmp_path) as batch:
+        assert batch.read(blob) == (blob, "blob", b"line one\nline two")
+        assert batch.read("0" * 40) is None
+        assert batch.read("no\nnewlines") is None
+        _, kind, content = batch.read(tree)
+        assert kind == "tree"
+        assert gitmeta.parse_tree(content, len(blob) // 2) == [("100644", "notes.md", blob)]
+        assert batch.read(f"{tree}:notes.md")[2] == b"line one\nline two"
+
+    assert gitmeta.git_process_count() == before + 1
@@ -0,0 +1,136 @@
+"""Unit tests for quest_dashboard.handoff module."""
+
+import json
+from pathlib import Path
+
+from quest_dashboard.handoff import (
+    SCHEMA_PATH,
+    UNKNOWN_ROLE,
+    compile_schema,
+    role_stats,
+    scan_handoffs,
+)
+from quest_dashboard.models import HandoffRoleStats
+from quest_dashboard.render import _render_handoff_section
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCHEMA = REPO_ROOT / SCHEMA_PATH
+
+_VALID = {
+    "role": "planner_agent",
+    "status": "complete",
+    "artifacts_written": [{"path": "plan.md", "kind": "plan"}],
+    "questions": [],
+    "next_role": None,
+    "summary": "Wrote the plan.",
+}
+
+
+def _handoff(root: Path, quest: str, rel_path: str, content) -> Path:
+    quest_dir = root / ".quest" / quest
+    quest_dir.mkdir(parents=True, exist_ok=True)
+    (quest_dir / "state.json").write_text("{}", encoding="utf-8")
+    path = quest_dir / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content if isinstance(content, str) else json.dumps(content))
+    return path
+
+
+def test_compiled_schema_checks_enums_required_and_closed_objects():
+    """The real handoff schema compiles into checks for each contract rule."""
+    check = compile_schema(json.loads(SCHEMA.read_text(encoding="utf-8")))
+
+    assert check(_VALID) == []
+    assert check({**_VALID, "role": "intern"})[0].startswith("$.role: 'intern' is not one of")
+    assert check({**_VALID, "next_role": "fixer_agent"}) == []
+    assert check({**_VALID, "artifacts_written": [{"path": "x", "kind": "memo"}]}) == [
+        "$.artifacts_written[0].kind: 'memo' is not one of "
+        "plan, review, verdict, code, fix, pr_description, discussion, brief"
+    ]
+    missing = {k: v for k, v in _VALID.items() if k != "status"}
+    assert check(missing) == ["$: missing required key 'status'"]
+    assert check({**_VALID, "extra": 1}) == ["$: unexpected key 'extra'"]
+    assert check({**_VALID, "questions": [{"id": "q1", "question": "?", "blocking": 1}]}) == [
+        "$.questions[0].blocking: expected boolean"
+    ]
+    assert check({**_VALID, "summary": "x" * 501}) == ["$.summary: longer than 500 characters"]
+    assert check([]) == ["$: expected object"]
+
+
+def test_compiled_schema_checks_minimum_and_additional_property_schemas():
+    """additionalProperties may be a schema applied to every unlisted key."""
+    check = compile_schema(
+        {
+            "type": "object",
+            "properties": {"version": {"type": "integer", "minimum": 1}},
+            "additionalProperties": {"type": "array", "items": {"type": "string"}},
+        }
+    )
+
+    assert check({"version": 2, "bash": ["pytest"]}) == []
+    assert check({"version": 0, "bash": "pytest", "read": [1]}) == [
+        "$.version: less than 1",
+        "$.bash: expected array",
+        "$.read[0]: expected string",
+    ]
+
+
+def test_scan_is_incremental_and_keyed_by_content_hash(tmp_path):
+    """Unchanged and duplicate files are answered from the cache."""
+    cache = tmp_path / "cache.json"
+    _handoff(tmp_path, "q1", "phase_01_plan/handoff.json", _VALID)
+    _handoff(tmp_path, "q2", "phase_01_plan/handoff.json", _VALID)
+    bad = _handoff(tmp_path, "q2", "phase_02_plan_review/handoff_claude.json", "{not json")
+    _handoff(tmp_path, "q2", "notes/handoff.json", {"role": 1})  # Not a phase dir
+
+    first = scan_handoffs(tmp_path / ".quest", SCHEMA, cache)
+    assert [r.path for r in first.results] == [
+        "q1/phase_01_plan/handoff.json",
+        "q2/phase_01_plan/handoff.json",
+        "q2/phase_02_plan_review/handoff_claude.json",
+    ]
+    assert (first.validated, first.cached) == (2, 1)  # q2's plan handoff == q1's
+    assert first.results[2].role == UNKNOWN_ROLE
+    assert first.results[2].violations[0].startswith("not valid JSON")
+
+    second = scan_handoffs(tmp_path / ".quest", SCHEMA, cache)
+    assert (second.validated, second.cached) == (0, 3)
+    assert second.results == first.results
+
+    bad.write_text(json.dumps({**_VALID, "role": "fixer_agent"}))
+    third = scan_handoffs(tmp_path / ".quest", SCHEMA, cache)
+    assert (third.validated, third.cached) == (1, 2)
+    assert not third.results[2].violations
+
+
+def test_schema_change_invalidates_cache(tmp_path):
+    """Cached verdicts are dropped when the schema changes."""
+    cache = tmp_path / "cache.json"
+    schema = tmp_path / "schema.json"
+    schema.write_text(json.dumps({"type": "object"}))
+    _handoff(tmp_path, "q1", "phase_01_plan/handoff.json", {"role": "planner_agent"})
+
+    assert not scan_handoffs(tmp_path / ".quest", schema, cache).results[0].violations
+
+    schema.write_text(json.dumps({"type": "object", "required": ["status"]}))
+    rescan = scan_handoffs(tmp_path / ".quest", schema, cache)
+    assert rescan.validated == 1
+    assert rescan.results[0].violations == ("$: missing required key 'status'",)
+
+
+def test_role_stats_and_panel(tmp_path):
+    """Violation counts aggregate per role and render as a table panel."""
+    _handoff(tmp_path, "q1", "phase_01_plan/handoff.json", _VALID)
+    _handoff(tmp_path, "q2", "phase_01_plan/handoff.json", {**_VALID, "status": "done"})
+    _handoff(tmp_path, "q2", "phase_04_fix/handoff.json", {**_VALID, "role": "fixer_agent"})
+
+    stats = role_stats(scan_handoffs(tmp_path / ".quest", SCHEMA).results)
+
+    assert stats == [
+        HandoffRoleStats(role="fixer_agent", files=1, invalid=0),
+        HandoffRoleStats(role="planner_agent", files=2, invalid=1),
+    ]
+    panel = _render_handoff_section(stats)
+    assert "1 of 3 handoff files violate" in panel
+    assert '<td class="num rate--bad">50%</td>' in panel
+    assert _render_handoff_section([]) == ""
@@ -0,0 +1,135 @@
+"""Unit tests for quest_dashboard.history module."""
+
+from datetime import datetime, timedelta, timezone
+
+from quest_dashboard.history import (
+    append_snapshot,
+    compact,
+    load_history,
+    take_snapshot,
+)
+from quest_dashboard.models import ActiveQuest, DashboardData, StatsSnapshot
+from quest_dashboard.render import render_dashboard
+
+UTC = timezone.utc
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+
+def _snapshot(taken_at, in_progress=1, blocked=0):
+    return StatsSnapshot(
+        taken_at=taken_at,
+        counts={
+            "finished": 0,
+            "abandoned": 0,
+            "in_progress": in_progress,
+            "blocked": blocked,
+            "unknown": 0,
+        },
+        phases={"building": in_progress},
+    )
+
+
+def test_take_snapshot_counts_kpis_and_phases():
+    """Snapshots record KPI categories and per-phase active counts."""
+    quests = [
+        ActiveQuest(
+            quest_id=f"q{i}",
+            slug=f"q{i}",
+            title="Q",
+            elevator_pitch="",
+            status=status,
+            phase=phase,
+            updated_at=NOW,
+        )
+        for i, (status, phase) in enumerate(
+            [("In Progress", "Building"), ("Blocked", "Plan"), ("In Progress", "Code Review")]
+        )
+    ]
+    data = DashboardData(
+        finished_quests=[], active_quests=quests, abandoned_quests=[], generated_at=NOW
+    )
+
+    snapshot = take_snapshot(data)
+
+    assert snapshot.taken_at == NOW
+    assert snapshot.counts["in_progress"] == 2
+    assert snapshot.counts["blocked"] == 1
+    assert snapshot.phases == {"building": 1, "code_review": 1, "plan": 1}
+
+
+def test_append_and_load_round_trip(tmp_path):
+    """Appended snapshots are read back oldest first."""
+    path = tmp_path / "history.ndjson"
+
+    append_snapshot(path, _snapshot(NOW, in_progress=3))
+    result = append_snapshot(path, _snapshot(NOW - timedelta(hours=1), in_progress=2))
+
+    assert [s.counts["in_progress"] for s in result] == [2, 3]
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+    assert load_history(path) == result
+
+
+def test_load_history_skips_torn_lines(tmp_path):
+    """A partially written line does not break loading."""
+    path = tmp_path / "history.ndjson"
+    append_snapshot(path, _snapshot(NOW))
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"t":"2026-10-')
+
+    assert len(load_history(path)) == 1
+
+
+def test_compact_downsamples_by_age():
+    """Recent snapshots stay raw; older ones keep one per day, then per week."""
+    recent = [NOW - timedelta(hours=h) for h in range(3)]
+    month_old = [NOW - timedelta(days=30, hours=h) for h in range(3)]
+    # Three snapshots in the same ISO week, two years ago
+    week_start = datetime(2024, 10, 14, 9, 0, tzinfo=UTC)
+    ancient = [week_start + timedelta(days=d) for d in range(3)]
+    snapshots = [_snapshot(t) for t in recent + month_old + ancient]
+
+    result = compact(snapshots, now=NOW)
+
+    times = [s.taken_at for s in result]
+    assert all(t in times for t in recent)
+    assert sum(1 for t in times if t in month_old) == 1
+    assert [t for t in times if t.year == 2024] == [ancient[-1]]
+
+
+def test_append_compacts_past_threshold(tmp_path):
+    """The store is rewritten in compacted form once it exceeds the threshold."""
+    path = tmp_path / "history.ndjson"
+    for h in range(40):
+        append_snapshot(path, _snapshot(NOW - timedelta(days=100, minutes=h)))
+
+    result = append_snapshot(path, _snapshot(NOW), compact_threshold=1024)
+
+    # 40 snapshots from one old day -> 1 daily point, plus today's raw one
+    assert len(result) == 2
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_history_chart_rendered_from_snapshots(tmp_path):
+    """The dashboard charts one point per day from recorded history."""
+    data = DashboardData(finished_quests=[], active_quests=[], abandoned_quests=[])
+    history = [
+        _snapshot(NOW - timedelta(days=1), in_progress=4, blocked=1),
+        _snapshot(NOW - timedelta(hours=2), in_progress=5, blocked=2),
+        _snapshot(NOW, in_progress=6, blocked=0),
+    ]
+
+    result = render_dashboard(data, tmp_path / "index.html", tmp_path, history=history)
+
+    assert 'id="chart-history-wip"' in result
+    assert '["2026-10-18", "2026-10-19"]' in result
+    assert "[4, 6]" in result
+
+
+def test_history_panel_absent_without_history(tmp_path):
+    """No history panel is emitted when there are no snapshots."""
+    data = DashboardData(finished_quests=[], active_quests=[], abandoned_quests=[])
+
+    result = render_dashboard(data, tmp_path / "index.html", tmp_path)
+
+    assert "chart-history-wip" not in result
@@ -1,19 +1,28 @@
 """Unit tests for quest_dashboard.loaders module."""
 
 import json
+import os
+import shutil
+import subprocess
+import time
 from datetime import date, datetime
 from pathlib import Path
 
+import pytest
+
+from quest_dashboard import gitmeta, loaders
 from quest_dashboard.loaders import (
     _extract_iterations,
-    _extract_metadata,
     _extract_summary_pitch,
-    _normalize_status,
     _parse_active_quest,
     _parse_journal_entry,
+    _split_sections,
+    extract_metadata,
     load_active_quests,
+    load_active_quests_from_events,
     load_dashboard_data,
     load_journal_entries,
+    normalize_status,
 )
 
 
@@ -116,12 +125,12 @@ This quest was abandoned.
 def test_status_normalization_prefix_matching():
     """Test that status normalization uses prefix matching."""
     # BUILDER GUIDANCE NOTE #3
-    assert _normalize_status("Completed") == "Completed"
-    assert _normalize_status("Complete") == "Completed"  # Without 'd'
-    assert _normalize_status("Finished") == "Completed"
-    assert _normalize_status("Abandoned") == "Abandoned"
-    assert _normalize_status("Abandoned (plan approved, never built)") == "Abandoned"
-    assert _normalize_status("") == "Completed"  # Default
+    assert normalize_status("Completed") == "Completed"
+    assert normalize_status("Complete") == "Completed"  # Without 'd'
+    assert normalize_status("Finished") == "Completed"
+    assert normalize_status("Abandoned") == "Abandoned"
+    assert normalize_status("Abandoned (plan approved, never built)") == "Abandoned"
+    assert normalize_status("") == "Completed"  # Default
 
 
 def test_iterations_extraction_bold_format():
@@ -219,7 +228,10 @@ def test_malformed_state_json_produces_warning(tmp_path):
 
     assert len(quests) == 0
     assert len(warnings) == 1
-    assert "bad-quest" in warnings[0].lower() or "state.json" in warnings[0].lower()
+    assert warnings[0].code == "state-parse"
+    assert warnings[0].file == ".quest/bad-quest/state.json"
+    assert "bad-quest" in warnings[0].message.lower()
+    assert str(tmp_path) not in warnings[0].message  # Reports are published; no local paths
 
 
 def test_missing_quest_brief_produces_warning(tmp_path):
@@ -244,7 +256,8 @@ def test_missing_quest_brief_produces_warning(tmp_path):
     assert quests[0].title == "no-brief-quest"  # Falls back to slug
     assert quests[0].elevator_pitch == ""
     assert len(warnings) == 1
-    assert "quest_brief.md" in warnings[0].lower() or "missing" in warnings[0].lower()
+    assert warnings[0].code == "brief-missing"
+    assert "quest_brief.md" in warnings[0].message.lower()
 
 
 def test_active_quests_sorted_by_phase_then_date(tmp_path):
@@ -286,6 +299,65 @@ def test_active_quests_sorted_by_phase_then_date(tmp_path):
     assert quests[2].slug == "plan-quest"
 
 
+def test_active_quests_from_events_reparse_only_logged_quests(tmp_path):
+    """Cached quests are reused; events, hand edits, new and removed directories apply."""
+    from quest_dashboard.quest_state import apply_change
+
+    quest_root = tmp_path / ".quest"
+    cache = tmp_path / "out" / loaders.ACTIVE_CACHE_NAME
+    for slug in ("alpha", "beta"):
+        (quest_root / slug).mkdir(parents=True)
+        state = {"quest_id": slug, "phase": "plan", "updated_at": "2026-02-10T10:00:00Z"}
+        (quest_root / slug / "state.json").write_text(json.dumps(state), encoding="utf-8")
+
+    full, warnings, parsed = load_active_quests_from_events(quest_root, cache)
+    assert (len(full), len(warnings), parsed) == (2, 2, 2)  # Both briefs missing
+    assert load_active_quests_from_events(quest_root, cache) == (full, warnings, 0)
+
+    assert apply_change(quest_root / "beta", status="blocked").applied
+    edited = {"quest_id": "alpha", "phase": "plan", "status": "abandoned"}
+    (quest_root / "alpha" / "state.json").write_text(json.dumps(edited))  # Not logged
+    shutil.copytree(quest_root / "beta", quest_root / "gamma")
+    quests, _, parsed = load_active_quests_from_events(quest_root, cache)
+
+    assert parsed == 3
+    assert sorted((q.quest_id, q.status) for q in quests) == [
+        ("alpha", "Abandoned"),
+        ("beta", "Blocked"),
+        ("beta", "Blocked"),  # gamma's copied state still says beta
+    ]
+
+    shutil.rmtree(quest_root / "gamma")
+    quests, _, parsed = load_active_quests_from_events(quest_root, cache)
+    assert parsed == 0
+    assert sorted(q.quest_id for q in quests) == ["alpha", "beta"]
+
+    (quest_root / "beta" / "quest_brief.md").write_text("# Quest Brief: Beta\n")
+    quests, warnings, parsed = load_active_quests_from_events(quest_root, cache)
+    assert (parsed, len(warnings)) == (1, 1)  # Only alpha's brief is still missing
+
+
+def test_active_quests_from_events_ignore_paths_outside_quest_dir(tmp_path):
+    """An event whose quest path climbs out of .quest with '..' is skipped."""
+    from quest_dashboard.events import EVENTS_NAME
+
+    quest_root = tmp_path / ".quest"
+    quest_root.mkdir()
+    cache = tmp_path / "out" / loaders.ACTIVE_CACHE_NAME
+    outside = tmp_path / "docs" / "x"
+    outside.mkdir(parents=True)
+    state = {"quest_id": "x", "phase": "plan", "updated_at": "2026-02-10T10:00:00Z"}
+    (outside / "state.json").write_text(json.dumps(state), encoding="utf-8")
+    (quest_root / EVENTS_NAME).write_text("")
+    assert load_active_quests_from_events(quest_root, cache)[2] == 0
+
+    with (quest_root / EVENTS_NAME).open("a") as f:
+        f.write(json.dumps({"quest": ".quest/../docs/x"}) + "\n")
+    quests, _, parsed = load_active_quests_from_events(quest_root, cache)
+
+    assert (quests, parsed) == ([], 0)
+
+
 def test_load_journal_entries_skips_readme(tmp_path):
     """Test that README.md in journal directory is skipped."""
     # BUILDER GUIDANCE NOTE #1: Skip README.md
@@ -347,8 +419,8 @@ def test_colon_outside_bold_metadata(tmp_path):
 **Quest ID**: ci-validation
 """
     # Colon-outside-bold format
-    assert _extract_metadata(content, "completed") == "2026-02-04"
-    assert _extract_metadata(content, "quest id") == "ci-validation"
+    assert extract_metadata(content, "completed") == "2026-02-04"
+    assert extract_metadata(content, "quest id") == "ci-validation"
 
 
 def test_dedup_active_quests_against_journal_entries(tmp_path):
@@ -451,3 +523,156 @@ def test_load_dashboard_data_normalizes_none_github_url(tmp_path):
 
     assert data.github_repo_url == ""
     assert isinstance(data.github_repo_url, str)
+
+
+def test_active_quest_records_relative_quest_path(tmp_path):
+    """Test that active quests carry their directory relative to the repo root."""
+    quest_dir = tmp_path / ".quest" / "path-quest"
+    quest_dir.mkdir(parents=True)
+    state = {"quest_id": "path-quest", "phase": "plan", "status": "in_progress"}
+    (quest_dir / "state.json").write_text(json.dumps(state), encoding="utf-8")
+
+    quests, _ = load_active_quests(tmp_path / ".quest")
+
+    assert quests[0].quest_path == Path(".quest/path-quest")
+
+
+# Adversarial inputs that made the old regex extraction super-linear, as
+# functions of their size n
+_ADVERSARIAL_CORPUS = {
+    "iterations_space_run": lambda n: "**Plan iterations:**" + " " * n + "x\n",
+    "summary_without_next_heading": lambda n: "## Summary\n\n" + "word " * n,
+    "summary_blank_tail": lambda n: "## Summary" + " \n" * n,
+    "unterminated_bold": lambda n: "## Summary\n\n**" + ": " * n + "\n",
+    "many_headings": lambda n: "## Summary\n" + "##\n" * n,
+    "repeated_headings": lambda n: "## Summary\n" * n,
+}
+
+
+def _best_parse_time(journal_dir, tmp_path, content):
+    """Fastest of three parses, which filters scheduler noise."""
+    (journal_dir / "adversarial.md").write_text(
+        "# Quest Journal: Adversarial\n\n" + content, encoding="utf-8"
+    )
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        entries, _ = load_journal_entries(journal_dir, tmp_path)
+        timings.append(time.perf_counter() - started)
+        assert len(entries) == 1
+    return min(timings)
+
+
+@pytest.mark.parametrize("name", sorted(_ADVERSARIAL_CORPUS))
+def test_adversarial_journal_parses_in_linear_time(tmp_path, name):
+    """Benchmark: 4x the input costs about 4x the time (quadratic would be 16x)."""
+    journal_dir = tmp_path / "docs" / "quest-journal"
+    journal_dir.mkdir(parents=True)
+    make = _ADVERSARIAL_CORPUS[name]
+
+    small = _best_parse_time(journal_dir, tmp_path, make(50_000))
+    large = _best_parse_time(journal_dir, tmp_path, make(200_000))
+
+    assert large < 8 * small + 0.01
+
+
+def test_slow_parse_emits_warning(tmp_path, monkeypatch):
+    """A file over the parse budget is still loaded, with a warning."""
+    journal_dir = tmp_path / "docs" / "quest-journal"
+    journal_dir.mkdir(parents=True)
+    (journal_dir / "slow.md").write_text("# Quest Journal: Slow\n", encoding="utf-8")
+    monkeypatch.setattr(loaders, "PARSE_BUDGET_SECONDS", -1.0)
+
+    entries, warnings = load_journal_entries(journal_dir, tmp_path)
+
+    assert len(entries) == 1
+    assert any(
+        w.code == "slow-parse" and w.message.startswith("Slow parse: slow.md") for w in warnings
+    )
+
+
+def test_split_sections_boundaries():
+    """Sections end at the next ## or ### line; first duplicate heading wins."""
+    sections = _split_sections(
+        "# Title\n## Summary\nbody\n### Sub\nsub body\n## Summary\nsecond\n##NoSpace\n"
+    )
+
+    assert sections == {"Summary": "body"}
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        env={
+            **os.environ,
+            "GIT_AUTHOR_NAME": "t",
+            "GIT_AUTHOR_EMAIL": "t@example.com",
+            "GIT_COMMITTER_NAME": "t",
+            "GIT_COMMITTER_EMAIL": "t@example.com",
+            "GIT_CONFIG_GLOBAL": os.devnull,
+        },
+    )
+
+
+def _write_quest_files(repo: Path, journal_title: str, phase: str) -> None:
+    journal_dir = repo / "docs" / "quest-journal"
+    journal_dir.mkdir(parents=True, exist_ok=True)
+    (journal_dir / "done.md").write_text(
+        f"# Quest Journal: {journal_title}\n\n**Completed:** 2026-02-10\n\n## Summary\n\nShipped.\n",
+        encoding="utf-8",
+    )
+    quest_dir = repo / ".quest" / "live_2026-02-01__0900"
+    quest_dir.mkdir(parents=True, exist_ok=True)
+    (quest_dir / "state.json").write_text(
+        json.dumps({"quest_id": "live", "phase": phase, "updated_at": "2026-02-12T10:00:00Z"}),
+        encoding="utf-8",
+    )
+    (quest_dir / "quest_brief.md").write_text("# Live quest\n\nBuilding it.\n", encoding="utf-8")
+    archived = repo / ".quest" / "archive" / "old"
+    archived.mkdir(parents=True, exist_ok=True)
+    (archived / "state.json").write_text('{"quest_id": "old"}', encoding="utf-8")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+def test_git_ref_source_matches_a_checkout_of_that_ref(tmp_path):
+    """Loading at a ref reads that commit's files, not the working tree."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _write_quest_files(tmp_path, "Original", "plan")
+    (tmp_path / ".quest" / "notes.md").write_text("no state here", encoding="utf-8")
+    _git(tmp_path, "add", "-f", "docs", ".quest")
+    _git(tmp_path, "commit", "-q", "-m", "quests")
+    _git(tmp_path, "tag", "v1")
+    expected = load_dashboard_data(tmp_path, github_url="")
+    _write_quest_files(tmp_path, "Rewritten", "building")
+    (tmp_path / "docs" / "quest-journal" / "new.md").write_text("# New\n", encoding="utf-8")
+
+    gitmeta.clear_cache()
+    before = gitmeta.git_process_count()
+    at_tag = load_dashboard_data(tmp_path, github_url="", ref="v1")
+    forks = gitmeta.git_process_count() - before
+
+    assert at_tag.finished_quests == expected.finished_quests
+    assert [q.title for q in at_tag.finished_quests] == ["Original"]
+    assert at_tag.active_quests == expected.active_quests
+    assert at_tag.active_quests[0].phase == "Plan"
+    assert at_tag.active_quests[0].quest_path == Path(".quest/live_2026-02-01__0900")
+    assert at_tag.warnings == expected.warnings == []
+    assert forks == 2  # One cat-file --batch for every object, one merge-history log
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+def test_git_ref_source_rejects_unknown_refs_and_reports_missing_trees(tmp_path):
+    """An unknown ref raises; a ref without quest trees loads with warnings."""
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "README.md").write_text("root\n", encoding="utf-8")
+    _git(tmp_path, "add", "README.md")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+
+    with pytest.raises(ValueError, match="Unknown git ref: nope"):
+        load_dashboard_data(tmp_path, github_url="", ref="nope")
+
+    data = load_dashboard_data(tmp_path, github_url="", ref="main")
+    assert [w.code for w in data.warnings] == ["journal-dir-missing", "quest-dir-missing"]
@@ -0,0 +1,73 @@
+"""Unit tests for quest_dashboard.metrics module."""
+
+import re
+from datetime import date
+from pathlib import Path
+
+from quest_dashboard.metrics import BuildMetrics, format_metrics, write_metrics
+from quest_dashboard.models import DashboardData, JournalEntry
+
+# One sample line: name, optional {label="value"}, numeric value
+_SAMPLE_RE = re.compile(r'^[a-z_]+(\{[a-z]+="[^"]*"\})? -?\d+(\.\d+)?$')
+
+
+def _data() -> DashboardData:
+    entry = JournalEntry(
+        quest_id="q1",
+        slug="q1",
+        title="Q1",
+        elevator_pitch="",
+        status="Completed",
+        completed_date=date(2026, 2, 1),
+        journal_path=Path("docs/quest-journal/q1.md"),
+    )
+    return DashboardData(
+        finished_quests=[entry],
+        active_quests=[],
+        abandoned_quests=[],
+        warnings=["one warning"],
+        files_parsed={"journal": 1, "state": 0},
+    )
+
+
+def test_format_metrics_exposition():
+    """Output is valid exposition text with build and KPI gauges."""
+    metrics = BuildMetrics(output_bytes=1234, git_processes=1)
+    metrics.stages["load"] = 0.25
+    metrics.cache_hits["detail_pages"] = 7
+
+    text = format_metrics(metrics, _data(), finished_at=1700000000.0)
+
+    for line in text.splitlines():
+        assert line.startswith("# ") or _SAMPLE_RE.match(line), line
+    assert 'quest_dashboard_build_stage_duration_seconds{stage="load"} 0.250000' in text
+    assert 'quest_dashboard_files_parsed{kind="journal"} 1' in text
+    assert 'quest_dashboard_cache_hits{cache="detail_pages"} 7' in text
+    assert "quest_dashboard_git_processes 1" in text
+    assert "quest_dashboard_output_bytes 1234" in text
+    assert "quest_dashboard_warnings 1" in text
+    assert "quest_dashboard_quests_total 1" in text
+    assert 'quest_dashboard_quests{status="finished"} 1' in text
+    assert 'quest_dashboard_quests{status="blocked"} 0' in text
+
+
+def test_stage_timer_accumulates():
+    """Timing the same stage twice adds the durations."""
+    metrics = BuildMetrics()
+    with metrics.stage("render"):
+        pass
+    first = metrics.stages["render"]
+    with metrics.stage("render"):
+        pass
+
+    assert metrics.stages["render"] >= first
+
+
+def test_write_metrics_creates_parent(tmp_path):
+    """The metrics file is written atomically with no temp file left behind."""
+    path = tmp_path / "textfile" / "quest_dashboard.prom"
+
+    write_metrics(path, "quest_dashboard_warnings 0\n")
+
+    assert path.read_text(encoding="utf-8") == "quest_dashboard_warnings 0\n"
+    assert [p.name for p in path.parent.iterdir()] == ["quest_dashboard.prom"]
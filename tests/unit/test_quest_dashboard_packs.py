@@ -0,0 +1,96 @@
+"""Unit tests for quest_dashboard.packs module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from quest_dashboard.audit import find_quest_dirs
+from quest_dashboard.loaders import find_state_files
+from quest_dashboard.packs import (
+    ArchiveDir,
+    compact_archive,
+    iter_archived,
+    main,
+    pack_quest_dir,
+)
+
+
+def _archived(quest_root: Path, quest_id: str, phase: str = "complete") -> Path:
+    quest_dir = quest_root / "archive" / quest_id
+    (quest_dir / "logs").mkdir(parents=True)
+    (quest_dir / "state.json").write_text(json.dumps({"quest_id": quest_id, "phase": phase}))
+    (quest_dir / "quest_brief.md").write_text(f"# {quest_id}\n" + "brief text\n" * 200)
+    (quest_dir / "logs" / "builder.log").write_text("log line\n" * 500)
+    return quest_dir
+
+
+def test_pack_round_trip_reads_members_without_extracting(tmp_path):
+    """Packed members read back byte-for-byte and the directory is gone."""
+    quest_dir = _archived(tmp_path, "q1")
+    brief = (quest_dir / "quest_brief.md").read_bytes()
+
+    result = pack_quest_dir(quest_dir)
+
+    assert not quest_dir.exists()
+    assert result.members == 3
+    assert result.pack_bytes < result.source_bytes
+    for reader in iter_archived(tmp_path):
+        assert reader.quest_id == "q1"
+        assert reader.names() == ["logs/builder.log", "quest_brief.md", "state.json"]
+        assert reader.read_json("state.json")["phase"] == "complete"
+        assert reader.read_bytes("quest_brief.md") == brief
+        assert not reader.has("missing.md")
+        with pytest.raises(FileNotFoundError):
+            reader.read_bytes("missing.md")
+
+
+def test_compact_packs_directories_and_iterates_both_forms(tmp_path):
+    """compact packs every directory; --keep leaves them and packs win on read."""
+    _archived(tmp_path, "q1")
+    _archived(tmp_path, "q2", phase="abandoned")
+
+    results, warnings = compact_archive(tmp_path, remove=False)
+    assert [r.quest_id for r in results] == ["q1", "q2"] and not warnings
+    assert [(r.quest_id, isinstance(r, ArchiveDir)) for r in iter_archived(tmp_path)] == [
+        ("q1", False),
+        ("q2", False),
+    ]
+
+    again, warnings = compact_archive(tmp_path)
+    assert again == []
+    assert warnings == [
+        "Already packed, directory left in place: q1",
+        "Already packed, directory left in place: q2",
+    ]
+
+    _archived(tmp_path, "q3")
+    assert [(r.quest_id, isinstance(r, ArchiveDir)) for r in iter_archived(tmp_path)] == [
+        ("q1", False),
+        ("q2", False),
+        ("q3", True),
+    ]
+
+
+def test_active_quest_discovery_skips_archive_trees(tmp_path):
+    """Loaders and audits never descend into archive/ (packed or not)."""
+    active = tmp_path / "my-archive-tool_2026"
+    active.mkdir()
+    (active / "state.json").write_text("{}")
+    _archived(tmp_path, "q1")
+
+    assert find_state_files(tmp_path) == [active / "state.json"]
+    assert find_quest_dirs(tmp_path) == [active]
+
+
+def test_cli_compact_and_list(tmp_path, capsys):
+    """The CLI packs the archive and lists quests straight from packs."""
+    _archived(tmp_path / ".quest", "q1", phase="complete")
+
+    assert main(["compact", "--repo-root", str(tmp_path)]) == 0
+    assert main(["list", "--repo-root", str(tmp_path)]) == 0
+
+    out = capsys.readouterr().out
+    assert "1 quests packed" in out
+    assert "q1\tpack\tcomplete\t3 files" in out
+    assert (tmp_path / ".quest" / "archive" / "q1.qpack").is_file()
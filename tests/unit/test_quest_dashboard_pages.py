@@ -0,0 +1,216 @@
+"""Unit tests for quest_dashboard.pages module."""
+
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from quest_dashboard.models import ActiveQuest, DashboardData, JournalEntry
+from quest_dashboard.pages import (
+    MANIFEST_NAME,
+    MAX_QUOTE_DEPTH,
+    detail_page_filename,
+    render_markdown,
+    write_detail_pages,
+)
+from quest_dashboard.render import render_dashboard
+
+UTC = timezone.utc
+
+
+def _journal_site(tmp_path: Path, count: int) -> DashboardData:
+    """Create count journal files and matching entries under tmp_path."""
+    journal_dir = tmp_path / "docs" / "quest-journal"
+    journal_dir.mkdir(parents=True)
+    entries = []
+    for i in range(count):
+        rel_path = Path("docs/quest-journal") / f"quest-{i:04d}.md"
+        (tmp_path / rel_path).write_text(
+            f"# Quest Journal: Quest {i}\n\n## Summary\n\nBody of quest {i}.\n",
+            encoding="utf-8",
+        )
+        entries.append(
+            JournalEntry(
+                quest_id=f"quest-{i:04d}",
+                slug=f"quest-{i:04d}",
+                title=f"Quest {i}",
+                elevator_pitch=f"Body of quest {i}.",
+                status="Completed",
+                completed_date=date(2026, 2, 1),
+                journal_path=rel_path,
+            )
+        )
+    return DashboardData(finished_quests=entries, active_quests=[], abandoned_quests=[])
+
+
+def test_pages_written_once_then_unchanged(tmp_path):
+    """A second build with identical inputs rewrites no pages."""
+    data = _journal_site(tmp_path, 3)
+    pages_dir = tmp_path / "site" / "quests"
+
+    first = write_detail_pages(data, tmp_path, pages_dir, workers=1)
+    second = write_detail_pages(data, tmp_path, pages_dir, workers=1)
+
+    assert first.written == 3
+    assert second.written == 0
+    assert second.unchanged == 3
+    assert (pages_dir / MANIFEST_NAME).exists()
+    assert first.links["quest-0001"] == "quests/quest-0001.html"
+
+
+def test_only_changed_page_rewritten_in_parallel(tmp_path):
+    """Editing one journal rewrites exactly one page, using the worker pool."""
+    data = _journal_site(tmp_path, 80)
+    pages_dir = tmp_path / "site" / "quests"
+    write_detail_pages(data, tmp_path, pages_dir, workers=2)
+
+    untouched = pages_dir / "quest-0002.html"
+    untouched_mtime = untouched.stat().st_mtime_ns
+    (tmp_path / "docs" / "quest-journal" / "quest-0007.md").write_text(
+        "# Quest Journal: Quest 7\n\n## Summary\n\nEdited body.\n", encoding="utf-8"
+    )
+
+    result = write_detail_pages(data, tmp_path, pages_dir, workers=2)
+
+    assert result.written == 1
+    assert result.unchanged == 79
+    assert "Edited body." in (pages_dir / "quest-0007.html").read_text(encoding="utf-8")
+    assert untouched.stat().st_mtime_ns == untouched_mtime
+
+
+def test_stale_pages_removed(tmp_path):
+    """Pages for quests that disappeared are deleted."""
+    data = _journal_site(tmp_path, 2)
+    pages_dir = tmp_path / "site" / "quests"
+    write_detail_pages(data, tmp_path, pages_dir, workers=1)
+
+    smaller = DashboardData(
+        finished_quests=data.finished_quests[:1], active_quests=[], abandoned_quests=[]
+    )
+    result = write_detail_pages(smaller, tmp_path, pages_dir, workers=1)
+
+    assert result.removed == 1
+    assert not (pages_dir / "quest-0001.html").exists()
+
+
+def test_active_quest_page_uses_brief(tmp_path):
+    """Active quest pages render quest_brief.md from the quest directory."""
+    quest_dir = tmp_path / ".quest" / "live_2026-02-12__1000"
+    quest_dir.mkdir(parents=True)
+    (quest_dir / "quest_brief.md").write_text(
+        "# Quest Brief: Live\n\n## Requirements\n\n- Ship **it**\n", encoding="utf-8"
+    )
+    quest = ActiveQuest(
+        quest_id="live_2026-02-12__1000",
+        slug="live",
+        title="Live",
+        elevator_pitch="",
+        status="In Progress",
+        phase="Building",
+        updated_at=datetime(2026, 2, 12, tzinfo=UTC),
+        quest_path=Path(".quest/live_2026-02-12__1000"),
+    )
+    data = DashboardData(finished_quests=[], active_quests=[quest], abandoned_quests=[])
+    pages_dir = tmp_path / "site" / "quests"
+
+    write_detail_pages(data, tmp_path, pages_dir, workers=1)
+
+    page = (pages_dir / "live_2026-02-12__1000.html").read_text(encoding="utf-8")
+    assert "<li>Ship <strong>it</strong></li>" in page
+    assert "<b>Phase:</b> Building" in page
+    assert 'href="../index.html"' in page
+
+
+def test_markdown_escapes_html_and_unsafe_links():
+    """Markdown conversion escapes raw HTML and drops non-https schemes."""
+    result = render_markdown(
+        "<script>alert(1)</script>\n\n"
+        "[bad](javascript:alert) [good](https://github.com/o/r) [rel](../x.md)\n\n"
+        "```\n<b>code</b>\n```"
+    )
+
+    assert "<script>" not in result
+    assert "&lt;script&gt;" in result
+    assert 'href="javascript' not in result
+    assert '<a href="https://github.com/o/r">good</a>' in result
+    assert '<a href="../x.md">rel</a>' in result
+    assert "<pre><code>&lt;b&gt;code&lt;/b&gt;</code></pre>" in result
+
+
+def test_markdown_tables_and_headings():
+    """Tables and headings convert to their HTML elements."""
+    result = render_markdown("## Results\n\n| A | B |\n|---|---|\n| 1 | `x` |\n")
+
+    assert "<h2>Results</h2>" in result
+    assert "<th>A</th>" in result
+    assert "<td><code>x</code></td>" in result
+
+
+def test_deeply_nested_quotes_are_flattened():
+    """Quote nesting stops at MAX_QUOTE_DEPTH instead of recursing once per '>'."""
+    nested = render_markdown("> > inner")
+    assert nested == "<blockquote><blockquote><p>inner</p></blockquote></blockquote>"
+
+    result = render_markdown(">" * 1200 + " deep")
+
+    assert result.count("<blockquote>") == MAX_QUOTE_DEPTH
+    assert "<p>deep</p>" in result
+
+
+def test_code_spans_pair_equal_backtick_runs():
+    """A span closes at the next run of its own length; a lone run stays literal."""
+    assert render_markdown("``a ` b`` and `c`") == "<p><code>a ` b</code> and <code>c</code></p>"
+    assert render_markdown("a ``x` b") == "<p>a ``x` b</p>"
+
+
+# Inline text that made the lazy (.+?) patterns super-linear, by size n
+_HOSTILE_INLINE = {
+    "backticks": lambda n: "`a" * n,
+    "italic_star": lambda n: "*a " * n,
+    "italic_underscore": lambda n: "_a " * n,
+    "bold": lambda n: "**a " * n,
+    "link_label": lambda n: "[a" * n,
+    "link_target": lambda n: "[a](b" * n,
+}
+
+
+def _best_render_time(text):
+    """Fastest of three renders, which filters scheduler noise."""
+    timings = []
+    for _ in range(3):
+        started = time.perf_counter()
+        render_markdown(text)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+@pytest.mark.parametrize("name", sorted(_HOSTILE_INLINE))
+def test_hostile_inline_markdown_renders_in_linear_time(name):
+    """Benchmark: 4x the input costs about 4x the time (quadratic would be 16x)."""
+    make = _HOSTILE_INLINE[name]
+
+    small = _best_render_time(make(4_000))
+    large = _best_render_time(make(16_000))
+
+    assert large < 8 * small + 0.01
+
+
+def test_detail_page_filename_is_safe():
+    """Quest ids with path characters produce flat, safe filenames."""
+    assert detail_page_filename("../../etc/passwd") == "etc-passwd.html"
+    assert detail_page_filename("ok_2026-02-12__1000") == "ok_2026-02-12__1000.html"
+
+
+def test_cards_link_to_detail_pages(tmp_path):
+    """Card titles link to detail pages when detail links are supplied."""
+    data = _journal_site(tmp_path, 1)
+
+    result = render_dashboard(
+        data,
+        tmp_path / "index.html",
+        tmp_path,
+        detail_links={"quest-0000": "quests/quest-0000.html"},
+    )
+
+    assert '<a href="quests/quest-0000.html">Quest 0</a>' in result
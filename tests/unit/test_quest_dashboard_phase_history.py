@@ -0,0 +1,140 @@
+"""Unit tests for quest_dashboard.phase_history module."""
+
+import json
+import os
+import subprocess
+from datetime import datetime, timezone
+
+import pytest
+
+from quest_dashboard.phase_history import CACHE_NAME, dwell_times, mine_phase_history
+from quest_dashboard.render import _render_phase_dwell_section
+
+T0 = int(datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc).timestamp())
+HOUR = 3600
+
+
+def _git(root, *args, at=T0):
+    subprocess.run(
+        ["git", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+        env={
+            **os.environ,
+            "GIT_AUTHOR_NAME": "t",
+            "GIT_AUTHOR_EMAIL": "t@example.com",
+            "GIT_COMMITTER_NAME": "t",
+            "GIT_COMMITTER_EMAIL": "t@example.com",
+            "GIT_AUTHOR_DATE": f"@{at} +0000",
+            "GIT_COMMITTER_DATE": f"@{at} +0000",
+            "GIT_CONFIG_GLOBAL": os.devnull,
+        },
+    )
+
+
+def _commit(root, at, states, moves=()):
+    """Commit quest state files ({quest dir: (phase, updated_at or None)}) at time at."""
+    for old, new in moves:
+        (root / ".quest" / new).parent.mkdir(parents=True, exist_ok=True)
+        _git(root, "mv", f".quest/{old}", f".quest/{new}")
+    for quest, (phase, updated_at) in states.items():
+        state = {"quest_id": quest.rsplit("/", 1)[-1], "phase": phase}
+        if updated_at is not None:
+            state["updated_at"] = datetime.fromtimestamp(updated_at, timezone.utc).isoformat()
+        path = root / ".quest" / quest / "state.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(state), encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", f"state at {at}", at=at)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "main")
+    return root
+
+
+def _history(repo):
+    """q1 moves plan -> review -> build -> complete (archived); q2 plan -> build."""
+    _commit(repo, T0, {"q1": ("plan", T0)})
+    _commit(repo, T0 + 1 * HOUR, {"q2": ("plan", None)})  # Commit time is used
+    _commit(repo, T0 + 3 * HOUR, {"q1": ("review", T0 + 2 * HOUR)})
+    _commit(repo, T0 + 5 * HOUR, {"q1": ("build", T0 + 5 * HOUR), "q2": ("build", None)})
+    _commit(repo, T0 + 6 * HOUR, {}, moves=[("q1", "archive/q1")])
+    _commit(repo, T0 + 29 * HOUR, {"archive/q1": ("complete", T0 + 29 * HOUR)})
+
+
+def _by_phase(history):
+    return {d.phase: (d.samples, d.median_hours, d.p90_hours, d.total_hours) for d in history.dwell}
+
+
+def test_dwell_times_from_state_history(repo):
+    """Closed stays count per phase; current phases and archive moves do not."""
+    _history(repo)
+
+    history = mine_phase_history(repo)
+
+    assert _by_phase(history) == {
+        "build": (1, 24.0, 24.0, 24.0),
+        "plan": (2, 3.0, 3.8, 6.0),
+        "review": (1, 3.0, 3.0, 3.0),
+    }
+    assert [d.phase for d in history.dwell] == ["build", "plan", "review"]
+    assert history.quests == 2
+    assert not history.incremental
+
+
+def test_second_run_only_reads_new_commits(repo):
+    """The cache replays nothing for an unchanged tip and only tip..HEAD after."""
+    _history(repo)
+    cache = repo / "out" / CACHE_NAME
+
+    first = mine_phase_history(repo, cache)
+    again = mine_phase_history(repo, cache)
+    assert (first.new_commits, first.blobs_read) == (6, 6)
+    assert (again.new_commits, again.blobs_read, again.incremental) == (0, 0, True)
+    assert again.dwell == first.dwell
+
+    _commit(repo, T0 + 13 * HOUR, {"q2": ("fix", T0 + 13 * HOUR)})
+    after = mine_phase_history(repo, cache)
+
+    assert (after.new_commits, after.blobs_read, after.incremental) == (1, 1, True)
+    assert _by_phase(after)["build"] == (2, 16.0, 22.4, 32.0)
+    assert after.dwell == mine_phase_history(repo).dwell  # Same as a full replay
+
+
+def test_rewritten_history_is_replayed_without_rereading_blobs(repo):
+    """A cached tip that is no longer an ancestor triggers a full, cached replay."""
+    _history(repo)
+    cache = repo / "out" / CACHE_NAME
+    mine_phase_history(repo, cache)
+
+    _git(repo, "reset", "-q", "--hard", "HEAD~3")
+    rewound = mine_phase_history(repo, cache)
+
+    assert (rewound.incremental, rewound.new_commits, rewound.blobs_read) == (False, 3, 0)
+    assert _by_phase(rewound) == {"plan": (1, 2.0, 2.0, 2.0)}
+
+
+def test_no_repository_yields_empty_history(tmp_path):
+    """Outside a git repository nothing is mined and no cache is written."""
+    history = mine_phase_history(tmp_path, tmp_path / CACHE_NAME)
+
+    assert history.dwell == [] and history.quests == 0
+    assert not (tmp_path / CACHE_NAME).exists()
+
+
+def test_phase_dwell_section_formats_hours_and_days():
+    """The panel title-cases phases and switches to days above 48 hours."""
+    dwell = dwell_times({"q": [[0, "code_review"], [5 * HOUR, "build"], [77 * HOUR, "done"]]})
+
+    panel = _render_phase_dwell_section(dwell)
+
+    assert "<h2>Time in Phase</h2>" in panel
+    assert "<td>Code Review</td>" in panel
+    assert '<td class="num">5.0 h</td>' in panel
+    assert '<td class="num">3.0 days</td>' in panel
+    assert _render_phase_dwell_section([]) == ""
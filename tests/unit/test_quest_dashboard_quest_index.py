@@ -0,0 +1,130 @@
+"""Unit tests for quest_dashboard.quest_index module."""
+
+import os
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from quest_dashboard.models import ActiveQuest, DashboardData, JournalEntry
+from quest_dashboard.quest_index import (
+    END_MARKER,
+    INDEX_PATH,
+    START_MARKER,
+    main,
+    update_quest_index,
+)
+
+
+def _journal(quest_id, completed, status="Completed"):
+    slug = quest_id.split("_")[0]
+    return JournalEntry(
+        quest_id=quest_id,
+        slug=slug,
+        title=slug,
+        elevator_pitch="",
+        status=status,
+        completed_date=completed,
+        journal_path=Path("docs") / "quest-journal" / f"{slug}_{completed}.md",
+    )
+
+
+def _active(quest_id, phase="Building", updated=datetime(2026, 3, 4, tzinfo=timezone.utc)):
+    return ActiveQuest(
+        quest_id=quest_id,
+        slug=quest_id.split("_")[0],
+        title="",
+        elevator_pitch="",
+        status="In Progress",
+        phase=phase,
+        updated_at=updated,
+        quest_path=Path(".quest") / quest_id,
+    )
+
+
+@pytest.fixture
+def data():
+    return DashboardData(
+        finished_quests=[_journal("alpha_2026-01-05__0900", date(2026, 1, 9))],
+        active_quests=[_active("beta_2026-03-01__1200")],
+        abandoned_quests=[_journal("gamma", date(2026, 2, 2), "Abandoned")],
+    )
+
+
+def _rows(text):
+    block = text[text.index(START_MARKER) : text.index(END_MARKER)]
+    return [line for line in block.splitlines() if line.startswith("| `")]
+
+
+def test_new_index_lists_every_quest_newest_first(tmp_path, data):
+    """Missing README: created from the template with status, phase, dates and links."""
+    update = update_quest_index(tmp_path, data)
+
+    text = (tmp_path / INDEX_PATH).read_text(encoding="utf-8")
+    assert (update.changed, update.rows, update.rewritten) == (True, 3, 3)
+    assert text.startswith("# Quests\n")
+    assert "## Notes" in text
+    assert _rows(text) == [
+        "| `beta_2026-03-01__1200` | In Progress | Building | 2026-03-01 | 2026-03-04 "
+        "| [folder](beta_2026-03-01__1200/) |",
+        "| `gamma` | Abandoned | - | - | 2026-02-02 "
+        "| [journal](../docs/quest-journal/gamma_2026-02-02.md) |",
+        "| `alpha_2026-01-05__0900` | Completed | - | 2026-01-05 | 2026-01-09 "
+        "| [journal](../docs/quest-journal/alpha_2026-01-09.md) |",
+    ]
+
+
+def test_only_changed_rows_are_rewritten(tmp_path, data):
+    """Hand edits survive on unchanged quests; a changed quest gets a fresh row."""
+    update_quest_index(tmp_path, data)
+    index = tmp_path / INDEX_PATH
+    text = index.read_text(encoding="utf-8")
+    text = text.replace("| Abandoned | - |", "| Abandoned | superseded by alpha |")
+    index.write_text(text, encoding="utf-8")
+    os.utime(index, ns=(0, 0))
+
+    assert not update_quest_index(tmp_path, data).changed
+    assert index.stat().st_mtime_ns == 0
+
+    moved = DashboardData(
+        finished_quests=data.finished_quests,
+        active_quests=[_active("beta_2026-03-01__1200", phase="Reviewing")],
+        abandoned_quests=data.abandoned_quests,
+    )
+    update = update_quest_index(tmp_path, moved)
+
+    rows = _rows(index.read_text(encoding="utf-8"))
+    assert (update.changed, update.rewritten) == (True, 1)
+    assert "| In Progress | Reviewing |" in rows[0]
+    assert "| Abandoned | superseded by alpha |" in rows[1]
+
+
+def test_hand_written_text_outside_the_markers_is_kept(tmp_path, data):
+    """An existing README without markers gets the table after its title."""
+    index = tmp_path / INDEX_PATH
+    index.parent.mkdir()
+    index.write_text("# Our quests\n\nRead me first.\n\n## How to read folders\n", "utf-8")
+
+    update_quest_index(tmp_path, data)
+    first = index.read_text(encoding="utf-8")
+    assert first.startswith(f"# Our quests\n\n{START_MARKER}\n| Quest |")
+    assert first.endswith(f"{END_MARKER}\n\nRead me first.\n\n## How to read folders\n")
+
+    dropped = DashboardData(finished_quests=[], active_quests=[], abandoned_quests=[])
+    update = update_quest_index(tmp_path, dropped)
+    assert (update.rows, update.removed) == (0, 3)
+    assert index.read_text(encoding="utf-8").endswith("## How to read folders\n")
+
+
+def test_cli_check(tmp_path, capsys):
+    """--check writes nothing and exits 1 until the index is generated."""
+    (tmp_path / ".quest" / "q1").mkdir(parents=True)
+    (tmp_path / ".quest" / "q1" / "state.json").write_text(
+        '{"quest_id": "q1", "phase": "plan", "status": "in_progress"}', encoding="utf-8"
+    )
+
+    assert main(["--repo-root", str(tmp_path), "--check"]) == 1
+    assert not (tmp_path / INDEX_PATH).exists()
+    assert main(["--repo-root", str(tmp_path)]) == 0
+    assert main(["--repo-root", str(tmp_path), "--check"]) == 0
+    assert "Quest index is up to date (1 quests)" in capsys.readouterr().out
@@ -0,0 +1,120 @@
+"""Unit tests for quest_dashboard.quest_state and events modules."""
+
+import json
+import os
+from datetime import datetime, timezone
+
+from quest_dashboard.events import EVENTS_NAME, append_event, read_events
+from quest_dashboard.quest_state import apply_change, main
+
+NOW = datetime(2026, 3, 2, 10, 0, tzinfo=timezone.utc)
+
+
+def _quest(tmp_path, phase="building", **state):
+    quest_dir = tmp_path / ".quest" / "q1"
+    quest_dir.mkdir(parents=True)
+    state = {"quest_id": "q1", "phase": phase, "status": "in_progress", **state}
+    (quest_dir / "state.json").write_text(json.dumps(state), encoding="utf-8")
+    return quest_dir
+
+
+def _events(tmp_path):
+    return read_events(tmp_path / ".quest" / EVENTS_NAME).events
+
+
+def test_transition_writes_state_and_appends_event(tmp_path):
+    """A valid transition rewrites state.json (other fields kept) and logs one event."""
+    quest_dir = _quest(tmp_path, created_at="2026-03-01T09:00:00Z")
+    (quest_dir / "phase_02_implementation").mkdir()
+    (quest_dir / "phase_02_implementation" / "handoff.json").write_text("{}")
+
+    change = apply_change(quest_dir, "reviewing", role="code_review_agent", now=NOW)
+
+    assert change.applied and change.findings == ()
+    state = json.loads((quest_dir / "state.json").read_text())
+    assert state == {
+        "quest_id": "q1",
+        "phase": "reviewing",
+        "status": "in_progress",
+        "created_at": "2026-03-01T09:00:00Z",
+        "last_role": "code_review_agent",
+        "updated_at": "2026-03-02T10:00:00Z",
+    }
+    assert _events(tmp_path) == [
+        {
+            "v": 1,
+            "ts": "2026-03-02T10:00:00Z",
+            "quest": ".quest/q1",
+            "quest_id": "q1",
+            "event": "transition",
+            "from": "building",
+            "to": "reviewing",
+            "changes": {"phase": "reviewing", "last_role": "code_review_agent"},
+        }
+    ]
+
+
+def test_failed_validation_writes_nothing(tmp_path):
+    """Missing artifacts or a transition outside the table leave state and log alone."""
+    quest_dir = _quest(tmp_path)
+    before = (quest_dir / "state.json").read_text()
+
+    missing = apply_change(quest_dir, "reviewing", now=NOW)
+    invalid = apply_change(quest_dir, "complete", now=NOW)
+
+    assert not missing.applied and not invalid.applied
+    assert [f.message for f in missing.findings] == [
+        "Directory is empty or missing: phase_02_implementation"
+    ]
+    assert "Invalid transition: building -> complete" in invalid.findings[0].message
+    assert (quest_dir / "state.json").read_text() == before
+    assert not (tmp_path / ".quest" / EVENTS_NAME).exists()
+
+
+def test_update_increments_counters_without_validation(tmp_path):
+    """update changes fields only; iteration counters count up from any value."""
+    quest_dir = _quest(tmp_path, phase="plan", plan_iteration="2")
+
+    change = apply_change(
+        quest_dir, status="blocked", increment=("plan_iteration", "fix_iteration"), now=NOW
+    )
+
+    assert change.applied
+    assert change.event["event"] == "update"
+    assert change.event["from"] == change.event["to"] == "plan"
+    assert change.event["changes"] == {"status": "blocked", "plan_iteration": 3, "fix_iteration": 1}
+
+
+def test_read_events_tails_complete_lines_and_detects_a_new_log(tmp_path):
+    """A torn last line waits for the next read; a replaced log is read from the start."""
+    log = tmp_path / EVENTS_NAME
+    append_event(log, {"quest": ".quest/a"})
+    with log.open("a", encoding="utf-8") as f:
+        f.write('not json\n{"quest": ".quest/b"')
+
+    first = read_events(log)
+    assert [e["quest"] for e in first.events] == [".quest/a"]
+
+    with log.open("a", encoding="utf-8") as f:
+        f.write("}\n")
+    second = read_events(log, first.log_id, first.offset)
+    assert (second.reset, [e["quest"] for e in second.events]) == (False, [".quest/b"])
+
+    os.replace(log, tmp_path / "old.ndjson")
+    append_event(log, {"quest": ".quest/c"})
+    third = read_events(log, second.log_id, second.offset)
+    assert (third.reset, [e["quest"] for e in third.events]) == (True, [".quest/c"])
+
+
+def test_cli_exit_codes(tmp_path, capsys):
+    """0 when applied, 1 when validation fails, 2 without a state file."""
+    quest_dir = _quest(tmp_path, phase="plan")
+
+    assert main(["update", str(quest_dir), "--role", "planner_agent"]) == 0
+    assert main(["transition", str(quest_dir), "plan_reviewed"]) == 1
+    assert main(["update", str(tmp_path / "missing")]) == 2
+
+    out = capsys.readouterr().out
+    assert "q1: plan -> plan (" in out
+    assert "[FAIL] Missing artifact: phase_01_plan/plan.md" in out
+    assert "State not modified." in out
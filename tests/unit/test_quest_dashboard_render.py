@@ -4,7 +4,7 @@ from datetime import date, datetime, timezone
 from pathlib import Path
 from unittest.mock import patch
 
-from quest_dashboard.models import ActiveQuest, DashboardData, JournalEntry
+from quest_dashboard.models import ActiveQuest, DashboardData, Diagnostic, JournalEntry
 from quest_dashboard.render import _compute_monthly_buckets, render_dashboard
 
 UTC = timezone.utc
@@ -247,7 +247,10 @@ def test_warnings_section_rendered(tmp_path):
         finished_quests=[],
         active_quests=[],
         abandoned_quests=[],
-        warnings=["Warning 1: Something went wrong", "Warning 2: Another issue"],
+        warnings=[
+            Diagnostic("test-one", "Warning 1: Something went wrong"),
+            Diagnostic("test-two", "Warning 2: Another issue"),
+        ],
     )
 
     output_path = tmp_path / "docs" / "dashboard" / "index.html"
@@ -0,0 +1,128 @@
+"""Unit tests for quest_dashboard.resolver module."""
+
+import json
+import shutil
+
+import pytest
+
+from quest_dashboard.events import EVENTS_NAME, append_event
+from quest_dashboard.packs import pack_quest_dir
+from quest_dashboard.resolver import INDEX_NAME, main, resolve
+
+
+def _quest(quest_root, rel, phase="building", **extra):
+    quest_dir = quest_root / rel
+    quest_dir.mkdir(parents=True, exist_ok=True)
+    state = {"quest_id": quest_dir.name, "slug": quest_dir.name.split("_")[0], "phase": phase}
+    (quest_dir / "state.json").write_text(json.dumps({**state, **extra}), encoding="utf-8")
+    return quest_dir
+
+
+@pytest.fixture
+def quest_root(tmp_path):
+    root = tmp_path / ".quest"
+    _quest(root, "rate-limiter_2026-03-01__1200", status="in_progress")
+    _quest(root, "rate-cards_2026-02-10__0900", phase="plan")
+    _quest(root, "archive/audit-log_2026-01-05__0800", phase="complete")
+    return root
+
+
+def test_warm_up_indexes_live_and_archived_quests(quest_root):
+    """The first lookup walks the tree; the next exact lookup does not."""
+    first = resolve(quest_root, "rate-limiter_2026-03-01__1200")
+
+    assert (first.how, first.rescanned) == ("exact", True)
+    assert (first.unique.path, first.unique.phase, first.unique.status) == (
+        "rate-limiter_2026-03-01__1200", "building", "in_progress"
+    )
+    assert (quest_root / INDEX_NAME).is_file()
+
+    archived = resolve(quest_root, "audit-log_2026-01-05__0800")
+    assert archived.unique.path == "archive/audit-log_2026-01-05__0800"
+    assert not archived.rescanned
+    assert archived.unique.archived and not archived.unique.packed
+
+
+def test_prefix_substring_and_fuzzy_matches(quest_root):
+    """Prefixes can be ambiguous; slug fragments and typos still find the quest."""
+    ambiguous = resolve(quest_root, "rate")
+    assert ambiguous.how == "prefix" and ambiguous.unique is None
+    assert [m.quest_id for m in ambiguous.matches] == [
+        "rate-limiter_2026-03-01__1200", "rate-cards_2026-02-10__0900"
+    ]
+
+    assert resolve(quest_root, "LIMITER").unique.quest_id == "rate-limiter_2026-03-01__1200"
+    assert resolve(quest_root, "log_2026").how == "substring"
+
+    fuzzy = resolve(quest_root, "rate-limtier")
+    assert (fuzzy.how, fuzzy.unique.quest_id) == ("fuzzy", "rate-limiter_2026-03-01__1200")
+    assert resolve(quest_root, "zzz").how == "none"
+
+
+def test_entry_heals_when_the_quest_moves_into_the_archive(quest_root):
+    """A moved or packed quest is found in archive/ without a full rescan."""
+    quest_id = "rate-cards_2026-02-10__0900"
+    resolve(quest_root, quest_id)
+    (quest_root / "archive").mkdir(exist_ok=True)
+    shutil.move(quest_root / quest_id, quest_root / "archive" / quest_id)
+
+    moved = resolve(quest_root, quest_id)
+    assert (moved.rescanned, moved.unique.path) == (False, f"archive/{quest_id}")
+
+    pack_quest_dir(quest_root / "archive" / quest_id)
+    packed = resolve(quest_root, quest_id)
+    assert (packed.rescanned, packed.unique.path) == (False, f"archive/{quest_id}.qpack")
+    assert packed.unique.packed and packed.unique.phase == "plan"
+
+
+def test_phase_changes_arrive_through_the_event_log(quest_root):
+    """quest-state events re-read only the changed quest; unknown ids trigger a rescan."""
+    quest_id = "rate-limiter_2026-03-01__1200"
+    resolve(quest_root, quest_id)
+    _quest(quest_root, quest_id, phase="reviewing")
+    append_event(quest_root / EVENTS_NAME, {"quest": f".quest/{quest_id}", "quest_id": quest_id})
+
+    changed = resolve(quest_root, quest_id)
+    assert (changed.rescanned, changed.unique.phase) == (False, "reviewing")
+
+    _quest(quest_root, "new-thing_2026-03-05__1000")
+    created = resolve(quest_root, "new-thing")
+    assert (created.rescanned, created.how) == (True, "prefix")
+
+
+def test_events_outside_the_quest_root_are_ignored(quest_root):
+    """An event path that climbs out of .quest with '..' is never indexed."""
+    resolve(quest_root, "rate-limiter_2026-03-01__1200")
+    _quest(quest_root.parent / "docs", "sneaky_2026-03-05__1000")
+    append_event(quest_root / EVENTS_NAME, {"quest": ".quest/../docs/sneaky_2026-03-05__1000"})
+
+    assert resolve(quest_root, "sneaky").unique is None
+
+
+def test_new_quest_created_by_hand_beats_a_look_alike(quest_root, capsys):
+    """An unindexed full id is found where it was created, never as a similar older quest."""
+    resolve(quest_root, "rate-limiter_2026-03-01__1200")
+    _quest(quest_root, "rate-limiter_2026-03-02__0900", phase="plan")
+
+    created = resolve(quest_root, "rate-limiter_2026-03-02__0900")
+    assert (created.how, created.rescanned) == ("exact", False)
+    assert (created.unique.path, created.unique.phase) == ("rate-limiter_2026-03-02__0900", "plan")
+
+    repo = ["--repo-root", str(quest_root.parent)]
+    assert main(["rate-limiter_2026-03-09__0900", *repo]) == 2
+    assert "No exact match for quest" in capsys.readouterr().out
+
+
+def test_cli_exit_codes(quest_root, capsys):
+    """0 for one match, 2 for several, 1 for none; --json lists candidates."""
+    repo = ["--repo-root", str(quest_root.parent)]
+
+    assert main(["limiter", *repo]) == 0
+    assert capsys.readouterr().out == (
+        ".quest/rate-limiter_2026-03-01__1200\trate-limiter_2026-03-01__1200\tbuilding"
+        "\tin_progress\n"
+    )
+    assert main(["rate", *repo, "--json"]) == 2
+    report = json.loads(capsys.readouterr().out)
+    assert report["match"] == "prefix" and len(report["quests"]) == 2
+    assert main(["zzz", *repo]) == 1
@@ -0,0 +1,184 @@
+"""Unit tests for quest_dashboard.search module."""
+
+import json
+import os
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from quest_dashboard import search as search_module
+from quest_dashboard.search import INDEX_NAME, main, open_index, search, update_index
+
+
+def _journal(repo: Path, name: str, quest_id: str, status: str, completed: str, body: str):
+    path = repo / "docs" / "quest-journal" / f"{name}.md"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        f"# Quest Journal: {name}\n\n"
+        f"**Quest ID:** `{quest_id}`\n**Status:** {status}\n**Completed:** {completed}\n\n"
+        f"## Summary\n\n{body}\n",
+        encoding="utf-8",
+    )
+
+
+def _quest(repo: Path, dir_name: str, state: dict, files: dict[str, str]) -> Path:
+    quest_dir = repo / ".quest" / dir_name
+    quest_dir.mkdir(parents=True)
+    (quest_dir / "state.json").write_text(json.dumps(state), encoding="utf-8")
+    for rel, text in files.items():
+        (quest_dir / rel).parent.mkdir(parents=True, exist_ok=True)
+        (quest_dir / rel).write_text(text, encoding="utf-8")
+    return quest_dir
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _journal(
+        tmp_path, "limiter", "limiter_2026-01-05__0900", "Complete", "2026-01-20",
+        "Replaced the token bucket in the API rate limiter.",
+    )
+    _journal(
+        tmp_path, "cache", "cache_2026-02-01__1000", "Abandoned", "2026-02-10",
+        "Tried caching; the rate of misses was too high.",
+    )
+    _quest(
+        tmp_path,
+        "retry_2026-03-01__0800",
+        {
+            "quest_id": "retry_2026-03-01__0800",
+            "status": "blocked",
+            "updated_at": "2026-03-02T10:00:00Z",
+        },
+        {
+            "quest_brief.md": "# Quest Brief: Retry policy\n\nBack off on rate limiter errors.\n",
+            "phase_01_plan/plan.md": "# Plan\n\nWrap the client.\n",
+            "phase_03_review/review_claude.md": "# Review\n\nThe limiter tests are flaky.\n",
+            "phase_03_review/notes.md": "rate limiter rate limiter rate limiter\n",  # Not indexed
+        },
+    )
+    return tmp_path
+
+
+def _index(repo):
+    conn = open_index(repo / "out" / INDEX_NAME)
+    update_index(conn, repo)
+    return conn
+
+
+def test_ranked_quests_with_snippets_and_dashboard_status(repo):
+    """One hit per quest, title matches first, carrying the dashboard's status and date."""
+    conn = _index(repo)
+
+    hits = search(conn, "rate limiter")
+
+    assert [(h.quest_id, h.status, h.day) for h in hits] == [
+        ("limiter_2026-01-05__0900", "finished", date(2026, 1, 20)),
+        ("retry_2026-03-01__0800", "blocked", date(2026, 3, 2)),
+    ]
+    assert hits[0].path == "docs/quest-journal/limiter.md"
+    assert "[rate] [limiter]" in hits[0].snippet
+    assert hits[1].path == ".quest/retry_2026-03-01__0800/quest_brief.md"
+
+
+def test_status_and_date_filters(repo):
+    """Status categories and inclusive date bounds filter quests, not files."""
+    conn = _index(repo)
+
+    def ids(**filters):
+        return [h.quest_id for h in search(conn, "rate", **filters)]
+
+    assert ids(statuses=("abandoned",)) == ["cache_2026-02-01__1000"]
+    assert ids(statuses=("blocked", "finished"), since=date(2026, 2, 1)) == [
+        "retry_2026-03-01__0800"
+    ]
+    assert ids(until=date(2026, 1, 20)) == ["limiter_2026-01-05__0900"]
+
+
+def test_incremental_update_reads_only_changed_files(repo):
+    """Unchanged fingerprints are skipped; edits and deletions are applied."""
+    conn = _index(repo)
+    review = repo / ".quest" / "retry_2026-03-01__0800" / "phase_03_review" / "review_claude.md"
+
+    assert update_index(conn, repo).indexed == 0
+
+    review.write_text("# Review\n\nAdd jitter to the backoff.\n", encoding="utf-8")
+    os.utime(review, ns=(0, 0))
+    update = update_index(conn, repo)
+    assert (update.indexed, update.removed) == (1, 0)
+    hits = search(conn, "jitter")
+    assert [h.path for h in hits] == [
+        ".quest/retry_2026-03-01__0800/phase_03_review/review_claude.md"
+    ]
+    assert hits[0].quest_id == "retry_2026-03-01__0800"
+
+    (repo / "docs" / "quest-journal" / "limiter.md").unlink()
+    assert update_index(conn, repo).removed == 1
+    assert [h.quest_id for h in search(conn, "token bucket")] == []
+
+
+def test_journal_status_wins_over_quest_state(repo):
+    """A quest with a journal is filtered by the journal, as on the dashboard."""
+    _journal(
+        repo, "retry", "retry_2026-03-01__0800", "Complete", "2026-03-05", "Retries shipped."
+    )
+    conn = _index(repo)
+
+    hits = search(conn, "limiter", statuses=("finished",))
+
+    assert [(h.quest_id, h.day) for h in hits] == [
+        ("limiter_2026-01-05__0900", date(2026, 1, 20)),
+        ("retry_2026-03-01__0800", date(2026, 3, 5)),
+    ]
+
+
+def test_plain_text_that_is_not_query_syntax(repo):
+    """Punctuation that FTS5 rejects falls back to a phrase search."""
+    conn = _index(repo)
+
+    assert sorted(h.quest_id for h in search(conn, "rate-limiter")) == [
+        "limiter_2026-01-05__0900",
+        "retry_2026-03-01__0800",
+    ]
+    assert search(conn, '"') == []
+
+
+def test_outdated_index_is_rebuilt(tmp_path):
+    """A file that is not a current index is replaced."""
+    index_path = tmp_path / INDEX_NAME
+    index_path.write_text("not a database", encoding="utf-8")
+
+    conn = open_index(index_path)
+
+    assert conn.execute("SELECT count(*) FROM files").fetchone() == (0,)
+
+
+def test_missing_fts5_is_reported(tmp_path, monkeypatch, capsys):
+    """Without FTS5 the CLI says so and leaves no half-built index behind."""
+    schema = search_module._SCHEMA.replace("USING fts5", "USING fts5_not_compiled_in")
+    monkeypatch.setattr(search_module, "_SCHEMA", schema)
+    index_path = tmp_path / INDEX_NAME
+
+    assert main(["limiter", "--repo-root", str(tmp_path), "--index", str(index_path)]) == 2
+    assert "Error: SQLite FTS5 not available" in capsys.readouterr().err
+    assert not index_path.exists()
+
+
+def test_limit_must_be_positive(tmp_path):
+    """--limit 0 is rejected rather than read as 'no limit'."""
+    with pytest.raises(SystemExit):
+        main(["limiter", "--repo-root", str(tmp_path), "--limit", "0"])
+
+
+def test_cli_prints_hits_and_exit_code(repo, capsys):
+    """The CLI updates the index, prints one line per quest and exits 1 on no match."""
+    index = str(repo / "out" / INDEX_NAME)
+
+    assert main(["limiter", "--repo-root", str(repo), "--index", index, "--limit", "1"]) == 0
+    out, err = capsys.readouterr()
+    assert out.splitlines()[0] == (
+        "limiter_2026-01-05__0900\tfinished\t2026-01-20\tdocs/quest-journal/limiter.md"
+    )
+    assert "Index: 6 indexed, 0 unchanged, 0 removed" in err
+
+    assert main(["zeppelin", "--repo-root", str(repo), "--index", index, "--no-update"]) == 1
@@ -0,0 +1,115 @@
+"""Unit tests for quest_dashboard.shards module."""
+
+from dataclasses import replace
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from quest_dashboard.models import DashboardData, JournalEntry
+from quest_dashboard.render import portfolio_period, render_dashboard
+from quest_dashboard.shards import write_portfolio_shards
+
+UTC = timezone.utc
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)
+
+
+def _entry(quest_id: str, completed: date, pitch: str = "Pitch.") -> JournalEntry:
+    return JournalEntry(
+        quest_id=quest_id,
+        slug=quest_id,
+        title=f"Title {quest_id}",
+        elevator_pitch=pitch,
+        status="Completed",
+        completed_date=completed,
+        journal_path=Path(f"docs/quest-journal/{quest_id}.md"),
+    )
+
+
+def _data(entries) -> DashboardData:
+    return DashboardData(
+        finished_quests=list(entries),
+        active_quests=[],
+        abandoned_quests=[],
+        generated_at=NOW,
+    )
+
+
+def _multi_year_entries():
+    return [
+        _entry("q2026", date(2026, 3, 1)),
+        _entry("q2025a", date(2025, 6, 1)),
+        _entry("q2025b", date(2025, 2, 1)),
+        _entry("q2024", date(2024, 11, 5)),
+    ]
+
+
+def test_portfolio_period_year_and_quarter():
+    """Periods are years or year-quarters."""
+    assert portfolio_period(date(2025, 2, 1), "year") == "2025"
+    assert portfolio_period(date(2025, 2, 1), "quarter") == "2025-Q1"
+    assert portfolio_period(date(2025, 12, 31), "quarter") == "2025-Q4"
+
+
+def test_shards_written_for_past_periods_only(tmp_path):
+    """Past years get one fragment each; the current year stays inline."""
+    shards = write_portfolio_shards(_data(_multi_year_entries()), tmp_path, "year")
+
+    assert [(s.period, s.count) for s in shards] == [("2025", 2), ("2024", 1)]
+    fragment = (tmp_path / shards[0].href).read_text(encoding="utf-8")
+    assert "Title q2025a" in fragment
+    assert fragment.index("Title q2025a") < fragment.index("Title q2025b")
+    assert "Title q2026" not in fragment
+
+
+def test_index_inlines_only_current_period(tmp_path):
+    """The index renders current cards plus placeholders for older shards."""
+    data = _data(_multi_year_entries())
+    shards = write_portfolio_shards(data, tmp_path, "year")
+
+    result = render_dashboard(
+        data, tmp_path / "index.html", tmp_path, shard_by="year", portfolio_shards=shards
+    )
+
+    assert "Title q2026" in result
+    assert "Title q2025a" not in result
+    assert "4 quests represented" in result
+    assert f'data-src="{shards[0].href}"' in result
+    assert 'id="portfolio-shards"' in result
+
+
+def test_loader_only_fetches_over_http(tmp_path):
+    """Under file:// the loader bails out so Load links open fragments."""
+    data = _data(_multi_year_entries())
+    shards = write_portfolio_shards(data, tmp_path, "year")
+
+    result = render_dashboard(
+        data, tmp_path / "index.html", tmp_path, shard_by="year", portfolio_shards=shards
+    )
+
+    guard = result.index("if (!/^https?:$/.test(location.protocol)) return;")
+    assert guard < result.index("preventDefault")
+    assert f'<a class="shard-load" href="{shards[0].href}">Load</a>' in result
+
+
+def test_unchanged_shards_keep_their_names(tmp_path):
+    """Editing one old quest renames only that quest's shard."""
+    entries = _multi_year_entries()
+    first = write_portfolio_shards(_data(entries), tmp_path, "year")
+
+    edited = [replace(e, elevator_pitch="Edited.") if e.quest_id == "q2024" else e for e in entries]
+    second = write_portfolio_shards(_data(edited), tmp_path, "year")
+
+    assert second[0].href == first[0].href  # 2025 untouched
+    assert second[1].href != first[1].href  # 2024 edited
+    assert not (tmp_path / first[1].href).exists()
+    assert sorted(p.name for p in (tmp_path / "portfolio").iterdir()) == sorted(
+        Path(s.href).name for s in second
+    )
+
+
+def test_rejects_unknown_granularity(tmp_path):
+    """Only year and quarter sharding are supported."""
+    with pytest.raises(ValueError):
+        write_portfolio_shards(_data([]), tmp_path, "month")
@@ -0,0 +1,74 @@
+"""Unit tests for quest_dashboard.stamp module."""
+
+import os
+
+from quest_dashboard.stamp import compute_fingerprint, is_up_to_date, write_stamp
+
+
+def _repo(tmp_path):
+    journal = tmp_path / "docs" / "quest-journal"
+    journal.mkdir(parents=True)
+    (journal / "a.md").write_text("# Quest Journal: A\n", encoding="utf-8")
+    (tmp_path / ".quest" / "q1").mkdir(parents=True)
+    (tmp_path / ".quest" / "q1" / "state.json").write_text("{}", encoding="utf-8")
+    return tmp_path
+
+
+def test_fingerprint_stable_without_changes(tmp_path):
+    """Repeated fingerprints of an untouched tree are identical."""
+    repo = _repo(tmp_path)
+
+    assert compute_fingerprint(repo, {}) == compute_fingerprint(repo, {})
+
+
+def test_fingerprint_tracks_edits_and_options(tmp_path):
+    """Edited files, new files and changed options all change the fingerprint."""
+    repo = _repo(tmp_path)
+    base = compute_fingerprint(repo, {"detail_pages": False})
+
+    state = repo / ".quest" / "q1" / "state.json"
+    st = state.stat()
+    os.utime(state, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    edited = compute_fingerprint(repo, {"detail_pages": False})
+
+    (repo / "docs" / "quest-journal" / "b.md").write_text("x", encoding="utf-8")
+    added = compute_fingerprint(repo, {"detail_pages": False})
+
+    (repo / ".ai").mkdir()
+    (repo / ".ai" / "allowlist.json").write_text("{}", encoding="utf-8")  # --audit bounds
+    allowlist = compute_fingerprint(repo, {"detail_pages": False})
+
+    options = compute_fingerprint(repo, {"detail_pages": True})
+    assert len({base, edited, added, allowlist, options}) == 5
+
+
+def test_fingerprint_ignores_the_generated_quest_index(tmp_path):
+    """--quest-index output inside .quest does not invalidate the stamp; new quests do."""
+    from quest_dashboard.fsutil import write_atomic
+
+    repo = _repo(tmp_path)
+    base = compute_fingerprint(repo, {})
+
+    write_atomic(repo / ".quest" / "README.md", "# Quests\n")
+    write_atomic(repo / ".quest" / ".quest-index-cache.json", "{}\n")
+    assert compute_fingerprint(repo, {}) == base
+
+    (repo / ".quest" / "q2").mkdir()
+    assert compute_fingerprint(repo, {}) != base
+
+
+def test_stamp_requires_untouched_output(tmp_path):
+    """A stamp is stale once the output file is modified or removed."""
+    repo = _repo(tmp_path)
+    output = tmp_path / "site" / "index.html"
+    output.parent.mkdir()
+    output.write_text("<html></html>", encoding="utf-8")
+    stamp = tmp_path / "site" / ".build-stamp.json"
+    fingerprint = compute_fingerprint(repo, {})
+
+    write_stamp(stamp, fingerprint, output)
+    assert is_up_to_date(stamp, fingerprint, output)
+    assert not is_up_to_date(stamp, "other", output)
+
+    output.write_text("<html>edited</html>", encoding="utf-8")
+    assert not is_up_to_date(stamp, fingerprint, output)
@@ -0,0 +1,119 @@
+"""Unit tests for quest_dashboard.validate module."""
+
+import json
+import shutil
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from quest_dashboard.validate import CHECKS, main, run_checks
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A copy of this repo's quest config, with .quest/ ignored."""
+    for name in (".ai", ".skills", ".agents"):
+        shutil.copytree(REPO_ROOT / name, tmp_path / name)
+    shutil.copy(REPO_ROOT / ".quest-manifest", tmp_path)
+    (tmp_path / "scripts").mkdir()
+    shutil.copy(REPO_ROOT / "scripts" / "validate-quest-config.sh", tmp_path / "scripts")
+    (tmp_path / ".gitignore").write_text(".quest/\n", encoding="utf-8")
+    return tmp_path
+
+
+def _failures(run):
+    return {
+        r.name: [f.message for f in r.findings if f.level == "fail"]
+        for r in run.results
+        if r.failed
+    }
+
+
+def test_repo_config_passes_every_check(repo):
+    """The real allowlist, roles, manifest and workflow pass, in check order."""
+    run = run_checks(repo)
+
+    assert [r.name for r in run.results] == list(CHECKS)
+    assert _failures(run) == {}
+    assert all(r.seconds >= 0 for r in run.results)
+
+
+def test_failures_are_reported_per_check(repo):
+    """Each broken artifact fails only the check that owns it."""
+    (repo / ".gitignore").write_text("node_modules/\n.quest/cache.json\n", encoding="utf-8")
+    allowlist = json.loads((repo / ".ai" / "allowlist.json").read_text(encoding="utf-8"))
+    allowlist["gates"]["max_fix_iterations"] = 0
+    allowlist["role_permissions"]["builder_agent"]["bash"] = "pytest"
+    (repo / ".ai" / "allowlist.json").write_text(json.dumps(allowlist), encoding="utf-8")
+    fixer = repo / ".skills" / "quest" / "agents" / "fixer.md"
+    fixer.write_text(
+        fixer.read_text(encoding="utf-8").replace("## Allowed Actions", "## Actions")
+        + "\nContext Is In Your Prompt\n",
+        encoding="utf-8",
+    )
+    (repo / ".ai" / "templates" / "new_template.md").write_text("# New\n", encoding="utf-8")
+
+    run = run_checks(repo)
+
+    assert _failures(run) == {
+        "gitignore": [
+            ".quest/ is NOT in .gitignore - add '.quest/' to prevent committing ephemeral state"
+        ],
+        "allowlist-schema": [
+            "allowlist.json does not validate against schema: "
+            "$.role_permissions.builder_agent.bash: expected array",
+            "allowlist.json does not validate against schema: "
+            "$.gates.max_fix_iterations: less than 1",
+        ],
+        "roles": ["fixer.md missing sections: Allowed Actions"],
+        "manifest": ["Missing from .quest-manifest: .ai/templates/new_template.md"],
+        "handoff-contracts": ["'Context Is In Your Prompt' found in: fixer.md"],
+    }
+
+
+def test_missing_artifacts_fail_without_raising(tmp_path):
+    """An empty directory fails cleanly instead of crashing a check."""
+    run = run_checks(tmp_path)
+
+    assert set(_failures(run)) == set(CHECKS)
+    assert _failures(run)["handoff-contracts"][0] == (
+        "Missing role file: .skills/quest/agents/planner.md"
+    )
+
+
+def test_stale_manifest_entries_only_warn(repo):
+    """A listed file that does not exist is a warning, as in validate-manifest.sh."""
+    (repo / ".ai" / "context_digest.md").unlink()
+
+    run = run_checks(repo, ("manifest",))
+
+    findings = [(f.level, f.message) for f in run.results[0].findings]
+    assert not run.failed
+    assert ("pass", "All Quest files are listed in .quest-manifest") in findings
+    assert ("warn", "Stale entry (file not found): .ai/context_digest.md") in findings
+
+
+def test_cli_suites_json_and_junit(repo, capsys):
+    """--check expands suites; --json and --junit carry per-check timings."""
+    junit = repo / "report.xml"
+
+    code = main(["--repo-root", str(repo), "--check", "config", "--json", "--junit", str(junit)])
+
+    assert code == 0
+    report = json.loads(capsys.readouterr().out)
+    assert [c["name"] for c in report["checks"]] == [
+        "gitignore", "allowlist-json", "allowlist-schema", "roles"
+    ]
+    assert all("seconds" in c for c in report["checks"])
+    suite = ET.parse(junit).getroot()
+    assert (suite.get("tests"), suite.get("failures")) == ("4", "0")
+    assert [case.get("name") for case in suite.iter("testcase")][0] == "gitignore"
+
+    (repo / ".gitignore").write_text("", encoding="utf-8")
+    assert main(["--repo-root", str(repo), "--check", "gitignore"]) == 1
+    out = capsys.readouterr().out
+    assert "[FAIL] .quest/ is NOT in .gitignore" in out
+    assert "1 check(s) failed" in out